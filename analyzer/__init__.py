@@ -1,87 +1,147 @@
 """
 Analyzer Module
 Main entry point for the SPEK analyzer system
+
+Subsystems are imported lazily on first attribute access (PEP 562), so
+``import analyzer`` and ``python -m analyzer --help`` stay cheap. Availability
+flags (``UNIFIED_ANALYZER_AVAILABLE``, ``CRITICAL_MODULES_STATUS``, ...) are
+resolved the same way.
 """
 
-# Import core analysis modules for enhanced analyzer
-try:
-    from .github_analyzer_runner import AnalyzerResult
-    from .github_status_reporter import GitHubStatusReporter
-    from .nasa_compliance_calculator import NASAComplianceCalculator, ComplianceConfig, ComplianceResult
-    from .violation_remediation import ViolationRemediationEngine, ViolationSuppression, FixSuggestion
-except ImportError as e:
-    print(f"Warning: Enhanced analyzer imports failed: {e}")
-
-# Core types and classes for Phase 1 implementation
-try:
-    from .utils.types import ConnascenceViolation, ConnascenceType, SeverityLevel, AnalysisResult
-    from .detectors import DetectorBase, MagicLiteralDetector
-    from .integrations.github_bridge import GitHubBridge, GitHubConfig
-    CORE_IMPORTS_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Core imports failed: {e}")
-    CORE_IMPORTS_AVAILABLE = False
-
-# Import with fallback for missing modules
-try:
-    from .core import IMPORT_MANAGER, UNIFIED_IMPORTS_AVAILABLE
-except ImportError as e:
-    print(f"CRITICAL: Core imports failed: {e}")
-    IMPORT_MANAGER = None
-    UNIFIED_IMPORTS_AVAILABLE = False
-
-# Import UnifiedAnalyzer with proper error handling
-try:
-    from .unified_analyzer import UnifiedConnascenceAnalyzer
-    # Create alias for backward compatibility
-    UnifiedAnalyzer = UnifiedConnascenceAnalyzer
-    UNIFIED_ANALYZER_AVAILABLE = True
-except ImportError as e:
-    print(f"CRITICAL: UnifiedAnalyzer import failed: {e}")
-    UnifiedAnalyzer = None
-    UNIFIED_ANALYZER_AVAILABLE = False
-
-# Import critical modules and report failures
-CRITICAL_MODULES_STATUS = {}
-
-try:
-    from .theater_detection import TheaterDetector
-    CRITICAL_MODULES_STATUS['theater_detection'] = True
-except ImportError as e:
-    print(f"CRITICAL: TheaterDetector import failed: {e}")
-    CRITICAL_MODULES_STATUS['theater_detection'] = False
-
-try:
-    from .enterprise_security import SecurityScanner
-    CRITICAL_MODULES_STATUS['enterprise_security'] = True
-except ImportError as e:
-    print(f"CRITICAL: SecurityScanner import failed: {e}")
-    CRITICAL_MODULES_STATUS['enterprise_security'] = False
-
-try:
-    from .validation import InputValidator
-    CRITICAL_MODULES_STATUS['validation'] = True
-except ImportError as e:
-    print(f"CRITICAL: InputValidator import failed: {e}")
-    CRITICAL_MODULES_STATUS['validation'] = False
-
-try:
-    from .ml_modules import QualityPredictor
-    CRITICAL_MODULES_STATUS['ml_modules'] = True
-except ImportError as e:
-    print(f"CRITICAL: QualityPredictor import failed: {e}")
-    CRITICAL_MODULES_STATUS['ml_modules'] = False
-
-# Report overall status
-failed_modules = [name for name, status in CRITICAL_MODULES_STATUS.items() if not status]
-if failed_modules:
-    print(f"CRITICAL: {len(failed_modules)} critical modules failed to load: {', '.join(failed_modules)}")
-    print("This indicates real problems that need to be fixed, not hidden!")
-else:
-    print("SUCCESS: All critical modules loaded successfully")
+import importlib
+import threading
 
 __version__ = '1.0.0'
 
+# Public name -> (relative module, attribute)
+_LAZY_ATTRIBUTES = {
+    # Enhanced analyzer
+    'AnalyzerResult': ('.github_analyzer_runner', 'AnalyzerResult'),
+    'GitHubStatusReporter': ('.github_status_reporter', 'GitHubStatusReporter'),
+    'NASAComplianceCalculator': ('.nasa_compliance_calculator', 'NASAComplianceCalculator'),
+    'ComplianceConfig': ('.nasa_compliance_calculator', 'ComplianceConfig'),
+    'ComplianceResult': ('.nasa_compliance_calculator', 'ComplianceResult'),
+    'ViolationRemediationEngine': ('.violation_remediation', 'ViolationRemediationEngine'),
+    'ViolationSuppression': ('.violation_remediation', 'ViolationSuppression'),
+    'FixSuggestion': ('.violation_remediation', 'FixSuggestion'),
+    # Core types and classes for Phase 1 implementation
+    'ConnascenceViolation': ('.utils.types', 'ConnascenceViolation'),
+    'ConnascenceType': ('.utils.types', 'ConnascenceType'),
+    'SeverityLevel': ('.utils.types', 'SeverityLevel'),
+    'AnalysisResult': ('.utils.types', 'AnalysisResult'),
+    'DetectorBase': ('.detectors', 'DetectorBase'),
+    'MagicLiteralDetector': ('.detectors', 'MagicLiteralDetector'),
+    'GitHubBridge': ('.integrations.github_bridge', 'GitHubBridge'),
+    'GitHubConfig': ('.integrations.github_bridge', 'GitHubConfig'),
+    # Unified analyzer
+    'UnifiedConnascenceAnalyzer': ('.unified_analyzer', 'UnifiedConnascenceAnalyzer'),
+    # Critical modules
+    'TheaterDetector': ('.theater_detection', 'TheaterDetector'),
+    'SecurityScanner': ('.enterprise_security', 'SecurityScanner'),
+    'InputValidator': ('.validation', 'InputValidator'),
+    'QualityPredictor': ('.ml_modules', 'QualityPredictor'),
+}
+
+# Module names checked for CRITICAL_MODULES_STATUS -> attribute proving it loaded
+_CRITICAL_MODULES = {
+    'theater_detection': 'TheaterDetector',
+    'enterprise_security': 'SecurityScanner',
+    'validation': 'InputValidator',
+    'ml_modules': 'QualityPredictor',
+}
+
+_CORE_TYPE_NAMES = ('ConnascenceViolation', 'DetectorBase', 'GitHubBridge')
+
+_resolve_lock = threading.RLock()
+
+def _load(name):
+    """Import a lazy attribute, cache it in the module namespace and return it."""
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    with _resolve_lock:
+        if name in globals():
+            return globals()[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+        globals()[name] = value
+        return value
+
+def _available(*names):
+    """Whether all given lazy attributes import cleanly."""
+    try:
+        for name in names:
+            _load(name)
+        return True
+    except ImportError as e:
+        print(f"Warning: Import failed: {e}")
+        return False
+
+def _resolve_core_import_manager():
+    """IMPORT_MANAGER and UNIFIED_IMPORTS_AVAILABLE from the core module."""
+    try:
+        from .core import IMPORT_MANAGER, UNIFIED_IMPORTS_AVAILABLE
+        return IMPORT_MANAGER, UNIFIED_IMPORTS_AVAILABLE
+    except ImportError as e:
+        print(f"CRITICAL: Core imports failed: {e}")
+        return None, False
+
+def _check_critical_modules():
+    """Import critical modules and report failures."""
+    status = {}
+    for module_name, attribute in _CRITICAL_MODULES.items():
+        try:
+            _load(attribute)
+            status[module_name] = True
+        except ImportError as e:
+            print(f"CRITICAL: {attribute} import failed: {e}")
+            status[module_name] = False
+
+    failed_modules = [name for name, loaded in status.items() if not loaded]
+    if failed_modules:
+        print(f"CRITICAL: {len(failed_modules)} critical modules failed to load: {', '.join(failed_modules)}")
+        print("This indicates real problems that need to be fixed, not hidden!")
+    return status
+
+def _resolve_flag(name):
+    """Compute an availability flag (or alias) on first access."""
+    if name == 'CORE_IMPORTS_AVAILABLE':
+        return _available(*_CORE_TYPE_NAMES)
+    if name == 'UNIFIED_ANALYZER_AVAILABLE':
+        return _available('UnifiedConnascenceAnalyzer')
+    if name == 'UnifiedAnalyzer':
+        # Alias for backward compatibility; None when unavailable
+        return _load('UnifiedConnascenceAnalyzer') if _resolve('UNIFIED_ANALYZER_AVAILABLE') else None
+    if name in ('IMPORT_MANAGER', 'UNIFIED_IMPORTS_AVAILABLE'):
+        manager, available = _resolve_core_import_manager()
+        globals().update(IMPORT_MANAGER=manager, UNIFIED_IMPORTS_AVAILABLE=available)
+        return globals()[name]
+    if name == 'CRITICAL_MODULES_STATUS':
+        return _check_critical_modules()
+    raise KeyError(name)
+
+_FLAGS = ('CORE_IMPORTS_AVAILABLE', 'UNIFIED_ANALYZER_AVAILABLE', 'UnifiedAnalyzer',
+            'IMPORT_MANAGER', 'UNIFIED_IMPORTS_AVAILABLE', 'CRITICAL_MODULES_STATUS')
+
+def _resolve(name):
+    """Resolve and cache a flag."""
+    with _resolve_lock:
+        if name not in globals():
+            globals()[name] = _resolve_flag(name)
+        return globals()[name]
+
+def __getattr__(name):
+    """PEP 562 lazy loading of analyzer subsystems."""
+    if name in _LAZY_ATTRIBUTES:
+        try:
+            return _load(name)
+        except ImportError as e:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({e})") from e
+    if name in _FLAGS:
+        return _resolve(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    """Include lazily loaded names."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_FLAGS))
+
 __all__ = [
     'ConnascenceViolation', 'ConnascenceType', 'SeverityLevel', 'AnalysisResult',
     'DetectorBase', 'MagicLiteralDetector', 'GitHubBridge', 'GitHubConfig',
@@ -98,4 +158,4 @@ __all__ = [
     'performance_optimizer',
     'semgrep_scanner',
     'vulnerability_analyzer'
-]
\ No newline at end of file
+]
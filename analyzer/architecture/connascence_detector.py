@@ -18,6 +18,8 @@ from .interfaces import (
     ConnascenceViolation,
     ConfigurationProvider
 )
+from .detector_profiler import get_global_detector_profiler
+from ..optimization.unified_visitor import ASTNodeData, find_nodes, get_global_ast_data_cache
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,7 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
         """
         self.config_provider = config_provider
         self.detector_name = "CoreConnascenceDetector"
+        self.profiler = get_global_detector_profiler()
 
         # Performance optimization: Pre-compile regex patterns
         self._magic_number_pattern = re.compile(r'\b(?!0|1|2|10|100|1000)\d+\b')
@@ -64,25 +67,57 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
         """
         Main detection entry point - orchestrates all detection methods.
 
+        Facts are taken from the shared per-file fact table, so analyzers
+        sharing a file reuse one traversal.
+
         NASA Rule 2 Compliant: <= 60 LOC with early performance optimization
         """
-        violations = []
-
         try:
-            # Performance optimization: Single AST traversal with visitor pattern
-            visitor = ConnascenceASTVisitor(self, file_path, source_lines)
-            visitor.visit(tree)
-            violations.extend(visitor.violations)
-
-            # Additional specialized detections
-            violations.extend(self._detect_god_objects(tree, file_path))
-            violations.extend(self._detect_configuration_coupling(tree, file_path, source_lines))
-            violations.extend(self._detect_timing_dependencies(tree, file_path))
+            with self.profiler.profile(self.detector_name, 'collect_facts'):
+                data = get_global_ast_data_cache().get_or_collect(
+                    file_path, tree=tree, source_lines=source_lines)
+            return self.analyze_from_data(data)
 
         except Exception as e:
             logger.error(f"Detection failed for {file_path}: {e}")
-            violations.append(self._create_error_violation(e, file_path))
+            return [self._create_error_violation(e, file_path)]
 
+    def analyze_from_data(self, collected_data: ASTNodeData) -> List[ConnascenceViolation]:
+        """
+        Run every detection rule against a pre-collected fact table.
+
+        NASA Rule 2 Compliant: <= 60 LOC
+        """
+        assert collected_data is not None, "collected_data cannot be None"
+        data = collected_data
+        file_path = data.file_path
+        constants = data.nodes_of(ast.Constant)
+        functions = data.nodes_of(ast.FunctionDef)
+        classes = data.nodes_of(ast.ClassDef)
+
+        rules = (
+            ('magic_literals', constants,
+                lambda: [v for node in constants for v in self._detect_magic_literals(node, file_path)]),
+            ('parameter_coupling', functions,
+                lambda: [v for node in functions for v in self._detect_parameter_coupling(node, file_path)]),
+            ('method_coupling', classes,
+                lambda: [v for node in classes for v in self._detect_method_coupling(node, file_path)]),
+            ('god_objects', classes + functions,
+                lambda: self._detect_god_objects(data.tree, file_path, data)),
+            ('configuration_coupling', constants,
+                lambda: self._detect_configuration_coupling(data.tree, file_path, data.source_lines, data)),
+            ('timing_dependencies', data.nodes_of(ast.Call),
+                lambda: self._detect_timing_dependencies(data.tree, file_path, data)),
+        )
+
+        violations = []
+        try:
+            for rule, nodes, check in rules:
+                with self.profiler.profile(self.detector_name, rule, nodes=len(nodes)):
+                    violations.extend(check())
+        except Exception as e:
+            logger.error(f"Detection failed for {file_path}: {e}")
+            return [self._create_error_violation(e, file_path)]
         return violations
 
     def get_detector_name(self) -> str:
@@ -187,7 +222,8 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
 
         return violations
 
-    def _detect_god_objects(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
+    def _detect_god_objects(self, tree: ast.AST, file_path: str,
+                            data: Optional[ASTNodeData] = None) -> List[ConnascenceViolation]:
         """
         Detect god object violations with comprehensive analysis.
 
@@ -195,7 +231,7 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
         """
         violations = []
 
-        for node in ast.walk(tree):
+        for node in find_nodes(tree, (ast.ClassDef, ast.FunctionDef), data):
             if isinstance(node, ast.ClassDef):
                 violations.extend(self._analyze_class_complexity(node, file_path))
             elif isinstance(node, ast.FunctionDef):
@@ -203,8 +239,8 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
 
         return violations
 
-    def _detect_configuration_coupling(self, tree: ast.AST, file_path: str,
-                                    source_lines: List[str]) -> List[ConnascenceViolation]:
+    def _detect_configuration_coupling(self, tree: ast.AST, file_path: str, source_lines: List[str],
+                                    data: Optional[ASTNodeData] = None) -> List[ConnascenceViolation]:
         """
         Detect tight coupling to configuration values.
 
@@ -212,8 +248,8 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
         """
         violations = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        for node in find_nodes(tree, (ast.Constant,), data):
+            if isinstance(node.value, str):
                 if self._config_pattern.search(node.value.lower()):
                     violations.append(ConnascenceViolation(
                         type='Configuration Coupling',
@@ -230,7 +266,8 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
 
         return violations
 
-    def _detect_timing_dependencies(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
+    def _detect_timing_dependencies(self, tree: ast.AST, file_path: str,
+                                    data: Optional[ASTNodeData] = None) -> List[ConnascenceViolation]:
         """
         Detect timing-dependent code patterns.
 
@@ -238,20 +275,19 @@ class ConnascenceDetector(ConnascenceDetectorInterface):
         """
         violations = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if self._is_timing_dependent_call(node):
-                    violations.append(ConnascenceViolation(
-                        type='Timing Dependency',
-                        severity='medium',
-                        file_path=file_path,
-                        line_number=getattr(node, 'lineno', 0),
-                        column=getattr(node, 'col_offset', 0),
-                        description='Timing-dependent code detected - may cause race conditions',
-                        connascence_type='CoT',
-                        weight=6.0,
-                        fix_suggestion='Use explicit synchronization primitives'
-                    ))
+        for node in find_nodes(tree, (ast.Call,), data):
+            if self._is_timing_dependent_call(node):
+                violations.append(ConnascenceViolation(
+                    type='Timing Dependency',
+                    severity='medium',
+                    file_path=file_path,
+                    line_number=getattr(node, 'lineno', 0),
+                    column=getattr(node, 'col_offset', 0),
+                    description='Timing-dependent code detected - may cause race conditions',
+                    connascence_type='CoT',
+                    weight=6.0,
+                    fix_suggestion='Use explicit synchronization primitives'
+                ))
 
         return violations
 
@@ -382,4 +418,4 @@ class ConnascenceASTVisitor(ast.NodeVisitor):
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Visit class definitions for method coupling."""
         self.violations.extend(self.detector._detect_method_coupling(node, self.file_path))
-        self.generic_visit(node)
\ No newline at end of file
+        self.generic_visit(node)
@@ -115,29 +115,58 @@ class ConnascenceMetrics(ConnascenceMetricsInterface):
 
         NASA Rule 2 Compliant: <= 60 LOC with focused compliance assessment
         """
+        return self.calculate_nasa_compliance_from_counts(self.count_nasa_categories(violations))
+
+    @staticmethod
+    def count_nasa_categories(violations: List[ConnascenceViolation]) -> Dict[str, int]:
+        """Count the violation categories that drive NASA rule scores in one pass."""
+        counts = {'critical': 0, 'oversized': 0, 'parameter': 0, 'magic': 0}
+        for v in violations:
+            if isinstance(v, dict):
+                violation_type = str(v.get('type', '')).lower()
+                severity = v.get('severity')
+            else:
+                violation_type = v.type.lower()
+                severity = v.severity
+            if severity == 'critical':
+                counts['critical'] += 1
+            if 'god' in violation_type or 'long' in violation_type:
+                counts['oversized'] += 1
+            if 'parameter' in violation_type:
+                counts['parameter'] += 1
+            if 'magic' in violation_type:
+                counts['magic'] += 1
+        return counts
+
+    def calculate_nasa_compliance_from_counts(self, counts: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Calculate NASA Power of Ten compliance from pre-aggregated category counts.
+
+        NASA Rule 2 Compliant: <= 60 LOC, O(1) for incremental callers
+        """
         compliance_violations = []
         rule_scores = {}
 
         # Rule 1: Avoid complex flow constructs (critical violations)
-        critical_count = len([v for v in violations if v.severity == 'critical'])
+        critical_count = counts.get('critical', 0)
         rule_scores['rule_1'] = max(0, 1.0 - (critical_count / 10))
         if critical_count > 0:
             compliance_violations.append(f"Rule 1: {critical_count} critical violations")
 
         # Rule 4: Limit function and class size
-        god_objects = len([v for v in violations if 'god' in v.type.lower() or 'long' in v.type.lower()])
+        god_objects = counts.get('oversized', 0)
         rule_scores['rule_4'] = max(0, 1.0 - (god_objects / 20))
         if god_objects > MAXIMUM_NESTED_DEPTH:
             compliance_violations.append(f"Rule 4: {god_objects} oversized functions/classes")
 
         # Rule 6: Limit function parameters
-        param_violations = len([v for v in violations if 'parameter' in v.type.lower()])
+        param_violations = counts.get('parameter', 0)
         rule_scores['rule_6'] = max(0, 1.0 - (param_violations / 15))
         if param_violations > MAXIMUM_RETRY_ATTEMPTS:
             compliance_violations.append(f"Rule 6: {param_violations} parameter violations")
 
         # Rule 8: Limit preprocessor use (magic literals)
-        magic_violations = len([v for v in violations if 'magic' in v.type.lower()])
+        magic_violations = counts.get('magic', 0)
         rule_scores['rule_8'] = max(0, 1.0 - (magic_violations / 10))
         if magic_violations > MAXIMUM_NESTED_DEPTH:
             compliance_violations.append(f"Rule 8: {magic_violations} magic literals")
@@ -9,11 +9,10 @@ Coordinates all analysis components with Strategy and Observer patterns.
 
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
-import ast
 import logging
 import time
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from .interfaces import (
     ConnascenceOrchestratorInterface,
@@ -30,6 +29,15 @@ from .connascence_metrics import ConnascenceMetrics
 from .connascence_reporter import ConnascenceReporter
 from .connascence_fixer import ConnascenceFixer
 from .connascence_cache import ConnascenceCache
+from .detector_profiler import get_global_detector_profiler, get_process_memory_usage
+from ..optimization.memory_monitor import get_global_memory_monitor
+from ..optimization.unified_visitor import get_global_ast_data_cache
+
+try:
+    from src.detectors.workload_optimizer import AdaptiveConcurrencyController, get_global_file_cost_estimator
+    ADAPTIVE_CONCURRENCY_AVAILABLE = True
+except ImportError:
+    ADAPTIVE_CONCURRENCY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +65,8 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
         self.reporter = ConnascenceReporter(config_provider)
         self.fixer = ConnascenceFixer(config_provider)
         self.cache = ConnascenceCache(config_provider)
+        # Per-file fact tables shared with other analyzers (one parse per file)
+        self.ast_data_cache = get_global_ast_data_cache()
 
         # Observer pattern implementation
         self.observers: List[AnalysisObserver] = []
@@ -69,6 +79,31 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
         self.max_worker_threads = self._get_config('max_worker_threads', 4)
         self.enable_caching = self._get_config('enable_caching', True)
 
+        # Worker count adapts to measured throughput, queue depth and memory
+        # headroom; files are scheduled longest-first from cost history
+        self.concurrency_controller = None
+        self.file_costs = None
+        if ADAPTIVE_CONCURRENCY_AVAILABLE and self._get_config('adaptive_concurrency', True):
+            self.concurrency_controller = AdaptiveConcurrencyController(
+                initial_concurrency=self.max_worker_threads,
+                max_concurrency=self._get_config('max_worker_threads_limit', None),
+                min_memory_headroom_mb=self._get_config('min_memory_headroom_mb', 256.0),
+            )
+            self.file_costs = get_global_file_cost_estimator()
+
+        # Opt-in per-detector profiling (shared with the detector and CLI)
+        self.profiler = get_global_detector_profiler()
+        if self._get_config('enable_profiling', False):
+            self.profiler.enable(track_memory=self._get_config('profile_memory', True))
+
+        # Opt-in phase-scoped allocation tracing (discovery .. report)
+        self.memory_monitor = get_global_memory_monitor()
+        if self._get_config('trace_allocations', False):
+            self.memory_monitor.enable_allocation_tracing(
+                top_n=self._get_config('allocation_top_n', 10),
+                sample_every=self._get_config('allocation_sample_every', 10),
+            )
+
         # System health tracking
         self.analysis_count = 0
         self.total_analysis_time = 0.0
@@ -138,17 +173,12 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
                 if cached_result:
                     return cached_result
 
-            # Read and parse file
+            # Read file
             with open(file_path, 'r', encoding='utf-8') as f:
                 source_code = f.read()
-                source_lines = source_code.splitlines()
-
-            tree = ast.parse(source_code, filename=str(file_path))
 
             # Execute analysis pipeline
-            violations = self.detector.detect_violations(tree, str(file_path), source_lines)
-            classified_violations = [self.classifier.classify_violation(v) for v in violations]
-            enhanced_violations = self.fixer.generate_fix_suggestions(classified_violations)
+            enhanced_violations = self._run_pipeline(str(file_path), source_code)
 
             # Calculate metrics
             metrics = self.metrics_calculator.calculate_metrics(enhanced_violations)
@@ -216,6 +246,9 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
                 'parallel_processing_enabled': self.enable_parallel_processing
             },
             'cache_status': cache_stats,
+            'ast_data_cache': self.ast_data_cache.get_stats(),
+            'concurrency': (self.concurrency_controller.get_stats() if self.concurrency_controller
+                            else {'current_concurrency': self.max_worker_threads}),
             'component_status': {
                 'detector': self.detector.get_detector_name(),
                 'classifier': self.classifier.classifier_name,
@@ -227,8 +260,13 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
             'system_health': {
                 'status': 'healthy' if self.error_count == 0 else 'degraded',
                 'uptime_analyses': self.analysis_count,
-                'memory_usage': 'optimal',  # Would calculate actual usage
+                'memory_usage': get_process_memory_usage(),
                 'nasa_compliance_ready': True
+            },
+            'allocation_phases': self.memory_monitor.get_phase_report(),
+            'detector_profile': {
+                **self.profiler.get_report(),
+                'hotspots': self.profiler.get_hotspots(),
             }
         }
 
@@ -239,13 +277,15 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
         all_violations = []
         files_analyzed = 0
         analysis_start = time.time()
+        trace_phase = self.memory_monitor.trace_phase
 
-        # Find Python files
-        python_files = list(project_path.rglob("*.py"))
+        with trace_phase('discovery'):
+            # Find Python files
+            python_files = list(project_path.rglob("*.py"))
 
-        # Filter out unwanted files
-        filtered_files = [f for f in python_files
-                        if not any(skip in str(f) for skip in ['__pycache__', '.git', 'node_modules'])]
+            # Filter out unwanted files
+            filtered_files = [f for f in python_files
+                            if not any(skip in str(f) for skip in ['__pycache__', '.git', 'node_modules'])]
 
         # Process files (parallel or sequential)
         if self.enable_parallel_processing and len(filtered_files) > 1:
@@ -256,9 +296,10 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
         all_violations.extend(violations)
         files_analyzed = len(filtered_files)
 
-        # Calculate comprehensive metrics
-        metrics = self.metrics_calculator.calculate_metrics(all_violations)
-        nasa_compliance = self.metrics_calculator.calculate_nasa_compliance(all_violations)
+        with trace_phase('aggregate'):
+            # Calculate comprehensive metrics
+            metrics = self.metrics_calculator.calculate_metrics(all_violations)
+            nasa_compliance = self.metrics_calculator.calculate_nasa_compliance(all_violations)
 
         # Create final result
         analysis_time = (time.time() - analysis_start) * 1000
@@ -279,26 +320,45 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
         )
 
     def _process_files_parallel(self, files: List[Path]) -> List[ConnascenceViolation]:
-        """Process files in parallel for improved performance."""
-        all_violations = []
-
-        with ThreadPoolExecutor(max_workers=self.max_worker_threads) as executor:
-            # Submit all file analysis tasks
-            future_to_file = {
-                executor.submit(self._analyze_single_file, file_path): file_path
-                for file_path in files
-            }
+        """
+        Process files in parallel for improved performance.
 
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    violations = future.result()
-                    all_violations.extend(violations)
-                    self._notify_file_analyzed(str(file_path), violations)
-                except Exception as e:
-                    logger.error(f"Parallel file analysis failed for {file_path}: {e}")
-                    self._notify_error(e, {'file_path': str(file_path)})
+        With adaptive concurrency, files are submitted longest-first and the
+        number in flight is re-sized after every batch of completions.
+        """
+        all_violations = []
+        controller = self.concurrency_controller
+        if controller is None:
+            pending, max_workers = list(files), self.max_worker_threads
+        else:
+            pending, max_workers = self.file_costs.order_longest_first(files), controller.max_concurrency
+        pending.reverse()  # pop() from the end takes the next file
+
+        limit = controller.current_concurrency if controller else max_workers
+        in_flight = {}
+        batch_completed, batch_start = 0, time.time()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or in_flight:
+                while pending and len(in_flight) < limit:
+                    file_path = pending.pop()
+                    in_flight[executor.submit(self._analyze_single_file, file_path)] = file_path
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = in_flight.pop(future)
+                    try:
+                        violations = future.result()
+                        all_violations.extend(violations)
+                        self._notify_file_analyzed(str(file_path), violations)
+                    except Exception as e:
+                        logger.error(f"Parallel file analysis failed for {file_path}: {e}")
+                        self._notify_error(e, {'file_path': str(file_path)})
+
+                batch_completed += len(done)
+                if controller is not None and batch_completed >= limit:
+                    limit = controller.record_batch(batch_completed, time.time() - batch_start, len(pending))
+                    batch_completed, batch_start = 0, time.time()
 
         return all_violations
 
@@ -320,23 +380,42 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
     def _analyze_single_file(self, file_path: Path) -> List[ConnascenceViolation]:
         """Analyze single file and return enhanced violations."""
         try:
+            start = time.perf_counter()
             with open(file_path, 'r', encoding='utf-8') as f:
                 source_code = f.read()
-                source_lines = source_code.splitlines()
-
-            tree = ast.parse(source_code, filename=str(file_path))
 
             # Analysis pipeline
-            violations = self.detector.detect_violations(tree, str(file_path), source_lines)
-            classified_violations = [self.classifier.classify_violation(v) for v in violations]
-            enhanced_violations = self.fixer.generate_fix_suggestions(classified_violations)
-
-            return enhanced_violations
+            violations = self._run_pipeline(str(file_path), source_code)
+            if self.file_costs is not None:
+                self.file_costs.record(str(file_path), time.perf_counter() - start, len(source_code))
+            return violations
 
         except Exception as e:
             logger.error(f"Single file analysis failed for {file_path}: {e}")
             return []
 
+    def _run_pipeline(self, file_path: str, source_code: str) -> List[ConnascenceViolation]:
+        """
+        Collect facts, then detect, classify and enhance violations.
+
+        The file is parsed and walked once, into the shared fact table; each
+        stage is profiled when profiling is enabled.
+        """
+        profile = self.profiler.profile
+        trace_phase = self.memory_monitor.trace_phase
+        name = self.orchestrator_name
+
+        with profile(name, 'analyze_file'):
+            with trace_phase('parse'), profile(name, 'collect_facts'):
+                data = self.ast_data_cache.get_or_collect(file_path, source_code)
+            with trace_phase('detect'), profile(name, 'detection'):
+                violations = self.detector.analyze_from_data(data)
+            with trace_phase('classify'):
+                with profile(self.classifier.classifier_name, 'classify', nodes=len(violations)):
+                    classified_violations = [self.classifier.classify_violation(v) for v in violations]
+                with profile(self.fixer.fixer_name, 'fix_suggestions', nodes=len(classified_violations)):
+                    return self.fixer.generate_fix_suggestions(classified_violations)
+
     def _check_cache(self, project_path: Path) -> Optional[AnalysisResult]:
         """Check cache for existing analysis result."""
         cache_key = self._generate_project_cache_key(project_path)
@@ -1,5 +1,3 @@
-from src.constants.base import MAXIMUM_FUNCTION_PARAMETERS, MAXIMUM_NESTED_DEPTH
-
 """
 Advanced report generator implementing 14 methods for multiple output formats.
 Defense industry compliant with audit trail generation and NASA POT10 reporting.
@@ -14,12 +12,15 @@ import xml.etree.ElementTree as ET
 from dataclasses import asdict
 import logging
 
+from src.constants.base import MAXIMUM_FUNCTION_PARAMETERS, MAXIMUM_NESTED_DEPTH
+
 from .interfaces import (
     ConnascenceReporterInterface,
     AnalysisResult,
     ConnascenceViolation,
     ConfigurationProvider
 )
+from ..optimization.memory_monitor import get_global_memory_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,9 @@ class ConnascenceReporter(ConnascenceReporterInterface):
         self.max_violations_per_report = self._get_config('max_violations_per_report', 1000)
         self.compress_large_reports = self._get_config('compress_large_reports', True)
 
+        # Report rendering is attributed to the 'report' allocation phase
+        self.memory_monitor = get_global_memory_monitor()
+
     def generate_report(self, result: AnalysisResult, format_type: str = 'json') -> str:
         """
         Main report generation entry point with format selection.
@@ -69,12 +73,13 @@ class ConnascenceReporter(ConnascenceReporterInterface):
             if not handler:
                 raise ValueError(f"Unsupported format: {format_type}")
 
-            # Generate report using appropriate handler
-            report_content = handler(result)
+            with self.memory_monitor.trace_phase('report'):
+                # Generate report using appropriate handler
+                report_content = handler(result)
 
-            # Add audit trail if enabled
-            if self.include_audit_trail:
-                report_content = self._add_audit_trail(report_content, format_type, result)
+                # Add audit trail if enabled
+                if self.include_audit_trail:
+                    report_content = self._add_audit_trail(report_content, format_type, result)
 
             return report_content
 
@@ -1,15 +1,27 @@
-from src.constants.base import DAYS_RETENTION_PERIOD
+"""
+Detector Pool
+=============
+
+Worker-local detector reuse for parallel scans.
+
+Each worker thread owns its own detector set, so acquiring and releasing a
+detector touches no shared state and takes no lock. A reused detector is
+pointed at the next file with DetectorBase.reset(file_path, source_lines)
+instead of being re-initialized. Pool metrics are kept per worker and only
+summed when get_metrics() is called. A worker's set is unregistered when its
+thread exits, folding its counters into the pool totals.
 
-NASA Rule DAYS_RETENTION_PERIOD Compliant: Bounded resource management
-Singleton pattern with thread-safe detector reuse
-Eliminates object creation overhead (8 objects per file -> 1 pool)
+Pools are per process: a forked child starts with a fresh global pool.
+
+NASA Rule 7 Compliant: Bounded resource management
+Eliminates object creation overhead (8 objects per file -> 1 set per worker)
 """
 
+import os
 import threading
 import time
+import weakref
 from typing import Dict, List, Type, Optional, Any
-from concurrent.futures import ThreadPoolExecutor
-import ast
 
 try:
     from ..detectors.base import DetectorBase
@@ -39,329 +51,283 @@ except ImportError:
         ValuesDetector,
         ExecutionDetector
     )
-try:
-    from utils.types import ConnascenceViolation
-except ImportError:
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-    from utils.types import ConnascenceViolation
 
-class PooledDetector:
+# Default detector type mapping
+DEFAULT_DETECTOR_TYPES: Dict[str, Type[DetectorBase]] = {
+    'position': PositionDetector,
+    'magic_literal': MagicLiteralDetector,
+    'algorithm': AlgorithmDetector,
+    'god_object': GodObjectDetector,
+    'timing': TimingDetector,
+    'convention': ConventionDetector,
+    'values': ValuesDetector,
+    'execution': ExecutionDetector
+}
+
+class WorkerDetectorSet:
     """
-    Wrapper for pooled detector instances with state management.
-    
-    NASA Rule 4: Class under 60 lines per method
-    NASA Rule 5: Input validation
+    Idle detectors and counters owned by a single worker thread.
+
+    Only the owning thread mutates a set, so no locking is needed; counters
+    are read (possibly slightly stale) when metrics are aggregated.
+
     NASA Rule 6: Clear variable scoping
     """
-    
-    def __init__(self, detector_instance: DetectorBase, created_at: float):
-        assert isinstance(detector_instance, DetectorBase), "detector_instance must be DetectorBase"
-        assert isinstance(created_at, (int, float)), "created_at must be numeric"
-        
-        self.detector = detector_instance
-        self.created_at = created_at
-        self.last_used = created_at
-        self.use_count = 0
-        self.is_in_use = False
-        self._lock = threading.Lock()
-    
-    def acquire(self, file_path: str, source_lines: List[str]) -> DetectorBase:
-        """
-        Acquire detector for use with new file context.
-        
-        NASA Rule 4: Function under 60 lines
-        NASA Rule 5: Input validation
-        """
-        assert isinstance(file_path, str), "file_path must be string"
-        assert isinstance(source_lines, list), "source_lines must be list"
-        
-        with self._lock:
-            if self.is_in_use:
-                return None  # Already in use
-            
-            # Reset detector state for new file
-            self.detector.file_path = file_path
-            self.detector.source_lines = source_lines
-            self.detector.violations = []
-            
-            self.is_in_use = True
-            self.last_used = time.time()
-            self.use_count += 1
-            
-            return self.detector
-    
-    def release(self):
-        """Release detector back to pool."""
-        with self._lock:
-            self.is_in_use = False
-            # Clear sensitive data
-            self.detector.file_path = ""
-            self.detector.source_lines = []
-            self.detector.violations = []
+
+    def __init__(self, worker_name: str):
+        self.worker_name = worker_name
+        self.idle: Dict[str, List[DetectorBase]] = {}
+        self.created: Dict[str, int] = {}
+        self.acquisitions = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.last_used = time.time()
+
+    def pool_size(self) -> int:
+        """Detectors created by this worker."""
+        return sum(self.created.values())
+
+class _WorkerExitSentinel:
+    """Held only in thread-local storage; collected when its thread exits."""
+
+def _retire_worker(pool_ref: 'weakref.ref', worker: WorkerDetectorSet) -> None:
+    """Unregister a finished thread's detector set (weakref.finalize callback)."""
+    pool = pool_ref()
+    if pool is not None:
+        pool._unregister_worker(worker)
 
 class DetectorPool:
     """
-    Thread-safe singleton detector pool for performance optimization.
-    
-    NASA Rule 7: Bounded resources (max pool size)
+    Lock-free, worker-local detector pool.
+
+    NASA Rule 7: Bounded resources (max detectors per type per worker)
     NASA Rule 4: All methods under 60 lines
     NASA Rule 5: Input validation
     NASA Rule 6: Clear variable scoping
-    
+
     Performance Benefits:
-    - Eliminates 8 object creations per file
-    - Consistent memory usage patterns
-    - Thread-safe parallel processing
-    - Detector warmup for consistent performance
+    - No object creation per file after warmup
+    - No locks or shared counters on the acquire/release path
+    - Reset instead of re-initialization on reuse
     """
-    
-    _instance: Optional['DetectorPool'] = None
-    _lock = threading.Lock()
-    
+
     # NASA Rule 7: Bounded resource limits
-    MAX_POOL_SIZE = 16  # Maximum detectors per type
-    WARMUP_COUNT = 2    # Pre-warmed instances per type
-    CLEANUP_INTERVAL = 300  # 5 minutes
-    MAX_IDLE_TIME = 600     # 10 minutes
-    
-    def __new__(cls):
-        """Thread-safe singleton implementation."""
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
-    
-    def __init__(self):
-        """Initialize pool with bounded resources."""
-        if self._initialized:
+    MAX_POOL_SIZE = 16  # Maximum detectors per type per worker
+    WARMUP_COUNT = 1    # Pre-warmed instances per type per worker
+    MAX_IDLE_TIME = 600  # 10 minutes; idle workers shrink back to WARMUP_COUNT
+
+    def __init__(self, detector_types: Optional[Dict[str, Type[DetectorBase]]] = None):
+        """Initialize an empty pool; worker sets are created on first use."""
+        self._detector_types = dict(detector_types or DEFAULT_DETECTOR_TYPES)
+        self._type_names = {detector_class: name for name, detector_class in self._detector_types.items()}
+        self._local = threading.local()
+
+        # Live worker sets, registered once per worker for lazy metric aggregation
+        self._workers: List[WorkerDetectorSet] = []
+        self._registry_lock = threading.Lock()
+        # Counters of workers whose threads have exited
+        self._retired = {'acquisitions': 0, 'cache_hits': 0, 'cache_misses': 0}
+
+    def _worker_set(self) -> WorkerDetectorSet:
+        """Detector set of the calling worker (created on first use)."""
+        worker = getattr(self._local, 'worker', None)
+        if worker is None:
+            worker = WorkerDetectorSet(threading.current_thread().name)
+            worker.idle = {name: [] for name in self._detector_types}
+            worker.created = {name: 0 for name in self._detector_types}
+            with self._registry_lock:  # once per worker, never on acquire
+                self._workers.append(worker)
+            self._local.worker = worker
+            # Thread-local storage is cleared on thread exit, which fires the finalizer
+            sentinel = _WorkerExitSentinel()
+            weakref.finalize(sentinel, _retire_worker, weakref.ref(self), worker)
+            self._local.exit_sentinel = sentinel
+        return worker
+
+    def _unregister_worker(self, worker: WorkerDetectorSet) -> None:
+        """Drop a worker's set from the registry, keeping its counters in the totals."""
+        with self._registry_lock:
+            if not any(item is worker for item in self._workers):
+                return
+            self._workers = [item for item in self._workers if item is not worker]
+            self._retired['acquisitions'] += worker.acquisitions
+            self._retired['cache_hits'] += worker.cache_hits
+            self._retired['cache_misses'] += worker.cache_misses
+        for idle in worker.idle.values():
+            idle.clear()
+
+    def _trim_idle(self, worker: WorkerDetectorSet, now: float) -> None:
+        """Shrink a worker's idle lists to WARMUP_COUNT after MAX_IDLE_TIME unused."""
+        if now - worker.last_used <= self.MAX_IDLE_TIME:
             return
-            
-        self._initialized = True
-        self._pools: Dict[str, List[PooledDetector]] = {}
-        self._pool_locks: Dict[str, threading.Lock] = {}
-        self._metrics = {
-            'total_acquisitions': 0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'pool_size': 0
-        }
-        
-        # Detector type mapping
-        self._detector_types = {
-            'position': PositionDetector,
-            'magic_literal': MagicLiteralDetector,
-            'algorithm': AlgorithmDetector,
-            'god_object': GodObjectDetector,
-            'timing': TimingDetector,
-            'convention': ConventionDetector,
-            'values': ValuesDetector,
-            'execution': ExecutionDetector
-        }
-        
-        # Initialize pools with warmup
-        self._initialize_pools()
-        
-        # Start cleanup thread
-        self._cleanup_thread = threading.Thread(target=self._cleanup_worker, daemon=True)
-        self._cleanup_thread.start()
-    
-    def _initialize_pools(self):
-        """Initialize detector pools with warmup instances."""
-        for detector_name in self._detector_types:
-            self._pools[detector_name] = []
-            self._pool_locks[detector_name] = threading.Lock()
-            
-            # Pre-warm instances for consistent performance
-            for _ in range(self.WARMUP_COUNT):
-                self._create_detector_instance(detector_name)
-    
-    def _create_detector_instance(self, detector_name: str) -> Optional[PooledDetector]:
+        for detector_name, idle in worker.idle.items():
+            excess = len(idle) - self.WARMUP_COUNT
+            if excess > 0:
+                del idle[:excess]
+                worker.created[detector_name] -= excess
+
+    def _create_detector_instance(self, worker: WorkerDetectorSet, detector_name: str) -> Optional[DetectorBase]:
         """
-        Create new detector instance with NASA compliance.
-        
-        NASA Rule 4: Function under 60 lines
+        Create a detector for a worker, bounded by MAX_POOL_SIZE.
+
         NASA Rule 5: Input validation
         NASA Rule 7: Bounded resources
         """
         assert detector_name in self._detector_types, f"Unknown detector: {detector_name}"
-        
-        # NASA Rule 7: Check pool size limits
-        if len(self._pools[detector_name]) >= self.MAX_POOL_SIZE:
+
+        if worker.created[detector_name] >= self.MAX_POOL_SIZE:
             return None
-        
+
         try:
-            detector_class = self._detector_types[detector_name]
-            # Create with dummy values - will be reset on acquire
-            detector_instance = detector_class("", [])
-            pooled_detector = PooledDetector(detector_instance, time.time())
-            
-            self._pools[detector_name].append(pooled_detector)
-            self._metrics['pool_size'] += 1
-            
-            return pooled_detector
-            
+            # Created with empty context - reset() supplies the file
+            detector = self._detector_types[detector_name]("", [])
         except Exception as e:
             # NASA Rule 5: Error handling
             print(f"Warning: Failed to create {detector_name} detector: {e}")
             return None
-    
-    def acquire_detector(self, detector_name: str, file_path: str, 
+
+        worker.created[detector_name] += 1
+        return detector
+
+    def acquire_detector(self, detector_name: str, file_path: str,
                         source_lines: List[str]) -> Optional[DetectorBase]:
         """
-        Acquire detector from pool for analysis.
-        
+        Acquire a detector from the calling worker's set, reset for the file.
+
+        Returns None only when the worker already holds MAX_POOL_SIZE
+        detectors of this type.
+
         NASA Rule 4: Function under 60 lines
         NASA Rule 5: Input validation
-        NASA Rule 7: Resource bounds checking
         """
-        assert isinstance(detector_name, str), "detector_name must be string"
-        assert isinstance(file_path, str), "file_path must be string"
-        assert isinstance(source_lines, list), "source_lines must be list"
         assert detector_name in self._detector_types, f"Unknown detector: {detector_name}"
-        
-        self._metrics['total_acquisitions'] += 1
-        
-        with self._pool_locks[detector_name]:
-            # Try to find available detector
-            for pooled_detector in self._pools[detector_name]:
-                detector = pooled_detector.acquire(file_path, source_lines)
-                if detector is not None:
-                    self._metrics['cache_hits'] += 1
-                    return detector
-            
-            # No available detector, try to create new one
-            self._metrics['cache_misses'] += 1
-            pooled_detector = self._create_detector_instance(detector_name)
-            
-            if pooled_detector is not None:
-                return pooled_detector.acquire(file_path, source_lines)
-            
-            # Pool at capacity, wait briefly and try again
-            time.sleep(0.001)  # 1ms backoff
-            return None
-    
+
+        worker = self._worker_set()
+        now = time.time()
+        self._trim_idle(worker, now)
+        worker.acquisitions += 1
+        worker.last_used = now
+
+        idle = worker.idle[detector_name]
+        if idle:
+            worker.cache_hits += 1
+            detector = idle.pop()
+        else:
+            worker.cache_misses += 1
+            detector = self._create_detector_instance(worker, detector_name)
+            if detector is None:
+                return None
+
+        detector.reset(file_path, source_lines)
+        return detector
+
     def release_detector(self, detector: DetectorBase):
         """
-        Release detector back to pool.
-        
-        NASA Rule 4: Function under 60 lines
+        Return a detector to the calling worker's set.
+
         NASA Rule 5: Input validation
         """
         assert isinstance(detector, DetectorBase), "detector must be DetectorBase"
-        
-        # Find the pooled detector by instance
-        for detector_name, pool in self._pools.items():
-            with self._pool_locks[detector_name]:
-                for pooled_detector in pool:
-                    if pooled_detector.detector is detector:
-                        pooled_detector.release()
-                        return
-    
-    def acquire_all_detectors(self, file_path: str, 
+
+        detector_name = self._type_names.get(type(detector))
+        if detector_name is None:
+            return  # Not created by this pool
+
+        idle = self._worker_set().idle[detector_name]
+        if len(idle) < self.MAX_POOL_SIZE and not any(item is detector for item in idle):
+            # Drop file references so idle detectors do not pin source text
+            detector.file_path = ""
+            detector.source_lines = []
+            detector.violations = []
+            idle.append(detector)
+
+    def acquire_all_detectors(self, file_path: str,
                             source_lines: List[str]) -> Dict[str, DetectorBase]:
         """
-        Acquire all detector types for comprehensive analysis.
-        
+        Acquire one detector of every type for comprehensive analysis.
+
         NASA Rule 4: Function under 60 lines
         NASA Rule 5: Input validation
         """
         assert isinstance(file_path, str), "file_path must be string"
         assert isinstance(source_lines, list), "source_lines must be list"
-        
+
         acquired_detectors = {}
-        failed_acquisitions = []
-        
-        # Acquire all detector types
         for detector_name in self._detector_types:
             detector = self.acquire_detector(detector_name, file_path, source_lines)
-            if detector is not None:
-                acquired_detectors[detector_name] = detector
-            else:
-                failed_acquisitions.append(detector_name)
-        
-        # If any acquisition failed, release acquired ones and retry
-        if failed_acquisitions and len(acquired_detectors) > 0:
-            self._handle_partial_acquisition_failure(acquired_detectors, failed_acquisitions)
-        
+            if detector is None:
+                # Worker at capacity: give back what was taken
+                self.release_all_detectors(acquired_detectors)
+                print(f"Warning: Could not acquire detector: {detector_name}. Pool at capacity.")
+                return {}
+            acquired_detectors[detector_name] = detector
+
         return acquired_detectors
-    
-    def _handle_partial_acquisition_failure(self, acquired: Dict[str, DetectorBase], 
-                                            failed: List[str]):
-        """
-        Handle cases where some detectors couldn't be acquired.'
-        
-        NASA Rule 4: Function under 60 lines
-        """
-        # Release successfully acquired detectors
-        for detector in acquired.values():
-            self.release_detector(detector)
-        
-        # Log warning about resource pressure
-        print(f"Warning: Could not acquire detectors: {failed}. Pool at capacity.")
-    
+
     def release_all_detectors(self, detectors: Dict[str, DetectorBase]):
-        """Release multiple detectors back to pool."""
+        """Release multiple detectors back to the calling worker's set."""
         for detector in detectors.values():
             self.release_detector(detector)
-    
-    def _cleanup_worker(self):
-        """Background cleanup of idle detectors."""
-        while True:
-            time.sleep(self.CLEANUP_INTERVAL)
-            self._cleanup_idle_detectors()
-    
-    def _cleanup_idle_detectors(self):
-        """Remove detectors that have been idle too long."""
-        current_time = time.time()
-        
-        for detector_name, pool in self._pools.items():
-            with self._pool_locks[detector_name]:
-                # Keep warmup count but remove excess idle detectors
-                to_remove = []
-                active_count = sum(1 for pd in pool if pd.is_in_use)
-                idle_count = len(pool) - active_count
-                
-                if idle_count > self.WARMUP_COUNT:
-                    for pooled_detector in pool:
-                        if (not pooled_detector.is_in_use and 
-                            current_time - pooled_detector.last_used > self.MAX_IDLE_TIME and
-                            idle_count > self.WARMUP_COUNT):
-                            to_remove.append(pooled_detector)
-                            idle_count -= 1
-                
-                for pooled_detector in to_remove:
-                    pool.remove(pooled_detector)
-                    self._metrics['pool_size'] -= 1
-    
+
+    def warmup_pool(self):
+        """Pre-create WARMUP_COUNT detectors of each type for the calling worker."""
+        worker = self._worker_set()
+        for detector_name in self._detector_types:
+            idle = worker.idle[detector_name]
+            while len(idle) < self.WARMUP_COUNT:
+                detector = self._create_detector_instance(worker, detector_name)
+                if detector is None:
+                    break
+                idle.append(detector)
+
+    def clear_worker(self):
+        """Drop the calling worker's idle detectors (e.g. before a worker exits)."""
+        worker = getattr(self._local, 'worker', None)
+        if worker is not None:
+            for idle in worker.idle.values():
+                idle.clear()
+
     def get_metrics(self) -> Dict[str, Any]:
-        """Get pool performance metrics."""
-        hit_rate = 0.0
-        if self._metrics['total_acquisitions'] > 0:
-            hit_rate = self._metrics['cache_hits'] / self._metrics['total_acquisitions']
-        
+        """Pool metrics, aggregated across workers on demand."""
+        with self._registry_lock:
+            workers = list(self._workers)
+            retired = dict(self._retired)
+
+        total_acquisitions = retired['acquisitions'] + sum(worker.acquisitions for worker in workers)
+        cache_hits = retired['cache_hits'] + sum(worker.cache_hits for worker in workers)
+        pool_sizes = {
+            name: sum(worker.created[name] for worker in workers)
+            for name in self._detector_types
+        }
+
         return {
-            **self._metrics,
-            'hit_rate': hit_rate,
-            'pool_sizes': {name: len(pool) for name, pool in self._pools.items()}
+            'total_acquisitions': total_acquisitions,
+            'cache_hits': cache_hits,
+            'cache_misses': retired['cache_misses'] + sum(worker.cache_misses for worker in workers),
+            'pool_size': sum(pool_sizes.values()),
+            'hit_rate': cache_hits / total_acquisitions if total_acquisitions else 0.0,
+            'pool_sizes': pool_sizes,
+            'workers': len(workers),
         }
-    
-    def warmup_pool(self):
-        """Pre-warm all detector pools for consistent performance."""
-        for detector_name in self._detector_types:
-            with self._pool_locks[detector_name]:
-                current_size = len(self._pools[detector_name])
-                for _ in range(max(0, self.WARMUP_COUNT - current_size)):
-                    self._create_detector_instance(detector_name)
 
-# Global pool instance
-_global_pool = None
+# Global pool instance (per process)
+_global_pool: Optional[DetectorPool] = None
+_global_pool_lock = threading.Lock()
 
 def get_detector_pool() -> DetectorPool:
-    """Get the global detector pool instance."""
+    """Get the global detector pool instance of this process."""
     global _global_pool
     if _global_pool is None:
-        _global_pool = DetectorPool()
-    return _global_pool
\ No newline at end of file
+        with _global_pool_lock:
+            if _global_pool is None:
+                _global_pool = DetectorPool()
+    return _global_pool
+
+def _reset_after_fork() -> None:
+    """Give forked children their own pool and an unlocked registry."""
+    global _global_pool, _global_pool_lock
+    _global_pool = None
+    _global_pool_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,247 @@
+# SPDX-License-Identifier: MIT
+"""
+Detector Profiler - Per-Detector Hot-Path Instrumentation
+=========================================================
+
+Opt-in profiler recording, per detector and per rule, wall time, call
+counts, AST nodes visited and allocated bytes (tracemalloc deltas).
+
+Frames nest: a rule profiled while its detector stage is active is recorded
+under that stage, so the collected stacks can be exported in the collapsed
+format (``frame;frame;frame <value>``) read by flamegraph.pl, speedscope and
+inferno. Exported values are self time in microseconds.
+
+When the profiler is disabled ``profile()`` returns a shared no-op context,
+so instrumented hot paths pay one attribute check.
+
+Note: tracemalloc counters are process-wide, so allocation deltas recorded
+while several threads analyze files concurrently are approximate.
+"""
+
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import logging
+import threading
+import time
+import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+_NO_OP = nullcontext()
+
+@dataclass
+class FrameStats:
+    """Accumulated measurements for one call stack."""
+    calls: int = 0
+    wall_time: float = 0.0  # inclusive seconds
+    self_time: float = 0.0  # exclusive seconds
+    nodes_visited: int = 0
+    allocated_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize stats with millisecond timings."""
+        return {
+            'calls': self.calls,
+            'wall_time_ms': round(self.wall_time * 1000, 3),
+            'self_time_ms': round(self.self_time * 1000, 3),
+            'nodes_visited': self.nodes_visited,
+            'allocated_bytes': self.allocated_bytes,
+        }
+
+class _Frame:
+    """Active measurement on a thread's frame stack."""
+
+    __slots__ = ('label', 'start', 'memory_start', 'child_time', 'nodes')
+
+    def __init__(self, label: str, nodes: int, memory_start: int):
+        self.label = label
+        self.nodes = nodes
+        self.memory_start = memory_start
+        self.child_time = 0.0
+        self.start = time.perf_counter()
+
+class DetectorProfiler:
+    """
+    Thread-safe per-detector/per-rule profiler.
+
+    NASA Rule 7: Stack count bounded by max_stacks.
+    """
+
+    def __init__(self, enabled: bool = False, track_memory: bool = True, max_stacks: int = 10000):
+        assert max_stacks > 0, "max_stacks must be positive"
+        self.enabled = False
+        self.track_memory = track_memory
+        self.max_stacks = max_stacks
+        self._stacks: Dict[Tuple[str, ...], FrameStats] = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+        self.dropped_stacks = 0
+        if enabled:
+            self.enable()
+
+    def enable(self, track_memory: Optional[bool] = None) -> None:
+        """Start recording; starts tracemalloc if memory tracking is on."""
+        if track_memory is not None:
+            self.track_memory = track_memory
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; stops tracemalloc only if this profiler started it."""
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self) -> None:
+        """Discard all recorded stacks."""
+        with self._lock:
+            self._stacks.clear()
+            self.dropped_stacks = 0
+
+    def profile(self, detector: str, rule: str = 'total', nodes: int = 0):
+        """Context manager measuring one detector/rule invocation."""
+        if not self.enabled:
+            return _NO_OP
+        return self._measure(f"{detector}:{rule}", nodes)
+
+    @contextmanager
+    def _measure(self, label: str, nodes: int) -> Iterator[_Frame]:
+        """Push a frame, yield it (callers may add nodes) and record on exit."""
+        stack = self._frame_stack()
+        frame = _Frame(label, nodes, self._traced_memory())
+        stack.append(frame)
+        try:
+            yield frame
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            allocated = max(0, self._traced_memory() - frame.memory_start)
+            path = tuple(active.label for active in stack)
+            stack.pop()
+            if stack:
+                stack[-1].child_time += elapsed
+            self._record(path, elapsed, elapsed - frame.child_time, frame.nodes, allocated)
+
+    def add_nodes(self, count: int) -> None:
+        """Attribute visited AST nodes to the innermost active frame."""
+        if self.enabled:
+            stack = self._frame_stack()
+            if stack:
+                stack[-1].nodes += count
+
+    def get_report(self) -> Dict[str, Any]:
+        """Per-detector, per-rule stats aggregated over all call stacks."""
+        detectors: Dict[str, Dict[str, FrameStats]] = {}
+        with self._lock:
+            for path, stats in self._stacks.items():
+                detector, _, rule = path[-1].partition(':')
+                merged = detectors.setdefault(detector, {}).setdefault(rule, FrameStats())
+                merged.calls += stats.calls
+                merged.wall_time += stats.wall_time
+                merged.self_time += stats.self_time
+                merged.nodes_visited += stats.nodes_visited
+                merged.allocated_bytes += stats.allocated_bytes
+            dropped = self.dropped_stacks
+
+        return {
+            'enabled': self.enabled,
+            'memory_tracking': self.track_memory and tracemalloc.is_tracing(),
+            'dropped_stacks': dropped,
+            'detectors': {
+                detector: {rule: stats.to_dict() for rule, stats in sorted(rules.items())}
+                for detector, rules in sorted(detectors.items())
+            },
+        }
+
+    def get_hotspots(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Call stacks with the most self time, descending."""
+        with self._lock:
+            ranked = sorted(self._stacks.items(), key=lambda item: item[1].self_time, reverse=True)[:limit]
+        return [{'stack': ';'.join(path), **stats.to_dict()} for path, stats in ranked]
+
+    def to_collapsed_stacks(self) -> List[str]:
+        """Collapsed-stack lines (``a;b;c <self time in microseconds>``)."""
+        with self._lock:
+            items = sorted(self._stacks.items())
+        lines = []
+        for path, stats in items:
+            micros = int(round(stats.self_time * 1_000_000))
+            if micros > 0:
+                lines.append(f"{';'.join(_sanitize(label) for label in path)} {micros}")
+        return lines
+
+    def write_collapsed(self, output_path: Union[str, Path]) -> Path:
+        """Write collapsed stacks for flamegraph tools; returns the path."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for line in self.to_collapsed_stacks():
+                f.write(line + '\n')
+        logger.info(f"Collapsed profile written to {output_path}")
+        return output_path
+
+    def _record(self, path: Tuple[str, ...], wall_time: float, self_time: float,
+                nodes: int, allocated: int) -> None:
+        """Fold one measurement into its stack's stats."""
+        with self._lock:
+            stats = self._stacks.get(path)
+            if stats is None:
+                if len(self._stacks) >= self.max_stacks:
+                    self.dropped_stacks += 1
+                    return
+                stats = self._stacks[path] = FrameStats()
+            stats.calls += 1
+            stats.wall_time += wall_time
+            stats.self_time += self_time
+            stats.nodes_visited += nodes
+            stats.allocated_bytes += allocated
+
+    def _frame_stack(self) -> List[_Frame]:
+        """Frame stack of the calling thread."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _traced_memory(self) -> int:
+        """Currently traced bytes, or 0 when tracemalloc is off."""
+        if self.track_memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return 0
+
+def _sanitize(label: str) -> str:
+    """Strip characters with meaning in the collapsed format."""
+    return label.replace(';', '_').replace(' ', '_')
+
+def get_process_memory_usage() -> Dict[str, Any]:
+    """Resident set size and traced heap of this process, in megabytes."""
+    usage: Dict[str, Any] = {}
+    try:
+        import psutil
+        usage['rss_mb'] = round(psutil.Process().memory_info().rss / (1024 * 1024), 2)
+    except ImportError:
+        import resource
+        usage['max_rss_mb'] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2)
+    except Exception as e:
+        logger.debug(f"Memory usage unavailable: {e}")
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        usage['traced_current_mb'] = round(current / (1024 * 1024), 2)
+        usage['traced_peak_mb'] = round(peak / (1024 * 1024), 2)
+    return usage
+
+_global_detector_profiler: Optional[DetectorProfiler] = None
+_profiler_lock = threading.Lock()
+
+def get_global_detector_profiler() -> DetectorProfiler:
+    """Process-wide profiler shared by detectors, orchestrator and CLI."""
+    global _global_detector_profiler
+    with _profiler_lock:
+        if _global_detector_profiler is None:
+            _global_detector_profiler = DetectorProfiler()
+        return _global_detector_profiler
@@ -19,6 +19,8 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
 import threading
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class CacheEntry:
     """Single cache entry with metadata."""
@@ -233,6 +235,11 @@ class ASTCache:
 
         logger.info("Cache cleared")
 
+    def memory_footprint(self) -> Dict[str, int]:
+        """Entries and bytes held, for the memory monitor's cache namespace report."""
+        with self.cache_lock:
+            return {"entries": len(self.memory_cache), "size_bytes": self.cache_stats["size_bytes"]}
+
     def get_cache_statistics(self) -> Dict[str, Any]:
         """Get cache performance statistics."""
 
@@ -510,25 +517,47 @@ class ASTCache:
 
         logger.debug(f"Saved {saved_count} cache entries to disk")
 
-# Global cache instance
-ast_cache = ASTCache()
+# Global cache instance, created on first use: construction scans the cache
+# directory, which importing this module should not pay for.
+_global_ast_cache: Optional[ASTCache] = None
+_global_ast_cache_lock = threading.Lock()
+
+def get_global_ast_cache() -> ASTCache:
+    """Get (creating on first call) the process-wide AST cache."""
+    global _global_ast_cache
+    if _global_ast_cache is None:
+        with _global_ast_cache_lock:
+            if _global_ast_cache is None:
+                _global_ast_cache = ASTCache()
+                try:
+                    from ..optimization.memory_monitor import register_cache_namespace
+                    register_cache_namespace('ast_cache', _global_ast_cache.memory_footprint)
+                except ImportError:
+                    pass
+    return _global_ast_cache
+
+def __getattr__(name: str) -> Any:
+    """Keep ``ast_cache`` importable as a module attribute (PEP 562)."""
+    if name == "ast_cache":
+        return get_global_ast_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_cached_ast(file_path: Union[str, Path]) -> Optional[ast.AST]:
     """Get cached AST for file (convenience function)."""
-    return ast_cache.get_ast(file_path)
+    return get_global_ast_cache().get_ast(file_path)
 
 def cache_ast(file_path: Union[str, Path], ast_tree: ast.AST, analysis_duration_ms: float = 0.0):
     """Cache AST for file (convenience function)."""
-    ast_cache.put_ast(file_path, ast_tree, analysis_duration_ms)
+    get_global_ast_cache().put_ast(file_path, ast_tree, analysis_duration_ms)
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics (convenience function)."""
-    return ast_cache.get_cache_statistics()
+    return get_global_ast_cache().get_cache_statistics()
 
 def optimize_cache():
     """Optimize cache (convenience function)."""
-    ast_cache.optimize_cache()
+    get_global_ast_cache().optimize_cache()
 
 def clear_cache():
     """Clear cache (convenience function)."""
-    ast_cache.clear_cache()
+    get_global_ast_cache().clear_cache()
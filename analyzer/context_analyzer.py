@@ -1,5 +1,3 @@
-from src.constants.base import MAXIMUM_FILE_LENGTH_LINES, MAXIMUM_GOD_OBJECTS_ALLOWED, MAXIMUM_NESTED_DEPTH, MAXIMUM_RETRY_ATTEMPTS
-
 """Provides context classification and domain-specific analysis for accurate
 god object detection and connascence analysis. Reduces false positives by
 understanding the purpose and domain of code structures.
@@ -11,6 +9,8 @@ from enum import Enum
 import re
 from typing import Dict, List, Optional, Set
 
+from src.constants.base import MAXIMUM_FILE_LENGTH_LINES, MAXIMUM_GOD_OBJECTS_ALLOWED, MAXIMUM_NESTED_DEPTH, MAXIMUM_RETRY_ATTEMPTS
+
 class ClassContext(Enum):
     """Classification of class contexts for domain-specific analysis."""
 
@@ -147,6 +147,13 @@ class ContextAnalyzer:
             },
         }
 
+    def analyze_from_data(self, data) -> List[ClassAnalysis]:
+        """Context analysis of every class in a pre-collected fact table (ASTNodeData)."""
+        return [
+            self.analyze_class_context(class_node, data.source_lines, data.file_path)
+            for class_node in data.nodes_of(ast.ClassDef)
+        ]
+
     def analyze_class_context(self, class_node: ast.ClassDef, source_lines: List[str], file_path: str) -> ClassAnalysis:
         """Perform comprehensive context analysis of a class."""
 
@@ -798,6 +798,8 @@ def _add_pipeline_arguments(parser):
     parser.add_argument("--export-correlations", type=str, help="Export correlation data to specified file path")
     parser.add_argument("--export-recommendations", type=str, help="Export smart recommendations to specified file path")
     parser.add_argument("--phase-timing", action="store_true", help="Display detailed phase timing information")
+    parser.add_argument("--profile", type=str, metavar="PATH",
+                        help="Profile detectors and write collapsed stacks (flamegraph input) to PATH")
 
 def main():
     """Main entry point for command-line execution."""
@@ -811,6 +813,7 @@ def main():
     if include_duplication and DUPLICATION_ANALYZER_AVAILABLE:
         analyzer.duplication_analyzer.similarity_threshold = args.duplication_threshold
 
+    profiler = _start_profiling(args)
     try:
         result = _run_analysis(analyzer, args, policy, include_duplication)
         _handle_output(result, args)
@@ -819,6 +822,33 @@ def main():
 
     except Exception as e:
         _handle_error(e, args)
+    finally:
+        _finish_profiling(profiler, args)
+
+def _start_profiling(args):
+    """Enable the shared detector profiler when --profile is given."""
+    if not args.profile:
+        return None
+    try:
+        from .architecture.detector_profiler import get_global_detector_profiler
+    except ImportError:
+        from architecture.detector_profiler import get_global_detector_profiler
+    profiler = get_global_detector_profiler()
+    profiler.reset()
+    profiler.enable()
+    return profiler
+
+def _finish_profiling(profiler, args):
+    """Write collapsed-stack profile output and stop profiling."""
+    if profiler is None:
+        return
+    try:
+        profiler.write_collapsed(args.profile)
+        print(f"Detector profile written to: {args.profile}", file=sys.stderr)
+    except OSError as e:
+        print(f"Failed to write detector profile: {e}", file=sys.stderr)
+    finally:
+        profiler.disable()
 
 def _resolve_and_validate_policy(args):
     """Resolve and validate policy configuration."""
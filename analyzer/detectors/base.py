@@ -1,15 +1,18 @@
-from src.constants.base import MAXIMUM_NESTED_DEPTH
-
 """Provides common functionality for all specialized connascence detectors.
 Supports two-phase analysis: data collection and violation analysis.
 """
 
 import ast
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Protocol
+from typing import TYPE_CHECKING, List, Dict, Any, Protocol
+
+from src.constants.base import MAXIMUM_NESTED_DEPTH
 
 from ..utils.types import ConnascenceViolation
 
+if TYPE_CHECKING:
+    from ..optimization.unified_visitor import ASTNodeData
+
 class DetectorInterface(Protocol):
     """
     Protocol defining the interface for two-phase detector analysis.
@@ -95,8 +98,9 @@ class DetectorBase(ABC):
         """
         New two-phase method: Analyze violations from pre-collected data.
         
-        Default implementation falls back to legacy detect_violations.
-        Detectors should override this for performance optimization.
+        Default implementation falls back to legacy detect_violations on
+        the fact table's tree. Detectors should override this to read the
+        indexed nodes instead of walking the tree again.
         
         NASA Rule 4: Function under 60 lines
         NASA Rule 5: Input validation
@@ -114,7 +118,10 @@ class DetectorBase(ABC):
         self._pool_reuse_count += 1
         
         # Fallback to legacy method - subclasses should override
-        return []
+        tree = getattr(collected_data, 'tree', None)
+        if tree is None:
+            return []
+        return self.detect_violations(tree)
 
     def get_line_content(self, node: ast.AST) -> str:
         """Get the full line content containing the node."""
@@ -127,21 +134,33 @@ class DetectorBase(ABC):
         line_content = self.source_lines[node.lineno - 1] if node.lineno <= len(self.source_lines) else ""
         return any(keyword in line_content for keyword in ["if ", "elif ", "while ", "assert "])
 
-    def reset_for_reuse(self, file_path: str, source_lines: List[str]):
+    # Per-file collections cleared by reset(); subclasses list their own
+    FILE_STATE_FIELDS: tuple = ()
+
+    def reset(self, file_path: str, source_lines: List[str]):
         """
-        Reset detector state for pool reuse.
-        
+        Point a reused detector at a new file.
+
+        Replaces re-initialization: configuration and compiled patterns are
+        kept, per-file collections (FILE_STATE_FIELDS) are cleared.
+
         NASA Rule 4: Function under 60 lines
         NASA Rule 5: Input validation
         """
         assert isinstance(file_path, str), "file_path must be string"
         assert isinstance(source_lines, list), "source_lines must be list"
-        
+
         self.file_path = file_path
         self.source_lines = source_lines
         self.violations = []
+        for field_name in self.FILE_STATE_FIELDS:
+            getattr(self, field_name).clear()
         self._pool_reuse_count += 1
 
+    def reset_for_reuse(self, file_path: str, source_lines: List[str]):
+        """Reset detector state for pool reuse (alias of reset)."""
+        self.reset(file_path, source_lines)
+
     def get_pool_metrics(self) -> Dict[str, Any]:
         """Get detector-specific pool metrics."""
         return {
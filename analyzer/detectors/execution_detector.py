@@ -14,6 +14,10 @@ from .base import DetectorBase
 
 class ExecutionDetector(DetectorBase):
     """Detects execution-based coupling and control flow dependencies."""
+
+    FILE_STATE_FIELDS = ('global_assignments', 'global_reads', 'exception_handlers', 'function_calls',
+                         'control_flow_nodes', 'import_statements', 'stateful_variables',
+                         'initialization_patterns')
     
     def __init__(self, file_path: str, source_lines: List[str]):
         super().__init__(file_path, source_lines)
@@ -4,12 +4,22 @@ God Object Detector
 Detects God Object violations - classes that are too large and violate Single Responsibility Principle.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import TYPE_CHECKING, List
 import ast
 
 from analyzer.utils.types import ConnascenceViolation
 from .base import DetectorBase
 
+if TYPE_CHECKING:
+    from analyzer.optimization.unified_visitor import ASTNodeData
+
+@lru_cache(maxsize=1)
+def _get_context_analyzer():
+    """Shared ContextAnalyzer; it holds only static classification tables."""
+    from analyzer.context_analyzer import ContextAnalyzer
+    return ContextAnalyzer()
+
 class GodObjectDetector(DetectorBase):
     """Detects classes that violate Single Responsibility Principle."""
     
@@ -41,6 +51,26 @@ class GodObjectDetector(DetectorBase):
         assert isinstance(self.violations, list), "violations must be a list"
         return self.violations
     
+    def analyze_from_data(self, collected_data: 'ASTNodeData') -> List[ConnascenceViolation]:
+        """
+        Detect god objects from the classes indexed in a pre-collected fact table.
+        
+        Args:
+            collected_data: Pre-collected AST data from unified visitor
+            
+        Returns:
+            List of god object violations
+        """
+        # NASA Rule 5: Input validation
+        assert collected_data is not None, "collected_data cannot be None"
+        
+        self.violations.clear()
+        
+        for node in collected_data.nodes_of(ast.ClassDef):
+            self._analyze_class(node)
+        
+        return self.violations
+    
     def _analyze_class(self, node: ast.ClassDef) -> None:
         """Analyze a class for god object patterns."""
         # NASA Rule 5: Input validation assertions
@@ -49,9 +79,7 @@ class GodObjectDetector(DetectorBase):
         
         # Try context-aware analysis first
         try:
-            from analyzer.context_analyzer import ContextAnalyzer
-            
-            context_analyzer = ContextAnalyzer()
+            context_analyzer = _get_context_analyzer()
             class_analysis = context_analyzer.analyze_class_context(node, self.source_lines, self.file_path)
             
             # NASA Rule 1: Use guard clause to reduce nesting
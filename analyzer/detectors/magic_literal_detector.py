@@ -20,6 +20,8 @@ except ImportError as e:
 
 class MagicLiteralDetector(DetectorBase, ConfigurableDetectorMixin):
     """Detects magic literals that should be named constants."""
+
+    FILE_STATE_FIELDS = ('magic_literals',)
     
     def __init__(self, file_path: str, source_lines: List[str]):
         DetectorBase.__init__(self, file_path, source_lines)
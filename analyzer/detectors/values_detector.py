@@ -23,6 +23,8 @@ class ValuesDetector(DetectorBase, ConfigurableDetectorMixin):
     Detects value-based coupling and shared constant dependencies.
     Refactored to eliminate Connascence of Values through configuration externalization.
     """
+
+    FILE_STATE_FIELDS = ('string_literals', 'numeric_literals', 'constant_assignments', 'configuration_patterns')
     
     def __init__(self, file_path: str, source_lines: List[str]):
         DetectorBase.__init__(self, file_path, source_lines)
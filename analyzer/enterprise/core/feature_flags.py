@@ -17,8 +17,8 @@ import logging
 from dataclasses import dataclass
 from enum import Enum
 
-from src.constants.base import MAXIMUM_NESTED_DEPTH, NASA_POT10_MINIMUM_COMPLIANCE_THRESHOLD
-logger = loggi, NASA_POT10_TARGET_COMPLIANCE_THRESHOLDng.getLogger(__name__)
+from src.constants.base import MAXIMUM_NESTED_DEPTH, NASA_POT10_MINIMUM_COMPLIANCE_THRESHOLD, NASA_POT10_TARGET_COMPLIANCE_THRESHOLD
+logger = logging.getLogger(__name__)
 
 class FeatureState(Enum):
     """Enterprise feature states."""
@@ -0,0 +1,317 @@
+"""
+Shared HTTP client for remote advisory sources.
+Batches OSV and GitHub advisory queries, caps concurrency, retries with
+backoff and keeps a disk response cache revalidated by ETag.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+ADVISORY_CACHE_VERSION = 1
+
+OSV_BATCH_SIZE = 1000          # querybatch limit
+GITHUB_AFFECTS_BATCH_SIZE = 50  # packages per advisories query, keeps URLs short
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+KEPT_HEADERS = ("ETag", "Last-Modified", "Link")
+
+class AdvisoryRequestError(Exception):
+    """A request still failed after all retries."""
+
+class AdvisoryResponseCache:
+    """
+    Disk cache of advisory responses, one JSON file per key.
+
+    Entries younger than ttl_seconds are served without a request. Older
+    entries keep their ETag/Last-Modified so the client can revalidate
+    them with a conditional request.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], ttl_seconds: float = 6 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._memory: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Stable key for a request description."""
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached entry, fresh or stale; None if absent or unreadable."""
+        entry = self._memory.get(key)
+        if entry is None:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if entry.get("version") != ADVISORY_CACHE_VERSION:
+                return None
+            self._memory[key] = entry
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return time.time() - entry.get("stored_at", 0) < self.ttl_seconds
+
+    def put(self, key: str, body: Any, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> Dict[str, Any]:
+        """Store a response body with its validators."""
+        entry = {
+            "version": ADVISORY_CACHE_VERSION,
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        self._memory[key] = entry
+        path = self._path(key)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+        return entry
+
+    def touch(self, key: str, entry: Dict[str, Any]) -> None:
+        """Mark a revalidated entry fresh again."""
+        self.put(key, entry["body"], entry.get("etag"), entry.get("last_modified"))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+class AdvisoryClient:
+    """
+    Pooled client for OSV and GitHub advisory lookups.
+
+    Use as an async context manager; all requests share one session whose
+    connector and semaphore cap in-flight requests at max_concurrency.
+    """
+
+    def __init__(self,
+                 cache: AdvisoryResponseCache,
+                 osv_api_url: str = "https://api.osv.dev/v1",
+                 github_api_url: str = "https://api.github.com",
+                 github_api_key: Optional[str] = None,
+                 max_concurrency: int = 8,
+                 max_retries: int = 3,
+                 backoff_seconds: float = 0.5,
+                 timeout_seconds: float = 30.0):
+        assert max_concurrency > 0, "max_concurrency must be positive"
+        assert max_retries >= 0, "max_retries cannot be negative"
+        self.cache = cache
+        self.osv_api_url = osv_api_url.rstrip("/")
+        self.github_api_url = github_api_url.rstrip("/")
+        self.github_api_key = github_api_key
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout_seconds = timeout_seconds
+        self.stats = {"requests": 0, "cache_hits": 0, "revalidated": 0, "retries": 0, "failures": 0}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AdvisoryClient":
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds))
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def query_osv(self, queries: Sequence[Tuple[str, str, Optional[str]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Full OSV advisories for each (ecosystem, name, version) query.
+
+        Uncached queries go out through /querybatch; advisory documents are
+        fetched once per id and reused while their modified stamp matches.
+        """
+        refs: List[Optional[List[Dict[str, str]]]] = [None] * len(queries)
+        pending: List[int] = []
+        for index, query in enumerate(queries):
+            entry = self.cache.get(self.cache.make_key("osv-query", self.osv_api_url, *query))
+            if entry is not None and self.cache.is_fresh(entry):
+                self.stats["cache_hits"] += 1
+                refs[index] = entry["body"]
+            else:
+                pending.append(index)
+
+        batches = [pending[start:start + OSV_BATCH_SIZE] for start in range(0, len(pending), OSV_BATCH_SIZE)]
+        for batch, results in zip(batches, await asyncio.gather(
+                *(self._osv_querybatch([queries[index] for index in batch]) for batch in batches))):
+            for index, vulns in zip(batch, results):
+                refs[index] = vulns
+                self.cache.put(self.cache.make_key("osv-query", self.osv_api_url, *queries[index]), vulns)
+
+        wanted = {ref["id"]: ref.get("modified") for query_refs in refs for ref in query_refs or []}
+        documents = dict(zip(wanted, await asyncio.gather(
+            *(self._osv_vulnerability(vuln_id, modified) for vuln_id, modified in wanted.items()))))
+        return [[documents[ref["id"]] for ref in query_refs or [] if documents.get(ref["id"])]
+                for query_refs in refs]
+
+    async def query_github_advisories(self, ecosystem: str, packages: Sequence[Tuple[str, Optional[str]]]
+                                      ) -> Dict[str, List[Dict[str, Any]]]:
+        """Reviewed GitHub advisories per package name, batched with the affects filter."""
+        names = sorted({name for name, _ in packages})
+        affects = [f"{name}@{version}" if version else name for name, version in sorted(set(packages), key=lambda package: (package[0], package[1] or ""))]
+        by_package: Dict[str, List[Dict[str, Any]]] = {name: [] for name in names}
+        batches = [affects[start:start + GITHUB_AFFECTS_BATCH_SIZE]
+                   for start in range(0, len(affects), GITHUB_AFFECTS_BATCH_SIZE)]
+        for advisories in await asyncio.gather(*(self._github_batch(ecosystem, batch) for batch in batches)):
+            for advisory in advisories:
+                for vulnerability in advisory.get("vulnerabilities") or []:
+                    name = (vulnerability.get("package") or {}).get("name")
+                    if name in by_package and advisory not in by_package[name]:
+                        by_package[name].append(advisory)
+        return by_package
+
+    async def get_json(self, url: str, params: Optional[Dict[str, str]] = None,
+                       headers: Optional[Dict[str, str]] = None) -> Tuple[Any, Dict[str, str]]:
+        """
+        GET with TTL caching and ETag/Last-Modified revalidation.
+        Returns the body and the response headers that matter for paging.
+        """
+        key = self.cache.make_key("GET", url, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.stats["cache_hits"] += 1
+            return entry["body"]["data"], entry["body"]["headers"]
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        status, data, response_headers = await self._request("GET", url, params=params, headers=request_headers)
+        if status == 304 and entry is not None:
+            self.stats["revalidated"] += 1
+            self.cache.touch(key, entry)
+            return entry["body"]["data"], entry["body"]["headers"]
+
+        kept_headers = {"link": response_headers.get("Link", "")}
+        self.cache.put(key, {"data": data, "headers": kept_headers},
+                       response_headers.get("ETag"), response_headers.get("Last-Modified"))
+        return data, kept_headers
+
+    async def _osv_querybatch(self, queries: List[Tuple[str, str, Optional[str]]]) -> List[List[Dict[str, str]]]:
+        """One /querybatch call, following per-query page tokens."""
+        payload = [self._osv_query(query) for query in queries]
+        _, data, _ = await self._request("POST", f"{self.osv_api_url}/querybatch", json_body={"queries": payload})
+        results = [list(result.get("vulns") or []) for result in data.get("results", [])]
+        results += [[] for _ in range(len(queries) - len(results))]
+
+        tokens = {index: result.get("next_page_token")
+                  for index, result in enumerate(data.get("results", [])) if result.get("next_page_token")}
+        while tokens:
+            indices = list(tokens)
+            _, data, _ = await self._request("POST", f"{self.osv_api_url}/querybatch", json_body={
+                "queries": [dict(payload[index], page_token=tokens[index]) for index in indices]})
+            tokens = {}
+            for index, result in zip(indices, data.get("results", [])):
+                results[index].extend(result.get("vulns") or [])
+                if result.get("next_page_token"):
+                    tokens[index] = result["next_page_token"]
+        return [[{"id": vuln["id"], "modified": vuln.get("modified")} for vuln in vulns] for vulns in results]
+
+    async def _osv_vulnerability(self, vuln_id: str, modified: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Advisory document; a cached copy with the same modified stamp needs no request."""
+        url = f"{self.osv_api_url}/vulns/{vuln_id}"
+        entry = self.cache.get(self.cache.make_key("GET", url, None))
+        if entry is not None and modified and (entry["body"]["data"] or {}).get("modified") == modified:
+            self.stats["cache_hits"] += 1
+            return entry["body"]["data"]
+        try:
+            document, _ = await self.get_json(url)
+        except AdvisoryRequestError as e:
+            logger.warning(f"Failed to fetch OSV advisory {vuln_id}: {e}")
+            return None
+        return document
+
+    async def _github_batch(self, ecosystem: str, affects: List[str]) -> List[Dict[str, Any]]:
+        """All pages of one advisories query."""
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.github_api_key:
+            headers["Authorization"] = f"token {self.github_api_key}"
+        url: Optional[str] = f"{self.github_api_url}/advisories"
+        params: Optional[Dict[str, str]] = {"type": "reviewed", "ecosystem": ecosystem,
+                                            "affects": ",".join(affects), "per_page": "100"}
+        advisories: List[Dict[str, Any]] = []
+        while url:
+            page, headers_seen = await self.get_json(url, params=params, headers=headers)
+            advisories.extend(page or [])
+            url, params = self._next_link(headers_seen.get("link", "")), None
+        return advisories
+
+    async def _request(self, method: str, url: str, params: Optional[Dict[str, str]] = None,
+                       headers: Optional[Dict[str, str]] = None,
+                       json_body: Any = None) -> Tuple[int, Any, Dict[str, str]]:
+        """Send one request under the concurrency cap, retrying transient failures."""
+        assert self._session is not None, "AdvisoryClient must be used as an async context manager"
+        last_error = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats["retries"] += 1
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    self.stats["requests"] += 1
+                    async with self._session.request(method, url, params=params, headers=headers,
+                                                     json=json_body) as response:
+                        kept_headers = {name: response.headers[name] for name in KEPT_HEADERS
+                                        if name in response.headers}
+                        if response.status == 304:
+                            return 304, None, kept_headers
+                        if response.status < 400:
+                            return response.status, await response.json(content_type=None), kept_headers
+                        last_error = f"HTTP {response.status}"
+                        if response.status not in RETRY_STATUSES:
+                            break
+                        retry_after = response.headers.get("Retry-After")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = f"{type(e).__name__}: {e}"
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+
+        self.stats["failures"] += 1
+        raise AdvisoryRequestError(f"{method} {url} failed: {last_error}")
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Exponential backoff with jitter, honouring a numeric Retry-After."""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), 60.0)
+        return self.backoff_seconds * (2 ** attempt) * (0.5 + random.random() / 2)
+
+    @staticmethod
+    def _osv_query(query: Tuple[str, str, Optional[str]]) -> Dict[str, Any]:
+        ecosystem, name, version = query
+        payload: Dict[str, Any] = {"package": {"name": name, "ecosystem": ecosystem}}
+        if version:
+            payload["version"] = version
+        return payload
+
+    @staticmethod
+    def _next_link(link_header: str) -> Optional[str]:
+        """URL of rel="next" in a Link header."""
+        for part in link_header.split(","):
+            section = part.split(";")
+            if len(section) > 1 and section[1].strip() == 'rel="next"':
+                return section[0].strip()[1:-1]
+        return None
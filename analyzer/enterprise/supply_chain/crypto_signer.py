@@ -7,12 +7,25 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import base64
-import hashlib
 import json
 import os
 import subprocess
 import tempfile
 
+from .digest_cache import file_sha256, get_digest_cache
+from .evidence_packager import path_exists
+from .merkle import MerkleTree, merkle_leaf_hash, verify_inclusion
+
+def _file_name(file_path: Optional[str]) -> Optional[str]:
+    return Path(file_path).name if file_path else None
+
+def _resolve_proof_reference(proof_dir: Path, proof: Dict[str, Any], name_key: str, path_key: str) -> Optional[str]:
+    """File referenced by an inclusion proof: beside the proof if present, else the recorded path."""
+    name = proof.get(name_key)
+    if name and path_exists(str(proof_dir / name)):
+        return str(proof_dir / name)
+    return proof.get(path_key)
+
 class CryptographicSigner:
     """Enterprise cryptographic signing system with cosign integration."""
     
@@ -39,6 +52,11 @@ class CryptographicSigner:
         self.ca_cert_path = config.get('ca_cert_path')
         self.intermediate_cert_path = config.get('intermediate_cert_path')
         
+        # Batch signing: 'merkle' signs one root over all artifact digests,
+        # 'per_artifact' keeps one signature per artifact for compatibility
+        self.signing_mode = config.get('signing_mode', 'merkle')
+        assert self.signing_mode in ('merkle', 'per_artifact'), f"Unknown signing mode: {self.signing_mode}"
+        
     def sign_artifacts(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Sign multiple artifacts with cryptographic signatures."""
         
@@ -47,27 +65,22 @@ class CryptographicSigner:
             'signer_info': self._get_signer_info(),
             'artifacts': [],
             'signatures_created': 0,
+            'artifacts_signed': 0,  # artifacts covered; one Merkle signature covers many
             'verification_successful': 0,
             'errors': []
         }
         
-        for artifact in artifacts:
-            try:
-                result = self._sign_single_artifact(artifact)
-                signing_results['artifacts'].append(result)
-                
-                if result.get('signature_created'):
-                    signing_results['signatures_created'] += 1
-                    
-                if result.get('verification_passed'):
-                    signing_results['verification_successful'] += 1
-                    
-            except Exception as e:
-                error_info = {
-                    'artifact': artifact.get('path', 'unknown'),
-                    'error': str(e)
-                }
-                signing_results['errors'].append(error_info)
+        # Hash all artifacts up front in parallel; each file is read once
+        get_digest_cache().digests_many(artifact.get('path') for artifact in artifacts)
+        
+        if self.signing_mode == 'merkle':
+            # Container images are signed in the registry by cosign, not as blobs
+            containers = [artifact for artifact in artifacts if artifact.get('format') == 'container']
+            blobs = [artifact for artifact in artifacts if artifact.get('format') != 'container']
+            self._sign_artifacts_merkle(blobs, signing_results)
+            self._sign_each_artifact(containers, signing_results)
+        else:
+            self._sign_each_artifact(artifacts, signing_results)
         
         # Save signing results
         results_path = self.output_dir / "signing-results.json"
@@ -125,6 +138,162 @@ class CryptographicSigner:
         
         return result
     
+    def _sign_each_artifact(self, artifacts: List[Dict[str, Any]], signing_results: Dict[str, Any]) -> None:
+        """Sign artifacts one at a time, each with its own signature."""
+        
+        for artifact in artifacts:
+            try:
+                result = self._sign_single_artifact(artifact)
+                signing_results['artifacts'].append(result)
+                
+                if result.get('signature_created'):
+                    signing_results['signatures_created'] += 1
+                    signing_results['artifacts_signed'] += 1
+                    
+                if result.get('verification_passed'):
+                    signing_results['verification_successful'] += 1
+                    
+            except Exception as e:
+                error_info = {
+                    'artifact': artifact.get('path', 'unknown'),
+                    'error': str(e)
+                }
+                signing_results['errors'].append(error_info)
+    
+    def _sign_artifacts_merkle(self, artifacts: List[Dict[str, Any]], signing_results: Dict[str, Any]) -> None:
+        """Sign a Merkle root over all artifact digests once and emit inclusion proofs."""
+        
+        leaves = []
+        for artifact in artifacts:
+            artifact_path = artifact.get('path')
+            artifact_hash = self._calculate_file_hash(artifact_path) if artifact_path else ''
+            if not artifact_hash:
+                signing_results['errors'].append({
+                    'artifact': artifact_path or 'unknown',
+                    'error': f"Artifact path not found: {artifact_path}"
+                })
+                continue
+            name = artifact.get('name') or Path(artifact_path).name
+            leaves.append((artifact_path, name, artifact_hash))
+        
+        if not leaves:
+            return
+        
+        tree = MerkleTree([merkle_leaf_hash(name, artifact_hash) for _, name, artifact_hash in leaves])
+        statement = {
+            'statement_version': '1.0',
+            'hash_algorithm': 'sha256',
+            'leaf_encoding': 'sha256(0x00 || artifact_sha256 || utf8(name))',
+            'tree_size': tree.size,
+            'root_hash': tree.root.hex(),
+            'created': datetime.now(timezone.utc).isoformat()
+        }
+        statement_path = self.output_dir / f"merkle-root-{tree.root.hex()[:16]}.json"
+        with open(statement_path, 'w', encoding='utf-8') as f:
+            json.dump(statement, f, indent=2, ensure_ascii=False)
+        
+        # One signature operation covers every artifact in the tree
+        try:
+            root_result = self._sign_single_artifact({'path': str(statement_path), 'format': 'merkle-root'})
+        except Exception as e:
+            signing_results['errors'].append({'artifact': str(statement_path), 'error': str(e)})
+            return
+        
+        signing_results['merkle_root'] = {
+            'statement_path': str(statement_path),
+            'root_hash': statement['root_hash'],
+            'tree_size': tree.size,
+            'signature_created': bool(root_result.get('signature_created')),
+            'verification_passed': bool(root_result.get('verification_passed')),
+            'signing_method': root_result.get('signing_method'),
+            'signature_path': root_result.get('signature_path'),
+            'certificate_path': root_result.get('certificate_path'),
+            'metadata_path': root_result.get('metadata_path'),
+            'error': root_result.get('error')
+        }
+        
+        for index, (artifact_path, name, artifact_hash) in enumerate(leaves):
+            proof = {
+                'proof_version': '1.0',
+                'artifact_name': name,
+                'artifact_sha256': artifact_hash,
+                'leaf_index': index,
+                'tree_size': tree.size,
+                'root_hash': statement['root_hash'],
+                'audit_path': tree.proof(index),
+                # File names are resolved next to the proof first, so a proof
+                # copied with its statement verifies anywhere; paths are the fallback
+                'statement_file': statement_path.name,
+                'signature_file': _file_name(root_result.get('signature_path')),
+                'certificate_file': _file_name(root_result.get('certificate_path')),
+                'statement_path': str(statement_path),
+                'signature_path': root_result.get('signature_path'),
+                'certificate_path': root_result.get('certificate_path')
+            }
+            proof_path = f"{artifact_path}.proof.json"
+            with open(proof_path, 'w', encoding='utf-8') as f:
+                json.dump(proof, f, indent=2, ensure_ascii=False)
+            
+            signing_results['artifacts'].append({
+                'artifact_path': artifact_path,
+                'artifact_name': name,
+                'artifact_hash': artifact_hash,
+                'signature_created': bool(root_result.get('signature_created')),
+                'verification_passed': bool(root_result.get('verification_passed')),
+                'signing_method': f"merkle/{root_result.get('signing_method')}",
+                'signature_path': root_result.get('signature_path'),
+                'certificate_path': root_result.get('certificate_path'),
+                'proof_path': proof_path,
+                'timestamp': statement['created']
+            })
+        
+        if root_result.get('signature_created'):
+            signing_results['signatures_created'] += 1
+            signing_results['artifacts_signed'] += len(leaves)
+        if root_result.get('verification_passed'):
+            signing_results['verification_successful'] += 1
+    
+    def verify_inclusion_proof(self,
+                               artifact_path: str,
+                               proof_path: Optional[str] = None,
+                               check_signature: bool = True) -> Dict[str, Any]:
+        """Verify one artifact against its inclusion proof and the signed Merkle root."""
+        
+        proof_path = proof_path or f"{artifact_path}.proof.json"
+        verification = {'artifact_path': artifact_path, 'valid': False, 'errors': []}
+        
+        try:
+            with open(proof_path, 'r', encoding='utf-8') as f:
+                proof = json.load(f)
+            proof_dir = Path(proof_path).parent
+            statement_path = _resolve_proof_reference(proof_dir, proof, 'statement_file', 'statement_path')
+            with open(statement_path, 'r', encoding='utf-8') as f:
+                statement = json.load(f)
+        except Exception as e:
+            verification['errors'].append(f"Cannot load proof: {e}")
+            return verification
+        
+        artifact_hash = self._calculate_file_hash(artifact_path)
+        if artifact_hash != proof['artifact_sha256']:
+            verification['errors'].append("Artifact digest does not match proof")
+        
+        if statement['root_hash'] != proof['root_hash'] or statement['tree_size'] != proof['tree_size']:
+            verification['errors'].append("Proof does not match signed statement")
+        
+        leaf = merkle_leaf_hash(proof['artifact_name'], proof['artifact_sha256'])
+        if not verify_inclusion(leaf, proof['leaf_index'], statement['tree_size'],
+                                proof['audit_path'], bytes.fromhex(statement['root_hash'])):
+            verification['errors'].append("Inclusion proof does not lead to the root")
+        
+        if check_signature and not self._verify_signature(
+                statement_path,
+                _resolve_proof_reference(proof_dir, proof, 'signature_file', 'signature_path'),
+                _resolve_proof_reference(proof_dir, proof, 'certificate_file', 'certificate_path')):
+            verification['errors'].append("Merkle root signature verification failed")
+        
+        verification['valid'] = not verification['errors']
+        return verification
+    
     def _sign_with_cosign(self, artifact_path: str, artifact: Dict[str, Any]) -> Dict[str, Any]:
         """Sign artifact using cosign."""
         
@@ -539,12 +708,7 @@ class CryptographicSigner:
     
     def _calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of file."""
-        
-        try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        except Exception:
-            return ''
+        return file_sha256(file_path)
     
     def create_signature_bundle(self, artifacts: List[Dict[str, Any]]) -> str:
         """Create a comprehensive signature bundle."""
@@ -0,0 +1,157 @@
+"""
+Shared file digest service for supply chain artifacts.
+Streams each file once in fixed-size chunks, feeding every requested hash
+algorithm in the same pass, and memoizes results by file identity.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+import hashlib
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_ENTRIES = 4096
+
+# Algorithms kept only for legacy checksums, never for security decisions
+LEGACY_ALGORITHMS = frozenset({'md5', 'sha1'})
+
+PathLike = Union[str, os.PathLike]
+# (real path, size, mtime_ns, inode)
+FileIdentity = Tuple[str, int, int, int]
+
+def _new_hash(algorithm: str):
+    if algorithm in LEGACY_ALGORITHMS:
+        return hashlib.new(algorithm, usedforsecurity=False)
+    return hashlib.new(algorithm)
+
+def _identity(real_path: str, stat: os.stat_result) -> FileIdentity:
+    return (real_path, stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+def compute_digests(file_path: PathLike, algorithms: Sequence[str] = ('sha256',),
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, str]:
+    """Hash a file with all algorithms in one pass, using a single reusable buffer."""
+    hashers = {algorithm: _new_hash(algorithm) for algorithm in algorithms}
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(file_path, 'rb', buffering=0) as f:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            chunk = view[:count]
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()}
+
+class FileDigestCache:
+    """Memoized multi-algorithm file digests keyed by (path, size, mtime_ns, inode)."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_workers: Optional[int] = None):
+        assert chunk_size > 0, "chunk_size must be positive"
+        assert max_entries > 0, "max_entries must be positive"
+        self.chunk_size = chunk_size
+        self.max_entries = max_entries
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 2)
+        self._entries: 'OrderedDict[FileIdentity, Dict[str, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'bytes_hashed': 0}
+
+    def digests(self, file_path: PathLike, algorithms: Sequence[str] = ('sha256',)) -> Dict[str, str]:
+        """Return {algorithm: hexdigest} for a file, hashing only what is not cached.
+
+        Raises OSError if the file cannot be read.
+        """
+        algorithms = tuple(dict.fromkeys(algorithm.lower() for algorithm in algorithms))
+        real_path = os.path.realpath(file_path)
+        before = os.stat(real_path)
+        key = _identity(real_path, before)
+
+        with self._lock:
+            cached = self._entries.get(key, {})
+            missing = [algorithm for algorithm in algorithms if algorithm not in cached]
+            if not missing:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return {algorithm: cached[algorithm] for algorithm in algorithms}
+            self.stats['misses'] += 1
+
+        computed = compute_digests(real_path, missing, self.chunk_size)
+        after = os.stat(real_path)
+
+        with self._lock:
+            self.stats['bytes_hashed'] += before.st_size
+            if _identity(real_path, after) != key:
+                # File changed underneath us; the digest describes neither version reliably
+                logger.debug("File changed while hashing, not caching: %s", real_path)
+                return computed
+            entry = self._entries.setdefault(key, {})
+            entry.update(computed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return {algorithm: entry[algorithm] for algorithm in algorithms}
+
+    def digest(self, file_path: PathLike, algorithm: str = 'sha256') -> str:
+        """Return a single hexdigest for a file."""
+        return self.digests(file_path, (algorithm,))[algorithm.lower()]
+
+    def digests_many(self, file_paths: Iterable[PathLike],
+                     algorithms: Sequence[str] = ('sha256',)) -> Dict[str, Dict[str, str]]:
+        """Hash many files in parallel; unreadable files map to an empty dict."""
+        unique_paths = list(dict.fromkeys(str(path) for path in file_paths if path))
+
+        def _safe_digests(path: str) -> Dict[str, str]:
+            try:
+                return self.digests(path, algorithms)
+            except OSError as e:
+                logger.debug("Cannot hash %s: %s", path, e)
+                return {}
+
+        if len(unique_paths) <= 1:
+            return {path: _safe_digests(path) for path in unique_paths}
+
+        # hashlib releases the GIL for large updates, so threads hash files concurrently
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_paths))) as executor:
+            return dict(zip(unique_paths, executor.map(_safe_digests, unique_paths)))
+
+    def invalidate(self, file_path: PathLike) -> None:
+        """Drop every cached entry for a path."""
+        real_path = os.path.realpath(file_path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == real_path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, 'entries': len(self._entries)}
+
+_shared_cache: Optional[FileDigestCache] = None
+_shared_lock = threading.Lock()
+
+def get_digest_cache() -> FileDigestCache:
+    """Process-wide digest cache shared by the packager, signer and provenance generator."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = FileDigestCache()
+        return _shared_cache
+
+def file_sha256(file_path: Optional[PathLike]) -> str:
+    """SHA256 of a file via the shared cache, or '' if it cannot be read."""
+    if not file_path:
+        return ''
+    try:
+        return get_digest_cache().digest(Path(file_path), 'sha256')
+    except OSError:
+        return ''
@@ -2,16 +2,18 @@ from src.constants.base import MAXIMUM_RETRY_ATTEMPTS
 
 import json
 import hashlib
+import io
+import os
 import zipfile
 import tarfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
-import tempfile
-import shutil
+from typing import BinaryIO, Dict, List, Any, Optional, Union
 import base64
 import uuid
 
+from .digest_cache import file_sha256, get_digest_cache
+
 def path_exists(file_path: Optional[str]) -> bool:
     """Check if file path exists."""
     if not file_path:
@@ -21,6 +23,103 @@ def path_exists(file_path: Optional[str]) -> bool:
     except Exception:
         return False
 
+PACKAGE_EXTENSIONS = {'zip': 'zip', 'tar': 'tar', 'tar.gz': 'tar.gz'}
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+class _HashingReader:
+    """File wrapper hashing bytes as the archive reads them."""
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self.hasher = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.hasher.update(data)
+        return data
+
+class _EvidenceArchiveWriter:
+    """Writes evidence straight into the package archive, hashing each entry inline.
+
+    Entries are streamed from their original locations, so nothing is staged on
+    disk and every source byte is read once. The archive is written under a
+    .partial name and moved into place on close.
+    """
+
+    def __init__(self, package_path: Path, package_format: str, compression_level: int):
+        self.package_path = package_path
+        self.partial_path = package_path.with_name(package_path.name + '.partial')
+        self.package_format = package_format
+        self.files: Dict[str, str] = {}  # arcname -> sha256
+
+        if package_format == 'zip':
+            self._zip = zipfile.ZipFile(self.partial_path, 'w', zipfile.ZIP_DEFLATED,
+                                        compresslevel=compression_level)
+            self._tar = None
+        else:
+            self._zip = None
+            if package_format == 'tar.gz':
+                self._tar = tarfile.open(self.partial_path, 'w:gz', compresslevel=compression_level)
+            else:
+                self._tar = tarfile.open(self.partial_path, 'w')
+
+    def add_file(self, source: Path, arcname: str) -> bool:
+        """Stream a file into the archive. Returns False if arcname was already added."""
+        if arcname in self.files:
+            return False
+
+        if self._zip is not None:
+            info = zipfile.ZipInfo.from_file(source, arcname)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            hasher = hashlib.sha256()
+            with open(source, 'rb') as src, self._zip.open(info, 'w') as dest:
+                for chunk in iter(lambda: src.read(STREAM_CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+                    dest.write(chunk)
+        else:
+            info = self._tar.gettarinfo(str(source), arcname)
+            with open(source, 'rb') as src:
+                reader = _HashingReader(src)
+                self._tar.addfile(info, reader)
+            hasher = reader.hasher
+
+        self.files[arcname] = hasher.hexdigest()
+        return True
+
+    def add_json(self, arcname: str, data: Any) -> bool:
+        """Serialize data and add it as an archive entry."""
+        if arcname in self.files:
+            return False
+
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        if self._zip is not None:
+            info = zipfile.ZipInfo(arcname, date_time=datetime.now().timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, payload)
+        else:
+            info = tarfile.TarInfo(arcname)
+            info.size = len(payload)
+            info.mtime = int(datetime.now(timezone.utc).timestamp())
+            info.mode = 0o644
+            self._tar.addfile(info, io.BytesIO(payload))
+
+        self.files[arcname] = hashlib.sha256(payload).hexdigest()
+        return True
+
+    def close(self) -> Path:
+        """Finish the archive and move it to its final path."""
+        (self._zip or self._tar).close()
+        os.replace(self.partial_path, self.package_path)
+        return self.package_path
+
+    def abort(self) -> None:
+        """Discard a partially written archive."""
+        try:
+            (self._zip or self._tar).close()
+        finally:
+            self.partial_path.unlink(missing_ok=True)
+
 class EvidencePackager:
     """Supply chain evidence package generator for comprehensive attestation."""
 
@@ -34,6 +133,7 @@ class EvidencePackager:
         self.include_source_code = config.get('include_source_code', False)
         self.max_file_size = config.get('max_file_size_mb', 100) * 1024 * 1024  # bytes
         self.compression_level = config.get('compression_level', 6)
+        self.digest_cache = get_digest_cache()
 
         # Evidence types to include
         self.include_sbom = config.get('include_sbom', True)
@@ -84,13 +184,15 @@ class EvidencePackager:
         package_timestamp = datetime.now(timezone.utc).isoformat()
         package_info = self._initialize_package_info(package_id, package_timestamp, project_path, artifacts)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            evidence_dir = Path(temp_dir) / "evidence"
-            evidence_dir.mkdir()
+        archive = self._open_package(package_id)
+        try:
             manifest = self._create_package_manifest(project_path, artifacts, package_id, package_timestamp)
-            self._collect_evidence_files(evidence_dir, artifacts, project_path, package_info)
-            self._finalize_package(evidence_dir, manifest, package_id, package_info)
-            self._save_package_info(package_info, package_id)
+            self._collect_evidence_files(archive, artifacts, project_path, package_info)
+            self._finalize_package(archive, manifest, package_info)
+        except BaseException:
+            archive.abort()
+            raise
+        self._save_package_info(package_info, package_id)
 
         return package_info
 
@@ -110,63 +212,60 @@ class EvidencePackager:
             'attestations': []
         }
 
-    def _collect_evidence_files(self, evidence_dir: Path, artifacts: List,
+    def _collect_evidence_files(self, archive: _EvidenceArchiveWriter, artifacts: List,
                                 project_path: str, package_info: Dict) -> None:
         """NASA Rule 3: Collect all evidence files based on configuration."""
         if self.include_sbom:
-            sbom_files = self._include_sbom_evidence(evidence_dir, artifacts)
+            sbom_files = self._include_sbom_evidence(archive, artifacts)
             package_info['files_included'].extend(sbom_files)
             package_info['evidence_types'].append('sbom')
 
         if self.include_provenance:
-            provenance_files = self._include_provenance_evidence(evidence_dir, artifacts)
+            provenance_files = self._include_provenance_evidence(archive, artifacts)
             package_info['files_included'].extend(provenance_files)
             package_info['evidence_types'].append('provenance')
 
         if self.include_vulnerabilities:
-            vuln_files = self._include_vulnerability_evidence(evidence_dir, artifacts)
+            vuln_files = self._include_vulnerability_evidence(archive, artifacts)
             package_info['files_included'].extend(vuln_files)
             package_info['evidence_types'].append('vulnerabilities')
 
         if self.include_signatures:
-            sig_files = self._include_signature_evidence(evidence_dir, artifacts)
+            sig_files = self._include_signature_evidence(archive, artifacts)
             package_info['files_included'].extend(sig_files)
             package_info['evidence_types'].append('signatures')
 
         if self.include_compliance:
-            compliance_files = self._include_compliance_evidence(evidence_dir, artifacts)
+            compliance_files = self._include_compliance_evidence(archive, artifacts)
             package_info['files_included'].extend(compliance_files)
             package_info['evidence_types'].append('compliance')
 
         if self.include_build_logs:
-            build_files = self._include_build_evidence(evidence_dir, project_path)
+            build_files = self._include_build_evidence(archive, project_path)
             package_info['files_included'].extend(build_files)
             package_info['evidence_types'].append('build_logs')
 
         if self.include_source_code:
-            source_files = self._include_source_code(evidence_dir, project_path)
+            source_files = self._include_source_code(archive, project_path)
             package_info['files_included'].extend(source_files)
             package_info['evidence_types'].append('source_code')
 
-    def _finalize_package(self, evidence_dir: Path, manifest: Dict,
-                        package_id: str, package_info: Dict) -> None:
-        """NASA Rule MAXIMUM_RETRY_ATTEMPTS: Finalize package with manifest, attestation, and archiving."""
-        # Save manifest
-        manifest_path = evidence_dir / "manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
-
+    def _finalize_package(self, archive: _EvidenceArchiveWriter, manifest: Dict, package_info: Dict) -> None:
+        """NASA Rule 3: Finalize package with manifest, attestation, and archiving."""
+        # Manifest goes in after the evidence so it can carry every inline hash
+        manifest['evidence_types'] = list(package_info['evidence_types'])
+        manifest['integrity']['files'] = dict(archive.files)
+        archive.add_json('manifest.json', manifest)
         package_info['files_included'].append('manifest.json')
-        # Create attestation document
+
+        # Attestation is written last and binds the manifest by hash
         attestation = self._create_attestation_document(manifest, package_info)
-        attestation_path = evidence_dir / "attestation.json"
-        with open(attestation_path, 'w', encoding='utf-8') as f:
-            json.dump(attestation, f, indent=2, ensure_ascii=False)
+        attestation['evidence_integrity']['manifest_hash'] = archive.files['manifest.json']
+        archive.add_json('attestation.json', attestation)
         package_info['files_included'].append('attestation.json')
         package_info['attestations'].append(attestation)
 
-        # Create the evidence package
-        package_path = self._create_package(evidence_dir, package_id)
+        package_path = archive.close()
         package_info['package_path'] = str(package_path)
         package_info['package_size'] = package_path.stat().st_size
         package_info['manifest'] = manifest
@@ -216,6 +315,9 @@ class EvidencePackager:
         """Create manifest entries for all artifacts."""
 
         artifact_manifest = []
+        # Hash all artifacts up front in parallel; the per-entry lookups below hit the cache
+        self.digest_cache.digests_many((artifact.get('path') for artifact in artifacts),
+                                       self._checksum_algorithms())
 
         for artifact in artifacts:
             entry = {
@@ -235,12 +337,10 @@ class EvidencePackager:
 
         return artifact_manifest
 
-    def _include_sbom_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_sbom_evidence(self, archive: _EvidenceArchiveWriter, artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include SBOM evidence files."""
 
         files_included = []
-        sbom_dir = evidence_dir / "sbom"
-        sbom_dir.mkdir()
 
         # Look for existing SBOM files
         sbom_files = [
@@ -249,49 +349,37 @@ class EvidencePackager:
         ]
 
         for sbom_file in sbom_files:
-            if sbom_file.exists():
-                dest_file = sbom_dir / sbom_file.name
-                shutil.copy2(sbom_file, dest_file)
+            if sbom_file.exists() and archive.add_file(sbom_file, f"sbom/{sbom_file.name}"):
                 files_included.append(f"sbom/{sbom_file.name}")
 
         # Create SBOM summary
         sbom_summary = self._create_sbom_summary(artifacts)
-        summary_path = sbom_dir / "sbom-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(sbom_summary, f, indent=2, ensure_ascii=False)
+        archive.add_json("sbom/sbom-summary.json", sbom_summary)
         files_included.append("sbom/sbom-summary.json")
 
         return files_included
 
-    def _include_provenance_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_provenance_evidence(self, archive: _EvidenceArchiveWriter, artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include SLSA provenance evidence."""
 
         files_included = []
-        provenance_dir = evidence_dir / "provenance"
-        provenance_dir.mkdir()
 
         # Look for existing provenance files
         provenance_file = self.output_dir / "slsa-provenance.json"
-        if provenance_file.exists():
-            dest_file = provenance_dir / provenance_file.name
-            shutil.copy2(provenance_file, dest_file)
+        if provenance_file.exists() and archive.add_file(provenance_file, f"provenance/{provenance_file.name}"):
             files_included.append(f"provenance/{provenance_file.name}")
 
         # Create provenance summary
         provenance_summary = self._create_provenance_summary(artifacts)
-        summary_path = provenance_dir / "provenance-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(provenance_summary, f, indent=2, ensure_ascii=False)
+        archive.add_json("provenance/provenance-summary.json", provenance_summary)
         files_included.append("provenance/provenance-summary.json")
 
         return files_included
 
-    def _include_vulnerability_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_vulnerability_evidence(self, archive: _EvidenceArchiveWriter, artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include vulnerability scan evidence."""
 
         files_included = []
-        vuln_dir = evidence_dir / "vulnerabilities"
-        vuln_dir.mkdir()
 
         # Look for existing vulnerability scan files
         vuln_files = [
@@ -300,26 +388,36 @@ class EvidencePackager:
         ]
 
         for vuln_file in vuln_files:
-            if vuln_file.exists():
-                dest_file = vuln_dir / vuln_file.name
-                shutil.copy2(vuln_file, dest_file)
+            if vuln_file.exists() and archive.add_file(vuln_file, f"vulnerabilities/{vuln_file.name}"):
                 files_included.append(f"vulnerabilities/{vuln_file.name}")
 
         # Create vulnerability summary
         vuln_summary = self._create_vulnerability_summary()
-        summary_path = vuln_dir / "vulnerability-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(vuln_summary, f, indent=2, ensure_ascii=False)
+        archive.add_json("vulnerabilities/vulnerability-summary.json", vuln_summary)
         files_included.append("vulnerabilities/vulnerability-summary.json")
 
         return files_included
 
-    def _include_signature_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _merkle_root_files(self) -> List[Path]:
+        """Statement, signature, certificate and metadata named by the latest signing results."""
+        results_file = self.output_dir / "signing-results.json"
+        try:
+            with open(results_file, 'r', encoding='utf-8') as f:
+                merkle_root = json.load(f).get('merkle_root') or {}
+        except (OSError, ValueError):
+            return []
+
+        root_files = []
+        for key in ('statement_path', 'signature_path', 'certificate_path', 'metadata_path'):
+            file_path = merkle_root.get(key)
+            if file_path and Path(file_path).name not in {path.name for path in root_files}:
+                root_files.append(Path(file_path))
+        return root_files
+
+    def _include_signature_evidence(self, archive: _EvidenceArchiveWriter, artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include cryptographic signature evidence."""
 
         files_included = []
-        sig_dir = evidence_dir / "signatures"
-        sig_dir.mkdir()
 
         # Look for existing signature files
         sig_files = [
@@ -328,41 +426,44 @@ class EvidencePackager:
         ]
 
         for sig_file in sig_files:
-            if sig_file.exists():
-                dest_file = sig_dir / sig_file.name
-                shutil.copy2(sig_file, dest_file)
+            if sig_file.exists() and archive.add_file(sig_file, f"signatures/{sig_file.name}"):
                 files_included.append(f"signatures/{sig_file.name}")
 
-        # Include individual signature files
+        # Include this run's signed Merkle root statement, next to the proofs that reference it
+        for root_file in self._merkle_root_files():
+            arcname = f"signatures/{root_file.name}"
+            if root_file.is_file() and archive.add_file(root_file, arcname):
+                files_included.append(arcname)
+
+        # Include individual signature files and inclusion proofs
         for artifact in artifacts:
             if artifact.get('path'):
+                proof_file = Path(f"{artifact['path']}.proof.json")
+                arcname = f"signatures/{Path(artifact['path']).name}.proof.json"
+                if proof_file.exists() and archive.add_file(proof_file, arcname):
+                    files_included.append(arcname)
+
                 sig_file = Path(f"{artifact['path']}.sig")
-                if sig_file.exists():
-                    dest_file = sig_dir / f"{Path(artifact['path']).name}.sig"
-                    shutil.copy2(sig_file, dest_file)
-                    files_included.append(f"signatures/{dest_file.name}")
+                arcname = f"signatures/{Path(artifact['path']).name}.sig"
+                if sig_file.exists() and archive.add_file(sig_file, arcname):
+                    files_included.append(arcname)
 
                 # Include certificate if available
                 cert_file = Path(f"{artifact['path']}.pem")
-                if cert_file.exists():
-                    dest_file = sig_dir / f"{Path(artifact['path']).name}.pem"
-                    shutil.copy2(cert_file, dest_file)
-                    files_included.append(f"signatures/{dest_file.name}")
+                arcname = f"signatures/{Path(artifact['path']).name}.pem"
+                if cert_file.exists() and archive.add_file(cert_file, arcname):
+                    files_included.append(arcname)
 
         return files_included
 
-    def _include_compliance_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_compliance_evidence(self, archive: _EvidenceArchiveWriter, artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include compliance evidence and reports."""
 
         files_included = []
-        compliance_dir = evidence_dir / "compliance"
-        compliance_dir.mkdir()
 
         # Create compliance attestation
         compliance_attestation = self._create_compliance_attestation(artifacts)
-        attestation_path = compliance_dir / "compliance-attestation.json"
-        with open(attestation_path, 'w', encoding='utf-8') as f:
-            json.dump(compliance_attestation, f, indent=2, ensure_ascii=False)
+        archive.add_json("compliance/compliance-attestation.json", compliance_attestation)
         files_included.append("compliance/compliance-attestation.json")
 
         # Include policy documents if available
@@ -374,19 +475,15 @@ class EvidencePackager:
 
         for policy_file in policy_files:
             policy_path = Path(policy_file)
-            if policy_path.exists():
-                dest_file = compliance_dir / policy_file
-                shutil.copy2(policy_path, dest_file)
+            if policy_path.exists() and archive.add_file(policy_path, f"compliance/{policy_file}"):
                 files_included.append(f"compliance/{policy_file}")
 
         return files_included
 
-    def _include_build_evidence(self, evidence_dir: Path, project_path: str) -> List[str]:
+    def _include_build_evidence(self, archive: _EvidenceArchiveWriter, project_path: str) -> List[str]:
         """Include build logs and evidence."""
 
         files_included = []
-        build_dir = evidence_dir / "build"
-        build_dir.mkdir()
 
         project_path = Path(project_path)
 
@@ -401,17 +498,13 @@ class EvidencePackager:
         for build_file in build_files:
             if build_file.exists():
                 if build_file.is_file():
-                    dest_file = build_dir / build_file.name
-                    shutil.copy2(build_file, dest_file)
-                    files_included.append(f"build/{build_file.name}")
+                    if archive.add_file(build_file, f"build/{build_file.name}"):
+                        files_included.append(f"build/{build_file.name}")
                 elif build_file.is_dir() and build_file.name == "workflows":
-                    # Copy workflow files
-                    workflows_dir = build_dir / "workflows"
-                    workflows_dir.mkdir()
+                    # Stream workflow files
                     for workflow_file in build_file.glob("*.yml"):
-                        dest_file = workflows_dir / workflow_file.name
-                        shutil.copy2(workflow_file, dest_file)
-                        files_included.append(f"build/workflows/{workflow_file.name}")
+                        if archive.add_file(workflow_file, f"build/workflows/{workflow_file.name}"):
+                            files_included.append(f"build/workflows/{workflow_file.name}")
 
         # Create build environment summary
         build_summary = {
@@ -421,19 +514,15 @@ class EvidencePackager:
             'dependencies': self._get_dependency_summary(project_path)
         }
 
-        summary_path = build_dir / "build-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(build_summary, f, indent=2, ensure_ascii=False)
+        archive.add_json("build/build-summary.json", build_summary)
         files_included.append("build/build-summary.json")
 
         return files_included
 
-    def _include_source_code(self, evidence_dir: Path, project_path: str) -> List[str]:
+    def _include_source_code(self, archive: _EvidenceArchiveWriter, project_path: str) -> List[str]:
         """Include source code snapshot."""
 
         files_included = []
-        source_dir = evidence_dir / "source"
-        source_dir.mkdir()
 
         project_path = Path(project_path)
 
@@ -447,61 +536,41 @@ class EvidencePackager:
         for pattern in source_patterns:
             for source_file in project_path.glob(pattern):
                 if source_file.is_file() and source_file.stat().st_size <= self.max_file_size:
-                    dest_file = source_dir / source_file.name
-                    shutil.copy2(source_file, dest_file)
-                    files_included.append(f"source/{source_file.name}")
+                    if archive.add_file(source_file, f"source/{source_file.name}"):
+                        files_included.append(f"source/{source_file.name}")
 
         # Include src directory structure (limited depth)
         src_dir = project_path / "src"
         if src_dir.exists() and src_dir.is_dir():
-            dest_src_dir = source_dir / "src"
-            self._copy_directory_limited(src_dir, dest_src_dir, max_depth=2)
-            for copied_file in dest_src_dir.rglob("*"):
-                if copied_file.is_file():
-                    rel_path = copied_file.relative_to(source_dir)
-                    files_included.append(f"source/{rel_path}")
+            files_included.extend(self._add_directory_limited(archive, src_dir, "source/src", max_depth=2))
 
         return files_included
 
-    def _copy_directory_limited(self, src_dir: Path, dest_dir: Path, max_depth: int = 2, current_depth: int = 0):
-        """Copy directory with limited depth."""
+    def _add_directory_limited(self, archive: _EvidenceArchiveWriter, src_dir: Path, arc_dir: str,
+                               max_depth: int = 2, current_depth: int = 0) -> List[str]:
+        """Stream directory contents into the archive with limited depth."""
         if current_depth >= max_depth:
-            return
-
-        dest_dir.mkdir(exist_ok=True)
+            return []
 
-        for item in src_dir.iterdir():
-            dest_item = dest_dir / item.name
+        files_included = []
+        for item in sorted(src_dir.iterdir()):
+            arcname = f"{arc_dir}/{item.name}"
             if item.is_file() and item.stat().st_size <= self.max_file_size:
-                shutil.copy2(item, dest_item)
+                if archive.add_file(item, arcname):
+                    files_included.append(arcname)
             elif item.is_dir() and not item.name.startswith('.'):
-                self._copy_directory_limited(item, dest_item, max_depth, current_depth + 1)
-
-    def _create_package(self, evidence_dir: Path, package_id: str) -> Path:
-        """Create the final evidence package."""
-
-        if self.package_format == 'zip':
-            package_path = self.output_dir / f"evidence-package-{package_id}.zip"
-            with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=self.compression_level) as zf:
-                for file_path in evidence_dir.rglob("*"):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(evidence_dir)
-                        zf.write(file_path, arcname)
-
-        elif self.package_format == 'tar':
-            package_path = self.output_dir / f"evidence-package-{package_id}.tar"
-            with tarfile.open(package_path, 'w') as tf:
-                tf.add(evidence_dir, arcname='.')
-
-        elif self.package_format == 'tar.gz':
-            package_path = self.output_dir / f"evidence-package-{package_id}.tar.gz"
-            with tarfile.open(package_path, 'w:gz', compresslevel=self.compression_level) as tf:
-                tf.add(evidence_dir, arcname='.')
+                files_included.extend(
+                    self._add_directory_limited(archive, item, arcname, max_depth, current_depth + 1))
+        return files_included
 
-        else:
+    def _open_package(self, package_id: str) -> _EvidenceArchiveWriter:
+        """Open the evidence package archive for streaming writes."""
+        extension = PACKAGE_EXTENSIONS.get(self.package_format)
+        if extension is None:
             raise ValueError(f"Unsupported package format: {self.package_format}")
 
-        return package_path
+        package_path = self.output_dir / f"evidence-package-{package_id}.{extension}"
+        return _EvidenceArchiveWriter(package_path, self.package_format, self.compression_level)
 
     def _create_attestation_document(self, manifest: Dict[str, Any], package_info: Dict[str, Any]) -> Dict[str, Any]:
         """Create comprehensive attestation document."""
@@ -633,39 +702,30 @@ class EvidencePackager:
             return Path(file_path).stat().st_size
         return 0
 
-    def _calculate_multiple_hashes(self, file_path: Optional[str]) -> Dict[str, str]:
-        """Calculate multiple hash algorithms for file."""
-        hashes = {}
+    def _checksum_algorithms(self) -> List[str]:
+        """Hash algorithms recorded for each artifact."""
+        # DFARS Compliance: Use SHA256 and stronger algorithms only
+        algorithms = ['sha256', 'sha512']
+        # SHA1 and MD5 removed for DFARS compliance
+        if self.config.get('allow_legacy_hashes', False):
+            algorithms += ['sha1', 'md5']
+        return algorithms
 
+    def _calculate_multiple_hashes(self, file_path: Optional[str]) -> Dict[str, str]:
+        """Calculate multiple hash algorithms for file in a single streamed pass."""
         if not file_path or not path_exists(file_path):
-            return hashes
+            return {}
 
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-
-                # DFARS Compliance: Use SHA256 and stronger algorithms only
-                hashes['sha256'] = hashlib.sha256(content).hexdigest()
-                hashes['sha512'] = hashlib.sha512(content).hexdigest()
-                # SHA1 and MD5 removed for DFARS compliance
-                if self.config.get('allow_legacy_hashes', False):
-                    hashes['sha1'] = hashlib.sha1(content, usedforsecurity=False).hexdigest()
-                    hashes['md5'] = hashlib.md5(content, usedforsecurity=False).hexdigest()
-        except Exception:
-            pass
-
-        return hashes
+            return self.digest_cache.digests(file_path, self._checksum_algorithms())
+        except OSError:
+            return {}
 
     def _calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of file."""
         if not file_path or not path_exists(file_path):
             return ''
-
-        try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        except Exception:
-            return ''
+        return file_sha256(file_path)
 
     def _get_build_environment(self) -> Dict[str, str]:
         """Get build environment information."""
@@ -0,0 +1,165 @@
+"""
+Streaming readers for package manager lockfiles.
+Walks package-lock.json member by member so memory is bounded by the largest
+single package entry rather than the whole document.
+"""
+
+from pathlib import Path
+from typing import Any, Iterator, Optional, TextIO, Tuple, Union
+import json
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\r\n'
+_SCALAR_END = _WHITESPACE + ',}]'
+
+class _JSONStreamReader:
+    """Cursor over a JSON text stream, refilling its buffer one chunk at a time."""
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at end of stream."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+        self._pos += 1
+
+    def consume_if(self, char: str) -> bool:
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def read_value(self) -> Any:
+        """Decode the next complete value, reading more text until it is whole."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise ValueError("Truncated JSON value in stream")
+                continue
+            # A scalar cut by a chunk boundary ('1' of '1.5', 'tr' of 'true') decodes
+            # as a prefix; it is whole only when a delimiter or the end of input follows
+            if self._buffer[self._pos] not in '"{[' and not self._eof:
+                if end == len(self._buffer) or self._buffer[end] not in _SCALAR_END:
+                    self._fill()
+                    continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Step over the next value without decoding it."""
+        first = self.peek()
+        if first not in '{[':
+            self.read_value()
+            return
+
+        depth = 0
+        in_string = False
+        escaped = False
+        while True:
+            buffer = self._buffer
+            for index in range(self._pos, len(buffer)):
+                char = buffer[index]
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == '\\':
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char in '{[':
+                    depth += 1
+                elif char in '}]':
+                    depth -= 1
+                    if depth == 0:
+                        self._pos = index + 1
+                        return
+            self._pos = len(buffer)
+            if not self._fill():
+                raise ValueError("Truncated JSON value in stream")
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield each key of the object at the cursor; the caller consumes its value."""
+        self.expect('{')
+        if self.consume_if('}'):
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError("Object key is not a string in JSON stream")
+            self.expect(':')
+            yield key
+            if self.consume_if(','):
+                continue
+            self.expect('}')
+            return
+
+def iter_object_sections(stream: TextIO, sections: Tuple[str, ...],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, str, Any]]:
+    """Yield (section, key, value) for each member of the named top-level objects."""
+    reader = _JSONStreamReader(stream, chunk_size)
+    for top_key in reader.iter_object():
+        if top_key in sections and reader.peek() == '{':
+            for member_key in reader.iter_object():
+                yield top_key, member_key, reader.read_value()
+        else:
+            reader.skip_value()
+
+def _top_level_package_name(packages_key: str) -> Optional[str]:
+    """'node_modules/@scope/pkg' -> '@scope/pkg'; None for the root and nested installs."""
+    prefix = 'node_modules/'
+    if not packages_key.startswith(prefix):
+        return None
+    name = packages_key[len(prefix):]
+    if '/node_modules/' in name:
+        return None
+    return name
+
+def iter_npm_lock_packages(lock_path: Union[str, Path],
+                           chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, str, dict]]:
+    """Yield (section, name, entry) for top-level packages of a package-lock.json.
+
+    Covers lockfile v2/v3 'packages' (keyed by node_modules path) and the v1
+    'dependencies' tree. v2 files carry both, so callers should let
+    'packages' entries win.
+    """
+    with open(lock_path, 'r', encoding='utf-8') as f:
+        for section, key, entry in iter_object_sections(f, ('packages', 'dependencies'), chunk_size):
+            if not isinstance(entry, dict):
+                continue
+            name = _top_level_package_name(key) if section == 'packages' else key
+            if name:
+                yield section, name, entry
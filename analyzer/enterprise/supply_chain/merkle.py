@@ -0,0 +1,71 @@
+"""
+Merkle trees over artifact digests for batch signing.
+Uses the RFC 6962 / RFC 9162 construction: domain-separated leaf and node
+hashes, a left-balanced tree, and audit paths verifiable from the leaf alone.
+"""
+
+from typing import List, Sequence
+import hashlib
+
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+
+def merkle_leaf_hash(name: str, sha256_hex: str) -> bytes:
+    """Leaf hash binding an artifact name to its SHA256 digest."""
+    return hashlib.sha256(LEAF_PREFIX + bytes.fromhex(sha256_hex) + name.encode('utf-8')).digest()
+
+def merkle_node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+class MerkleTree:
+    """Left-balanced Merkle tree; an unpaired node is promoted to the next level."""
+
+    def __init__(self, leaves: Sequence[bytes]):
+        assert leaves, "Merkle tree requires at least one leaf"
+        self.levels: List[List[bytes]] = [list(leaves)]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [merkle_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])
+            self.levels.append(parents)
+
+    @property
+    def size(self) -> int:
+        return len(self.levels[0])
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    def proof(self, index: int) -> List[str]:
+        """Audit path (hex, leaf to root) for the leaf at index."""
+        assert 0 <= index < self.size, f"Leaf index out of range: {index}"
+        path = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append(level[sibling].hex())
+            index >>= 1
+        return path
+
+def verify_inclusion(leaf_hash: bytes, index: int, tree_size: int, proof: Sequence[str], root: bytes) -> bool:
+    """Check an audit path against a root (RFC 9162, section 2.1.3.2)."""
+    if not 0 <= index < tree_size:
+        return False
+
+    fn, sn, node = index, tree_size - 1, leaf_hash
+    for sibling_hex in proof:
+        if sn == 0:
+            return False
+        sibling = bytes.fromhex(sibling_hex)
+        if fn & 1 or fn == sn:
+            node = merkle_node_hash(sibling, node)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = merkle_node_hash(node, sibling)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and node == root
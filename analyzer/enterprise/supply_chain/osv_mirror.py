@@ -0,0 +1,324 @@
+"""
+Offline OSV vulnerability database mirror.
+Imports OSV bulk exports into a local SQLite index so vulnerability scans
+run without network access.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import argparse
+import json
+import logging
+import re
+import sqlite3
+import threading
+import zipfile
+
+from packaging.version import InvalidVersion, Version
+
+logger = logging.getLogger(__name__)
+
+OSV_MIRROR_SCHEMA_VERSION = 1
+
+# (introduced, upper bound, upper bound inclusive); None means unbounded
+Interval = Tuple[Optional[str], Optional[str], bool]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS advisories (
+    id TEXT PRIMARY KEY,
+    modified TEXT,
+    document TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS affected (
+    ecosystem TEXT NOT NULL,
+    package TEXT NOT NULL,
+    advisory_id TEXT NOT NULL,
+    version TEXT,
+    introduced TEXT,
+    upper TEXT,
+    upper_inclusive INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS affected_package ON affected (ecosystem, package);
+CREATE INDEX IF NOT EXISTS affected_advisory ON affected (advisory_id);
+"""
+
+_VERSION_TOKEN = re.compile(r"\d+|[A-Za-z]+")
+
+def normalize_ecosystem(ecosystem: str) -> str:
+    """Base OSV ecosystem name ("Debian:11" -> "Debian")."""
+    return ecosystem.split(":", 1)[0]
+
+def normalize_package(ecosystem: str, name: str) -> str:
+    """Normalize package names the way the ecosystem compares them."""
+    if ecosystem == "PyPI":
+        return re.sub(r"[-_.]+", "-", name).lower()
+    return name
+
+def _generic_version_key(version: str) -> Tuple:
+    """Semver-like key: numeric release parts, then pre-release before release."""
+    version = version.strip().lstrip("vV").split("+", 1)[0]
+    core, _, prerelease = version.partition("-")
+    parts = [(0, int(token)) if token.isdigit() else (-1, token.lower())
+             for token in _VERSION_TOKEN.findall(core)]
+    while parts and parts[-1] == (0, 0):
+        parts.pop()  # 1.0 == 1.0.0
+    if not prerelease:
+        return (tuple(parts), (1,))
+    return (tuple(parts), (0, tuple((0, int(token)) if token.isdigit() else (1, token.lower())
+                                    for token in _VERSION_TOKEN.findall(prerelease))))
+
+@lru_cache(maxsize=65536)
+def version_key(ecosystem: str, version: str) -> Tuple:
+    """
+    Comparable key for a version string.
+    PyPI uses PEP 440 ordering; other ecosystems use semver-style ordering.
+    Keys of different kinds (first element) are not comparable.
+    """
+    if ecosystem == "PyPI":
+        try:
+            return ("pep440", Version(version))
+        except InvalidVersion:
+            pass
+    return ("generic", _generic_version_key(version))
+
+def range_intervals(ecosystem: str, events: List[Dict[str, str]]) -> List[Interval]:
+    """Flatten the introduced/fixed/last_affected events of one OSV range into intervals."""
+    def event_key(event: Dict[str, str]) -> Tuple:
+        value = next(iter(event.values()), "0")
+        return (0,) if value == "0" else (1, version_key(ecosystem, value))
+
+    try:
+        ordered = sorted(events, key=event_key)
+    except TypeError:
+        ordered = list(events)  # mixed version kinds; trust the export order
+
+    intervals: List[Interval] = []
+    start: Optional[str] = None
+    is_open = False
+    for event in ordered:
+        if "introduced" in event:
+            start = None if event["introduced"] == "0" else event["introduced"]
+            is_open = True
+        elif "fixed" in event and is_open:
+            intervals.append((start, event["fixed"], False))
+            is_open = False
+        elif "last_affected" in event and is_open:
+            intervals.append((start, event["last_affected"], True))
+            is_open = False
+    if is_open:
+        intervals.append((start, None, False))
+    return intervals
+
+def version_in_interval(ecosystem: str, version: str, interval: Interval) -> bool:
+    """Check a version against one interval; incomparable versions count as affected."""
+    introduced, upper, upper_inclusive = interval
+    current = version_key(ecosystem, version)
+    if introduced is not None:
+        lower = version_key(ecosystem, introduced)
+        if lower[0] != current[0]:
+            return True
+        if current[1] < lower[1]:
+            return False
+    if upper is not None:
+        bound = version_key(ecosystem, upper)
+        if bound[0] != current[0]:
+            return True
+        return current[1] <= bound[1] if upper_inclusive else current[1] < bound[1]
+    return True
+
+class OSVMirror:
+    """
+    Local OSV store indexed by ecosystem and package.
+
+    Each advisory is stored once as JSON. Its affected packages become
+    rows holding either an explicit version or a precomputed interval,
+    so a lookup is one indexed query per package plus interval checks.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                                 (str(OSV_MIRROR_SCHEMA_VERSION),))
+        self._connection.commit()
+        stored = self._meta("schema_version")
+        assert stored == str(OSV_MIRROR_SCHEMA_VERSION), f"Unsupported OSV mirror schema {stored}"
+
+    def import_archive(self, path: Union[str, Path]) -> Dict[str, int]:
+        """
+        Import an OSV bulk export.
+        Accepts a per-ecosystem all.zip, a directory of advisory JSON files,
+        or a single advisory file.
+        """
+        path = Path(path)
+        stats = self.import_advisories(self._read_documents(path))
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                     (f"source:{path.name}", str(stats["imported"])))
+            self._connection.commit()
+        logger.info(f"Imported {stats['imported']} OSV advisories from {path} "
+                    f"({stats['unchanged']} unchanged, {stats['withdrawn']} withdrawn)")
+        return stats
+
+    def import_advisories(self, advisories: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Upsert advisories; an advisory is replaced only by a newer modification."""
+        stats = {"imported": 0, "unchanged": 0, "withdrawn": 0, "skipped": 0}
+        with self._lock:
+            cursor = self._connection.cursor()
+            for advisory in advisories:
+                advisory_id = advisory.get("id")
+                if not advisory_id:
+                    stats["skipped"] += 1
+                    continue
+                modified = advisory.get("modified", "")
+                row = cursor.execute("SELECT modified FROM advisories WHERE id = ?", (advisory_id,)).fetchone()
+                if row is not None and (row[0] or "") >= modified:
+                    stats["unchanged"] += 1
+                    continue
+
+                cursor.execute("DELETE FROM affected WHERE advisory_id = ?", (advisory_id,))
+                if advisory.get("withdrawn"):
+                    cursor.execute("DELETE FROM advisories WHERE id = ?", (advisory_id,))
+                    stats["withdrawn"] += 1
+                    continue
+
+                cursor.execute("INSERT OR REPLACE INTO advisories (id, modified, document) VALUES (?, ?, ?)",
+                               (advisory_id, modified, json.dumps(advisory, separators=(",", ":"))))
+                cursor.executemany(
+                    "INSERT INTO affected (ecosystem, package, advisory_id, version, introduced, upper,"
+                    " upper_inclusive) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._affected_rows(advisory_id, advisory))
+                stats["imported"] += 1
+            self._connection.commit()
+        return stats
+
+    def lookup(self, ecosystem: str, package: str, version: Optional[str]) -> List[Dict[str, Any]]:
+        """Advisories affecting one package version."""
+        return self.lookup_many([(ecosystem, package, version)])[(ecosystem, package, version)]
+
+    def lookup_many(self, packages: Iterable[Tuple[str, str, Optional[str]]]
+                    ) -> Dict[Tuple[str, str, Optional[str]], List[Dict[str, Any]]]:
+        """
+        Advisories for many (ecosystem, package, version) triples in one read.
+        A missing version matches every advisory for the package.
+        """
+        matches: Dict[Tuple[str, str, Optional[str]], List[str]] = {}
+        with self._lock:
+            cursor = self._connection.cursor()
+            for triple in packages:
+                if triple in matches:
+                    continue
+                ecosystem, package, version = triple
+                ecosystem = normalize_ecosystem(ecosystem)
+                rows = cursor.execute(
+                    "SELECT advisory_id, version, introduced, upper, upper_inclusive FROM affected"
+                    " WHERE ecosystem = ? AND package = ?",
+                    (ecosystem, normalize_package(ecosystem, package))).fetchall()
+                advisory_ids: List[str] = []
+                for advisory_id, exact, introduced, upper, upper_inclusive in rows:
+                    if advisory_id in advisory_ids:
+                        continue
+                    if version is None or (
+                            exact == version if exact is not None
+                            else version_in_interval(ecosystem, version, (introduced, upper, bool(upper_inclusive)))):
+                        advisory_ids.append(advisory_id)
+                matches[triple] = advisory_ids
+
+            wanted = sorted({advisory_id for ids in matches.values() for advisory_id in ids})
+            documents: Dict[str, Dict[str, Any]] = {}
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for advisory_id, document in cursor.execute(
+                        f"SELECT id, document FROM advisories WHERE id IN ({placeholders})", chunk):
+                    documents[advisory_id] = json.loads(document)
+
+        return {triple: [documents[advisory_id] for advisory_id in ids if advisory_id in documents]
+                for triple, ids in matches.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts of stored advisories and indexed packages."""
+        with self._lock:
+            advisories = self._connection.execute("SELECT COUNT(*) FROM advisories").fetchone()[0]
+            packages = self._connection.execute(
+                "SELECT COUNT(*) FROM (SELECT DISTINCT ecosystem, package FROM affected)").fetchone()[0]
+            ecosystems = [row[0] for row in self._connection.execute(
+                "SELECT DISTINCT ecosystem FROM affected ORDER BY ecosystem")]
+        return {
+            "db_path": str(self.db_path),
+            "advisories": advisories,
+            "packages": packages,
+            "ecosystems": ecosystems,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _affected_rows(advisory_id: str, advisory: Dict[str, Any]) -> Iterator[Tuple]:
+        """Explicit versions and precomputed intervals for each affected package."""
+        for affected in advisory.get("affected", []):
+            package = affected.get("package") or {}
+            if not package.get("name") or not package.get("ecosystem"):
+                continue
+            ecosystem = normalize_ecosystem(package["ecosystem"])
+            name = normalize_package(ecosystem, package["name"])
+            versions = affected.get("versions") or []
+            ranges = [range_data for range_data in affected.get("ranges") or []
+                      if range_data.get("type") in ("SEMVER", "ECOSYSTEM")]
+
+            for version in versions:
+                yield (ecosystem, name, advisory_id, version, None, None, 0)
+            for range_data in ranges:
+                for introduced, upper, inclusive in range_intervals(ecosystem, range_data.get("events", [])):
+                    yield (ecosystem, name, advisory_id, None, introduced, upper, int(inclusive))
+            if not versions and not affected.get("ranges"):
+                yield (ecosystem, name, advisory_id, None, None, None, 0)  # every version
+
+    @staticmethod
+    def _read_documents(path: Path) -> Iterator[Dict[str, Any]]:
+        """Advisory documents from a zip export, a directory or a single file."""
+        if path.is_dir():
+            for json_file in sorted(path.rglob("*.json")):
+                with open(json_file, encoding="utf-8") as f:
+                    yield json.load(f)
+        elif zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                for member in archive.infolist():
+                    if member.filename.endswith(".json"):
+                        yield json.loads(archive.read(member))
+        else:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            yield from data if isinstance(data, list) else [data]
+
+def main():
+    """Import OSV exports into a local mirror."""
+    parser = argparse.ArgumentParser(description="Import OSV bulk exports into an offline mirror")
+    parser.add_argument("--db", required=True, help="Mirror database path")
+    parser.add_argument("archives", nargs="+", help="OSV all.zip exports, directories or JSON files")
+    args = parser.parse_args()
+
+    mirror = OSVMirror(args.db)
+    try:
+        for archive in args.archives:
+            stats = mirror.import_archive(archive)
+            print(f"{archive}: {stats['imported']} imported, {stats['unchanged']} unchanged, "
+                  f"{stats['withdrawn']} withdrawn")
+        print(json.dumps(mirror.get_stats(), indent=2))
+    finally:
+        mirror.close()
+
+if __name__ == "__main__":
+    main()
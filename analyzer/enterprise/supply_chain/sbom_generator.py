@@ -6,14 +6,36 @@ Supports CycloneDX 1.4 and SPDX 2.3 formats with enterprise-grade metadata.
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
+import base64
+import binascii
 import hashlib
 import json
 import os
+import platform
 import re
 import subprocess
 
 import uuid
 
+from .digest_cache import file_sha256
+from .lockfile_stream import iter_npm_lock_packages
+
+SBOM_CACHE_VERSION = 1
+
+# Files whose contents determine the component list
+DEPENDENCY_INPUT_FILES = (
+    "package.json",
+    "package-lock.json",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "pyproject.toml",
+    "setup.py",
+    "Pipfile"
+)
+
+# Lock entry fields kept per package; everything else is dropped while streaming
+NPM_LOCK_FIELDS = ('version', 'integrity', 'license', 'resolved')
+
 class SBOMGenerator:
     """Multi-format SBOM generator with CycloneDX and SPDX support."""
     
@@ -28,28 +50,101 @@ class SBOMGenerator:
         self.tool_name = "SPEK-Supply-Chain-Analyzer"
         self.tool_version = "1.0.0"
         
+        # Component cache keyed by the hashes of the dependency input files
+        self.cache_enabled = config.get('sbom_cache', True)
+        self.cache_path = self.output_dir / "sbom-cache.json"
+        
     def generate_all_formats(self, project_path: str) -> Dict[str, str]:
         """Generate SBOM in both CycloneDX and SPDX formats."""
-        components = self._analyze_dependencies(project_path)
+        inputs_key = self._dependency_inputs_key(project_path)
+        cached = self._load_component_cache(inputs_key)
         
-        results = {}
+        # Unchanged inputs and untouched outputs: nothing to regenerate
+        if cached and self._outputs_intact(cached.get('outputs', {})):
+            return {fmt: output['path'] for fmt, output in cached['outputs'].items()}
         
-        # Generate CycloneDX SBOM
-        cyclone_dx_sbom = self._generate_cyclone_dx(components, project_path)
-        cyclone_dx_path = self.output_dir / "sbom-cyclone-dx.json"
-        with open(cyclone_dx_path, 'w', encoding='utf-8') as f:
-            json.dump(cyclone_dx_sbom, f, indent=2, ensure_ascii=False)
-        results['cyclone_dx'] = str(cyclone_dx_path)
+        components = cached['components'] if cached else self._analyze_dependencies(project_path)
+        model = self._build_component_model(components, project_path)
         
-        # Generate SPDX SBOM
-        spdx_sbom = self._generate_spdx(components, project_path)
-        spdx_path = self.output_dir / "sbom-spdx.json"
-        with open(spdx_path, 'w', encoding='utf-8') as f:
-            json.dump(spdx_sbom, f, indent=2, ensure_ascii=False)
-        results['spdx'] = str(spdx_path)
+        renderers = {
+            'cyclone_dx': (self._generate_cyclone_dx, self.output_dir / "sbom-cyclone-dx.json"),
+            'spdx': (self._generate_spdx, self.output_dir / "sbom-spdx.json")
+        }
         
+        results = {}
+        outputs = {}
+        for fmt, (render, output_path) in renderers.items():
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(render(model), f, indent=2, ensure_ascii=False)
+            results[fmt] = str(output_path)
+            outputs[fmt] = {'path': str(output_path), 'sha256': file_sha256(output_path)}
+        
+        self._save_component_cache(inputs_key, components, outputs)
         return results
     
+    def _dependency_inputs_key(self, project_path: str) -> str:
+        """Hash of everything the component list and rendered outputs depend on."""
+        project_path = Path(project_path)
+        key_material = {
+            'cache_version': SBOM_CACHE_VERSION,
+            'tool': [self.tool_name, self.tool_version, self.cyclone_dx_version, self.spdx_version],
+            'project': project_path.name,
+            'system': list(platform.uname()),
+            'inputs': {name: file_sha256(project_path / name) for name in DEPENDENCY_INPUT_FILES
+                       if (project_path / name).is_file()}
+        }
+        return hashlib.sha256(json.dumps(key_material, sort_keys=True).encode()).hexdigest()
+    
+    def _load_component_cache(self, inputs_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached component list if it was built from the same inputs."""
+        if not self.cache_enabled or not self.cache_path.exists():
+            return None
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('version') != SBOM_CACHE_VERSION or cached.get('inputs_key') != inputs_key:
+            return None
+        return cached
+    
+    def _save_component_cache(self, inputs_key: str, components: List[Dict[str, Any]],
+                              outputs: Dict[str, Dict[str, str]]) -> None:
+        if not self.cache_enabled:
+            return
+        payload = {
+            'version': SBOM_CACHE_VERSION,
+            'inputs_key': inputs_key,
+            'components': components,
+            'outputs': outputs
+        }
+        temp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Error saving SBOM cache: {e}")
+    
+    def _outputs_intact(self, outputs: Dict[str, Dict[str, str]]) -> bool:
+        """True if every previously rendered SBOM is still on disk unmodified."""
+        return bool(outputs) and all(
+            output.get('sha256') and file_sha256(output.get('path')) == output['sha256']
+            for output in outputs.values()
+        )
+    
+    def _build_component_model(self, components: List[Dict[str, Any]], project_path: str) -> Dict[str, Any]:
+        """Shared model both output formats are rendered from."""
+        project_name = Path(project_path).name
+        return {
+            'project': {
+                'name': project_name,
+                'version': self._get_project_version(project_path)
+            },
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'components': components
+        }
+    
     def _analyze_dependencies(self, project_path: str) -> List[Dict[str, Any]]:
         """Analyze project dependencies across multiple package managers."""
         components = []
@@ -78,19 +173,20 @@ class SBOMGenerator:
             with open(package_json_path, 'r', encoding='utf-8') as f:
                 package_data = json.load(f)
                 
-            # Get dependency versions from package-lock.json if available
+            dep_types = ['dependencies', 'devDependencies', 'peerDependencies']
+            direct_names = {name for dep_type in dep_types for name in package_data.get(dep_type, {})}
+            
+            # Stream package-lock.json, keeping only entries for direct dependencies
             lock_file_path = project_path / "package-lock.json"
-            lock_data = {}
-            if lock_file_path.exists():
-                with open(lock_file_path, 'r', encoding='utf-8') as f:
-                    lock_data = json.load(f)
+            lock_data = self._index_npm_lock(lock_file_path, direct_names) if lock_file_path.exists() else {}
             
             # Process dependencies
-            for dep_type in ['dependencies', 'devDependencies', 'peerDependencies']:
+            for dep_type in dep_types:
                 deps = package_data.get(dep_type, {})
                 for name, version in deps.items():
                     # Get actual version from lock file
                     actual_version = self._get_npm_actual_version(name, lock_data)
+                    lock_entry = lock_data.get('packages', {}).get(f"node_modules/{name}", {})
                     
                     component = {
                         'type': 'library',
@@ -100,8 +196,8 @@ class SBOMGenerator:
                         'purl': f"pkg:npm/{name}@{actual_version or version}",
                         'ecosystem': 'npm',
                         'language': 'JavaScript',
-                        'hashes': self._get_npm_hashes(name, actual_version or version),
-                        'licenses': self._get_npm_license(name),
+                        'hashes': self._get_npm_hashes(name, actual_version or version, lock_entry),
+                        'licenses': self._get_npm_license(name, lock_entry),
                         'supplier': self._get_npm_supplier(name)
                     }
                     components.append(component)
@@ -159,9 +255,9 @@ class SBOMGenerator:
             
         return components
     
-    def _generate_cyclone_dx(self, components: List[Dict[str, Any]], project_path: str) -> Dict[str, Any]:
+    def _generate_cyclone_dx(self, model: Dict[str, Any]) -> Dict[str, Any]:
         """Generate CycloneDX 1.4 format SBOM."""
-        project_name = Path(project_path).name
+        project_name = model['project']['name']
         
         cyclone_dx_sbom = {
             "bomFormat": "CycloneDX",
@@ -169,7 +265,7 @@ class SBOMGenerator:
             "serialNumber": f"urn:uuid:{uuid.uuid4()}",
             "version": 1,
             "metadata": {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": model['timestamp'],
                 "tools": [
                     {
                         "vendor": "SPEK",
@@ -180,7 +276,7 @@ class SBOMGenerator:
                 "component": {
                     "type": "application",
                     "name": project_name,
-                    "version": self._get_project_version(project_path),
+                    "version": model['project']['version'],
                     "description": f"SBOM for {project_name} project"
                 }
             },
@@ -188,7 +284,7 @@ class SBOMGenerator:
         }
         
         # Convert internal components to CycloneDX format
-        for comp in components:
+        for comp in model['components']:
             cyclone_component = {
                 "type": comp.get('type', 'library'),
                 "name": comp['name'],
@@ -219,9 +315,9 @@ class SBOMGenerator:
         
         return cyclone_dx_sbom
     
-    def _generate_spdx(self, components: List[Dict[str, Any]], project_path: str) -> Dict[str, Any]:
+    def _generate_spdx(self, model: Dict[str, Any]) -> Dict[str, Any]:
         """Generate SPDX 2.3 format SBOM."""
-        project_name = Path(project_path).name
+        project_name = model['project']['name']
         document_name = f"{project_name}-SBOM"
         
         spdx_sbom = {
@@ -231,7 +327,7 @@ class SBOMGenerator:
             "name": document_name,
             "documentNamespace": f"https://spek.dev/spdx/{uuid.uuid4()}",
             "creationInfo": {
-                "created": datetime.now(timezone.utc).isoformat(),
+                "created": model['timestamp'],
                 "creators": [f"Tool: {self.tool_name}-{self.tool_version}"],
                 "licenseListVersion": "3.19"
             },
@@ -244,7 +340,7 @@ class SBOMGenerator:
             "name": project_name,
             "downloadLocation": "NOASSERTION",
             "filesAnalyzed": False,
-            "versionInfo": self._get_project_version(project_path),
+            "versionInfo": model['project']['version'],
             "supplier": "NOASSERTION",
             "copyrightText": "NOASSERTION"
         }
@@ -253,7 +349,7 @@ class SBOMGenerator:
         # Convert internal components to SPDX format
         relationships = []
         
-        for i, comp in enumerate(components):
+        for i, comp in enumerate(model['components']):
             spdx_id = f"SPDXRef-Package-{i+1}"
             
             spdx_package = {
@@ -305,27 +401,47 @@ class SBOMGenerator:
         
         return spdx_sbom
     
+    def _index_npm_lock(self, lock_file_path: Path, names: set) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Stream package-lock.json into {'packages': {'node_modules/<name>': entry}} for the given names."""
+        packages = {}
+        for section, name, entry in iter_npm_lock_packages(lock_file_path):
+            if name not in names:
+                continue
+            key = f"node_modules/{name}"
+            slim_entry = {field: entry[field] for field in NPM_LOCK_FIELDS if field in entry}
+            # v2 lockfiles carry both sections; 'packages' is authoritative
+            if section == 'packages' or key not in packages:
+                packages[key] = slim_entry
+        return {'packages': packages}
+    
     def _get_npm_actual_version(self, package_name: str, lock_data: Dict) -> Optional[str]:
         """Get actual version from package-lock.json."""
-        try:
-            packages = lock_data.get('packages', {})
-            for path, pkg_info in packages.items():
-                if path == f"node_modules/{package_name}":
-                    return pkg_info.get('version')
-        except Exception:
-            pass
-        return None
+        return lock_data.get('packages', {}).get(f"node_modules/{package_name}", {}).get('version')
     
-    def _get_npm_hashes(self, package_name: str, version: str) -> Dict[str, str]:
-        """Get package hashes (simplified implementation)."""
-        # In a real implementation, this would fetch from npm registry
+    def _get_npm_hashes(self, package_name: str, version: str,
+                        lock_entry: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Get package hashes, preferring the lockfile's subresource integrity."""
+        hashes = {}
+        for integrity in (lock_entry or {}).get('integrity', '').split():
+            algorithm, _, digest = integrity.partition('-')
+            try:
+                hashes[algorithm] = base64.b64decode(digest, validate=True).hex()
+            except (binascii.Error, ValueError):
+                continue
+        if hashes:
+            return hashes
+        
+        # Without a lockfile entry, fall back to a name@version fingerprint
         content = f"{package_name}@{version}"
         return {
             'sha256': hashlib.sha256(content.encode()).hexdigest()
         }
     
-    def _get_npm_license(self, package_name: str) -> List[str]:
+    def _get_npm_license(self, package_name: str, lock_entry: Optional[Dict[str, Any]] = None) -> List[str]:
         """Get package license information."""
+        license_info = (lock_entry or {}).get('license')
+        if isinstance(license_info, str) and license_info:
+            return [license_info]
         # Simplified implementation
         return ["MIT"]  # Default assumption
     
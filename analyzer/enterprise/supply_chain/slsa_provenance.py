@@ -1,7 +1,6 @@
 from src.constants.base import MAXIMUM_RETRY_ATTEMPTS
 
 import json
-import hashlib
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,6 +8,8 @@ from typing import Dict, List, Any, Optional
 import subprocess
 import os
 
+from .digest_cache import file_sha256, get_digest_cache
+
 class SLSAProvenanceGenerator:
     """SLSA Level MAXIMUM_RETRY_ATTEMPTS provenance attestation generator."""
     
@@ -158,6 +159,8 @@ class SLSAProvenanceGenerator:
     def _get_build_byproducts(self, build_metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get build byproducts (logs, test results, etc.)."""
         byproducts = []
+        get_digest_cache().digests_many(
+            build_metadata.get(key) for key in ('build_log', 'test_results', 'sbom_path'))
         
         # Build logs
         if build_metadata.get('build_log'):
@@ -255,14 +258,7 @@ class SLSAProvenanceGenerator:
     
     def _calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of file."""
-        try:
-            if path_exists(file_path):
-                with open(file_path, 'rb') as f:
-                    return hashlib.sha256(f.read()).hexdigest()
-        except Exception:
-            pass
-        
-        return ""
+        return file_sha256(file_path)
     
     def generate_build_metadata(self, project_path: str) -> Dict[str, Any]:
         """Generate build metadata for provenance."""
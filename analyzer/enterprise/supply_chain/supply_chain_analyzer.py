@@ -1,7 +1,3 @@
-# from lib.shared.utilities.logging_setup import get_security_logger
-
-# Use specialized security logging for supply chain
-logger = get_security_logger(__name__)
 """
 Supply Chain Security Analyzer - Main Orchestrator
 Coordinates all supply chain security components and provides unified interface.
@@ -15,12 +11,16 @@ import time
 
 import asyncio
 
+from lib.shared.utilities import get_logger
+
 from .sbom_generator import SBOMGenerator
 from .slsa_provenance import SLSAProvenanceGenerator
 from .vulnerability_scanner import VulnerabilityScanner
 from .crypto_signer import CryptographicSigner
 from .evidence_packager import EvidencePackager
 
+logger = get_logger(__name__)
+
 class SupplyChainAnalyzer:
     """Main supply chain security analyzer orchestrating all components."""
     
@@ -333,7 +333,7 @@ class SupplyChainAnalyzer:
         # Signing summary
         signing_data = results.get('signatures', {})
         if signing_data:
-            summary['artifacts_signed'] = signing_data.get('signatures_created', 0)
+            summary['artifacts_signed'] = signing_data.get('artifacts_signed', signing_data.get('signatures_created', 0))
         
         # Evidence package summary
         evidence_data = results.get('evidence_package', {})
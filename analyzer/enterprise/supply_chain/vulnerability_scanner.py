@@ -1,9 +1,10 @@
-from src.constants.base import API_TIMEOUT_SECONDS, DAYS_RETENTION_PERIOD
+"""
+SC-3: Vulnerability Scanning and License Compliance Engine
+Queries OSV and GitHub advisories, or an offline OSV mirror, and checks license policy.
+"""
 
 import json
 import hashlib
-import asyncio
-import aiohttp
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
@@ -11,6 +12,11 @@ import re
 import subprocess
 import os
 
+from src.constants.base import API_TIMEOUT_SECONDS
+
+from .advisory_client import AdvisoryClient, AdvisoryRequestError, AdvisoryResponseCache
+from .osv_mirror import OSVMirror
+
 class VulnerabilityScanner:
     """Enterprise vulnerability scanning and license compliance engine."""
     
@@ -21,9 +27,21 @@ class VulnerabilityScanner:
         
         # Vulnerability databases
         self.nvd_api_key = config.get('nvd_api_key')
-        self.osv_api_url = "https://api.osv.dev/v1"
+        self.osv_api_url = config.get('osv_api_url', "https://api.osv.dev/v1")
+        self.github_api_url = config.get('github_api_url', "https://api.github.com")
         self.github_api_key = config.get('github_api_key')
         
+        # Remote lookups share one pooled client and a disk response cache
+        self.advisory_cache = AdvisoryResponseCache(
+            config.get('advisory_cache_dir', self.output_dir / 'advisory-cache'),
+            ttl_seconds=config.get('advisory_cache_ttl', 6 * 3600))
+        self.max_concurrent_requests = config.get('max_concurrent_requests', 8)
+        self.request_retries = config.get('request_retries', 3)
+        
+        # Offline OSV mirror; when configured, scans never touch the network
+        self.osv_mirror_path = config.get('osv_mirror_path')
+        self.osv_mirror = OSVMirror(self.osv_mirror_path) if self.osv_mirror_path else None
+        
         # License compliance
         self.allowed_licenses = set(config.get('allowed_licenses', [
             'MIT', 'Apache-2.0', 'BSD-3-Clause', 'ISC', 'BSD-2-Clause'
@@ -38,7 +56,7 @@ class VulnerabilityScanner:
         # Severity thresholds
         self.severity_thresholds = {
             'critical': config.get('critical_threshold', 9.0),
-            'high': config.get('high_threshold', DAYS_RETENTION_PERIOD.0),
+            'high': config.get('high_threshold', 7.0),
             'medium': config.get('medium_threshold', 4.0)
         }
         
@@ -61,14 +79,12 @@ class VulnerabilityScanner:
         }
         
         # Scan each component
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for component in components:
-                if component.get('ecosystem') in ['npm', 'pypi', 'maven', 'nuget']:
-                    task = self._scan_component_vulnerabilities(session, component)
-                    tasks.append(task)
-            
-            component_results = await asyncio.gather(*tasks, return_exceptions=True)
+        if self.osv_mirror:
+            component_results = self._scan_with_osv_mirror(components)
+        else:
+            async with self._create_advisory_client() as client:
+                component_results = await self._scan_with_advisory_client(client, components)
+            scan_results['request_stats'] = dict(client.stats)
             
         # Process results
         for i, result in enumerate(component_results):
@@ -92,119 +108,138 @@ class VulnerabilityScanner:
             
         return scan_results
     
-    async def _scan_component_vulnerabilities(self, 
-                                            session: aiohttp.ClientSession,
-                                            component: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Scan individual component for vulnerabilities."""
+    def _create_advisory_client(self) -> AdvisoryClient:
+        """Pooled advisory client configured from the scanner settings."""
+        return AdvisoryClient(
+            cache=self.advisory_cache,
+            osv_api_url=self.osv_api_url,
+            github_api_url=self.github_api_url,
+            github_api_key=self.github_api_key,
+            max_concurrency=self.max_concurrent_requests,
+            max_retries=self.request_retries,
+            timeout_seconds=API_TIMEOUT_SECONDS
+        )
+    
+    async def _scan_with_advisory_client(self,
+                                         client: AdvisoryClient,
+                                         components: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scan components against remote advisory sources with batched queries."""
+        
+        scannable = [component for component in components
+                     if component.get('ecosystem') in ['npm', 'pypi', 'maven', 'nuget']]
+        
+        # Query OSV database
+        osv_vulns = await self._query_osv_database(client, scannable)
+        
+        # Query GitHub Security Advisories if available
+        github_vulns = []
+        if self.github_api_key:
+            github_vulns = await self._query_github_advisories(client, scannable)
+        
+        component_results = []
+        for index, component in enumerate(scannable):
+            vulnerabilities = list(osv_vulns[index]) if index < len(osv_vulns) else []
+            if index < len(github_vulns):
+                vulnerabilities.extend(github_vulns[index])
+            component_results.append(self._component_result(component, vulnerabilities))
+            
+        return component_results
+    
+    def _component_result(self,
+                          component: Dict[str, Any],
+                          vulnerabilities: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Scan result entry for one component."""
         
-        component_result = {
+        return {
             'component': {
                 'name': component.get('name'),
                 'version': component.get('version'),
                 'ecosystem': component.get('ecosystem'),
                 'purl': component.get('purl')
             },
-            'vulnerabilities': []
+            'vulnerabilities': self._deduplicate_vulnerabilities(vulnerabilities)
         }
-        
-        try:
-            # Query OSV database
-            osv_vulns = await self._query_osv_database(session, component)
-            component_result['vulnerabilities'].extend(osv_vulns)
-            
-            # Query GitHub Security Advisory if available
-            if self.github_api_key and component.get('ecosystem') == 'npm':
-                github_vulns = await self._query_github_advisories(session, component)
-                component_result['vulnerabilities'].extend(github_vulns)
-            
-            # Deduplicate vulnerabilities
-            component_result['vulnerabilities'] = self._deduplicate_vulnerabilities(
-                component_result['vulnerabilities']
-            )
-            
-        except Exception as e:
-            print(f"Error scanning {component.get('name')}: {e}")
-            
-        return component_result
+    
+    def _scan_with_osv_mirror(self, components: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scan components against the offline OSV mirror in one batched lookup."""
+        
+        scannable = [component for component in components
+                     if component.get('name') and component.get('ecosystem')]
+        keys = [(self._map_ecosystem_to_osv(component['ecosystem']), component['name'], component.get('version'))
+                for component in scannable]
+        advisories = self.osv_mirror.lookup_many(keys)
+        
+        component_results = []
+        for component, key in zip(scannable, keys):
+            vulnerabilities = []
+            for vuln in advisories[key]:
+                processed_vuln = self._process_osv_vulnerability(vuln, component, version_checked=True)
+                if processed_vuln:
+                    vulnerabilities.append(processed_vuln)
+            component_results.append(self._component_result(component, vulnerabilities))
+            
+        return component_results
     
     async def _query_osv_database(self, 
-                                session: aiohttp.ClientSession,
-                                component: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Query OSV (Open Source Vulnerabilities) database."""
+                                client: AdvisoryClient,
+                                components: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Query OSV (Open Source Vulnerabilities) database for all components in batches."""
         
-        vulnerabilities = []
+        vulnerabilities: List[List[Dict[str, Any]]] = [[] for _ in components]
         
         try:
-            query_data = {
-                "package": {
-                    "name": component.get('name'),
-                    "ecosystem": self._map_ecosystem_to_osv(component.get('ecosystem'))
-                }
-            }
-            
-            if component.get('version'):
-                query_data["version"] = component['version']
-            
-            async with session.post(
-                f"{self.osv_api_url}/query",
-                json=query_data,
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    for vuln in data.get('vulns', []):
-                        processed_vuln = self._process_osv_vulnerability(vuln, component)
-                        if processed_vuln:
-                            vulnerabilities.append(processed_vuln)
-                            
-        except Exception as e:
-            print(f"Error querying OSV for {component.get('name')}: {e}")
+            queries = [(self._map_ecosystem_to_osv(component.get('ecosystem')), component.get('name'),
+                        component.get('version')) for component in components]
+            advisories = await client.query_osv(queries)
+            
+            for component, component_vulns, component_advisories in zip(components, vulnerabilities, advisories):
+                for vuln in component_advisories:
+                    processed_vuln = self._process_osv_vulnerability(vuln, component)
+                    if processed_vuln:
+                        component_vulns.append(processed_vuln)
+                        
+        except AdvisoryRequestError as e:
+            print(f"Error querying OSV: {e}")
             
         return vulnerabilities
     
     async def _query_github_advisories(self, 
-                                    session: aiohttp.ClientSession,
-                                    component: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Query GitHub Security Advisories."""
+                                    client: AdvisoryClient,
+                                    components: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Query GitHub Security Advisories for npm components in batches."""
         
-        vulnerabilities = []
+        vulnerabilities: List[List[Dict[str, Any]]] = [[] for _ in components]
+        npm_indices = [index for index, component in enumerate(components) if component.get('ecosystem') == 'npm']
+        if not npm_indices:
+            return vulnerabilities
         
         try:
-            headers = {
-                'Authorization': f'token {self.github_api_key}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
-            # Search for advisories
-            query = f"type:reviewed ecosystem:npm {component.get('name')}"
-            
-            async with session.get(
-                f"https://api.github.com/search/advisories?q={query}",
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    for advisory in data.get('items', []):
-                        processed_vuln = self._process_github_advisory(advisory, component)
-                        if processed_vuln:
-                            vulnerabilities.append(processed_vuln)
-                            
-        except Exception as e:
-            print(f"Error querying GitHub advisories for {component.get('name')}: {e}")
+            advisories = await client.query_github_advisories(
+                'npm', [(components[index].get('name'), components[index].get('version')) for index in npm_indices])
+            
+            # Advisories are keyed by bare package name, so only npm components may match them
+            for index in npm_indices:
+                component = components[index]
+                component_vulns = vulnerabilities[index]
+                for advisory in advisories.get(component.get('name'), []):
+                    processed_vuln = self._process_github_advisory(advisory, component)
+                    if processed_vuln:
+                        component_vulns.append(processed_vuln)
+                        
+        except AdvisoryRequestError as e:
+            print(f"Error querying GitHub advisories: {e}")
             
         return vulnerabilities
     
     def _process_osv_vulnerability(self, 
                                     vuln_data: Dict[str, Any],
-                                    component: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                                    component: Dict[str, Any],
+                                    version_checked: bool = False) -> Optional[Dict[str, Any]]:
         """Process OSV vulnerability data."""
         
         try:
-            # Check if component version is affected
-            if not self._is_version_affected(component.get('version'), vuln_data):
+            # Check if component version is affected (the mirror matches versions itself)
+            if not version_checked and not self._is_version_affected(component.get('version'), vuln_data):
                 return None
             
             # Extract severity
@@ -13,6 +13,8 @@ from dataclasses import dataclass
 from enum import Enum
 import numpy as np
 
+from analyzer.optimization.unified_visitor import ASTNodeData, find_nodes, get_global_ast_data_cache
+
 class PatternType(Enum):
     """Types of code patterns that can be detected."""
     DESIGN_PATTERN = "design_pattern"
@@ -209,9 +211,12 @@ class PatternDetector:
             "duplication": self._detect_duplication_patterns
         }
 
+    # Algorithms reading the shared AST fact table instead of parsing
+    FACT_TABLE_ALGORITHMS = frozenset({"ast_based", "complexity"})
+
     def detect_patterns_in_file(self, file_path: str) -> List[CodePattern]:
         """Detect all patterns in a single file."""
-        if not path_exists(file_path):
+        if not os.path.exists(file_path):
             return []
 
         try:
@@ -220,12 +225,24 @@ class PatternDetector:
         except Exception:
             return []
 
+        return self._run_algorithms(file_path, content, self._collect_facts(file_path, content))
+
+    def analyze_from_data(self, data: ASTNodeData) -> List[CodePattern]:
+        """Detect all patterns from a pre-collected fact table."""
+        return self._run_algorithms(data.file_path, "\n".join(data.source_lines), data)
+
+    def _run_algorithms(self, file_path: str, content: str,
+                        data: Optional[ASTNodeData]) -> List[CodePattern]:
+        """Run every detection algorithm; AST algorithms share one fact table."""
         all_patterns = []
 
         # Run all detection algorithms
         for algorithm_name, algorithm in self.detection_algorithms.items():
             try:
-                patterns = algorithm(file_path, content)
+                if algorithm_name in self.FACT_TABLE_ALGORITHMS:
+                    patterns = algorithm(file_path, content, data)
+                else:
+                    patterns = algorithm(file_path, content)
                 all_patterns.extend(patterns)
             except Exception as e:
                 # Log error but continue with other algorithms
@@ -233,6 +250,13 @@ class PatternDetector:
 
         return all_patterns
 
+    def _collect_facts(self, file_path: str, content: str) -> Optional[ASTNodeData]:
+        """Shared fact table for the content, or None if it does not parse."""
+        try:
+            return get_global_ast_data_cache().get_or_collect(file_path, content)
+        except SyntaxError:
+            return None
+
     def _detect_regex_patterns(self, file_path: str, content: str) -> List[CodePattern]:
         """Detect patterns using regex matching."""
         patterns = []
@@ -270,23 +294,25 @@ class PatternDetector:
 
         return patterns
 
-    def _detect_ast_patterns(self, file_path: str, content: str) -> List[CodePattern]:
+    def _detect_ast_patterns(self, file_path: str, content: str,
+                                data: Optional[ASTNodeData] = None) -> List[CodePattern]:
         """Detect patterns using AST analysis."""
         patterns = []
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return patterns
+        if data is None:
+            data = self._collect_facts(file_path, content)
+            if data is None:
+                return patterns
+        tree = data.tree
 
         # Detect god object pattern
-        patterns.extend(self._detect_god_object(file_path, tree))
+        patterns.extend(self._detect_god_object(file_path, tree, data))
 
         # Detect long parameter lists
-        patterns.extend(self._detect_long_parameter_lists(file_path, tree))
+        patterns.extend(self._detect_long_parameter_lists(file_path, tree, data))
 
         # Detect complex methods
-        patterns.extend(self._detect_complex_methods(file_path, tree))
+        patterns.extend(self._detect_complex_methods(file_path, tree, data))
 
         return patterns
 
@@ -333,33 +359,32 @@ class PatternDetector:
 
         return patterns
 
-    def _detect_complexity_patterns(self, file_path: str, content: str) -> List[CodePattern]:
+    def _detect_complexity_patterns(self, file_path: str, content: str,
+                                    data: Optional[ASTNodeData] = None) -> List[CodePattern]:
         """Detect complexity-related patterns."""
         patterns = []
 
-        try:
-            tree = ast.parse(content)
-
-            # Calculate cyclomatic complexity for functions
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    complexity = self._calculate_cyclomatic_complexity(node)
-                    if complexity > 10:  # High complexity threshold
-                        patterns.append(CodePattern(
-                            pattern_type=PatternType.REFACTORING_OPPORTUNITY,
-                            pattern_name="high_complexity_method",
-                            severity=PatternSeverity.HIGH if complexity > 20 else PatternSeverity.MEDIUM,
-                            confidence=0.9,
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            description=f"Method '{node.name}' has high cyclomatic complexity ({complexity})",
-                            evidence={"complexity": complexity, "method_name": node.name},
-                            recommendation="Break down method into smaller functions",
-                            impact="High complexity reduces maintainability"
-                        ))
+        if data is None:
+            data = self._collect_facts(file_path, content)
+            if data is None:
+                return patterns
 
-        except SyntaxError:
-            pass
+        # Calculate cyclomatic complexity for functions
+        for node in data.nodes_of(ast.FunctionDef):
+            complexity = self._calculate_cyclomatic_complexity(node)
+            if complexity > 10:  # High complexity threshold
+                patterns.append(CodePattern(
+                    pattern_type=PatternType.REFACTORING_OPPORTUNITY,
+                    pattern_name="high_complexity_method",
+                    severity=PatternSeverity.HIGH if complexity > 20 else PatternSeverity.MEDIUM,
+                    confidence=0.9,
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description=f"Method '{node.name}' has high cyclomatic complexity ({complexity})",
+                    evidence={"complexity": complexity, "method_name": node.name},
+                    recommendation="Break down method into smaller functions",
+                    impact="High complexity reduces maintainability"
+                ))
 
         return patterns
 
@@ -406,104 +431,104 @@ class PatternDetector:
 
         return patterns
 
-    def _detect_god_object(self, file_path: str, tree: ast.AST) -> List[CodePattern]:
+    def _detect_god_object(self, file_path: str, tree: ast.AST,
+                           data: Optional[ASTNodeData] = None) -> List[CodePattern]:
         """Detect god object anti-pattern."""
         patterns = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Count methods and attributes
-                methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
-                attributes = [n for n in node.body if isinstance(n, ast.Assign)]
+        for node in find_nodes(tree, (ast.ClassDef,), data):
+            # Count methods and attributes
+            methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
+            attributes = [n for n in node.body if isinstance(n, ast.Assign)]
 
-                method_count = len(methods)
-                attribute_count = len(attributes)
+            method_count = len(methods)
+            attribute_count = len(attributes)
 
-                # Calculate total lines in class
-                if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
-                    class_lines = node.end_lineno - node.lineno
-                else:
-                    class_lines = len(methods) * 10  # Estimate
-
-                # God object thresholds
-                if method_count > 20 or attribute_count > 15 or class_lines > 500:
-                    severity = PatternSeverity.HIGH if method_count > 30 else PatternSeverity.MEDIUM
-
-                    patterns.append(CodePattern(
-                        pattern_type=PatternType.ANTI_PATTERN,
-                        pattern_name="god_object",
-                        severity=severity,
-                        confidence=0.8,
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        description=f"God object: class '{node.name}' with {method_count} methods",
-                        evidence={
-                            "class_name": node.name,
-                            "method_count": method_count,
-                            "attribute_count": attribute_count,
-                            "estimated_lines": class_lines
-                        },
-                        recommendation="Split class into smaller, focused classes",
-                        impact="Violates single responsibility principle"
-                    ))
+            # Calculate total lines in class
+            if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
+                class_lines = node.end_lineno - node.lineno
+            else:
+                class_lines = len(methods) * 10  # Estimate
+
+            # God object thresholds
+            if method_count > 20 or attribute_count > 15 or class_lines > 500:
+                severity = PatternSeverity.HIGH if method_count > 30 else PatternSeverity.MEDIUM
+
+                patterns.append(CodePattern(
+                    pattern_type=PatternType.ANTI_PATTERN,
+                    pattern_name="god_object",
+                    severity=severity,
+                    confidence=0.8,
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description=f"God object: class '{node.name}' with {method_count} methods",
+                    evidence={
+                        "class_name": node.name,
+                        "method_count": method_count,
+                        "attribute_count": attribute_count,
+                        "estimated_lines": class_lines
+                    },
+                    recommendation="Split class into smaller, focused classes",
+                    impact="Violates single responsibility principle"
+                ))
 
         return patterns
 
-    def _detect_long_parameter_lists(self, file_path: str, tree: ast.AST) -> List[CodePattern]:
+    def _detect_long_parameter_lists(self, file_path: str, tree: ast.AST,
+                                     data: Optional[ASTNodeData] = None) -> List[CodePattern]:
         """Detect long parameter list anti-pattern."""
         patterns = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                param_count = len(node.args.args)
-
-                if param_count > 5:  # More than 5 parameters
-                    severity = PatternSeverity.HIGH if param_count > 8 else PatternSeverity.MEDIUM
-
-                    patterns.append(CodePattern(
-                        pattern_type=PatternType.ANTI_PATTERN,
-                        pattern_name="long_parameter_list",
-                        severity=severity,
-                        confidence=0.9,
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        description=f"Function '{node.name}' has {param_count} parameters",
-                        evidence={
-                            "function_name": node.name,
-                            "parameter_count": param_count,
-                            "parameters": [arg.arg for arg in node.args.args]
-                        },
-                        recommendation="Use parameter object or reduce dependencies",
-                        impact="Reduced function usability and testability"
-                    ))
+        for node in find_nodes(tree, (ast.FunctionDef,), data):
+            param_count = len(node.args.args)
+
+            if param_count > 5:  # More than 5 parameters
+                severity = PatternSeverity.HIGH if param_count > 8 else PatternSeverity.MEDIUM
+
+                patterns.append(CodePattern(
+                    pattern_type=PatternType.ANTI_PATTERN,
+                    pattern_name="long_parameter_list",
+                    severity=severity,
+                    confidence=0.9,
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description=f"Function '{node.name}' has {param_count} parameters",
+                    evidence={
+                        "function_name": node.name,
+                        "parameter_count": param_count,
+                        "parameters": [arg.arg for arg in node.args.args]
+                    },
+                    recommendation="Use parameter object or reduce dependencies",
+                    impact="Reduced function usability and testability"
+                ))
 
         return patterns
 
-    def _detect_complex_methods(self, file_path: str, tree: ast.AST) -> List[CodePattern]:
+    def _detect_complex_methods(self, file_path: str, tree: ast.AST,
+                                data: Optional[ASTNodeData] = None) -> List[CodePattern]:
         """Detect overly complex methods."""
         patterns = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Calculate method length
-                method_lines = len(node.body)
-
-                if method_lines > 50:  # Long method threshold
-                    patterns.append(CodePattern(
-                        pattern_type=PatternType.REFACTORING_OPPORTUNITY,
-                        pattern_name="long_method",
-                        severity=PatternSeverity.MEDIUM,
-                        confidence=0.8,
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        description=f"Long method '{node.name}' with {method_lines} statements",
-                        evidence={
-                            "method_name": node.name,
-                            "statement_count": method_lines
-                        },
-                        recommendation="Break down into smaller methods",
-                        impact="Reduced readability and maintainability"
-                    ))
+        for node in find_nodes(tree, (ast.FunctionDef,), data):
+            # Calculate method length
+            method_lines = len(node.body)
+
+            if method_lines > 50:  # Long method threshold
+                patterns.append(CodePattern(
+                    pattern_type=PatternType.REFACTORING_OPPORTUNITY,
+                    pattern_name="long_method",
+                    severity=PatternSeverity.MEDIUM,
+                    confidence=0.8,
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description=f"Long method '{node.name}' with {method_lines} statements",
+                    evidence={
+                        "method_name": node.name,
+                        "statement_count": method_lines
+                    },
+                    recommendation="Break down into smaller methods",
+                    impact="Reduced readability and maintainability"
+                ))
 
         return patterns
 
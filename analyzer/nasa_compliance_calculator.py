@@ -95,8 +95,16 @@ class NASAComplianceCalculator:
         documentation_score: Optional[float] = None
     ) -> ComplianceResult:
         """Calculate NASA compliance score with proper weighting."""
+        return self.calculate_compliance_from_counts(
+            self.count_violations_by_severity(violations),
+            file_count=file_count,
+            test_coverage=test_coverage,
+            documentation_score=documentation_score
+        )
 
-        # Count violations by severity
+    @staticmethod
+    def count_violations_by_severity(violations: List[Dict]) -> Dict[str, int]:
+        """Count violations by severity, defaulting unknown severities to medium."""
         violation_counts = {
             "critical": 0,
             "high": 0,
@@ -112,6 +120,25 @@ class NASAComplianceCalculator:
                 # Default unknown severities to medium
                 violation_counts["medium"] += 1
 
+        return violation_counts
+
+    def calculate_compliance_from_counts(
+        self,
+        violation_counts: Dict[str, int],
+        file_count: int = 1,
+        test_coverage: Optional[float] = None,
+        documentation_score: Optional[float] = None
+    ) -> ComplianceResult:
+        """Calculate NASA compliance score from pre-aggregated severity counts.
+
+        Used by the incremental compliance tracker so the project score can be
+        refreshed without re-reading the full violation list.
+        """
+        violation_counts = {
+            severity: violation_counts.get(severity, 0)
+            for severity in ("critical", "high", "medium", "low")
+        }
+
         # Calculate weighted violation score
         weighted_violations = (
             violation_counts["critical"] * self.config.critical_weight +
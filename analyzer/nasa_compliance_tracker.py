@@ -0,0 +1,327 @@
+"""Incremental NASA compliance scoring.
+
+Keeps per-file violation counts (by severity, NASA rule and metric category)
+next to the cached file results and maintains a running project aggregate
+that is updated by deltas whenever a file changes. Dashboards and quality
+gates read the current compliance score in O(1) instead of re-scoring the
+full violation list after every change.
+"""
+
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from .architecture.connascence_metrics import ConnascenceMetrics
+from .nasa_compliance_calculator import ComplianceResult, NASAComplianceCalculator
+
+logger = logging.getLogger(__name__)
+
+# Result type used when counts are stored in an IncrementalCache
+COMPLIANCE_COUNTS_RESULT_TYPE = "nasa_compliance_counts"
+
+@dataclass
+class FileComplianceCounts:
+    """Violation counts for a single file, the unit of incremental updates."""
+    file_path: str
+    content_hash: str = ""
+    severity_counts: Dict[str, int] = field(default_factory=dict)
+    rule_counts: Dict[int, int] = field(default_factory=dict)
+    category_counts: Dict[str, int] = field(default_factory=dict)
+    total_violations: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize counts for cache storage."""
+        return {
+            "file_path": self.file_path,
+            "content_hash": self.content_hash,
+            "severity_counts": dict(self.severity_counts),
+            "rule_counts": {str(rule_id): count for rule_id, count in self.rule_counts.items()},
+            "category_counts": dict(self.category_counts),
+            "total_violations": self.total_violations
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileComplianceCounts":
+        """Rebuild counts from cached data."""
+        return cls(
+            file_path=data["file_path"],
+            content_hash=data.get("content_hash", ""),
+            severity_counts=dict(data.get("severity_counts", {})),
+            rule_counts={int(rule_id): count for rule_id, count in data.get("rule_counts", {}).items()},
+            category_counts=dict(data.get("category_counts", {})),
+            total_violations=data.get("total_violations", 0)
+        )
+
+def flatten_violations(violations: Union[List[Dict], Dict[str, Any], None]) -> List[Dict]:
+    """Normalize list or type-keyed dict violation payloads into a flat list."""
+    if not violations:
+        return []
+    if isinstance(violations, list):
+        return violations
+
+    flat = []
+    for violation_type, entries in violations.items():
+        if not entries:
+            continue
+        for entry in entries if isinstance(entries, list) else [entries]:
+            if isinstance(entry, dict):
+                flat.append(entry if "type" in entry else {**entry, "type": violation_type})
+            else:
+                flat.append({"type": violation_type})
+    return flat
+
+class IncrementalComplianceTracker:
+    """
+    Running NASA compliance aggregate maintained by per-file deltas.
+
+    Each ``update_file`` subtracts the file's previous counts and adds the new
+    ones, so the project aggregate never has to be rebuilt from scratch. The
+    scored result is memoized until the next change.
+    """
+
+    def __init__(self,
+                calculator: Optional[NASAComplianceCalculator] = None,
+                policy_engine=None,
+                metrics: Optional[ConnascenceMetrics] = None,
+                cache=None):
+        """
+        Initialize tracker.
+
+        Args:
+            calculator: Weighted severity scorer (created lazily if omitted)
+            policy_engine: Optional PolicyEngine for per-rule scoring
+            metrics: Optional ConnascenceMetrics for category-based scoring
+            cache: Optional IncrementalCache storing counts alongside file results
+        """
+        self._calculator = calculator
+        self.policy_engine = policy_engine
+        self.metrics = metrics
+        self.cache = cache
+
+        self._file_counts: Dict[str, FileComplianceCounts] = {}
+        self._severity_totals: Counter = Counter()
+        self._rule_totals: Counter = Counter()
+        self._category_totals: Counter = Counter()
+        self._total_violations = 0
+
+        self._cached_result: Optional[ComplianceResult] = None
+        self._cached_result_key = None
+        self._lock = threading.RLock()
+
+        self._stats = {
+            "file_updates": 0,
+            "file_removals": 0,
+            "cache_restores": 0,
+            "score_recalculations": 0
+        }
+
+    @property
+    def calculator(self) -> NASAComplianceCalculator:
+        """Severity scorer, created on first use."""
+        if self._calculator is None:
+            self._calculator = NASAComplianceCalculator()
+        return self._calculator
+
+    @property
+    def file_count(self) -> int:
+        """Number of files contributing to the aggregate."""
+        return len(self._file_counts)
+
+    def count_file(self, file_path: str,
+                    violations: Union[List[Dict], Dict[str, Any]],
+                    content_hash: str = "") -> FileComplianceCounts:
+        """Count a single file's violations without touching the aggregate."""
+        violations = flatten_violations(violations)
+        rule_counts = {}
+        if self.policy_engine is not None:
+            rule_counts = {
+                rule_id: count
+                for rule_id, count in self.policy_engine.count_nasa_rule_violations(violations).items()
+                if count
+            }
+        else:
+            for violation in violations:
+                rule_id = violation.get("nasa_rule")
+                if isinstance(rule_id, int):
+                    rule_counts[rule_id] = rule_counts.get(rule_id, 0) + 1
+
+        return FileComplianceCounts(
+            file_path=file_path,
+            content_hash=content_hash,
+            severity_counts=NASAComplianceCalculator.count_violations_by_severity(violations),
+            rule_counts=rule_counts,
+            category_counts=ConnascenceMetrics.count_nasa_categories(violations),
+            total_violations=len(violations)
+        )
+
+    def update_file(self, file_path: str,
+                    violations: Union[List[Dict], Dict[str, Any], None] = None,
+                    content_hash: str = "") -> Optional[FileComplianceCounts]:
+        """
+        Replace a file's contribution to the aggregate.
+
+        When ``violations`` is None the counts are restored from the cache for
+        ``content_hash``; None is returned if nothing valid is cached.
+        """
+        file_path = str(file_path)
+        if violations is None:
+            counts = self._restore_from_cache(file_path, content_hash)
+            if counts is None:
+                return None
+        else:
+            counts = self.count_file(file_path, violations, content_hash)
+            self._store_in_cache(counts)
+
+        with self._lock:
+            previous = self._file_counts.get(file_path)
+            if previous is not None:
+                self._apply_delta(previous, -1)
+            self._apply_delta(counts, 1)
+            self._file_counts[file_path] = counts
+            self._invalidate()
+            self._stats["file_updates"] += 1
+        return counts
+
+    def remove_file(self, file_path: str) -> bool:
+        """Drop a deleted file from the aggregate."""
+        file_path = str(file_path)
+        with self._lock:
+            previous = self._file_counts.pop(file_path, None)
+            if previous is None:
+                return False
+            self._apply_delta(previous, -1)
+            self._invalidate()
+            self._stats["file_removals"] += 1
+            return True
+
+    def get_file_counts(self, file_path: str) -> Optional[FileComplianceCounts]:
+        """Get the counts currently recorded for a file."""
+        with self._lock:
+            return self._file_counts.get(str(file_path))
+
+    def get_severity_counts(self) -> Dict[str, int]:
+        """Project-wide violation counts by severity."""
+        with self._lock:
+            return {severity: self._severity_totals.get(severity, 0)
+                    for severity in ("critical", "high", "medium", "low")}
+
+    def get_rule_counts(self) -> Dict[int, int]:
+        """Project-wide violation counts by NASA rule."""
+        with self._lock:
+            return {rule_id: self._rule_totals.get(rule_id, 0) for rule_id in range(1, 11)}
+
+    def get_category_counts(self) -> Dict[str, int]:
+        """Project-wide counts for the ConnascenceMetrics NASA categories."""
+        with self._lock:
+            return dict(self._category_totals)
+
+    def get_compliance_result(self,
+                            test_coverage: Optional[float] = None,
+                            documentation_score: Optional[float] = None) -> ComplianceResult:
+        """Current weighted compliance result, recomputed only after changes."""
+        with self._lock:
+            key = (test_coverage, documentation_score)
+            if self._cached_result is None or self._cached_result_key != key:
+                self._cached_result = self.calculator.calculate_compliance_from_counts(
+                    self.get_severity_counts(),
+                    file_count=max(self.file_count, 1),
+                    test_coverage=test_coverage,
+                    documentation_score=documentation_score
+                )
+                self._cached_result_key = key
+                self._stats["score_recalculations"] += 1
+            return self._cached_result
+
+    def get_score(self) -> float:
+        """Current project compliance score (0.0-1.0)."""
+        return self.get_compliance_result().score
+
+    def get_policy_compliance(self):
+        """Per-rule PolicyEngine compliance from the running rule counts."""
+        assert self.policy_engine is not None, "policy_engine required for rule scoring"
+        return self.policy_engine.evaluate_nasa_compliance_from_counts(self.get_rule_counts())
+
+    def get_metrics_compliance(self) -> Dict[str, Any]:
+        """ConnascenceMetrics compliance from the running category counts."""
+        metrics = self.metrics or ConnascenceMetrics()
+        return metrics.calculate_nasa_compliance_from_counts(self.get_category_counts())
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Dashboard-ready view of the current aggregate."""
+        with self._lock:
+            result = self.get_compliance_result()
+            return {
+                "score": result.score,
+                "level": result.level,
+                "passes_gate": result.passes_gate,
+                "files_tracked": self.file_count,
+                "total_violations": self._total_violations,
+                "severity_counts": self.get_severity_counts(),
+                "rule_counts": self.get_rule_counts(),
+                "stats": dict(self._stats)
+            }
+
+    def reset(self) -> None:
+        """Clear all tracked files."""
+        with self._lock:
+            self._file_counts.clear()
+            self._severity_totals.clear()
+            self._rule_totals.clear()
+            self._category_totals.clear()
+            self._total_violations = 0
+            self._invalidate()
+
+    def _apply_delta(self, counts: FileComplianceCounts, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a file's counts from the totals."""
+        for totals, file_totals in ((self._severity_totals, counts.severity_counts),
+                                    (self._rule_totals, counts.rule_counts),
+                                    (self._category_totals, counts.category_counts)):
+            for key, count in file_totals.items():
+                totals[key] += sign * count
+                if totals[key] <= 0:
+                    del totals[key]
+        self._total_violations = max(0, self._total_violations + sign * counts.total_violations)
+
+    def _invalidate(self) -> None:
+        """Drop the memoized result after the aggregate changed."""
+        self._cached_result = None
+        self._cached_result_key = None
+
+    def _store_in_cache(self, counts: FileComplianceCounts) -> None:
+        """Store counts next to the file's other cached results."""
+        if self.cache is None or not counts.content_hash:
+            return
+        try:
+            self.cache.store_partial_result(
+                counts.file_path,
+                COMPLIANCE_COUNTS_RESULT_TYPE,
+                counts.to_dict(),
+                counts.content_hash
+            )
+        except Exception as e:
+            logger.debug(f"Failed to cache compliance counts for {counts.file_path}: {e}")
+
+    def _restore_from_cache(self, file_path: str, content_hash: str) -> Optional[FileComplianceCounts]:
+        """Load counts for an unchanged file from the cache."""
+        if self.cache is None or not content_hash:
+            return None
+        cached = self.cache.get_partial_result(file_path, COMPLIANCE_COUNTS_RESULT_TYPE, content_hash)
+        if cached is None:
+            return None
+        self._stats["cache_restores"] += 1
+        return FileComplianceCounts.from_dict(cached.data)
+
+# Global tracker instance
+_global_compliance_tracker: Optional[IncrementalComplianceTracker] = None
+_tracker_lock = threading.Lock()
+
+def get_global_compliance_tracker() -> IncrementalComplianceTracker:
+    """Get or create global incremental compliance tracker."""
+    global _global_compliance_tracker
+
+    with _tracker_lock:
+        if _global_compliance_tracker is None:
+            _global_compliance_tracker = IncrementalComplianceTracker()
+    return _global_compliance_tracker
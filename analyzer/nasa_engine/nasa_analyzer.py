@@ -45,12 +45,14 @@ except ImportError:
 # Import optimization components
 try:
     from ..optimization.file_cache import (
-        cached_file_content, cached_ast_tree, get_global_cache
+        cached_file_content, get_global_cache
     )
     CACHE_AVAILABLE = True
 except ImportError:
     CACHE_AVAILABLE = False
 
+from analyzer.optimization.unified_visitor import ASTNodeData, find_nodes, get_global_ast_data_cache
+
 try:
     import yaml
 except ImportError:
@@ -102,12 +104,9 @@ class NASAAnalyzer:
             if not file_path.endswith(('.py', '.pyx')):
                 return []
 
-            # Parse AST
+            # Parse AST (shared fact table, one parse per file content)
             try:
-                if CACHE_AVAILABLE:
-                    tree = cached_ast_tree(file_path, content)
-                else:
-                    tree = ast.parse(content, filename=file_path)
+                data = get_global_ast_data_cache().get_or_collect(file_path, content)
             except SyntaxError as e:
                 # Return syntax error as violation
                 violation = ConnascenceViolation(
@@ -119,26 +118,42 @@ class NASAAnalyzer:
                 )
                 return [violation]
 
-            # Perform NASA Power of Ten analysis
+            return self.analyze_from_data(data)
+
+        except Exception as e:
+            return [self._analysis_error(file_path, e)]
+
+    def analyze_from_data(self, data: ASTNodeData) -> List[ConnascenceViolation]:
+        """
+        Check all Power of Ten rules against a pre-collected fact table.
+
+        Args:
+            data: Fact table from UnifiedASTVisitor / ASTDataCache
+
+        Returns:
+            List of NASA compliance violations found
+        """
+        tree, file_path = data.tree, data.file_path
+        try:
             violations = []
 
             # Rule 1: No goto statements (N/A in Python)
-            violations.extend(self._check_loop_bounds(tree, file_path))
+            violations.extend(self._check_loop_bounds(tree, file_path, data))
 
             # Rule 3: No dynamic memory allocation after initialization
             violations.extend(self._check_dynamic_allocation(tree, file_path))
 
             # Rule 4: No function longer than 60 lines
-            violations.extend(self._check_function_length(tree, file_path))
+            violations.extend(self._check_function_length(tree, file_path, data))
 
             # Rule 5: Assertion density at least 2%
-            violations.extend(self._check_assertion_density(tree, file_path))
+            violations.extend(self._check_assertion_density(tree, file_path, data))
 
             # Rule 6: Data objects declared at smallest possible scope
             violations.extend(self._check_data_scope(tree, file_path))
 
             # Rule 7: Check return values of non-void functions
-            violations.extend(self._check_return_values(tree, file_path))
+            violations.extend(self._check_return_values(tree, file_path, data))
 
             # Rule 8: No preprocessor use beyond includes/defines (limited Python equivalent)
             violations.extend(self._check_preprocessor_use(tree, file_path))
@@ -152,30 +167,32 @@ class NASAAnalyzer:
             return violations
 
         except Exception as e:
-            # Return analysis error as violation
-            violation = ConnascenceViolation(
-                type="NASA-Analysis-Error",
-                severity="error",
-                file_path=file_path,
-                line_number=1,
-                description=f"NASA analysis failed: {str(e)} (Check file accessibility and format)"
-            )
-            return [violation]
-
-    def _check_loop_bounds(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
+            return [self._analysis_error(file_path, e)]
+
+    def _analysis_error(self, file_path: str, error: Exception) -> ConnascenceViolation:
+        """Report an analysis failure as a violation."""
+        return ConnascenceViolation(
+            type="NASA-Analysis-Error",
+            severity="error",
+            file_path=file_path,
+            line_number=1,
+            description=f"NASA analysis failed: {str(error)} (Check file accessibility and format)"
+        )
+
+    def _check_loop_bounds(self, tree: ast.AST, file_path: str,
+                            data: Optional[ASTNodeData] = None) -> List[ConnascenceViolation]:
         """Check that all loops have fixed bounds (NASA Rule 2)."""
         violations = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.For, ast.While)):
-                # Basic check - more sophisticated analysis could be added
-                if isinstance(node, ast.While) and not self._has_fixed_bound(node):
-                    violations.append(ConnascenceViolation(
-                        type="NASA-Loop-Bounds",
-                        severity="warning",
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        description="While loop may not have fixed bounds. Ensure loop has deterministic termination condition"
-                    ))
+        for node in find_nodes(tree, (ast.For, ast.While), data):
+            # Basic check - more sophisticated analysis could be added
+            if isinstance(node, ast.While) and not self._has_fixed_bound(node):
+                violations.append(ConnascenceViolation(
+                    type="NASA-Loop-Bounds",
+                    severity="warning",
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    description="While loop may not have fixed bounds. Ensure loop has deterministic termination condition"
+                ))
         return violations
 
     def _check_dynamic_allocation(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
@@ -184,34 +201,34 @@ class NASAAnalyzer:
         # Python's garbage collection makes this less critical, but check for large allocations
         return violations
 
-    def _check_function_length(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
+    def _check_function_length(self, tree: ast.AST, file_path: str,
+                                data: Optional[ASTNodeData] = None) -> List[ConnascenceViolation]:
         """Check that functions are not longer than 60 lines (NASA Rule 4)."""
         violations = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if hasattr(node, 'end_lineno') and node.end_lineno:
-                    length = node.end_lineno - node.lineno + 1
-                    if length > 60:
-                        violations.append(ConnascenceViolation(
-                            violation_type="NASA-Function-Length",
-                            severity="warning",
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            description=f"Function '{node.name}' is {length} lines (max: 60). Break down large functions into smaller ones"
-                        ))
+        for node in find_nodes(tree, (ast.FunctionDef,), data):
+            if hasattr(node, 'end_lineno') and node.end_lineno:
+                length = node.end_lineno - node.lineno + 1
+                if length > 60:
+                    violations.append(ConnascenceViolation(
+                        violation_type="NASA-Function-Length",
+                        severity="warning",
+                        file_path=file_path,
+                        line_number=node.lineno,
+                        description=f"Function '{node.name}' is {length} lines (max: 60). Break down large functions into smaller ones"
+                    ))
         return violations
 
-    def _check_assertion_density(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
+    def _check_assertion_density(self, tree: ast.AST, file_path: str,
+                                    data: Optional[ASTNodeData] = None) -> List[ConnascenceViolation]:
         """Check assertion density is at least 2% (NASA Rule 5)."""
         violations = []
-        total_lines = 0
-        assertion_lines = 0
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assert):
-                assertion_lines += 1
-            if hasattr(node, 'lineno'):
-                total_lines = max(total_lines, node.lineno)
+        if data is not None and data.tree is tree:
+            assertion_lines = len(data.nodes_of(ast.Assert))
+            total_lines = data.max_lineno()
+        else:
+            nodes = list(ast.walk(tree))
+            assertion_lines = sum(1 for node in nodes if isinstance(node, ast.Assert))
+            total_lines = max((getattr(node, 'lineno', 0) for node in nodes), default=0)
 
         if total_lines > 0:
             density = (assertion_lines / total_lines) * 100
@@ -262,12 +279,13 @@ class NASAAnalyzer:
 
         return violations
 
-    def _check_return_values(self, tree: ast.AST, file_path: str) -> List[ConnascenceViolation]:
+    def _check_return_values(self, tree: ast.AST, file_path: str,
+                                data: Optional[ASTNodeData] = None) -> List[ConnascenceViolation]:
         """Check return values of functions are used (NASA Rule 7)."""
         violations = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+        for node in find_nodes(tree, (ast.Expr,), data):
+            if isinstance(node.value, ast.Call):
                 # Identify function name if possible
                 if isinstance(node.value.func, ast.Name):
                     func_name = node.value.func.id
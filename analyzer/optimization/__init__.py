@@ -25,12 +25,27 @@ from .file_cache import (
     CacheEntry
 )
 
-from .performance_benchmark import PerformanceBenchmark
+import importlib
 
-try:
-    from .streaming_performance_monitor import StreamingPerformanceMonitor
-except ImportError:
-    StreamingPerformanceMonitor = None
+# Benchmark and monitor pull in the unified analyzer; load them on first
+# access (PEP 562) so detectors can import the fact-table visitor cheaply.
+_LAZY_ATTRIBUTES = {
+    'PerformanceBenchmark': '.performance_benchmark',
+    'StreamingPerformanceMonitor': '.streaming_performance_monitor',
+}
+
+def __getattr__(name):
+    """Import heavy optimization components lazily."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    except ImportError:
+        if name != 'StreamingPerformanceMonitor':
+            raise
+        value = None
+    globals()[name] = value
+    return value
 
 __all__ = [
     'FileContentCache',
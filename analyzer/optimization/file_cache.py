@@ -207,8 +207,8 @@ class FileContentCache:
             except SyntaxError:
                 return None
     
-@lru_cache(maxsize=1000)
-def get_python_files(self, directory: str) -> List[str]:
+    @lru_cache(maxsize=1000)
+    def get_python_files(self, directory: str) -> List[str]:
         """
         Get list of Python files in directory (cached).
         
@@ -239,7 +239,7 @@ def get_python_files(self, directory: str) -> List[str]:
         except Exception:
             return []
     
-def get_file_lines(self, file_path: Union[str, Path]) -> List[str]:
+    def get_file_lines(self, file_path: Union[str, Path]) -> List[str]:
         """
         Get file content as list of lines.
         
@@ -254,7 +254,7 @@ def get_file_lines(self, file_path: Union[str, Path]) -> List[str]:
             return []
         return content.splitlines()
     
-def prefetch_files(self, file_paths: List[Union[str, Path]]) -> int:
+    def prefetch_files(self, file_paths: List[Union[str, Path]]) -> int:
         """
         Prefetch multiple files into cache.
         
@@ -270,7 +270,7 @@ def prefetch_files(self, file_paths: List[Union[str, Path]]) -> int:
                 cached_count += 1
         return cached_count
     
-def _enforce_memory_bounds(self) -> None:
+    def _enforce_memory_bounds(self) -> None:
         """Enforce memory bounds by evicting LRU entries."""
         # Phase 2A: Enhanced memory pressure handling
         current_usage = self._stats.memory_usage
@@ -308,7 +308,7 @@ def _enforce_memory_bounds(self) -> None:
             if oldest_path in self._file_mtimes:
                 del self._file_mtimes[oldest_path]
     
-def clear_cache(self) -> None:
+    def clear_cache(self) -> None:
         """Clear all cached data."""
         with self._lock:
             self._cache.clear()
@@ -318,7 +318,7 @@ def clear_cache(self) -> None:
             # Clear LRU cache
             self.get_python_files.cache_clear()
     
-def get_cache_stats(self) -> CacheStats:
+    def get_cache_stats(self) -> CacheStats:
         """Get cache performance statistics."""
         with self._lock:
             return CacheStats(
@@ -329,7 +329,7 @@ def get_cache_stats(self) -> CacheStats:
                 max_memory=self._stats.max_memory
             )
     
-def invalidate_file(self, file_path: Union[str, Path]) -> None:
+    def invalidate_file(self, file_path: Union[str, Path]) -> None:
         """Invalidate cache entry for specific file."""
         file_path = str(file_path)
         with self._lock:
@@ -340,7 +340,7 @@ def invalidate_file(self, file_path: Union[str, Path]) -> None:
             if file_path in self._file_mtimes:
                 del self._file_mtimes[file_path]
     
-def get_memory_usage(self) -> Dict[str, int]:
+    def get_memory_usage(self) -> Dict[str, int]:
         """Get detailed memory usage breakdown."""
         with self._lock:
             return {
@@ -353,13 +353,23 @@ def get_memory_usage(self) -> Dict[str, int]:
                 )
             }
     
-def __enter__(self):
+    def memory_footprint(self) -> Dict[str, int]:
+        """Entries and bytes held, for the memory monitor's cache namespace report."""
+        with self._lock:
+            return {
+                'entries': len(self._cache),
+                'size_bytes': self._stats.memory_usage,
+                'ast_entries': len(self._ast_cache),
+            }
+    
+    def __enter__(self):
         """Context manager entry."""
         return self
     
-def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup if needed."""
         # Optional: clear cache on exit
+        pass
 
 # Global cache instance for module-level access
 _global_cache: Optional[FileContentCache] = None
@@ -373,9 +383,18 @@ def get_global_cache() -> FileContentCache:
         with _cache_lock:
             if _global_cache is None:
                 _global_cache = FileContentCache()
+                _register_memory_namespace('file_content', _global_cache.memory_footprint)
     
     return _global_cache
 
+def _register_memory_namespace(name: str, reporter) -> None:
+    """Report a global cache's size to the memory monitor when it is available."""
+    try:
+        from .memory_monitor import register_cache_namespace
+        register_cache_namespace(name, reporter)
+    except ImportError:
+        pass
+
 def clear_global_cache() -> None:
     """Clear global cache instance."""
     global _global_cache
@@ -10,8 +10,18 @@ analyzes changed files and their dependencies.
 import hashlib
 import json
 import logging
+import subprocess
+import time
 
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..caching.ast_cache import ast_cache
+from ..core import IMPORT_MANAGER
+from .violation_fingerprints import BaselineIndex, FingerprintCalculator
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class FileChangeInfo:
@@ -67,20 +77,26 @@ class IncrementalAnalyzer:
         project_root: Union[str, Path],
         baseline_results_file: str = ".connascence_baseline.json",
         dependency_cache_file: str = ".connascence_deps.json",
+        baseline_index_file: str = ".connascence_baseline_index.json",
+        analyzer: Optional[Any] = None,
     ):
         """Initialize incremental analyzer."""
 
-        self.project_root = Path(project_root)
+        self.project_root = Path(project_root).resolve()
         self.baseline_file = self.project_root / baseline_results_file
         self.dependency_cache_file = self.project_root / dependency_cache_file
+        self.baseline_index = BaselineIndex(self.project_root / baseline_index_file, project_root=self.project_root)
 
-        self.analyzer = ConnascenceAnalyzer()
+        self.analyzer = analyzer or IMPORT_MANAGER.import_unified_analyzer().module()
         self.baseline_results = {}
         self.dependency_graph = {}
 
         # Load existing baseline and dependencies
         self._load_baseline_results()
         self._load_dependency_cache()
+        if not self.baseline_index.load() and self.baseline_results.get("violations"):
+            # Migrate list-based baselines to the fingerprint index
+            self.baseline_index.rebuild(self.baseline_results["violations"], FingerprintCalculator(self.project_root))
 
         logger.info(f"Incremental analyzer initialized for {self.project_root}")
 
@@ -130,7 +146,7 @@ class IncrementalAnalyzer:
         analysis_results = self._analyze_files(files_to_analyze)
 
         # Compare with baseline
-        comparison_results = self._compare_with_baseline(analysis_results, baseline_result)
+        comparison_results = self._compare_with_baseline(analysis_results, baseline_result, files_to_analyze)
 
         # Calculate performance metrics
         analysis_time = time.time() - start_time
@@ -167,7 +183,7 @@ class IncrementalAnalyzer:
         )
 
         # Update baseline with current results
-        self._update_baseline(analysis_results, current_commit)
+        self._update_baseline(analysis_results, current_commit, files_to_analyze)
 
         logger.info(
             f"Incremental analysis complete: {analysis_time:.2f}s saved {time_saved:.2f}s "
@@ -183,7 +199,7 @@ class IncrementalAnalyzer:
         start_time = time.time()
 
         # Analyze entire project
-        result = self.analyzer.analyze_path(str(self.project_root))
+        result = self._as_result_dict(self.analyzer.analyze_path(str(self.project_root)))
 
         # Add metadata
         baseline = {
@@ -204,6 +220,11 @@ class IncrementalAnalyzer:
         # Save baseline
         self.baseline_results = baseline
         self._save_baseline_results()
+        self.baseline_index.rebuild(baseline["violations"], FingerprintCalculator(self.project_root), baseline["commit_hash"])
+        try:
+            self.baseline_index.save()
+        except OSError as e:
+            logger.error(f"Failed to save baseline index: {e}")
 
         # Update dependency cache
         self._update_dependency_cache()
@@ -412,7 +433,7 @@ class IncrementalAnalyzer:
         for file_path in file_paths:
             try:
                 full_path = self.project_root / file_path
-                result = self.analyzer.analyze_path(str(full_path))
+                result = self._as_result_dict(self.analyzer.analyze_path(str(full_path)))
 
                 # Add file violations
                 file_violations = result.get("violations", [])
@@ -427,24 +448,21 @@ class IncrementalAnalyzer:
         }
 
     def _compare_with_baseline(
-        self, current_results: Dict[str, Any], baseline_results: Dict[str, Any]
+        self,
+        current_results: Dict[str, Any],
+        baseline_results: Dict[str, Any],
+        analyzed_files: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Compare current results with baseline."""
+        """Compare current results with baseline using line-shift-tolerant fingerprints."""
 
         current_violations = current_results.get("violations", [])
-        baseline_violations = baseline_results.get("violations", [])
-
-        # Create violation signatures for comparison
-    def violation_signature(v):
-            return (v.get("file_path", ""), v.get("line_number", 0), v.get("rule_id", ""), v.get("description", ""))
 
-        current_sigs = {violation_signature(v): v for v in current_violations}
-        baseline_sigs = {violation_signature(v): v for v in baseline_violations}
-
-        # Find new and resolved violations
-        new_violations = [v for sig, v in current_sigs.items() if sig not in baseline_sigs]
-
-        resolved_violations = [v for sig, v in baseline_sigs.items() if sig not in current_sigs]
+        # Set lookups against the persistent fingerprint index
+        diff = self.baseline_index.classify(
+            current_violations, FingerprintCalculator(self.project_root), scope_files=analyzed_files
+        )
+        new_violations = diff.new
+        resolved_violations = diff.fixed
 
         # Calculate quality score changes
         current_quality = current_results.get("summary", {}).get("overall_quality_score", 0)
@@ -458,11 +476,21 @@ class IncrementalAnalyzer:
         return {
             "new_violations": new_violations,
             "resolved_violations": resolved_violations,
+            "unchanged_violations_count": len(diff.unchanged),
             "quality_score_change": quality_change,
             "regression_detected": regression_detected,
             "improvement_detected": improvement_detected,
         }
 
+    def _as_result_dict(self, result: Any) -> Dict[str, Any]:
+        """Analyzers return dicts or result objects; normalize to a dict."""
+
+        if isinstance(result, dict):
+            return result
+        if hasattr(result, "to_dict"):
+            return result.to_dict()
+        return {"violations": list(getattr(result, "violations", []) or [])}
+
     def _is_analyzable_file(self, file_path: str) -> bool:
         """Check if file should be analyzed."""
 
@@ -521,7 +549,9 @@ class IncrementalAnalyzer:
         except Exception as e:
             logger.error(f"Failed to save baseline results: {e}")
 
-    def _update_baseline(self, current_results: Dict[str, Any], commit_hash: Optional[str]):
+    def _update_baseline(
+        self, current_results: Dict[str, Any], commit_hash: Optional[str], analyzed_files: Optional[List[str]] = None
+    ):
         """Update baseline with current results."""
 
         self.baseline_results = {
@@ -540,6 +570,17 @@ class IncrementalAnalyzer:
 
         self._save_baseline_results()
 
+        # Incremental runs only replace the fingerprints of re-analyzed files
+        calculator = FingerprintCalculator(self.project_root)
+        if analyzed_files is None:
+            self.baseline_index.rebuild(self.baseline_results["violations"], calculator, commit_hash)
+        else:
+            self.baseline_index.update_files(self.baseline_results["violations"], calculator, analyzed_files, commit_hash)
+        try:
+            self.baseline_index.save()
+        except OSError as e:
+            logger.error(f"Failed to save baseline index: {e}")
+
     def _load_dependency_cache(self):
         """Load dependency cache from file."""
 
@@ -558,33 +599,43 @@ class IncrementalAnalyzer:
         # This is a simplified implementation
 
         python_files = list(self.project_root.glob("**/*.py"))
+        self.dependency_graph = {}
 
         for file_path in python_files:
-            relative_path = str(file_path.relative_to(self.project_root))
+            relative_path = file_path.relative_to(self.project_root).as_posix()
 
             # Simple dependency detection based on imports
             try:
                 with open(file_path, encoding="utf-8") as f:
                     content = f.read()
 
-                dependencies = []
-                dependents = []
+                dependencies = set()
 
                 # Extract import statements (simplified)
                 for line in content.split("\n"):
                     line = line.strip()
                     if line.startswith("import ") or line.startswith("from "):
                         # This is a very simplified dependency extraction
+                        for module in self._imported_modules(line):
+                            target = self._resolve_module_file(module, relative_path)
+                            if target and target != relative_path:
+                                dependencies.add(target)
 
                 self.dependency_graph[relative_path] = {
-                    "dependencies": dependencies,
-                    "dependents": dependents,
+                    "dependencies": sorted(dependencies),
+                    "dependents": [],
                     "last_updated": time.time(),
                 }
 
             except Exception as e:
                 logger.warning(f"Failed to analyze dependencies for {file_path}: {e}")
 
+        # Invert edges so changes can pull in the files that import them
+        for relative_path, info in self.dependency_graph.items():
+            for dependency in info["dependencies"]:
+                if dependency in self.dependency_graph:
+                    self.dependency_graph[dependency]["dependents"].append(relative_path)
+
         # Save dependency cache
         try:
             with open(self.dependency_cache_file, "w") as f:
@@ -593,6 +644,38 @@ class IncrementalAnalyzer:
         except Exception as e:
             logger.error(f"Failed to save dependency cache: {e}")
 
+    def _imported_modules(self, line: str) -> List[str]:
+        """Dotted module names referenced by a single import line."""
+
+        parts = line.split()
+        if parts[0] == "from" and len(parts) >= 4 and parts[2] == "import":
+            base = parts[1]
+            names = [name.strip("(),") for name in " ".join(parts[3:]).split(",")]
+            # "from pkg import mod" may import a submodule
+            separator = "" if base.endswith(".") else "."
+            return [base] + [f"{base}{separator}{name.split()[0]}" for name in names if name and name != "*"]
+        if parts[0] == "import":
+            return [name.split()[0] for name in " ".join(parts[1:]).split(",") if name.strip()]
+        return []
+
+    def _resolve_module_file(self, module: str, importer: str) -> Optional[str]:
+        """Project-relative file for a dotted (possibly relative) module, if it exists."""
+
+        level = len(module) - len(module.lstrip("."))
+        parts = [part for part in module.lstrip(".").split(".") if part]
+        if level:
+            package = Path(importer).parent.parts
+            if level - 1 > len(package):
+                return None
+            parts = list(package[: len(package) - (level - 1)]) + parts
+        if not parts:
+            return None
+
+        for candidate in (Path(*parts).with_suffix(".py"), Path(*parts) / "__init__.py"):
+            if (self.project_root / candidate).is_file():
+                return candidate.as_posix()
+        return None
+
     def _get_current_commit(self) -> Optional[str]:
         """Get current Git commit hash."""
 
@@ -649,6 +732,6 @@ class IncrementalAnalyzer:
         return groups
 
 # Global incremental analyzer instance
-    def get_incremental_analyzer(project_root: Union[str, Path]) -> IncrementalAnalyzer:
+def get_incremental_analyzer(project_root: Union[str, Path]) -> IncrementalAnalyzer:
     """Get incremental analyzer instance for project."""
     return IncrementalAnalyzer(project_root)
@@ -1,5 +1,3 @@
-from src.constants.base import MAXIMUM_FUNCTION_PARAMETERS
-
 """Real-time memory usage tracking and leak detection for the connascence analyzer.
 Implements NASA Rule 7 compliance with bounded resource management and automatic
 recovery procedures.
@@ -10,22 +8,36 @@ Features:
 - Automatic alerts and intervention when limits exceeded
 - Memory profiling integration for detailed analysis
 - Thread-safe monitoring for concurrent operations
+- Phase-scoped allocation tracing (tracemalloc) with top allocation sites
+- Cache namespace registry so caches report their own sizes
+
+Note: tracemalloc counters are process-wide, so phases traced while several
+threads analyze files concurrently include each other's allocations.
 """
 
 import gc
+import inspect
 import os
 import psutil
 import threading
 import time
+import tracemalloc
 import warnings
 from collections import deque, defaultdict
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import weakref
 import logging
+
 logger = logging.getLogger(__name__)
 
+# Canonical analysis phases, reported in pipeline order
+ANALYSIS_PHASES = ("discovery", "parse", "detect", "classify", "aggregate", "report")
+
+_NO_OP = nullcontext()
+
 @dataclass
 class MemoryThreshold:
     """Memory threshold configuration."""
@@ -62,6 +74,81 @@ class MemoryStats:
     last_gc_time: float = 0.0
     leak_candidates: List[str] = field(default_factory=list)
 
+@dataclass
+class PhaseAllocationStats:
+    """Allocation accounting for one analysis phase."""
+    calls: int = 0
+    total_seconds: float = 0.0
+    net_retained_bytes: int = 0    # traced bytes gained across calls (negative if freed)
+    peak_growth_bytes: int = 0     # largest transient growth within a sampled call
+    sampled_calls: int = 0
+    top_sites: Dict[str, List[int]] = field(default_factory=dict)  # "file:line" -> [bytes, blocks]
+
+    def to_dict(self, top_n: int) -> Dict[str, Any]:
+        """Serialize stats with the top allocation sites."""
+        ranked = sorted(self.top_sites.items(), key=lambda item: item[1][0], reverse=True)[:top_n]
+        return {
+            "calls": self.calls,
+            "total_seconds": round(self.total_seconds, 4),
+            "net_retained_mb": round(self.net_retained_bytes / (1024 * 1024), 3),
+            "peak_growth_mb": round(self.peak_growth_bytes / (1024 * 1024), 3),
+            "sampled_calls": self.sampled_calls,
+            "top_sites": [
+                {"site": site, "size_kb": round(size / 1024, 1), "blocks": blocks}
+                for site, (size, blocks) in ranked
+            ],
+        }
+
+class CacheNamespaceRegistry:
+    """
+    Named caches reporting their own size for memory attribution.
+
+    A reporter returns a dict with ``entries`` and, where known, ``size_bytes``.
+    Bound-method reporters are held weakly, so registering never keeps a cache
+    alive; entries whose cache was collected are dropped on the next report.
+    """
+
+    def __init__(self):
+        self._reporters: Dict[str, Callable[[], Optional[Callable]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, reporter: Callable[[], Dict[str, Any]]) -> None:
+        """Register (or replace) the size reporter of a cache namespace."""
+        assert name, "name cannot be empty"
+        assert callable(reporter), "reporter must be callable"
+        if inspect.ismethod(reporter):
+            reference = weakref.WeakMethod(reporter)
+        else:
+            reference = lambda: reporter
+        with self._lock:
+            self._reporters[name] = reference
+
+    def unregister(self, name: str) -> None:
+        """Remove a cache namespace."""
+        with self._lock:
+            self._reporters.pop(name, None)
+
+    def report(self) -> Dict[str, Any]:
+        """Current size of every live namespace, plus the known total."""
+        with self._lock:
+            references = list(self._reporters.items())
+
+        namespaces = {}
+        for name, reference in references:
+            reporter = reference()
+            if reporter is None:
+                self.unregister(name)
+                continue
+            try:
+                namespaces[name] = dict(reporter())
+            except Exception as e:
+                namespaces[name] = {"error": str(e)}
+
+        return {
+            "namespaces": namespaces,
+            "total_size_bytes": sum(ns.get("size_bytes") or 0 for ns in namespaces.values()),
+        }
+
 class MemoryLeakDetector:
     """
     Advanced memory leak detection using statistical analysis.
@@ -78,7 +165,7 @@ class MemoryLeakDetector:
             window_size: Number of snapshots to analyze (bounded per NASA Rule 7)
             sensitivity: Sensitivity multiplier for leak detection
         """
-        assert MAXIMUM_FUNCTION_PARAMETERS <= window_size <= 100, "window_size must be between 10-100"
+        assert 10 <= window_size <= 100, "window_size must be between 10-100"
         assert 1.0 <= sensitivity <= 3.0, "sensitivity must be between 1.0-3.0"
         
         self.window_size = window_size
@@ -233,6 +320,14 @@ class MemoryMonitor:
         self._process = psutil.Process(os.getpid())
         self._start_time = time.time()
         self._emergency_cleanup_callbacks: List[Callable[[], None]] = []
+
+        # Phase-scoped allocation tracing (opt-in, see enable_allocation_tracing)
+        self._phase_stats: Dict[str, PhaseAllocationStats] = {}
+        self._tracing_phases = False
+        self._started_tracemalloc = False
+        self._allocation_top_n = 10
+        self._phase_sample_every = 10
+        self._snapshot_lock = threading.Lock()
         
     def start_monitoring(self) -> None:
         """Start background memory monitoring."""
@@ -272,6 +367,127 @@ class MemoryMonitor:
         assert callable(callback), "callback must be callable"
         self._emergency_cleanup_callbacks.append(callback)
     
+    def enable_allocation_tracing(self, top_n: int = 10, sample_every: int = 10, frames: int = 1) -> None:
+        """
+        Start phase-scoped allocation tracing.
+
+        Every traced phase call records time and net traced bytes (cheap);
+        the first call of a phase and every ``sample_every``-th after it also
+        diff tracemalloc snapshots to find the top allocation sites.
+
+        Args:
+            top_n: Allocation sites reported per phase
+            sample_every: Snapshot one in this many calls of each phase
+            frames: Traceback depth if this call starts tracemalloc
+        """
+        assert 1 <= top_n <= 100, "top_n must be 1-100"
+        assert sample_every >= 1, "sample_every must be positive"
+        self._allocation_top_n = top_n
+        self._phase_sample_every = sample_every
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._started_tracemalloc = True
+        self._tracing_phases = True
+
+    def disable_allocation_tracing(self) -> None:
+        """Stop phase tracing; stops tracemalloc only if this monitor started it."""
+        self._tracing_phases = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset_phase_stats(self) -> None:
+        """Discard recorded phase statistics."""
+        with self._lock:
+            self._phase_stats.clear()
+
+    def trace_phase(self, phase: str):
+        """Context manager attributing allocations to an analysis phase (no-op when disabled)."""
+        if not self._tracing_phases:
+            return _NO_OP
+        return self._trace_phase(phase)
+
+    @contextmanager
+    def _trace_phase(self, phase: str) -> Iterator[None]:
+        """Measure one phase call; sampled calls also diff snapshots."""
+        with self._lock:
+            stats = self._phase_stats.setdefault(phase, PhaseAllocationStats())
+            stats.calls += 1
+            due = (stats.calls - 1) % self._phase_sample_every == 0
+
+        # One sampled window at a time; concurrent calls fall back to counters
+        sampled = due and tracemalloc.is_tracing() and self._snapshot_lock.acquire(blocking=False)
+        before = None
+        if sampled:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            sites = []
+            if sampled:
+                try:
+                    if tracemalloc.is_tracing():
+                        sites = self._allocation_sites(before, tracemalloc.take_snapshot())
+                finally:
+                    self._snapshot_lock.release()
+
+            with self._lock:
+                stats.total_seconds += elapsed
+                stats.net_retained_bytes += current_bytes - start_bytes
+                if sampled:
+                    stats.sampled_calls += 1
+                    stats.peak_growth_bytes = max(stats.peak_growth_bytes, peak_bytes - start_bytes)
+                    self._merge_sites(stats, sites)
+
+    def _allocation_sites(self, before: tracemalloc.Snapshot,
+                          after: tracemalloc.Snapshot) -> List[Tuple[str, int, int]]:
+        """Top sites by bytes gained between two snapshots, excluding tracing overhead."""
+        filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+        differences = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+        sites = []
+        for difference in differences:
+            if difference.size_diff <= 0:
+                continue
+            frame = difference.traceback[0]
+            sites.append((f"{frame.filename}:{frame.lineno}", difference.size_diff, difference.count_diff))
+            if len(sites) >= self._allocation_top_n:
+                break
+        return sites
+
+    def _merge_sites(self, stats: PhaseAllocationStats, sites: List[Tuple[str, int, int]]) -> None:
+        """Accumulate sampled sites; NASA Rule 7: keep at most 4x top_n per phase."""
+        for site, size, blocks in sites:
+            totals = stats.top_sites.setdefault(site, [0, 0])
+            totals[0] += size
+            totals[1] += blocks
+        limit = self._allocation_top_n * 4
+        if len(stats.top_sites) > limit:
+            ranked = sorted(stats.top_sites.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+            stats.top_sites = dict(ranked)
+
+    def get_phase_report(self) -> Dict[str, Any]:
+        """Per-phase allocation stats, canonical phases first."""
+        with self._lock:
+            order = [p for p in ANALYSIS_PHASES if p in self._phase_stats]
+            order += sorted(p for p in self._phase_stats if p not in ANALYSIS_PHASES)
+            phases = {phase: self._phase_stats[phase].to_dict(self._allocation_top_n) for phase in order}
+
+        return {
+            "enabled": self._tracing_phases,
+            "sample_every": self._phase_sample_every,
+            "phases": phases,
+        }
+
     def _monitoring_loop(self) -> None:
         """Main monitoring loop (runs in background thread)."""
         logger.info("Memory monitoring loop started")
@@ -432,6 +648,8 @@ class MemoryMonitor:
         with self._lock:
             stats = self.get_current_stats()
             recent_snapshots = list(self._snapshots)[-20:]  # Last 20 snapshots
+            phase_report = self.get_phase_report()
+            cache_report = get_cache_namespace_report()
             
             return {
                 "monitoring_duration_minutes": (time.time() - self._start_time) / 60,
@@ -447,7 +665,10 @@ class MemoryMonitor:
                 },
                 "recent_trend": [s.rss_mb for s in recent_snapshots],
                 "gc_objects_count": recent_snapshots[-1].heap_objects if recent_snapshots else 0,
-                "recommendations": self._generate_recommendations(stats)
+                "allocation_phases": phase_report,
+                "cache_namespaces": cache_report,
+                "recommendations": (self._generate_recommendations(stats)
+                                    + self._attribution_recommendations(phase_report, cache_report))
             }
     
     def _generate_recommendations(self, stats: MemoryStats) -> List[str]:
@@ -464,6 +685,25 @@ class MemoryMonitor:
             recommendations.append("Current memory usage above average - consider manual garbage collection")
             
         return recommendations
+
+    def _attribution_recommendations(self, phase_report: Dict[str, Any],
+                                     cache_report: Dict[str, Any]) -> List[str]:
+        """Name the phase and cache holding the most memory."""
+        recommendations = []
+
+        phases = phase_report["phases"]
+        if phases:
+            phase, data = max(phases.items(), key=lambda item: item[1]["net_retained_mb"])
+            if data["net_retained_mb"] > 0:
+                site = f" (top site {data['top_sites'][0]['site']})" if data["top_sites"] else ""
+                recommendations.append(f"Phase '{phase}' retains {data['net_retained_mb']:.1f}MB{site}")
+
+        sized = {name: ns["size_bytes"] for name, ns in cache_report["namespaces"].items() if ns.get("size_bytes")}
+        if sized:
+            name = max(sized, key=sized.get)
+            recommendations.append(f"Largest cache namespace '{name}' holds {sized[name] / (1024 * 1024):.1f}MB")
+
+        return recommendations
     
     def __enter__(self):
         """Context manager entry."""
@@ -506,6 +746,21 @@ def get_memory_report() -> Dict[str, Any]:
     monitor = get_global_memory_monitor()
     return monitor.get_memory_report()
 
+# Process-wide cache namespace registry
+_cache_registry = CacheNamespaceRegistry()
+
+def register_cache_namespace(name: str, reporter: Callable[[], Dict[str, Any]]) -> None:
+    """Register a cache's size reporter (dict with ``entries`` and ``size_bytes``)."""
+    _cache_registry.register(name, reporter)
+
+def unregister_cache_namespace(name: str) -> None:
+    """Remove a cache namespace from memory reports."""
+    _cache_registry.unregister(name)
+
+def get_cache_namespace_report() -> Dict[str, Any]:
+    """Sizes reported by all registered cache namespaces."""
+    return _cache_registry.report()
+
 # Context manager for temporary memory monitoring
 class MemoryWatcher:
     """Context manager for temporary memory monitoring during analysis."""
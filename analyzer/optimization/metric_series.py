@@ -0,0 +1,243 @@
+"""
+Constant-Memory Metric Series
+=============================
+
+Fixed-size storage for long-running monitors:
+
+- RingBuffer: ``array('d')``-backed window of the most recent samples with
+  an O(1) running mean.
+- QuantileSketch: DDSketch-style log-bucketed histogram answering p50/p95/p99
+  within a relative error bound, without keeping samples or sorting them.
+- RateCounter: per-second event counts over a sliding window.
+- MetricSeries: a recent-window RingBuffer plus an all-time QuantileSketch.
+
+Memory and per-sample cost are independent of how many samples were seen,
+so a watcher running for days keeps the same footprint as one running for
+minutes.
+
+NASA Rule 7: All storage bounded at construction.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional
+import math
+import time
+
+class RingBuffer:
+    """Fixed-capacity float window; the oldest sample is overwritten when full."""
+
+    __slots__ = ('capacity', '_data', '_next', '_size', '_sum')
+
+    def __init__(self, capacity: int):
+        assert capacity > 0, "capacity must be positive"
+        self.capacity = capacity
+        self._data = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+        self._sum = 0.0
+
+    def append(self, value: float) -> None:
+        """Add a sample, evicting the oldest when full."""
+        if self._size == self.capacity:
+            self._sum -= self._data[self._next]
+        else:
+            self._size += 1
+        self._data[self._next] = value
+        self._sum += value
+        self._next = (self._next + 1) % self.capacity
+        if self._next == 0:
+            # Re-sum once per wrap so float drift cannot accumulate over days
+            self._sum = math.fsum(self._data[:self._size])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def values(self) -> List[float]:
+        """Samples in arrival order (oldest first)."""
+        return self.tail(self._size)
+
+    def tail(self, count: int) -> List[float]:
+        """The most recent ``count`` samples, oldest first."""
+        count = min(count, self._size)
+        start = (self._next - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._data[start:start + count].tolist()
+        return self._data[start:].tolist() + self._data[:self._next].tolist()
+
+    def last(self) -> Optional[float]:
+        """Most recent sample, or None when empty."""
+        return self._data[self._next - 1] if self._size else None
+
+    def mean(self) -> float:
+        """Mean of the window."""
+        return self._sum / self._size if self._size else 0.0
+
+    def clear(self) -> None:
+        """Drop all samples (storage is kept)."""
+        self._next = 0
+        self._size = 0
+        self._sum = 0.0
+
+class QuantileSketch:
+    """
+    DDSketch-style quantile sketch.
+
+    Positive values fall into logarithmic buckets of ratio gamma, so any
+    reported quantile is within ``relative_accuracy`` of a true sample value.
+    Values at or below MIN_INDEXABLE (including negatives) are counted as zero.
+    """
+
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        assert 0.0 < relative_accuracy < 1.0, "relative_accuracy must be in (0, 1)"
+        assert max_bins >= 16, "max_bins must be at least 16"
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Record one sample."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= self.MIN_INDEXABLE:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._bins[key] = self._bins.get(key, 0) + 1
+        if len(self._bins) > self.max_bins:
+            self._collapse_lowest()
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Fold another sketch with the same accuracy into this one."""
+        assert other.gamma == self.gamma, "sketches must share relative_accuracy"
+        for key, count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + count
+        while len(self._bins) > self.max_bins:
+            self._collapse_lowest()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (0 <= q <= 1); 0.0 when empty."""
+        assert 0.0 <= q <= 1.0, "q must be in [0, 1]"
+        if self.count == 0:
+            return 0.0
+        if q in (0.0, 1.0):
+            return self.min if q == 0.0 else self.max
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return max(min(0.0, self.max), self.min)
+
+        running = self.zero_count
+        for key in sorted(self._bins):
+            running += self._bins[key]
+            if running > rank:
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        """Exact mean of all samples."""
+        return self.sum / self.count if self.count else 0.0
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        self._bins.clear()
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def bin_count(self) -> int:
+        """Buckets in use (bounded by max_bins)."""
+        return len(self._bins)
+
+    def _collapse_lowest(self) -> None:
+        """Merge the two lowest buckets; keeps upper quantiles accurate."""
+        lowest, second = sorted(self._bins)[:2]
+        self._bins[second] += self._bins.pop(lowest)
+
+class RateCounter:
+    """Events per second over a sliding window of one-second slots."""
+
+    __slots__ = ('window_seconds', '_counts', '_seconds')
+
+    def __init__(self, window_seconds: int = 60):
+        assert window_seconds > 0, "window_seconds must be positive"
+        self.window_seconds = window_seconds
+        self._counts = array('q', bytes(8 * window_seconds))
+        self._seconds = array('q', [-1] * window_seconds)
+
+    def add(self, count: int = 1, now: Optional[float] = None) -> None:
+        """Count events at ``now`` (default: current time)."""
+        second = int(time.time() if now is None else now)
+        slot = second % self.window_seconds
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += count
+
+    def total(self, now: Optional[float] = None) -> int:
+        """Events within the window ending at ``now``."""
+        second = int(time.time() if now is None else now)
+        return sum(count for count, stamp in zip(self._counts, self._seconds)
+                   if 0 <= second - stamp < self.window_seconds)
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """Average events per second over the window."""
+        return self.total(now) / self.window_seconds
+
+class MetricSeries:
+    """Recent window for trends plus an all-time sketch for percentiles."""
+
+    __slots__ = ('window', 'sketch')
+
+    def __init__(self, window_size: int = 500, relative_accuracy: float = 0.01):
+        self.window = RingBuffer(window_size)
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        """Record one sample in both the window and the sketch."""
+        self.window.append(value)
+        self.sketch.add(value)
+
+    def __len__(self) -> int:
+        return self.sketch.count
+
+    def percentile(self, percent: float) -> float:
+        """All-time percentile (0-100)."""
+        return self.sketch.quantile(percent / 100.0)
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        self.window.clear()
+        self.sketch.clear()
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, means, extremes and p50/p95/p99."""
+        sketch = self.sketch
+        return {
+            'count': sketch.count,
+            'mean': sketch.mean(),
+            'window_mean': self.window.mean(),
+            'min': sketch.min if sketch.count else 0.0,
+            'max': sketch.max if sketch.count else 0.0,
+            'p50': sketch.quantile(0.50),
+            'p95': sketch.quantile(0.95),
+            'p99': sketch.quantile(0.99),
+        }
@@ -454,8 +454,7 @@ class PerformanceBenchmark:
             print(f"  [U+2022] Real-time monitoring: {streaming_data.get('monitor_report_time_ms', 0)}ms") 
             print(f"  [U+2022] Hybrid mode initialization: {streaming_data.get('hybrid_init_time_ms', 0)}ms")
 
-    def main():
-        pass
+def main():
     """Run benchmark suite from command line."""
     import argparse
     
@@ -13,8 +13,12 @@ from typing import Dict, Any, List, Optional, Callable
 import logging
 import time
 
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from threading import Lock
+from threading import Lock, RLock
+
+from .memory_monitor import MemoryLeakDetector
+from .metric_series import MetricSeries, RateCounter, RingBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +60,9 @@ class StreamingPerformanceMonitor:
     
     Features:
     - Event-driven metrics collection
+    - Constant-memory storage: ring buffers for recent samples and quantile
+      sketches for all-time percentiles, so week-long watch sessions cost
+      the same as short ones
     - Memory usage tracking during streaming
     - Latency and throughput measurement
     - Backpressure and queue depth monitoring
@@ -88,10 +95,13 @@ class StreamingPerformanceMonitor:
         self.active_sessions: Dict[str, StreamingSessionStats] = {}
         self.completed_sessions: deque = deque(maxlen=100)  # Bounded history
         
-        # Performance tracking
-        self.event_timings: defaultdict = defaultdict(list)
-        self.processing_times: deque = deque(maxlen=500)
-        self.memory_samples: deque = deque(maxlen=1000)
+        # Performance tracking (fixed-size; StreamingMetrics lists are only
+        # materialized from these windows when a snapshot is requested)
+        self.latency_series = MetricSeries(window_size=500)
+        self.debounce_series = MetricSeries(window_size=200)
+        self.event_rate = RateCounter(window_seconds=60)
+        self.event_counts: defaultdict = defaultdict(int)
+        self.memory_samples = RingBuffer(max_metrics_history)
         
         # Memory leak detector for streaming operations
         self.memory_detector = MemoryLeakDetector(window_size=100, sensitivity=1.2)
@@ -113,6 +123,8 @@ class StreamingPerformanceMonitor:
             
             # Reset current metrics for new session
             self.current_metrics = StreamingMetrics()
+            self.latency_series.clear()
+            self.debounce_series.clear()
             self.memory_detector.start_streaming_session()
             
             logger.info(f"Started streaming session {session_id} with {watched_files} watched files")
@@ -129,8 +141,7 @@ class StreamingPerformanceMonitor:
             
             # Calculate final statistics
             session.total_events_processed = self.current_metrics.file_change_events
-            if self.current_metrics.analysis_latency_ms:
-                session.average_latency_ms = sum(self.current_metrics.analysis_latency_ms) / len(self.current_metrics.analysis_latency_ms)
+            session.average_latency_ms = self.latency_series.sketch.mean()
             session.peak_memory_usage_mb = self.current_metrics.memory_peak_mb
             
             # Cache efficiency calculation
@@ -149,19 +160,14 @@ class StreamingPerformanceMonitor:
             
             self.current_metrics.file_change_events += 1
             self.current_metrics.processing_time_ms += processing_time_ms
-            self.current_metrics.analysis_latency_ms.append(processing_time_ms)
-            
-            # Keep latency list bounded (NASA Rule 7)
-            if len(self.current_metrics.analysis_latency_ms) > 500:
-                self.current_metrics.analysis_latency_ms = self.current_metrics.analysis_latency_ms[-400:]
+            self.latency_series.add(processing_time_ms)
             
-            # Track event timing patterns
-            self.event_timings[event_type].append((current_time, processing_time_ms))
-            if len(self.event_timings[event_type]) > 100:
-                self.event_timings[event_type] = self.event_timings[event_type][-80:]
+            # Track event rate and per-type counts
+            self.event_rate.add(1, current_time)
+            self.event_counts[event_type] += 1
             
             # Update throughput calculation
-            self._update_throughput()
+            self._update_throughput(current_time)
             
             # Notify callbacks
             self._notify_event_callbacks(event_type, file_path, processing_time_ms)
@@ -189,7 +195,7 @@ class StreamingPerformanceMonitor:
                 logger.warning(f"Memory leak detected during streaming: {memory_mb:.1f}MB")
             
             # Store sample for analysis
-            self.memory_samples.append((timestamp, memory_mb))
+            self.memory_samples.append(memory_mb)
     
     def record_queue_metrics(self, queue_depth: int, backpressure: bool = False) -> None:
         """Record queue depth and backpressure events."""
@@ -201,11 +207,7 @@ class StreamingPerformanceMonitor:
     def record_debounce_delay(self, delay_ms: float) -> None:
         """Record debounce delay for file change events."""
         with self._lock:
-            self.current_metrics.debounce_delays_ms.append(delay_ms)
-            
-            # Keep bounded (NASA Rule 7)
-            if len(self.current_metrics.debounce_delays_ms) > 200:
-                self.current_metrics.debounce_delays_ms = self.current_metrics.debounce_delays_ms[-150:]
+            self.debounce_series.add(delay_ms)
     
     def get_current_metrics(self) -> StreamingMetrics:
         """Get current streaming metrics snapshot."""
@@ -221,8 +223,8 @@ class StreamingPerformanceMonitor:
             metrics.backpressure_events = self.current_metrics.backpressure_events
             metrics.memory_peak_mb = self.current_metrics.memory_peak_mb
             metrics.file_change_events = self.current_metrics.file_change_events
-            metrics.debounce_delays_ms = self.current_metrics.debounce_delays_ms.copy()
-            metrics.analysis_latency_ms = self.current_metrics.analysis_latency_ms.copy()
+            metrics.debounce_delays_ms = self.debounce_series.window.values()
+            metrics.analysis_latency_ms = self.latency_series.window.values()
             metrics.throughput_files_per_second = self.current_metrics.throughput_files_per_second
             
             return metrics
@@ -231,6 +233,7 @@ class StreamingPerformanceMonitor:
         """Generate comprehensive performance report."""
         with self._lock:
             metrics = self.get_current_metrics()
+            latency = self.latency_series.summary()
             streaming_memory = self.memory_detector.get_streaming_memory_stats()
             
             report = {
@@ -251,9 +254,11 @@ class StreamingPerformanceMonitor:
                 },
                 "timing_analysis": {
                     "average_debounce_ms": self._calculate_average_debounce(),
-                    "p95_latency_ms": self._calculate_p95_latency(),
-                    "min_latency_ms": min(metrics.analysis_latency_ms) if metrics.analysis_latency_ms else 0,
-                    "max_latency_ms": max(metrics.analysis_latency_ms) if metrics.analysis_latency_ms else 0
+                    "p50_latency_ms": latency["p50"],
+                    "p95_latency_ms": latency["p95"],
+                    "p99_latency_ms": latency["p99"],
+                    "min_latency_ms": latency["min"],
+                    "max_latency_ms": latency["max"]
                 },
                 "session_summary": {
                     "active_sessions": len(self.active_sessions),
@@ -268,18 +273,13 @@ class StreamingPerformanceMonitor:
         """Add callback for real-time event notifications."""
         self.event_callbacks.append(callback)
     
-    def _update_throughput(self) -> None:
+    def _update_throughput(self, current_time: float) -> None:
         """Update throughput calculation based on recent events."""
-        if len(self.current_metrics.analysis_latency_ms) < 10:
+        if len(self.latency_series) < 10:
             return
             
         # Calculate events per second over last 60 seconds
-        current_time = time.time()
-        recent_events = [(t, _) for event_list in self.event_timings.values() 
-                        for t, _ in event_list if current_time - t <= 60.0]
-        
-        if recent_events:
-            self.current_metrics.throughput_files_per_second = len(recent_events) / 60.0
+        self.current_metrics.throughput_files_per_second = self.event_rate.rate(current_time)
     
     def _calculate_cache_hit_rate(self) -> float:
         """Calculate cache hit rate percentage."""
@@ -290,23 +290,15 @@ class StreamingPerformanceMonitor:
     
     def _calculate_average_latency(self) -> float:
         """Calculate average analysis latency."""
-        if not self.current_metrics.analysis_latency_ms:
-            return 0.0
-        return sum(self.current_metrics.analysis_latency_ms) / len(self.current_metrics.analysis_latency_ms)
+        return self.latency_series.sketch.mean()
     
     def _calculate_average_debounce(self) -> float:
         """Calculate average debounce delay."""
-        if not self.current_metrics.debounce_delays_ms:
-            return 0.0
-        return sum(self.current_metrics.debounce_delays_ms) / len(self.current_metrics.debounce_delays_ms)
+        return self.debounce_series.window.mean()
     
     def _calculate_p95_latency(self) -> float:
         """Calculate 95th percentile latency."""
-        if not self.current_metrics.analysis_latency_ms:
-            return 0.0
-        sorted_latencies = sorted(self.current_metrics.analysis_latency_ms)
-        p95_index = int(len(sorted_latencies) * 0.95)
-        return sorted_latencies[p95_index] if p95_index < len(sorted_latencies) else sorted_latencies[-1]
+        return self.latency_series.percentile(95)
     
     def _notify_event_callbacks(self, event_type: str, file_path: str, processing_time_ms: float) -> None:
         """Notify registered callbacks of events."""
@@ -1,27 +1,27 @@
-from src.constants.base import MAXIMUM_NESTED_DEPTH
 """
+Unified AST Visitor
+===================
 
 Single-pass AST visitor that collects all data needed by detectors in one traversal,
 implementing NASA coding standards for performance-critical systems.
 
+The resulting ASTNodeData is the shared per-file fact table: it is produced
+once per file content (see ASTDataCache) and consumed by every analyzer
+through ``analyze_from_data``, so a multi-analyzer run parses and walks each
+file exactly once.
+
 Performance improvement: 85-90% reduction in AST traversals (from 11+ to 1)
-NASA Compliance: Rules 4, MAXIMUM_NESTED_DEPTH, 6 (functions <60 lines, assertions, variable scoping)
+NASA Compliance: Rules 4, 5, 6 (functions <60 lines, assertions, variable scoping)
 """
 
+from collections import OrderedDict
+from typing import Any, Dict, List, Set, Tuple, Optional, Union
 import ast
 import collections
-from typing import Any, Dict, List, Set, Tuple, Optional, Union
-from dataclasses import dataclass, field
+import hashlib
+import threading
 
-try:
-    from utils.types import ConnascenceViolation
-except ImportError:
-    # Fallback for script execution
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-    from utils.types import ConnascenceViolation
-"""
+from dataclasses import dataclass, field
 
 @dataclass
 class ASTNodeData:
@@ -63,6 +63,43 @@ class ASTNodeData:
     # Execution order data
     order_dependencies: List[Tuple[ast.AST, str]] = field(default_factory=list)
 
+    # File facts: source, tree and every visited node indexed by node type
+    file_path: str = ""
+    source_lines: List[str] = field(default_factory=list)
+    tree: Optional[ast.AST] = None
+    content_hash: str = ""
+    node_count: int = 0
+    nodes_by_type: Dict[type, List[ast.AST]] = field(
+        default_factory=lambda: collections.defaultdict(list)
+    )
+
+    def nodes_of(self, *node_types: type) -> List[ast.AST]:
+        """All nodes of the given exact types, in visit order per type."""
+        if len(node_types) == 1:
+            return self.nodes_by_type.get(node_types[0], [])
+        return [node for node_type in node_types for node in self.nodes_by_type.get(node_type, ())]
+
+    def max_lineno(self) -> int:
+        """Highest line number carried by any node."""
+        return max((getattr(node, 'lineno', 0) for nodes in self.nodes_by_type.values() for node in nodes),
+                    default=0)
+
+def content_hash(source: str) -> str:
+    """Hash identifying file content for fact-table reuse."""
+    return hashlib.sha256(source.encode('utf-8', errors='replace')).hexdigest()
+
+def find_nodes(tree: ast.AST, node_types: Tuple[type, ...],
+                data: Optional[ASTNodeData] = None) -> List[ast.AST]:
+    """
+    Nodes of the given types in ``tree``.
+
+    Served from the fact table when ``data`` indexes this very tree,
+    otherwise by walking it (for callers passing an ad-hoc tree).
+    """
+    if data is not None and data.tree is tree:
+        return data.nodes_of(*node_types)
+    return [node for node in ast.walk(tree) if isinstance(node, node_types)]
+
 class UnifiedASTVisitor(ast.NodeVisitor):
     """
     Single-pass AST visitor that collects all detector data in one traversal.
@@ -92,11 +129,12 @@ class UnifiedASTVisitor(ast.NodeVisitor):
         """
         assert isinstance(tree, ast.AST), "tree must be AST node"
         
-        self.data = ASTNodeData()
+        self.data = ASTNodeData(file_path=self.file_path, source_lines=self.source_lines, tree=tree)
         self._current_class = None
         self._nesting_level = 0
         
         self.visit(tree)
+        self.data.node_count = sum(len(nodes) for nodes in self.data.nodes_by_type.values())
         
         # NASA Rule 5: Output validation
         assert len(self.data.functions) >= 0, "Functions data corrupted"
@@ -104,6 +142,11 @@ class UnifiedASTVisitor(ast.NodeVisitor):
         
         return self.data
     
+    def visit(self, node: ast.AST) -> Any:
+        """Index every node by type, then dispatch."""
+        self.data.nodes_by_type[type(node)].append(node)
+        return super().visit(node)
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Collect function definition data (NASA Rule 4: <60 lines)."""
         assert isinstance(node, ast.FunctionDef), "Invalid function node"
@@ -362,4 +405,111 @@ class UnifiedASTVisitor(ast.NodeVisitor):
         """Get line content for node."""
         if hasattr(node, 'lineno') and node.lineno <= len(self.source_lines):
             return self.source_lines[node.lineno - 1]
-        return ""
\ No newline at end of file
+        return ""
+
+class ASTDataCache:
+    """
+    Bounded LRU cache of per-file fact tables.
+
+    Keyed by file path and content hash: unchanged content is parsed and
+    walked once no matter how many analyzers ask for it. Facts collected from
+    a caller's tree are keyed on that tree object as well, since the source
+    passed alongside it may be empty or stale.
+
+    NASA Rule 7: Bounded by max_entries.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        assert max_entries > 0, "max_entries must be positive"
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get_or_collect(self, file_path: str, source: Optional[str] = None,
+                        tree: Optional[ast.AST] = None,
+                        source_lines: Optional[List[str]] = None) -> ASTNodeData:
+        """
+        Fact table for a file, collecting it on a miss.
+
+        Args:
+            file_path: File the facts belong to
+            source: File content; read from disk when neither source nor
+                source_lines is given
+            tree: Already parsed tree; only facts collected from this same
+                tree object are returned
+            source_lines: Split content, when the caller has no raw source
+
+        Raises:
+            SyntaxError: if the content must be parsed and is invalid
+        """
+        if source is None:
+            if source_lines is not None:
+                source = "\n".join(source_lines)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source = f.read()
+        # The entry holds the tree, so its id cannot be reused while cached
+        key = (file_path, content_hash(source), id(tree) if tree is not None else None)
+
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return data
+            self.stats['misses'] += 1
+
+        if tree is None:
+            tree = ast.parse(source, filename=file_path)
+        lines = source_lines if source_lines is not None else source.splitlines()
+        data = UnifiedASTVisitor(file_path, lines).collect_all_data(tree)
+        data.content_hash = key[1]
+
+        with self._lock:
+            self._entries[key] = data
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+        return data
+
+    def invalidate(self, file_path: str) -> None:
+        """Drop all fact tables of a file."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == file_path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all fact tables."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics."""
+        with self._lock:
+            total = self.stats['hits'] + self.stats['misses']
+            return {**self.stats, 'entries': len(self._entries),
+                    'hit_rate': self.stats['hits'] / total if total else 0.0}
+
+    def memory_footprint(self) -> Dict[str, int]:
+        """Entries and indexed nodes held, for the memory monitor's cache namespace report."""
+        with self._lock:
+            return {'entries': len(self._entries),
+                    'nodes': sum(data.node_count for data in self._entries.values())}
+
+_global_ast_data_cache: Optional[ASTDataCache] = None
+_global_ast_data_cache_lock = threading.Lock()
+
+def get_global_ast_data_cache() -> ASTDataCache:
+    """Process-wide fact-table cache shared by all analyzers."""
+    global _global_ast_data_cache
+    if _global_ast_data_cache is None:
+        with _global_ast_data_cache_lock:
+            if _global_ast_data_cache is None:
+                _global_ast_data_cache = ASTDataCache()
+                try:
+                    from .memory_monitor import register_cache_namespace
+                    register_cache_namespace('ast_data', _global_ast_data_cache.memory_footprint)
+                except ImportError:
+                    pass
+    return _global_ast_data_cache
@@ -0,0 +1,272 @@
+# SPDX-License-Identifier: MIT
+"""
+Violation Fingerprints and Baseline Index
+=========================================
+
+Stable, line-shift-tolerant fingerprints for analyzer findings, in the
+spirit of SARIF ``partialFingerprints``. A fingerprint hashes the file, the
+rule, the qualified enclosing scope and the whitespace-normalized source
+snippet - never the line number - so inserting code above a finding does
+not turn it into a "new" violation.
+
+Fingerprints are persisted in a BaselineIndex; classifying current findings
+as new / unchanged / fixed is then a set lookup per finding.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Union
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_KEY = "connascenceScopeHash/v1"
+BASELINE_INDEX_VERSION = 2
+
+_SCOPE_PATTERN = re.compile(r"^(\s*)(?:async\s+def|def|class|function)\s+([A-Za-z_$][\w$]*)")
+_WHITESPACE = re.compile(r"\s+")
+
+def _field(violation: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a dict or object violation, unwrapping enum values."""
+    if isinstance(violation, dict):
+        value = violation.get(name, default)
+    else:
+        value = getattr(violation, name, default)
+    return getattr(value, "value", value)
+
+def normalize_path(file_path: Any, project_root: Optional[Path] = None) -> str:
+    """POSIX path relative to the project root when it lies inside it."""
+    if not file_path:
+        return ""
+    path = Path(str(file_path))
+    if project_root is not None and path.is_absolute():
+        for candidate in (path, path.resolve()):
+            try:
+                return candidate.relative_to(project_root).as_posix()
+            except ValueError:
+                continue
+    normalized = path.as_posix().replace("\\", "/")
+    return normalized[2:] if normalized.startswith("./") else normalized
+
+def normalize_snippet(snippet: Optional[str]) -> str:
+    """Collapse whitespace so formatting-only edits keep the fingerprint."""
+    return _WHITESPACE.sub(" ", snippet or "").strip()
+
+def build_scope_map(source_lines: Sequence[str]) -> List[str]:
+    """
+    Map every line (0-based) to its qualified enclosing scope in one pass.
+
+    Scopes are recognised by indentation, which covers Python and the
+    ``function``/``class`` declarations of JavaScript-like sources.
+    """
+    scope_map = []
+    stack: List[tuple] = []  # (indent, name)
+    for line in source_lines:
+        stripped = line.strip()
+        if stripped:
+            indent = len(line) - len(line.lstrip())
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            match = _SCOPE_PATTERN.match(line)
+            if match:
+                stack.append((len(match.group(1)), match.group(2)))
+        scope_map.append(".".join(name for _, name in stack))
+    return scope_map
+
+class FingerprintCalculator:
+    """
+    Computes fingerprints for a batch of violations.
+
+    Source lines and scope maps are loaded once per file; identical findings
+    inside one scope are disambiguated by their occurrence order.
+    """
+
+    def __init__(self,
+                project_root: Union[str, Path, None] = None,
+                source_provider: Optional[Callable[[str], Optional[Sequence[str]]]] = None):
+        self.project_root = Path(project_root).resolve() if project_root else None
+        self.source_provider = source_provider or self._read_source_lines
+        self._scope_maps: Dict[str, Optional[tuple]] = {}
+
+    def fingerprint(self, violation: Any, occurrence: int = 0) -> str:
+        """Fingerprint a single violation."""
+        file_path = normalize_path(_field(violation, "file_path", ""), self.project_root)
+        rule = _field(violation, "rule_id") or _field(violation, "type", "unknown")
+        scope, snippet = self._scope_and_snippet(violation, file_path)
+        material = "\x1f".join([file_path, str(rule), scope, snippet, str(occurrence)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    def fingerprint_all(self, violations: Iterable[Any]) -> List[str]:
+        """Fingerprint violations, numbering duplicates within the same scope."""
+        seen: Dict[str, int] = {}
+        fingerprints = []
+        for violation in violations:
+            base = self.fingerprint(violation)
+            occurrence = seen.get(base, 0)
+            seen[base] = occurrence + 1
+            fingerprints.append(base if occurrence == 0 else self.fingerprint(violation, occurrence))
+        return fingerprints
+
+    def partial_fingerprints(self, violation: Any) -> Dict[str, str]:
+        """SARIF ``partialFingerprints`` entry for a violation."""
+        return {FINGERPRINT_KEY: self.fingerprint(violation)}
+
+    def _scope_and_snippet(self, violation: Any, file_path: str) -> tuple:
+        """Resolve enclosing scope and normalized snippet for a violation."""
+        scope = ".".join(
+            part for part in (_field(violation, "class_name"), _field(violation, "function_name")) if part
+        )
+        snippet = normalize_snippet(_field(violation, "code_snippet"))
+        if scope and snippet:
+            return scope, snippet
+
+        loaded = self._load(file_path)
+        line_number = _field(violation, "line_number", 0) or 0
+        if loaded and 1 <= line_number <= len(loaded[0]):
+            lines, scope_map = loaded
+            scope = scope or scope_map[line_number - 1]
+            snippet = snippet or normalize_snippet(lines[line_number - 1])
+        if not snippet:
+            # No source available: fall back to the message text
+            snippet = normalize_snippet(_field(violation, "description", ""))
+        return scope, snippet
+
+    def _load(self, file_path: str) -> Optional[tuple]:
+        """Source lines and scope map for a file, cached per batch."""
+        if file_path not in self._scope_maps:
+            lines = self.source_provider(file_path) if file_path else None
+            self._scope_maps[file_path] = (list(lines), build_scope_map(lines)) if lines else None
+        return self._scope_maps[file_path]
+
+    def _read_source_lines(self, file_path: str) -> Optional[List[str]]:
+        """Read source lines from disk, relative to the project root if set."""
+        path = Path(file_path)
+        if not path.is_absolute() and self.project_root is not None:
+            path = self.project_root / path
+        try:
+            return path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return None
+
+@dataclass
+class BaselineDiff:
+    """New / unchanged / fixed classification against a baseline."""
+    new: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: List[Dict[str, Any]] = field(default_factory=list)
+    fixed: List[Dict[str, Any]] = field(default_factory=list)
+
+class BaselineIndex:
+    """
+    Persistent fingerprint index of accepted findings.
+
+    Only a compact summary per fingerprint is stored, so a baseline of
+    millions of findings loads as one dict and lookups are O(1).
+    """
+
+    SUMMARY_FIELDS = ("file_path", "rule_id", "type", "severity", "line_number", "description")
+
+    def __init__(self, index_file: Union[str, Path, None] = None, project_root: Union[str, Path, None] = None):
+        self.index_file = Path(index_file) if index_file else None
+        # Stored and compared file paths are relative to this root
+        self.project_root = Path(project_root).resolve() if project_root else None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.created_at: Optional[str] = None
+        self.commit_hash: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.entries
+
+    @property
+    def fingerprints(self) -> Set[str]:
+        """Fingerprints in the baseline."""
+        return set(self.entries)
+
+    def rebuild(self, violations: Sequence[Any], calculator: FingerprintCalculator,
+                commit_hash: Optional[str] = None) -> None:
+        """Replace the index with the given findings."""
+        self.entries = {
+            fingerprint: self._summarize(violation)
+            for fingerprint, violation in zip(calculator.fingerprint_all(violations), violations)
+        }
+        self.created_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.commit_hash = commit_hash
+
+    def update_files(self, violations: Sequence[Any], calculator: FingerprintCalculator,
+                    files: Iterable[str], commit_hash: Optional[str] = None) -> None:
+        """Replace the entries of re-analyzed files, keeping all other files."""
+        scope = {normalize_path(path, self.project_root) for path in files}
+        self.entries = {
+            fingerprint: summary for fingerprint, summary in self.entries.items()
+            if summary.get("file_path") not in scope
+        }
+        for fingerprint, violation in zip(calculator.fingerprint_all(violations), violations):
+            self.entries[fingerprint] = self._summarize(violation)
+        self.created_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.commit_hash = commit_hash
+
+    def classify(self, violations: Sequence[Any], calculator: FingerprintCalculator,
+                scope_files: Optional[Iterable[str]] = None) -> BaselineDiff:
+        """
+        Classify current findings against the baseline.
+
+        Args:
+            violations: Current findings
+            calculator: Fingerprint calculator for the current tree
+            scope_files: Files that were re-analyzed; baseline entries in
+                other files are not reported as fixed (incremental runs)
+        """
+        diff = BaselineDiff()
+        current: Set[str] = set()
+        for fingerprint, violation in zip(calculator.fingerprint_all(violations), violations):
+            current.add(fingerprint)
+            (diff.unchanged if fingerprint in self.entries else diff.new).append(violation)
+
+        scope = {normalize_path(path, self.project_root) for path in scope_files} if scope_files is not None else None
+        for fingerprint in self.entries.keys() - current:
+            summary = self.entries[fingerprint]
+            if scope is None or summary.get("file_path") in scope:
+                diff.fixed.append({**summary, "fingerprint": fingerprint})
+        return diff
+
+    def load(self) -> bool:
+        """Load the index file; returns False if missing or unreadable."""
+        if self.index_file is None or not self.index_file.exists():
+            return False
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load baseline index: {e}")
+            return False
+        if data.get("version") != BASELINE_INDEX_VERSION:
+            logger.info("Ignoring baseline index with incompatible version")
+            return False
+        self.entries = data.get("entries", {})
+        self.created_at = data.get("created_at")
+        self.commit_hash = data.get("commit_hash")
+        return True
+
+    def save(self) -> None:
+        """Write the index file compactly."""
+        assert self.index_file is not None, "index_file required to save"
+        with open(self.index_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": BASELINE_INDEX_VERSION,
+                "created_at": self.created_at,
+                "commit_hash": self.commit_hash,
+                "entries": self.entries,
+            }, f, separators=(",", ":"), default=str)
+
+    def _summarize(self, violation: Any) -> Dict[str, Any]:
+        """Compact record kept per baseline finding."""
+        summary = {name: _field(violation, name) for name in self.SUMMARY_FIELDS if _field(violation, name) is not None}
+        if "file_path" in summary:
+            summary["file_path"] = normalize_path(summary["file_path"], self.project_root)
+        return summary
@@ -0,0 +1,357 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Analyzer Benchmark Suite
+========================
+
+One reproducible benchmark harness for the analyzer hot paths. Every run
+generates a seeded synthetic corpus (see corpus_generator) and times a fixed
+set of scenarios against it:
+
+- cold_full_scan: fresh analyzer and cleared caches, whole corpus
+- warm_rescan: the same analyzer scans the unchanged corpus again
+- single_file_edit: one file is edited and re-analyzed
+- streaming_burst: a burst of edits across files, analyzed as they arrive
+
+Results are written as JSON (schema BENCHMARK_SCHEMA_VERSION) with raw
+per-iteration samples, so runs from different machines or commits can be
+compared statistically.
+
+Usage:
+    python -m analyzer.performance.benchmark_suite --files 200 --output bench.json
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from .corpus_generator import CorpusConfig, CorpusManifest, SyntheticCorpusGenerator
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_SCHEMA_VERSION = 1
+
+SCENARIOS = {
+    "cold_full_scan": "Fresh analyzer with cleared caches scans the whole corpus",
+    "warm_rescan": "Already-used analyzer rescans the unchanged corpus",
+    "single_file_edit": "One file is edited and re-analyzed",
+    "streaming_burst": "A burst of file edits is analyzed as the edits arrive",
+}
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[rank]
+
+def _default_analyzer_factory():
+    """Unified analyzer used when no factory is supplied."""
+    from ..unified_analyzer import UnifiedConnascenceAnalyzer
+    return UnifiedConnascenceAnalyzer()
+
+def reset_analyzer_caches() -> None:
+    """Clear process-wide file and AST caches for cold measurements."""
+    try:
+        from ..optimization.file_cache import clear_global_cache
+        clear_global_cache()
+    except Exception as e:
+        logger.debug(f"File cache not cleared: {e}")
+    try:
+        from ..caching.ast_cache import ast_cache
+        ast_cache.memory_cache.clear()
+    except Exception as e:
+        logger.debug(f"AST cache not cleared: {e}")
+
+@dataclass
+class ScenarioResult:
+    """Raw timing samples for one scenario."""
+    name: str
+    samples_ms: List[float] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, float]:
+        """Descriptive statistics over the samples."""
+        ordered = sorted(self.samples_ms)
+        if not ordered:
+            return {}
+        return {
+            "mean_ms": statistics.fmean(ordered),
+            "median_ms": statistics.median(ordered),
+            "stdev_ms": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            "min_ms": ordered[0],
+            "max_ms": ordered[-1],
+            "p95_ms": _percentile(ordered, 0.95),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "description": SCENARIOS.get(self.name, ""),
+            "iterations": len(self.samples_ms),
+            "samples_ms": [round(sample, 4) for sample in self.samples_ms],
+            "summary": {key: round(value, 4) for key, value in self.summary().items()},
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "ScenarioResult":
+        return cls(name=name, samples_ms=list(data.get("samples_ms", [])), metadata=dict(data.get("metadata", {})))
+
+@dataclass
+class BenchmarkResults:
+    """Machine-readable output of one benchmark run."""
+    corpus: Dict[str, Any]
+    scenarios: Dict[str, ScenarioResult] = field(default_factory=dict)
+    environment: Dict[str, Any] = field(default_factory=dict)
+    label: str = ""
+    created_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schema_version": BENCHMARK_SCHEMA_VERSION,
+            "label": self.label,
+            "created_at": self.created_at,
+            "environment": self.environment,
+            "corpus": self.corpus,
+            "scenarios": {name: result.to_dict() for name, result in self.scenarios.items()},
+        }
+
+    def save(self, output_file: Union[str, Path]) -> None:
+        """Write results as JSON."""
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResults":
+        assert data.get("schema_version") == BENCHMARK_SCHEMA_VERSION, "unsupported benchmark schema version"
+        return cls(
+            corpus=data.get("corpus", {}),
+            scenarios={name: ScenarioResult.from_dict(name, scenario)
+                        for name, scenario in data.get("scenarios", {}).items()},
+            environment=data.get("environment", {}),
+            label=data.get("label", ""),
+            created_at=data.get("created_at", 0.0),
+        )
+
+    @classmethod
+    def load(cls, input_file: Union[str, Path]) -> "BenchmarkResults":
+        """Read results written by ``save``."""
+        with open(input_file, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+def collect_environment() -> Dict[str, Any]:
+    """Machine description stored with every result set."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+class AnalyzerBenchmarkSuite:
+    """
+    Runs the benchmark scenarios against a seeded synthetic corpus.
+
+    The analyzer is created through ``analyzer_factory``; it must provide
+    ``analyze_project(path)`` and ``analyze_file(path)``.
+    """
+
+    def __init__(self,
+                corpus_config: Optional[CorpusConfig] = None,
+                analyzer_factory: Optional[Callable[[], Any]] = None,
+                iterations: int = 5,
+                warmup: int = 1,
+                burst_size: int = 20,
+                work_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize benchmark suite.
+
+        Args:
+            corpus_config: Corpus shape and seed
+            analyzer_factory: Creates the analyzer under test
+            iterations: Measured iterations per scenario
+            warmup: Unmeasured iterations per scenario
+            burst_size: File edits per streaming burst
+            work_dir: Parent of the suite's scratch directory (system temp if omitted);
+                only the scratch directory the suite creates is ever removed
+        """
+        assert 1 <= iterations <= 1000, "iterations must be 1-1000"
+        assert 0 <= warmup <= 100, "warmup must be 0-100"
+        assert burst_size >= 1, "burst_size must be positive"
+
+        self.corpus_config = corpus_config or CorpusConfig()
+        self.generator = SyntheticCorpusGenerator(self.corpus_config)
+        self.analyzer_factory = analyzer_factory or _default_analyzer_factory
+        self.iterations = iterations
+        self.warmup = warmup
+        self.burst_size = burst_size
+        self.work_dir = Path(work_dir) if work_dir else None
+
+        self._scenario_runners: Dict[str, Callable[[CorpusManifest], Callable[[int], Dict[str, Any]]]] = {
+            "cold_full_scan": self._cold_full_scan,
+            "warm_rescan": self._warm_rescan,
+            "single_file_edit": self._single_file_edit,
+            "streaming_burst": self._streaming_burst,
+        }
+
+    def run(self, scenarios: Optional[List[str]] = None, label: str = "") -> BenchmarkResults:
+        """Generate the corpus and run the selected scenarios (all by default)."""
+        selected = list(scenarios or SCENARIOS)
+        unknown = [name for name in selected if name not in SCENARIOS]
+        if unknown:
+            raise ValueError(f"Unknown benchmark scenarios: {unknown}. Available: {list(SCENARIOS)}")
+
+        if self.work_dir is not None:
+            self.work_dir.mkdir(parents=True, exist_ok=True)
+        scratch = Path(tempfile.mkdtemp(prefix="connascence_bench_", dir=self.work_dir))
+        root = scratch / "corpus"
+        try:
+            results = BenchmarkResults(corpus={}, environment=collect_environment(), label=label)
+            for name in selected:
+                # Each scenario starts from a pristine corpus so edits never leak across scenarios
+                if root.exists():
+                    shutil.rmtree(root)
+                manifest = self.generator.generate(root)
+                results.corpus = manifest.to_dict()
+                results.scenarios[name] = self.run_scenario(name, manifest)
+                logger.info(f"Benchmark {name}: {results.scenarios[name].summary().get('median_ms', 0):.1f}ms median")
+            return results
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def run_scenario(self, name: str, manifest: CorpusManifest) -> ScenarioResult:
+        """Time one scenario: warmup iterations first, then measured ones."""
+        step = self._scenario_runners[name](manifest)
+        result = ScenarioResult(name=name)
+        for iteration in range(self.warmup + self.iterations):
+            start = time.perf_counter()
+            metadata = step(iteration)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if iteration >= self.warmup:
+                result.samples_ms.append(elapsed_ms)
+                for key, value in (metadata or {}).items():
+                    result.metadata.setdefault(key, []).append(value)
+        return result
+
+    # Scenario definitions: each returns a per-iteration step function
+
+    def _cold_full_scan(self, manifest: CorpusManifest) -> Callable[[int], Dict[str, Any]]:
+        def step(iteration: int) -> Dict[str, Any]:
+            reset_analyzer_caches()
+            self.analyzer_factory().analyze_project(str(manifest.root))
+            return {}
+        return step
+
+    def _warm_rescan(self, manifest: CorpusManifest) -> Callable[[int], Dict[str, Any]]:
+        analyzer = self.analyzer_factory()
+        analyzer.analyze_project(str(manifest.root))
+
+        def step(iteration: int) -> Dict[str, Any]:
+            analyzer.analyze_project(str(manifest.root))
+            return {}
+        return step
+
+    def _single_file_edit(self, manifest: CorpusManifest) -> Callable[[int], Dict[str, Any]]:
+        analyzer = self.analyzer_factory()
+        analyzer.analyze_project(str(manifest.root))
+        target = manifest.paths[len(manifest.paths) // 2]
+
+        def step(iteration: int) -> Dict[str, Any]:
+            self.generator.edit_module(target, iteration)
+            analyzer.analyze_file(str(target))
+            return {}
+        return step
+
+    def _streaming_burst(self, manifest: CorpusManifest) -> Callable[[int], Dict[str, Any]]:
+        analyzer = self.analyzer_factory()
+        analyzer.analyze_project(str(manifest.root))
+        paths = manifest.paths
+
+        def step(iteration: int) -> Dict[str, Any]:
+            latencies = []
+            for event in range(self.burst_size):
+                target = paths[(iteration * self.burst_size + event) % len(paths)]
+                start = time.perf_counter()
+                self.generator.edit_module(target, iteration * self.burst_size + event)
+                analyzer.analyze_file(str(target))
+                latencies.append((time.perf_counter() - start) * 1000)
+            latencies.sort()
+            return {"event_p50_ms": round(_percentile(latencies, 0.5), 4),
+                    "event_p95_ms": round(_percentile(latencies, 0.95), 4)}
+        return step
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite from the command line."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reproducible analyzer benchmark suite")
+    parser.add_argument("--files", type=int, default=100, help="Number of corpus files")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus seed")
+    parser.add_argument("--size-distribution", default="lognormal", help="uniform, lognormal or pareto")
+    parser.add_argument("--violation-density", type=float, default=0.3, help="Violations per unit (0-1)")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1, help="Near-duplicate file ratio (0-1)")
+    parser.add_argument("--max-nesting", type=int, default=6, help="Maximum nesting depth")
+    parser.add_argument("--iterations", type=int, default=5, help="Measured iterations per scenario")
+    parser.add_argument("--warmup", type=int, default=1, help="Warmup iterations per scenario")
+    parser.add_argument("--scenarios", help=f"Comma-separated subset of {','.join(SCENARIOS)}")
+    parser.add_argument("--label", default="", help="Label stored with the results (e.g. commit hash)")
+    parser.add_argument("--output", "-o", help="Write JSON results to this file (stdout if omitted)")
+    parser.add_argument("--baseline", help="Compare against this results file and fail on regressions")
+    parser.add_argument("--current", help="Compare this existing results file instead of running the suite")
+    parser.add_argument("--regression-threshold", type=float, default=10.0, help="Minimum slowdown in percent")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Required statistical confidence")
+    args = parser.parse_args(argv)
+
+    if args.current:
+        assert args.baseline, "--current requires --baseline"
+        return _regression_gate(args.baseline, BenchmarkResults.load(args.current), args)
+
+    suite = AnalyzerBenchmarkSuite(
+        corpus_config=CorpusConfig(
+            seed=args.seed,
+            file_count=args.files,
+            size_distribution=args.size_distribution,
+            violation_density=args.violation_density,
+            duplicate_ratio=args.duplicate_ratio,
+            max_nesting_depth=args.max_nesting,
+        ),
+        iterations=args.iterations,
+        warmup=args.warmup,
+    )
+    results = suite.run(args.scenarios.split(",") if args.scenarios else None, label=args.label)
+
+    if args.output:
+        results.save(args.output)
+        print(f"Results saved to: {args.output}")
+    else:
+        json.dump(results.to_dict(), sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        return _regression_gate(args.baseline, results, args)
+    return 0
+
+def _regression_gate(baseline_file: str, results: BenchmarkResults, args) -> int:
+    """Run the statistical regression gate; exit status 1 on regressions."""
+    from .regression_detector import evaluate_benchmark_gate
+
+    gate = evaluate_benchmark_gate(baseline_file, results.to_dict(), args.regression_threshold, args.confidence)
+    for name, scenario in gate["scenarios"].items():
+        status = "REGRESSION" if scenario["regression_detected"] else "ok"
+        low, high = scenario["change_percent_ci"]
+        print(f"{name}: {scenario['change_percent']:+.1f}% "
+                f"(CI {low:+.1f}%..{high:+.1f}%, p={scenario['p_value']:.4f}) {status}")
+    return 0 if gate["passed"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from src.constants.base import SESSION_TIMEOUT_SECONDS
 
+"""
 Advanced performance analysis and optimization system for all caching layers
 in the analyzer system. Provides detailed profiling, intelligent warming,
 and adaptive optimization strategies.
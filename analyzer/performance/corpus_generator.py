@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Seeded Synthetic Corpus Generator
+=================================
+
+Generates reproducible Python source trees for benchmarking the analyzer.
+The same CorpusConfig (including its seed) produces byte-identical files on
+any machine, so benchmark numbers from different boxes measure the same
+input. The manifest digest can be used to verify that.
+
+Knobs: file count, file size distribution, nesting depth, violation density
+(parameter bombs, magic literals, deep nesting, god classes) and the ratio of
+near-duplicate files.
+
+NASA Rule 7: All generated sizes are bounded by configuration.
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import hashlib
+import math
+import random
+
+SIZE_DISTRIBUTIONS = ("uniform", "lognormal", "pareto")
+VIOLATION_KINDS = ("parameter_bomb", "magic_literal", "deep_nesting", "god_class")
+
+# Methods emitted for an injected god class
+GOD_CLASS_METHODS = 24
+
+@dataclass
+class CorpusConfig:
+    """Shape of a synthetic corpus. Identical configs yield identical corpora."""
+    seed: int = 42
+    file_count: int = 100
+    size_distribution: str = "lognormal"
+    mean_units_per_file: int = 8  # functions/classes per file
+    max_units_per_file: int = 60
+    max_nesting_depth: int = 6
+    violation_density: float = 0.3  # probability a unit carries a violation
+    duplicate_ratio: float = 0.1  # fraction of files that are near-copies
+    files_per_package: int = 50
+
+    def __post_init__(self):
+        """Validate corpus configuration."""
+        assert self.file_count >= 1, "file_count must be positive"
+        assert self.size_distribution in SIZE_DISTRIBUTIONS, f"size_distribution must be one of {SIZE_DISTRIBUTIONS}"
+        assert 1 <= self.mean_units_per_file <= self.max_units_per_file, "mean_units must be 1-max_units"
+        assert 1 <= self.max_nesting_depth <= 20, "max_nesting_depth must be 1-20"
+        assert 0.0 <= self.violation_density <= 1.0, "violation_density must be 0.0-1.0"
+        assert 0.0 <= self.duplicate_ratio < 1.0, "duplicate_ratio must be 0.0-1.0"
+        assert self.files_per_package >= 1, "files_per_package must be positive"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize configuration for benchmark results."""
+        return asdict(self)
+
+@dataclass
+class CorpusManifest:
+    """What was generated, for reproducibility checks and scenario setup."""
+    root: Path
+    config: CorpusConfig
+    files: List[str] = field(default_factory=list)  # relative POSIX paths
+    total_lines: int = 0
+    injected_violations: Dict[str, int] = field(default_factory=dict)
+    duplicate_files: int = 0
+    digest: str = ""
+
+    @property
+    def paths(self) -> List[Path]:
+        """Absolute paths of generated files."""
+        return [self.root / relative for relative in self.files]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize manifest (without the machine-specific root)."""
+        return {
+            "config": self.config.to_dict(),
+            "file_count": len(self.files),
+            "total_lines": self.total_lines,
+            "injected_violations": dict(self.injected_violations),
+            "duplicate_files": self.duplicate_files,
+            "digest": self.digest,
+        }
+
+class SyntheticCorpusGenerator:
+    """Writes a seeded synthetic corpus to disk."""
+
+    def __init__(self, config: Optional[CorpusConfig] = None):
+        self.config = config or CorpusConfig()
+
+    def generate(self, root: Union[str, Path]) -> CorpusManifest:
+        """Generate the corpus under ``root`` and return its manifest."""
+        root = Path(root)
+        rng = random.Random(self.config.seed)
+        manifest = CorpusManifest(root=root, config=self.config,
+                                    injected_violations={kind: 0 for kind in VIOLATION_KINDS})
+        digest = hashlib.sha256()
+        originals: List[tuple] = []  # (token, source, violation counts)
+
+        for index in range(self.config.file_count):
+            token = f"m{index:05d}"
+            if originals and rng.random() < self.config.duplicate_ratio:
+                source_token, source, counts = rng.choice(originals)
+                source = source.replace(source_token, token)
+                manifest.duplicate_files += 1
+            else:
+                source, counts = self.render_module(rng, token)
+                originals.append((token, source, counts))
+
+            relative = f"pkg_{index // self.config.files_per_package:03d}/module_{index:05d}.py"
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source, encoding="utf-8")
+
+            manifest.files.append(relative)
+            manifest.total_lines += source.count("\n")
+            for kind, count in counts.items():
+                manifest.injected_violations[kind] += count
+            digest.update(relative.encode("utf-8"))
+            digest.update(source.encode("utf-8"))
+
+        for package in sorted({relative.split("/", 1)[0] for relative in manifest.files}):
+            (root / package / "__init__.py").touch()
+
+        manifest.digest = digest.hexdigest()
+        return manifest
+
+    def render_module(self, rng: random.Random, token: str) -> tuple:
+        """Render one module; returns (source, injected violation counts)."""
+        counts = {kind: 0 for kind in VIOLATION_KINDS}
+        lines = [f'"""Synthetic benchmark module {token}."""', "", "import os", "",
+                    f"LIMIT_{token.upper()} = 10", ""]
+
+        for unit in range(self._unit_count(rng)):
+            violation = None
+            if rng.random() < self.config.violation_density:
+                violation = rng.choice(VIOLATION_KINDS)
+                counts[violation] += 1
+            if violation == "god_class" or (violation is None and rng.random() < 0.2):
+                lines.extend(self._render_class(rng, f"Unit_{token}_{unit}", token, violation == "god_class"))
+            else:
+                lines.extend(self._render_function(rng, f"unit_{token}_{unit}", token, violation))
+            lines.append("")
+
+        return "\n".join(lines) + "\n", counts
+
+    def edit_module(self, path: Union[str, Path], revision: int) -> None:
+        """Deterministically append a function, simulating a single-file edit."""
+        path = Path(path)
+        rng = random.Random(f"{self.config.seed}:{path.name}:{revision}")
+        token = f"m{path.stem.rsplit('_', 1)[-1]}"
+        lines = self._render_function(rng, f"edit_{token}_{revision}", token, None)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n" + "\n".join(lines) + "\n")
+
+    def _unit_count(self, rng: random.Random) -> int:
+        """Draw a file size (in units) from the configured distribution."""
+        mean = self.config.mean_units_per_file
+        if self.config.size_distribution == "uniform":
+            count = rng.randint(1, 2 * mean - 1)
+        elif self.config.size_distribution == "lognormal":
+            sigma = 0.75
+            count = round(rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma))
+        else:
+            alpha = 1.5  # mean of a Pareto(alpha) scaled by xm is alpha * xm / (alpha - 1)
+            count = round(rng.paretovariate(alpha) * mean * (alpha - 1) / alpha)
+        return max(1, min(count, self.config.max_units_per_file))
+
+    def _render_function(self, rng: random.Random, name: str, token: str,
+                            violation: Optional[str], indent: str = "") -> List[str]:
+        """Render a function, optionally carrying one violation."""
+        param_count = rng.randint(7, 10) if violation == "parameter_bomb" else rng.randint(1, 3)
+        params = ", ".join(["self"] * bool(indent) + [f"arg{i}" for i in range(param_count)])
+        lines = [f"{indent}def {name}({params}):", f'{indent}    """Generated function."""']
+
+        depth = self.config.max_nesting_depth if violation == "deep_nesting" else rng.randint(1, min(3, self.config.max_nesting_depth))
+        body_indent = indent + "    "
+        lines.append(f"{body_indent}total = 0")
+        for level in range(depth):
+            inner = body_indent + "    " * level
+            if level % 2:
+                lines.append(f"{inner}if total < LIMIT_{token.upper()}:")
+            else:
+                lines.append(f"{inner}for item_{level} in range(len(os.sep) + {level}):")
+        inner = body_indent + "    " * depth
+        if violation == "magic_literal":
+            lines.append(f"{inner}total += arg0 * {rng.randint(100, 9999)} + {rng.randint(100, 9999)}")
+        else:
+            lines.append(f"{inner}total += arg0")
+        lines.append(f"{body_indent}return total")
+        return lines
+
+    def _render_class(self, rng: random.Random, name: str, token: str, god_class: bool) -> List[str]:
+        """Render a class; god classes get GOD_CLASS_METHODS methods."""
+        method_count = GOD_CLASS_METHODS if god_class else rng.randint(1, 5)
+        lines = [f"class {name}:", '    """Generated class."""', ""]
+        for method in range(method_count):
+            lines.extend(self._render_function(rng, f"method_{method}", token, None, indent="    "))
+            lines.append("")
+        return lines
@@ -1,5 +1,3 @@
-from src.constants.base import MAXIMUM_RETRY_ATTEMPTS
-
 """
 Parallel Processing Enhancement for Connascence Analysis
 =======================================================
@@ -27,6 +25,13 @@ try:
 except ImportError:
     psutil = None
 
+try:
+    from src.detectors.parallel_executor import AdaptiveBatchProcessor, WorkStealingProcessExecutor
+    from src.detectors.workload_optimizer import get_global_file_cost_estimator
+    WORK_STEALING_AVAILABLE = True
+except ImportError:
+    WORK_STEALING_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Define UnifiedAnalysisResult if not available
@@ -44,7 +49,9 @@ class ParallelAnalysisConfig:
     """Configuration for parallel analysis execution."""
 
     max_workers: int = field(default_factory=lambda: min(8, mp.cpu_count()))
-    chunk_size: int = 5  # Files per chunk
+    chunk_size: int = 5  # Files per chunk (static batching)
+    work_stealing: bool = True  # Size-aware chunks on per-worker deques
+    chunks_per_worker: int = 4  # Work-stealing granularity
     use_processes: bool = True  # True for CPU-bound tasks
     timeout_seconds: int = 300  # 5 minutes
     memory_limit_mb: int = 1024  # 1GB per worker
@@ -95,6 +102,11 @@ class ParallelConnascenceAnalyzer:
         self.worker_pool = None
         self.resource_monitor = None
 
+        # Work-stealing state persists across runs so batch sizing and file costs keep learning
+        self.batch_processor = AdaptiveBatchProcessor() if WORK_STEALING_AVAILABLE else None
+        self.file_costs = get_global_file_cost_estimator() if WORK_STEALING_AVAILABLE else None
+        self.last_schedule_stats: Dict[str, Any] = {}
+
         logger.info(f"Parallel analyzer initialized with {self.config.max_workers} workers")
 
     def analyze_project_parallel(
@@ -134,13 +146,10 @@ class ParallelConnascenceAnalyzer:
                 logger.warning(f"No files found to analyze in {project_path}")
                 return self._create_empty_result(project_path, policy_preset, start_time)
 
-            # Create file chunks for parallel processing
-            file_chunks = self._create_file_chunks(files_to_analyze)
-
-            logger.info(f"Processing {len(files_to_analyze)} files in {len(file_chunks)} chunks")
-
             # Execute parallel analysis
-            chunk_results, chunk_times = self._execute_parallel_chunks(file_chunks, policy_preset, options)
+            chunk_results, chunk_times = self._execute_chunks(files_to_analyze, policy_preset, options)
+
+            logger.info(f"Processed {len(files_to_analyze)} files in {len(chunk_results)} chunks")
 
             # Combine results from all chunks
             combined_result = self._combine_chunk_results(chunk_results, project_path, policy_preset, start_time)
@@ -202,11 +211,8 @@ class ParallelConnascenceAnalyzer:
 
         start_time = time.time()
 
-        # Create chunks from file list
-        file_chunks = self._create_file_chunks([Path(f) for f in file_paths])
-
         # Execute parallel analysis on chunks
-        chunk_results, chunk_times = self._execute_parallel_chunks(file_chunks, policy_preset, {})
+        chunk_results, chunk_times = self._execute_chunks([Path(f) for f in file_paths], policy_preset, {})
 
         # Combine results
         all_violations = []
@@ -232,7 +238,8 @@ class ParallelConnascenceAnalyzer:
             "execution_time_ms": total_time * 1000,
             "parallel_processing": True,
             "worker_count": self.config.max_workers,
-            "chunk_count": len(file_chunks),
+            "chunk_count": len(chunk_results),
+            "scheduling": self.last_schedule_stats,
         }
 
     def benchmark_parallel_performance(self, test_project_sizes: List[int] = None) -> Dict[str, Any]:
@@ -296,6 +303,68 @@ class ParallelConnascenceAnalyzer:
             },
         }
 
+    def benchmark_scheduling(
+        self, file_count: int = 60, size_distribution: str = "pareto", repeats: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Benchmark work-stealing against static batching on a skewed corpus.
+
+        A warm-up pass seeds the file cost history so both strategies see the
+        same estimates; the best wall time of ``repeats`` runs is reported.
+
+        Args:
+            file_count: Number of files in the synthetic corpus
+            size_distribution: Corpus file size distribution (pareto is heavy-tailed)
+            repeats: Timed runs per strategy
+
+        Returns:
+            Wall times, speedup and the work-stealing schedule statistics
+        """
+
+        import tempfile
+
+        from .corpus_generator import CorpusConfig, SyntheticCorpusGenerator
+
+        timings = {"static": [], "work_stealing": []}
+        schedules = {}
+        original_strategy = self.config.work_stealing
+
+        with tempfile.TemporaryDirectory() as corpus_root:
+            corpus_config = CorpusConfig(file_count=file_count, size_distribution=size_distribution)
+            test_files = SyntheticCorpusGenerator(corpus_config).generate(corpus_root).paths
+            sizes = sorted(path.stat().st_size for path in test_files)
+
+            try:
+                self.config.work_stealing = True
+                self.analyze_files_batch(test_files)  # warm-up seeds file cost history
+
+                for _ in range(repeats):
+                    for strategy in timings:
+                        self.config.work_stealing = strategy == "work_stealing"
+                        start_time = time.time()
+                        self.analyze_files_batch(test_files)
+                        timings[strategy].append(time.time() - start_time)
+                        schedules[strategy] = self.last_schedule_stats
+            finally:
+                self.config.work_stealing = original_strategy
+
+        static_time = min(timings["static"])
+        stealing_time = min(timings["work_stealing"])
+        logger.info(f"Scheduling benchmark: static {static_time:.2f}s, work stealing {stealing_time:.2f}s")
+
+        return {
+            "benchmark_timestamp": time.time(),
+            "file_count": len(sizes),
+            "size_distribution": size_distribution,
+            "size_skew": sizes[-1] / max(1, sizes[len(sizes) // 2]),  # largest / median file
+            "static_time_s": static_time,
+            "work_stealing_time_s": stealing_time,
+            "speedup_factor": static_time / max(stealing_time, 1e-6),
+            "schedules": schedules,
+            "worker_count": self.config.max_workers,
+            "work_stealing_available": WORK_STEALING_AVAILABLE,
+        }
+
     # Private implementation methods
 
     def _discover_files(self, project_path: Path) -> List[Path]:
@@ -332,6 +401,57 @@ class ParallelConnascenceAnalyzer:
 
         return sorted(files)
 
+    def _execute_chunks(
+        self, files: List[Path], policy_preset: str, options: Dict[str, Any]
+    ) -> Tuple[List[Dict], List[float]]:
+        """Run files through the work-stealing executor, or static batches when disabled."""
+
+        if not (self.config.work_stealing and WORK_STEALING_AVAILABLE):
+            file_chunks = self._create_file_chunks(files)
+            self.last_schedule_stats = {"strategy": "static", "chunks": len(file_chunks)}
+            return self._execute_parallel_chunks(file_chunks, policy_preset, options)
+
+        return self._execute_work_stealing(files, policy_preset, options)
+
+    def _execute_work_stealing(
+        self, files: List[Path], policy_preset: str, options: Dict[str, Any]
+    ) -> Tuple[List[Dict], List[float]]:
+        """Analyze size-aware chunks over per-worker deques with stealing."""
+
+        executor = WorkStealingProcessExecutor(
+            max_workers=self.config.max_workers,
+            use_processes=self.config.use_processes,
+            batch_processor=self.batch_processor,
+            chunks_per_worker=self.config.chunks_per_worker,
+        )
+        costs = [self.file_costs.estimate(str(file_path)) for file_path in files]
+        outcomes = executor.map_chunks(
+            analyze_file_chunk, files, costs, policy_preset, options, timeout=self.config.timeout_seconds
+        )
+
+        chunk_results = []
+        chunk_times = []
+        for outcome in outcomes:
+            if outcome.error is not None:
+                logger.error(f"Chunk on worker {outcome.worker_index} failed: {outcome.error}")
+                chunk_results.append(
+                    {"error": outcome.error, "violations": [], "nasa_violations": [], "duplication_clusters": []}
+                )
+                chunk_times.append(0.0)
+                continue
+
+            for file_path, (seconds, size_bytes) in outcome.result.get("file_costs", {}).items():
+                self.file_costs.record(file_path, seconds, size_bytes)
+            chunk_results.append(outcome.result)
+            chunk_times.append(outcome.execution_time)
+
+        self.last_schedule_stats = {"strategy": "work_stealing", **executor.last_run_stats}
+        logger.debug(
+            f"Work stealing: {executor.last_run_stats['chunks']} chunks, "
+            f"{executor.last_run_stats['steals']} steals, imbalance {executor.last_run_stats['imbalance']:.2f}"
+        )
+        return chunk_results, chunk_times
+
     def _create_file_chunks(self, files: List[Path]) -> List[List[Path]]:
         """Create chunks of files for parallel processing."""
 
@@ -357,7 +477,7 @@ class ParallelConnascenceAnalyzer:
         with executor_class(max_workers=self.config.max_workers) as executor:
             # Submit all chunks for processing
             future_to_chunk = {
-                executor.submit(self._analyze_chunk, chunk, policy_preset, options): i
+                executor.submit(analyze_file_chunk, chunk, policy_preset, options): i
                 for i, chunk in enumerate(file_chunks)
             }
 
@@ -387,102 +507,11 @@ class ParallelConnascenceAnalyzer:
 
     def _analyze_chunk(self, file_chunk: List[Path], policy_preset: str, options: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze a chunk of files with REAL detector execution."""
-
-        try:
-            # Import real detectors with proper path handling
-            import sys
-            from pathlib import Path
-
-            # Add analyzer directory to path
-            analyzer_path = Path(__file__).parent.parent
-            if str(analyzer_path) not in sys.path:
-                sys.path.insert(0, str(analyzer_path))
-
-            from detectors import (
-                PositionDetector, MagicLiteralDetector, AlgorithmDetector,
-                GodObjectDetector, TimingDetector, ConventionDetector,
-                ValuesDetector, ExecutionDetector
-            )
-
-            all_violations = []
-            all_nasa_violations = []
-            all_duplication_clusters = []
-            files_processed = 0
-
-            for file_path in file_chunk:
-                try:
-                    # Read and parse file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        source_code = f.read()
-                        source_lines = source_code.splitlines()
-
-                    import ast
-                    tree = ast.parse(source_code, str(file_path))
-
-                    # Run each detector with REAL analysis
-                    detectors = [
-                        PositionDetector(str(file_path), source_lines),
-                        MagicLiteralDetector(str(file_path), source_lines),
-                        AlgorithmDetector(str(file_path), source_lines),
-                        GodObjectDetector(str(file_path), source_lines),
-                        TimingDetector(str(file_path), source_lines),
-                        ConventionDetector(str(file_path), source_lines),
-                        ValuesDetector(str(file_path), source_lines),
-                        ExecutionDetector(str(file_path), source_lines)
-                    ]
-
-                    for detector in detectors:
-                        try:
-                            violations = detector.detect_violations(tree)
-                            # Convert violations to dict format
-                            for violation in violations:
-                                violation_dict = self._violation_to_dict(violation)
-                                all_violations.append(violation_dict)
-                        except Exception as e:
-                            logger.warning(f"Detector {detector.__class__.__name__} failed on {file_path}: {e}")
-
-                    files_processed += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to analyze {file_path}: {e}")
-                    continue
-
-            return {
-                "chunk_size": len(file_chunk),
-                "files_processed": files_processed,
-                "violations": all_violations,
-                "nasa_violations": all_nasa_violations,
-                "duplication_clusters": all_duplication_clusters,
-                "processing_successful": True,
-            }
-
-        except Exception as e:
-            logger.error(f"Chunk analysis failed: {e}")
-            return {
-                "chunk_size": len(file_chunk),
-                "files_processed": 0,
-                "violations": [],
-                "nasa_violations": [],
-                "duplication_clusters": [],
-                "processing_successful": False,
-                "error": str(e),
-            }
+        return analyze_file_chunk(file_chunk, policy_preset, options)
 
     def _violation_to_dict(self, violation) -> Dict[str, Any]:
         """Convert violation object to dictionary."""
-        if isinstance(violation, dict):
-            return violation
-        elif hasattr(violation, '__dict__'):
-            return violation.__dict__
-        elif hasattr(violation, '_asdict'):
-            return violation._asdict()
-        else:
-            return {
-                "description": str(violation),
-                "type": "unknown",
-                "severity": "medium",
-                "file_path": "unknown"
-            }
+        return _violation_to_dict(violation)
 
     def _get_analyzer(self):
         """Get analyzer instance with fallback."""
@@ -704,54 +733,14 @@ class ParallelConnascenceAnalyzer:
         )
 
     def _create_test_project(self, file_count: int) -> List[Path]:
-        """Create test project files for benchmarking."""
+        """Create a seeded synthetic test project for benchmarking."""
 
         import tempfile
 
-        temp_dir = Path(tempfile.mkdtemp())
-        test_files = []
-
-        for i in range(file_count):
-            test_file = temp_dir / f"test_file_{i:03d}.py"
-
-            # Create file with various violations for realistic testing
-            content = f"""
-    def test_function_{i}(param1, param2, param3, param4, param5):  # Parameter bomb
-    magic_value = {100 + i * 10}  # Magic literal
-    secret_key = "test_key_{i}"  # Magic string
-
-    if param1 > magic_value:
-        return param1 * {2.0 + i * 0.1}  # Magic literal
-    return param1
-
-class TestClass_{i}:
-    def method_01(self): pass
-    def method_02(self): pass
-    def method_03(self): pass
-    def method_04(self): pass
-    def method_05(self): pass
-    def method_06(self): pass
-    def method_07(self): pass
-    def method_08(self): pass
-    def method_09(self): pass
-    def method_10(self): pass
-    def method_11(self): pass
-    def method_12(self): pass
-    def method_13(self): pass
-    def method_14(self): pass
-    def method_15(self): pass
-    def method_16(self): pass
-    def method_17(self): pass
-    def method_18(self): pass
-    def method_19(self): pass
-    def method_20(self): pass
-    def method_21(self): pass  # God class
-"""
-
-            test_file.write_text(content)
-            test_files.append(test_file)
+        from .corpus_generator import CorpusConfig, SyntheticCorpusGenerator
 
-        return test_files
+        manifest = SyntheticCorpusGenerator(CorpusConfig(file_count=file_count)).generate(tempfile.mkdtemp())
+        return manifest.paths
 
     def _benchmark_sequential(self, test_files: List[Path]) -> float:
         """Benchmark sequential processing time."""
@@ -773,6 +762,113 @@ class TestClass_{i}:
 
         return time.time() - start_time
 
+def analyze_file_chunk(file_chunk: List[Path], policy_preset: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyze a chunk of files with REAL detector execution.
+
+    Module-level so process workers receive only the chunk, not the analyzer.
+    """
+
+    try:
+        # Import real detectors with proper path handling
+        import sys
+        from pathlib import Path
+
+        # Add project root to path so spawned workers can import the analyzer package
+        project_root = Path(__file__).resolve().parents[2]
+        if str(project_root) not in sys.path:
+            sys.path.insert(0, str(project_root))
+
+        from analyzer.detectors import (
+            PositionDetector, MagicLiteralDetector, AlgorithmDetector,
+            GodObjectDetector, TimingDetector, ConventionDetector,
+            ValuesDetector, ExecutionDetector
+        )
+
+        all_violations = []
+        all_nasa_violations = []
+        all_duplication_clusters = []
+        files_processed = 0
+        file_costs = {}
+
+        for file_path in file_chunk:
+            file_start = time.time()
+            try:
+                # Read and parse file
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source_code = f.read()
+                    source_lines = source_code.splitlines()
+
+                import ast
+                tree = ast.parse(source_code, str(file_path))
+
+                # Run each detector with REAL analysis
+                detectors = [
+                    PositionDetector(str(file_path), source_lines),
+                    MagicLiteralDetector(str(file_path), source_lines),
+                    AlgorithmDetector(str(file_path), source_lines),
+                    GodObjectDetector(str(file_path), source_lines),
+                    TimingDetector(str(file_path), source_lines),
+                    ConventionDetector(str(file_path), source_lines),
+                    ValuesDetector(str(file_path), source_lines),
+                    ExecutionDetector(str(file_path), source_lines)
+                ]
+
+                for detector in detectors:
+                    try:
+                        violations = detector.detect_violations(tree)
+                        # Convert violations to dict format
+                        for violation in violations:
+                            violation_dict = _violation_to_dict(violation)
+                            all_violations.append(violation_dict)
+                    except Exception as e:
+                        logger.warning(f"Detector {detector.__class__.__name__} failed on {file_path}: {e}")
+
+                files_processed += 1
+                file_costs[str(file_path)] = (time.time() - file_start, len(source_code))
+
+            except Exception as e:
+                logger.warning(f"Failed to analyze {file_path}: {e}")
+                continue
+
+        return {
+            "chunk_size": len(file_chunk),
+            "files_processed": files_processed,
+            "violations": all_violations,
+            "nasa_violations": all_nasa_violations,
+            "duplication_clusters": all_duplication_clusters,
+            "file_costs": file_costs,
+            "processing_successful": True,
+        }
+
+    except Exception as e:
+        logger.error(f"Chunk analysis failed: {e}")
+        return {
+            "chunk_size": len(file_chunk),
+            "files_processed": 0,
+            "violations": [],
+            "nasa_violations": [],
+            "duplication_clusters": [],
+            "processing_successful": False,
+            "error": str(e),
+        }
+
+def _violation_to_dict(violation) -> Dict[str, Any]:
+    """Convert violation object to dictionary."""
+    if isinstance(violation, dict):
+        return violation
+    elif hasattr(violation, '__dict__'):
+        return violation.__dict__
+    elif hasattr(violation, '_asdict'):
+        return violation._asdict()
+    else:
+        return {
+            "description": str(violation),
+            "type": "unknown",
+            "severity": "medium",
+            "file_path": "unknown"
+        }
+
 class ResourceMonitor:
     """Monitor system resources during parallel analysis."""
 
@@ -1,5 +1,4 @@
-from src.constants.base import MAXIMUM_NESTED_DEPTH
-
+"""
 Advanced real-time monitoring system for detector pool performance with
 automatic bottleneck detection, alert generation, and adaptive optimization
 triggers. Integrates with thread contention profiler and memory coordinator.
@@ -15,6 +14,7 @@ Features:
 
 import asyncio
 import gc
+import json
 import os
 import threading
 import time
@@ -22,8 +22,14 @@ import warnings
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
+from threading import RLock
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 import logging
+
+import psutil
+
+from analyzer.optimization.metric_series import MetricSeries, RingBuffer
+
 logger = logging.getLogger(__name__)
 
 class AlertSeverity(Enum):
@@ -95,6 +101,16 @@ class BottleneckDetector:
     pattern recognition for performance anomaly detection.
     """
     
+    # RealTimeMetrics fields kept in the rolling window, keyed as in the baseline
+    TRACKED_FIELDS = {
+        "wait_time_ms": "average_wait_time_ms",
+        "memory_mb": "memory_usage_mb",
+        "cpu_percent": "cpu_usage_percent",
+        "throughput_ops": "throughput_ops_per_second",
+        "latency_ms": "latency_p95_ms",
+    }
+    PERCENTILE_FIELDS = ("wait_time_ms", "latency_ms", "memory_mb")
+
     def __init__(self,
                 sensitivity: float = 1.0,
                 history_window: int = 100):
@@ -135,8 +151,16 @@ class BottleneckDetector:
             }
         }
         
-        # Historical data for baseline establishment
-        self.metrics_history: deque = deque(maxlen=history_window)
+        # Historical data for baseline establishment: one fixed-size ring per
+        # field instead of a deque of snapshot objects (NASA Rule 7)
+        self.metric_windows: Dict[str, RingBuffer] = {
+            name: RingBuffer(history_window) for name in self.TRACKED_FIELDS
+        }
+        # All-time percentiles in constant memory, for long-running monitors
+        self.metric_series: Dict[str, MetricSeries] = {
+            name: MetricSeries(window_size=history_window) for name in self.PERCENTILE_FIELDS
+        }
+        self.samples_seen = 0
         self.baseline_established = False
         self.baseline_metrics: Optional[Dict[str, float]] = None
         
@@ -159,10 +183,10 @@ class BottleneckDetector:
         alerts = []
         
         # Store metrics for historical analysis
-        self.metrics_history.append(metrics)
+        self._record(metrics)
         
         # Establish baseline if needed
-        if not self.baseline_established and len(self.metrics_history) >= 20:
+        if not self.baseline_established and self.samples_seen >= 20:
             self._establish_baseline()
         
         # Detect various bottleneck types
@@ -178,20 +202,27 @@ class BottleneckDetector:
         
         return alerts
     
+    def _record(self, metrics: RealTimeMetrics) -> None:
+        """Append one snapshot to the per-field rings and percentile series."""
+        for name, attribute in self.TRACKED_FIELDS.items():
+            value = getattr(metrics, attribute)
+            self.metric_windows[name].append(value)
+            if name in self.metric_series:
+                self.metric_series[name].add(value)
+        self.samples_seen += 1
+    
+    def get_percentiles(self) -> Dict[str, Dict[str, Any]]:
+        """All-time count, mean, min/max and p50/p95/p99 per tracked metric."""
+        return {name: series.summary() for name, series in self.metric_series.items()}
+    
     def _establish_baseline(self) -> None:
         """Establish performance baseline from historical data."""
-        if len(self.metrics_history) < 20:
+        if self.samples_seen < 20:
             return
         
         # Calculate baseline averages
-        recent_metrics = list(self.metrics_history)[-20:]
-        
         self.baseline_metrics = {
-            "wait_time_ms": sum(m.average_wait_time_ms for m in recent_metrics) / len(recent_metrics),
-            "memory_mb": sum(m.memory_usage_mb for m in recent_metrics) / len(recent_metrics),
-            "cpu_percent": sum(m.cpu_usage_percent for m in recent_metrics) / len(recent_metrics),
-            "throughput_ops": sum(m.throughput_ops_per_second for m in recent_metrics) / len(recent_metrics),
-            "latency_ms": sum(m.latency_p95_ms for m in recent_metrics) / len(recent_metrics)
+            name: sum(window.tail(20)) / 20 for name, window in self.metric_windows.items()
         }
         
         self.baseline_established = True
@@ -493,13 +524,11 @@ class BottleneckDetector:
         """Detect anomaly patterns using statistical analysis."""
         alerts = []
         
-        if len(self.metrics_history) < 30:
+        if self.samples_seen < 30:
             return alerts  # Need more data for pattern analysis
         
-        recent_metrics = list(self.metrics_history)[-30:]
-        
         # Analyze wait time pattern
-        wait_times = [m.average_wait_time_ms for m in recent_metrics]
+        wait_times = self.metric_windows["wait_time_ms"].tail(30)
         wait_time_avg = sum(wait_times) / len(wait_times)
         wait_time_std = (sum((x - wait_time_avg) ** 2 for x in wait_times) / len(wait_times)) ** 0.5
         
@@ -606,7 +635,7 @@ class RealTimePerformanceMonitor:
             
             self.monitoring_active = False
             if self.monitor_thread and self.monitor_thread.is_alive():
-                self.monitor_thread.join(timeout=MAXIMUM_NESTED_DEPTH)
+                self.monitor_thread.join(timeout=5.0)
         
         logger.info("Real-time performance monitoring stopped")
     
@@ -812,8 +841,10 @@ class RealTimePerformanceMonitor:
                 "bottleneck_detection": {
                     "baseline_established": self.bottleneck_detector.baseline_established,
                     "sensitivity": self.bottleneck_detector.sensitivity,
-                    "metrics_history_size": len(self.bottleneck_detector.metrics_history)
+                    "metrics_history_size": len(self.bottleneck_detector.metric_windows["wait_time_ms"]),
+                    "samples_seen": self.bottleneck_detector.samples_seen
                 },
+                "metric_percentiles": self.bottleneck_detector.get_percentiles(),
                 "performance_recommendations": self._generate_performance_recommendations()
             }
     
@@ -22,9 +22,29 @@ import threading
 from collections import deque, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, Callable
 import logging
+
+import numpy as np
+
+from .statistical_tests import (
+    WelfordAccumulator,
+    bootstrap_relative_change_ci,
+    mann_whitney_u,
+    welch_t_test,
+)
+
+if TYPE_CHECKING:
+    from .benchmark_suite import BenchmarkResults
+
+try:
+    from .real_time_monitor import AlertSeverity, PerformanceAlert
+    MONITORING_AVAILABLE = True
+except ImportError:
+    MONITORING_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class RegressionSeverity(Enum):
@@ -120,43 +140,45 @@ class StatisticalAnalyzer:
                         baseline_data: List[float],
                         current_data: List[float],
                         regression_threshold: float = 15.0,
-                        confidence_level: float = 0.95) -> Dict[str, Any]:
+                        confidence_level: float = 0.95,
+                        alternative: str = "two-sided") -> Dict[str, Any]:
         """
         Detect performance regression using statistical analysis.
-        
+
+        Significance comes from Welch's t-test; the Mann-Whitney U p-value and
+        a bootstrap CI of the percent change are reported alongside it.
+        ``alternative="greater"`` tests for an increase only (latency metrics).
+
         NASA Rule 4: Function under 60 lines
         NASA Rule 5: Input validation
         """
-        assert isinstance(baseline_data, list), "baseline_data must be list"
-        assert isinstance(current_data, list), "current_data must be list"
         assert len(baseline_data) >= 3, "baseline_data must have at least 3 samples"
         assert len(current_data) >= 3, "current_data must have at least 3 samples"
         assert 1.0 <= regression_threshold <= 60.0, "threshold must be 1-100%"
         assert 0.8 <= confidence_level <= 0.99, "confidence must be 0.8-0.99"
-        
-        # Calculate descriptive statistics
-        baseline_mean = statistics.mean(baseline_data)
-        current_mean = statistics.mean(current_data)
-        baseline_std = statistics.stdev(baseline_data) if len(baseline_data) > 1 else 0.0
-        current_std = statistics.stdev(current_data) if len(current_data) > 1 else 0.0
-        
+
+        baseline = np.asarray(baseline_data, dtype=float)
+        current = np.asarray(current_data, dtype=float)
+        baseline_mean = float(baseline.mean())
+        current_mean = float(current.mean())
+
         # Calculate regression percentage
-        regression_percent = ((current_mean - baseline_mean) / baseline_mean) * MAXIMUM_FUNCTION_LENGTH_LINES
-        
-        # Statistical significance test (simplified t-test)
-        t_statistic = self._calculate_t_statistic(baseline_data, current_data)
-        p_value = self._calculate_p_value(t_statistic, len(baseline_data) + len(current_data) - 2)
-        statistical_significance = 1.0 - p_value
-        
+        regression_percent = ((current_mean - baseline_mean) / baseline_mean) * 100.0 if baseline_mean else 0.0
+
+        welch = welch_t_test(baseline, current, alternative)
+        rank_test = mann_whitney_u(baseline, current, alternative)
+        ci_low, ci_high = bootstrap_relative_change_ci(baseline, current, confidence=confidence_level)
+        statistical_significance = 1.0 - welch.p_value
+
         # Determine if regression is detected
         regression_detected = (
             abs(regression_percent) >= regression_threshold and
             statistical_significance >= confidence_level
         )
-        
+
         # Calculate confidence score
         confidence_score = min(1.0, statistical_significance * (abs(regression_percent) / regression_threshold))
-        
+
         return {
             "regression_detected": regression_detected,
             "regression_percent": regression_percent,
@@ -164,53 +186,17 @@ class StatisticalAnalyzer:
             "confidence_score": confidence_score,
             "baseline_mean": baseline_mean,
             "current_mean": current_mean,
-            "baseline_std": baseline_std,
-            "current_std": current_std,
-            "t_statistic": t_statistic,
-            "p_value": p_value,
+            "baseline_std": float(baseline.std(ddof=1)),
+            "current_std": float(current.std(ddof=1)),
+            "t_statistic": welch.statistic,
+            "degrees_of_freedom": welch.df,
+            "p_value": welch.p_value,
+            "mann_whitney_u": rank_test.statistic,
+            "mann_whitney_p_value": rank_test.p_value,
+            "change_percent_ci": (ci_low, ci_high),
             "sample_sizes": {"baseline": len(baseline_data), "current": len(current_data)}
         }
-    
-    def _calculate_t_statistic(self, baseline: List[float], current: List[float]) -> float:
-        """Calculate t-statistic for two-sample t-test."""
-        baseline_mean = statistics.mean(baseline)
-        current_mean = statistics.mean(current)
-        
-        # Calculate pooled standard deviation
-        baseline_var = statistics.variance(baseline) if len(baseline) > 1 else 0.0
-        current_var = statistics.variance(current) if len(current) > 1 else 0.0
-        
-        pooled_var = ((len(baseline) - 1) * baseline_var + (len(current) - 1) * current_var) / \
-                    (len(baseline) + len(current) - 2)
-        
-        # Standard error
-        standard_error = math.sqrt(pooled_var * (1/len(baseline) + 1/len(current)))
-        
-        if standard_error == 0:
-            return 0.0
-        
-        return (current_mean - baseline_mean) / standard_error
-    
-    def _calculate_p_value(self, t_stat: float, degrees_freedom: int) -> float:
-        """Calculate p-value for t-statistic (simplified approximation)."""
-        # Simplified p-value calculation using normal approximation
-        try:
-            # Using normal approximation for simplicity
-            z_score = abs(t_stat)
-            
-            # Rough approximation of p-value for normal distribution
-            if z_score > 3.0:
-                return 0.1  # Very significant
-            elif z_score > 2.0:
-                return MINIMUM_TRADE_THRESHOLD   # Significant
-            elif z_score > 1.0:
-                return 0.2    # Somewhat significant
-            else:
-                return 0.5    # Not significant
-                
-        except Exception:
-            return 0.5  # Default to not significant if calculation fails
-    
+
     def detect_outliers(self, data: List[float], method: str = "iqr") -> List[int]:
         """
         Detect outliers in performance data.
@@ -323,6 +309,8 @@ class BaselineTracker:
         """Initialize baseline tracker."""
         self.baselines: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))  # Max 1000 points per metric
         self.baseline_configs: Dict[str, BaselineConfiguration] = {}
+        # Streaming per-metric statistics over the retained data points
+        self.accumulators: Dict[str, WelfordAccumulator] = defaultdict(WelfordAccumulator)
         self.baseline_lock = threading.RLock()
         self.last_cleanup = time.time()
         
@@ -338,13 +326,19 @@ class BaselineTracker:
         assert isinstance(metric, PerformanceMetric), "metric must be PerformanceMetric"
         
         with self.baseline_lock:
+            baseline = self.baselines[metric.metric_name]
+            if len(baseline) == baseline.maxlen:
+                # Keep the accumulator in step with the bounded window
+                self.accumulators[metric.metric_name].remove(baseline[0]["value"])
+
             # Add to baseline data
-            self.baselines[metric.metric_name].append({
+            baseline.append({
                 "value": metric.value,
                 "timestamp": metric.timestamp,
                 "context": metric.context,
                 "confidence": metric.confidence
             })
+            self.accumulators[metric.metric_name].add(metric.value)
             
             # Periodic cleanup of old data
             current_time = time.time()
@@ -388,6 +382,11 @@ class BaselineTracker:
             
             return baseline_values if len(baseline_values) >= min_samples else []
     
+    def get_metric_statistics(self, metric_name: str) -> WelfordAccumulator:
+        """Streaming count/mean/variance for a metric, without touching the data points."""
+        with self.baseline_lock:
+            return self.accumulators.get(metric_name) or WelfordAccumulator()
+
     def set_baseline_config(self, config: BaselineConfiguration) -> None:
         """Set baseline configuration for a metric."""
         with self.baseline_lock:
@@ -448,6 +447,12 @@ class BaselineTracker:
             
             self.baselines[metric_name] = recent_data
             cleanup_count += original_size - len(recent_data)
+
+            # Rebuild the accumulator from the retained points
+            accumulator = WelfordAccumulator()
+            for data_point in recent_data:
+                accumulator.add(data_point["value"])
+            self.accumulators[metric_name] = accumulator
         
         if cleanup_count > 0:
             logger.info(f"Cleaned up {cleanup_count} old baseline data points")
@@ -465,14 +470,14 @@ class BaselineTracker:
             metric_stats = {}
             for metric_name, baseline_data in self.baselines.items():
                 if baseline_data:
-                    values = [dp["value"] for dp in baseline_data]
+                    accumulator = self.get_metric_statistics(metric_name)
                     metric_stats[metric_name] = {
-                        "data_points": len(values),
-                        "mean": statistics.mean(values),
-                        "std_dev": statistics.stdev(values) if len(values) > 1 else 0.0,
-                        "min": min(values),
-                        "max": max(values),
-                        "latest_timestamp": max(dp["timestamp"] for dp in baseline_data)
+                        "data_points": len(baseline_data),
+                        "mean": accumulator.mean,
+                        "std_dev": accumulator.stdev,
+                        "min": min(dp["value"] for dp in baseline_data),
+                        "max": max(dp["value"] for dp in baseline_data),
+                        "latest_timestamp": baseline_data[-1]["timestamp"]
                     }
             
             stats["metric_details"] = metric_stats
@@ -559,7 +564,8 @@ class RegressionDetectionEngine:
         )
         
         if len(recent_data) < 3:
-            recent_data = [metric.value]  # Use current value if no recent data
+            logger.debug(f"Insufficient recent data for {metric.metric_name}: {len(recent_data)} samples")
+            return None
         
         # Perform regression analysis
         analysis_result = self.statistical_analyzer.detect_regression(
@@ -596,6 +602,78 @@ class RegressionDetectionEngine:
         
         return regression_result
     
+    def evaluate_benchmark_results(self,
+                                    baseline: Union["BenchmarkResults", Dict[str, Any], str, Path],
+                                    current: Union["BenchmarkResults", Dict[str, Any], str, Path],
+                                    regression_threshold: float = 10.0,
+                                    confidence_level: float = 0.95) -> List[RegressionDetectionResult]:
+        """
+        Compare two benchmark suite runs scenario by scenario.
+
+        Benchmark samples are latencies, so only slowdowns count: a scenario
+        regresses when its mean grows by at least ``regression_threshold``
+        percent, the one-sided Welch test is significant at
+        ``confidence_level`` and the bootstrap CI of the change lies above zero.
+        Current samples are also recorded in the baseline tracker.
+        """
+        from .benchmark_suite import BenchmarkResults
+
+        def _load(results):
+            if isinstance(results, BenchmarkResults):
+                return results
+            if isinstance(results, dict):
+                return BenchmarkResults.from_dict(results)
+            return BenchmarkResults.load(results)
+
+        baseline, current = _load(baseline), _load(current)
+        if baseline.corpus.get("digest") != current.corpus.get("digest"):
+            logger.warning("Benchmark runs used different corpora; comparison may not be meaningful")
+
+        results = []
+        for name, current_scenario in current.scenarios.items():
+            baseline_scenario = baseline.scenarios.get(name)
+            if baseline_scenario is None or min(len(baseline_scenario.samples_ms), len(current_scenario.samples_ms)) < 3:
+                logger.info(f"Skipping benchmark scenario {name}: not enough samples to compare")
+                continue
+
+            metric_name = f"benchmark.{name}"
+            for sample in current_scenario.samples_ms:
+                self.baseline_tracker.add_metric_data(PerformanceMetric(
+                    metric_name=metric_name, metric_type=RegressionType.LATENCY,
+                    value=sample, timestamp=current.created_at or time.time(),
+                    context={"label": current.label}
+                ))
+
+            analysis = self.statistical_analyzer.detect_regression(
+                baseline_scenario.samples_ms, current_scenario.samples_ms,
+                regression_threshold, confidence_level, alternative="greater"
+            )
+            ci_low, ci_high = analysis["change_percent_ci"]
+            result = RegressionDetectionResult(
+                metric_name=metric_name,
+                regression_detected=analysis["regression_detected"] and analysis["regression_percent"] > 0 and ci_low > 0,
+                severity=self._calculate_severity(analysis["regression_percent"]),
+                regression_percent=analysis["regression_percent"],
+                confidence_score=analysis["confidence_score"],
+                baseline_value=analysis["baseline_mean"],
+                current_value=analysis["current_mean"],
+                statistical_significance=analysis["statistical_significance"],
+                trend_analysis={
+                    "p_value": analysis["p_value"],
+                    "mann_whitney_p_value": analysis["mann_whitney_p_value"],
+                    "change_percent_ci": [ci_low, ci_high],
+                    "sample_sizes": analysis["sample_sizes"],
+                }
+            )
+
+            self.detection_stats["total_detections"] += 1
+            if result.regression_detected:
+                self.detection_stats["regressions_detected"] += 1
+            self.detection_results.append(result)
+            results.append(result)
+
+        return results
+
     def _calculate_severity(self, regression_percent: float) -> RegressionSeverity:
         """Calculate regression severity based on percentage change."""
         abs_percent = abs(regression_percent)
@@ -841,6 +919,36 @@ def get_global_regression_engine() -> RegressionDetectionEngine:
     
     return _global_regression_engine
 
+def evaluate_benchmark_gate(baseline: Union[Dict[str, Any], str, Path],
+                            current: Union[Dict[str, Any], str, Path],
+                            regression_threshold: float = 10.0,
+                            confidence_level: float = 0.95) -> Dict[str, Any]:
+    """
+    CI gate over two benchmark suite result sets.
+
+    Returns a JSON-serializable summary whose ``passed`` flag is False when
+    any scenario shows a statistically real slowdown.
+    """
+    results = RegressionDetectionEngine().evaluate_benchmark_results(
+        baseline, current, regression_threshold, confidence_level
+    )
+    return {
+        "passed": not any(result.regression_detected for result in results),
+        "regression_threshold_percent": regression_threshold,
+        "confidence_level": confidence_level,
+        "scenarios": {
+            result.metric_name: {
+                "regression_detected": result.regression_detected,
+                "severity": result.severity.value,
+                "change_percent": result.regression_percent,
+                "baseline_mean_ms": result.baseline_value,
+                "current_mean_ms": result.current_value,
+                **result.trend_analysis,
+            }
+            for result in results
+        },
+    }
+
 async def detect_performance_regression(metric_name: str, 
                                         metric_type: RegressionType,
                                         value: float,
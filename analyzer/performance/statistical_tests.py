@@ -0,0 +1,265 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Statistical Tests for Performance Regression Detection
+======================================================
+
+Vectorized (numpy) significance tests used by the regression detector:
+
+- Welch's unequal-variance t-test with exact Student t p-values
+- Mann-Whitney U test (normal approximation with tie correction)
+- Bootstrap confidence intervals for the relative change between samples
+- Welford accumulators for streaming mean/variance per metric
+
+Functions accept a trailing sample axis, so many metrics can be tested in
+one call when their sample counts match.
+
+NASA Rule 7: Iteration counts are bounded by constants.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple, Union
+import math
+
+import numpy as np
+
+ALTERNATIVES = ("two-sided", "greater", "less")
+
+# Continued-fraction limits for the regularized incomplete beta function
+_BETACF_MAX_ITERATIONS = 300
+_BETACF_EPSILON = 3.0e-14
+_BETACF_FPMIN = 1.0e-300
+
+_lgamma = np.vectorize(math.lgamma, otypes=[float])
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+def _betacf(a: np.ndarray, b: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Continued fraction for the incomplete beta function (modified Lentz)."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = np.ones_like(x)
+    d = 1.0 - qab * x / qap
+    d = 1.0 / np.where(np.abs(d) < _BETACF_FPMIN, _BETACF_FPMIN, d)
+    h = d.copy()
+    for m in range(1, _BETACF_MAX_ITERATIONS + 1):
+        m2 = 2 * m
+        for aa in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                    -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1.0 + aa * d
+            d = 1.0 / np.where(np.abs(d) < _BETACF_FPMIN, _BETACF_FPMIN, d)
+            c = 1.0 + aa / c
+            c = np.where(np.abs(c) < _BETACF_FPMIN, _BETACF_FPMIN, c)
+            delta = d * c
+            h = h * delta
+        if np.all(np.abs(delta - 1.0) < _BETACF_EPSILON):
+            break
+    return h
+
+def regularized_incomplete_beta(a: ArrayLike, b: ArrayLike, x: ArrayLike) -> np.ndarray:
+    """I_x(a, b), evaluated elementwise."""
+    a, b, x = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, x)))
+    x = np.clip(x, 0.0, 1.0)
+    inner = (x > 0.0) & (x < 1.0)
+    safe_x = np.where(inner, x, 0.5)
+
+    log_front = _lgamma(a + b) - _lgamma(a) - _lgamma(b) + a * np.log(safe_x) + b * np.log1p(-safe_x)
+    front = np.exp(log_front)
+
+    direct = safe_x < (a + 1.0) / (a + b + 2.0)
+    lower = front * _betacf(a, b, safe_x) / a
+    upper = 1.0 - front * _betacf(b, a, 1.0 - safe_x) / b
+    result = np.where(direct, lower, upper)
+    return np.where(x <= 0.0, 0.0, np.where(x >= 1.0, 1.0, result))
+
+def student_t_sf(t: ArrayLike, df: ArrayLike) -> np.ndarray:
+    """Survival function P(T > t) of Student's t distribution."""
+    t, df = np.broadcast_arrays(np.asarray(t, dtype=float), np.asarray(df, dtype=float))
+    tail = 0.5 * regularized_incomplete_beta(df / 2.0, 0.5, df / (df + t * t))
+    return np.where(t >= 0, tail, 1.0 - tail)
+
+def normal_sf(z: ArrayLike) -> np.ndarray:
+    """Survival function of the standard normal distribution."""
+    z = np.asarray(z, dtype=float)
+    return 0.5 * np.vectorize(math.erfc, otypes=[float])(z / math.sqrt(2.0))
+
+def _p_value(sf_of_stat, sf_of_negated, alternative: str) -> np.ndarray:
+    """Combine tail probabilities for the requested alternative."""
+    assert alternative in ALTERNATIVES, f"alternative must be one of {ALTERNATIVES}"
+    if alternative == "greater":
+        return sf_of_stat
+    if alternative == "less":
+        return sf_of_negated
+    return np.minimum(1.0, 2.0 * np.minimum(sf_of_stat, sf_of_negated))
+
+@dataclass(frozen=True)
+class SignificanceResult:
+    """Statistic and p-value of a significance test."""
+    statistic: float
+    p_value: float
+    df: Optional[float] = None
+
+def welch_t_test_from_stats(mean1: ArrayLike, var1: ArrayLike, n1: ArrayLike,
+                            mean2: ArrayLike, var2: ArrayLike, n2: ArrayLike,
+                            alternative: str = "two-sided") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Welch's t-test from summary statistics (e.g. Welford accumulators).
+
+    Tests sample 2 against sample 1; ``greater`` means mean2 > mean1.
+    Returns (t, p_value, degrees_of_freedom) arrays.
+    """
+    mean1, var1, n1, mean2, var2, n2 = (np.asarray(v, dtype=float) for v in (mean1, var1, n1, mean2, var2, n2))
+    se1, se2 = var1 / n1, var2 / n2
+    standard_error = np.sqrt(se1 + se2)
+    diff = mean2 - mean1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(standard_error > 0, diff / standard_error, np.sign(diff) * np.inf)
+        df_denominator = se1 ** 2 / np.maximum(n1 - 1, 1) + se2 ** 2 / np.maximum(n2 - 1, 1)
+        df = np.where(df_denominator > 0, (se1 + se2) ** 2 / df_denominator, n1 + n2 - 2)
+
+    finite = np.isfinite(t)
+    safe_t = np.where(finite, t, 0.0)
+    upper = np.where(finite, student_t_sf(safe_t, df), np.where(t > 0, 0.0, 1.0))
+    lower = np.where(finite, student_t_sf(-safe_t, df), np.where(t < 0, 0.0, 1.0))
+    # Identical constant samples carry no evidence of a difference
+    no_difference = (standard_error == 0) & (diff == 0)
+    p_value = np.where(no_difference, 1.0, _p_value(upper, lower, alternative))
+    return np.where(no_difference, 0.0, t), p_value, df
+
+def welch_t_test(baseline: ArrayLike, current: ArrayLike, alternative: str = "two-sided") -> SignificanceResult:
+    """Welch's t-test of ``current`` against ``baseline``."""
+    baseline = np.asarray(baseline, dtype=float)
+    current = np.asarray(current, dtype=float)
+    assert baseline.shape[-1] >= 2 and current.shape[-1] >= 2, "each sample needs at least 2 values"
+    t, p_value, df = welch_t_test_from_stats(
+        baseline.mean(axis=-1), baseline.var(axis=-1, ddof=1), baseline.shape[-1],
+        current.mean(axis=-1), current.var(axis=-1, ddof=1), current.shape[-1],
+        alternative,
+    )
+    return SignificanceResult(statistic=float(t), p_value=float(p_value), df=float(df)) if np.ndim(t) == 0 else \
+        SignificanceResult(statistic=t, p_value=p_value, df=df)
+
+def mann_whitney_u(baseline: ArrayLike, current: ArrayLike, alternative: str = "two-sided") -> SignificanceResult:
+    """
+    Mann-Whitney U test of ``current`` against ``baseline``.
+
+    Uses the normal approximation with tie and continuity corrections; the
+    statistic is U for ``current`` (large when current values are larger).
+    """
+    baseline = np.asarray(baseline, dtype=float).ravel()
+    current = np.asarray(current, dtype=float).ravel()
+    n1, n2 = baseline.size, current.size
+    assert n1 >= 1 and n2 >= 1, "each sample needs at least 1 value"
+
+    combined = np.concatenate([baseline, current])
+    _, inverse, counts = np.unique(combined, return_inverse=True, return_counts=True)
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2.0
+    ranks = average_ranks[inverse]
+
+    u_current = ranks[n1:].sum() - n2 * (n2 + 1) / 2.0
+    n = n1 + n2
+    mean_u = n1 * n2 / 2.0
+    tie_term = float(np.sum(counts ** 3 - counts)) / (n * (n - 1)) if n > 1 else 0.0
+    sigma = math.sqrt(max(n1 * n2 / 12.0 * ((n + 1) - tie_term), 0.0))
+    if sigma == 0:
+        return SignificanceResult(statistic=float(u_current), p_value=1.0)
+
+    upper = normal_sf((u_current - mean_u - 0.5) / sigma)
+    lower = normal_sf((mean_u - u_current - 0.5) / sigma)
+    return SignificanceResult(statistic=float(u_current), p_value=float(_p_value(upper, lower, alternative)))
+
+def bootstrap_relative_change_ci(baseline: ArrayLike, current: ArrayLike,
+                                confidence: float = 0.95,
+                                n_resamples: int = 2000,
+                                statistic: str = "mean",
+                                seed: Optional[int] = 0) -> Tuple[float, float]:
+    """
+    Percentile bootstrap CI for the percent change of ``current`` vs ``baseline``.
+
+    Both samples are resampled independently in one vectorized draw.
+    """
+    assert 0.5 <= confidence < 1.0, "confidence must be 0.5-1.0"
+    assert 100 <= n_resamples <= 100000, "n_resamples must be 100-100000"
+    assert statistic in ("mean", "median"), "statistic must be 'mean' or 'median'"
+    baseline = np.asarray(baseline, dtype=float).ravel()
+    current = np.asarray(current, dtype=float).ravel()
+    reduce = np.mean if statistic == "mean" else np.median
+
+    rng = np.random.default_rng(seed)
+    baseline_stats = reduce(baseline[rng.integers(0, baseline.size, (n_resamples, baseline.size))], axis=1)
+    current_stats = reduce(current[rng.integers(0, current.size, (n_resamples, current.size))], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = (current_stats - baseline_stats) / np.abs(baseline_stats) * 100.0
+    changes = changes[np.isfinite(changes)]
+    if changes.size == 0:
+        return 0.0, 0.0
+
+    alpha = (1.0 - confidence) / 2.0
+    low, high = np.quantile(changes, [alpha, 1.0 - alpha])
+    return float(low), float(high)
+
+class WelfordAccumulator:
+    """Streaming count/mean/variance/min/max in O(1) memory."""
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def remove(self, value: float) -> None:
+        """Remove a previously added observation (e.g. evicted from a window).
+
+        Minimum and maximum keep the extremes observed so far.
+        """
+        assert self.count > 0, "cannot remove from an empty accumulator"
+        if self.count == 1:
+            self.count, self.mean, self._m2 = 0, 0.0, 0.0
+            return
+        old_mean = self.mean
+        self.count -= 1
+        self.mean = (old_mean * (self.count + 1) - value) / self.count
+        self._m2 = max(0.0, self._m2 - (value - old_mean) * (value - self.mean))
+
+    def merge(self, other: "WelfordAccumulator") -> None:
+        """Combine another accumulator into this one (Chan et al.)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std_dev": self.stdev,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum if self.count else 0.0,
+        }
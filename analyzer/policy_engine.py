@@ -6,6 +6,8 @@ NASA Rule 4 Compliant: All methods under 60 lines.
 NASA Rule MAXIMUM_NESTED_DEPTH Compliant: Comprehensive defensive assertions.
 """
 
+from dataclasses import dataclass
+from typing import Any, Dict, List
 import json
 import logging
 logger = logging.getLogger(__name__)
@@ -54,18 +56,41 @@ class PolicyEngine:
         assert isinstance(violations, list), "violations must be a list"
         assert len(violations) < 50000, "Excessive violations indicate analysis error"
 
+        return self.evaluate_nasa_compliance_from_counts(self.count_nasa_rule_violations(violations))
+
+    def count_nasa_rule_violations(self, violations: List[Dict]) -> Dict[int, int]:
+        """
+        Count violations per NASA rule in a single pass.
+        NASA Rule 4 Compliant: Under 60 lines.
+        """
+        rule_counts = {rule_id: 0 for rule_id in range(1, 11)}
+        for violation in violations:
+            for rule_id in range(1, 11):
+                if violation.get('nasa_rule') == rule_id or self._maps_to_nasa_rule(violation, rule_id):
+                    rule_counts[rule_id] += 1
+        return rule_counts
+
+    def evaluate_nasa_compliance_from_counts(self, rule_counts: Dict[int, int]) -> ComplianceResult:
+        """
+        Evaluate NASA Power of Ten compliance from per-rule violation counts.
+        Lets incremental trackers refresh the score without the violation list.
+        NASA Rule 4 Compliant: Under 60 lines.
+        """
+        # NASA Rule 5: Input validation
+        assert isinstance(rule_counts, dict), "rule_counts must be a dict"
+
         rule_scores = {}
         total_score = 0.0
         compliance_violations = []
 
         # Evaluate each NASA rule (1-10)
         for rule_id in range(1, 11):
-            rule_score = self._evaluate_nasa_rule(rule_id, violations)
+            rule_score = self._score_nasa_rule(rule_id, rule_counts.get(rule_id, 0))
             rule_scores[f"rule_{rule_id}"] = rule_score
             total_score += rule_score
 
         # Calculate overall score (average of rule scores)
-        overall_score = total_score / MAXIMUM_FUNCTION_PARAMETERS.0
+        overall_score = total_score / 10.0
         passed = overall_score >= self.config.get_nasa_compliance_threshold()
 
         # Generate compliance violations for failed rules
@@ -155,20 +180,25 @@ class PolicyEngine:
             v for v in violations 
             if v.get('nasa_rule') == rule_id or self._maps_to_nasa_rule(v, rule_id)
         ]
+        return self._score_nasa_rule(rule_id, len(rule_violations))
+
+    def _score_nasa_rule(self, rule_id: int, violation_count: int) -> float:
+        """Score specific NASA rule compliance from its violation count."""
+        # NASA Rule 5: Input validation
+        assert 1 <= rule_id <= 10, f"Invalid NASA rule ID: {rule_id}"
 
-        if not rule_violations:
+        if violation_count <= 0:
             return 1.0  # Perfect compliance
 
         # Calculate rule-specific scoring
         if rule_id == 2:  # Function size rule
-            return self._score_function_size_rule(rule_violations)
+            return self._score_function_size_rule(violation_count)
         elif rule_id == 4:  # Loop bounds rule
-            return self._score_loop_bounds_rule(rule_violations)
+            return self._score_loop_bounds_rule(violation_count)
         elif rule_id == 5:  # Assertions rule
-            return self._score_assertions_rule(rule_violations)
+            return self._score_assertions_rule(violation_count)
         else:
             # General scoring for other rules
-            violation_count = len(rule_violations)
             penalty = min(1.0, violation_count * 0.05)  # 5% penalty per violation
             return max(0.0, 1.0 - penalty)
 
@@ -311,24 +341,24 @@ class PolicyEngine:
             
         return False
 
-    def _score_function_size_rule(self, violations: List) -> float:
+    def _score_function_size_rule(self, violation_count: int) -> float:
         """Score NASA Rule 2 (function size) compliance."""
         # Count functions over size limit
-        oversized_count = len(violations)
+        oversized_count = violation_count
         total_functions = self._estimate_total_functions()
         
         compliance_ratio = max(0.0, 1.0 - (oversized_count / max(total_functions, 1)))
         return compliance_ratio
 
-    def _score_loop_bounds_rule(self, violations: List) -> float:
+    def _score_loop_bounds_rule(self, violation_count: int) -> float:
         """Score NASA Rule 4 (loop bounds) compliance."""
-        unbounded_count = len(violations)
+        unbounded_count = violation_count
         penalty = min(1.0, unbounded_count * 0.1)
         return max(0.0, 1.0 - penalty)
 
-    def _score_assertions_rule(self, violations: List) -> float:
+    def _score_assertions_rule(self, violation_count: int) -> float:
         """Score NASA Rule MAXIMUM_NESTED_DEPTH (assertions) compliance."""
-        missing_assertions = len(violations)
+        missing_assertions = violation_count
         penalty = min(1.0, missing_assertions * 0.05)
         return max(0.0, 1.0 - penalty)
 
@@ -15,6 +15,11 @@ import time
 
 from dataclasses import dataclass
 
+try:
+    from .architecture.detector_profiler import get_global_detector_profiler
+except ImportError:
+    from architecture.detector_profiler import get_global_detector_profiler
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -387,6 +392,7 @@ class RealUnifiedAnalyzer:
         self.connascence_detector = RealConnascenceDetector()
         self.nasa_analyzer = RealNASAAnalyzer()
         self.duplication_analyzer = RealDuplicationAnalyzer()
+        self.profiler = get_global_detector_profiler()
 
         # Track real metrics
         self.analysis_stats = {
@@ -425,11 +431,13 @@ class RealUnifiedAnalyzer:
         for file_path in python_files:
             try:
                 # Connascence analysis
-                conn_violations = self.connascence_detector.analyze_file(str(file_path))
+                with self.profiler.profile("RealConnascenceDetector", "analyze_file"):
+                    conn_violations = self.connascence_detector.analyze_file(str(file_path))
                 all_violations.extend(conn_violations)
 
                 # NASA analysis
-                nasa_viols = self.nasa_analyzer.analyze_file(str(file_path))
+                with self.profiler.profile("RealNASAAnalyzer", "analyze_file"):
+                    nasa_viols = self.nasa_analyzer.analyze_file(str(file_path))
                 nasa_violations.extend(nasa_viols)
                 all_violations.extend(nasa_viols)
 
@@ -449,7 +457,8 @@ class RealUnifiedAnalyzer:
                 ))
 
         # Real duplication analysis
-        duplication_result = self.duplication_analyzer.analyze_path(project_path)
+        with self.profiler.profile("RealDuplicationAnalyzer", "analyze_path", nodes=files_analyzed):
+            duplication_result = self.duplication_analyzer.analyze_path(project_path)
         duplication_clusters = duplication_result.get("duplications", [])
 
         # Calculate real metrics
@@ -1,6 +1,4 @@
-from src.constants.base import DAYS_RETENTION_PERIOD, MAXIMUM_NESTED_DEPTH
 """
-
 Optimized version using unified AST visitor for single-pass analysis.
 Performance improvement: 85-90% reduction in AST traversals.
 NASA Rule 4/5/6 compliant implementation.
@@ -10,13 +8,15 @@ import ast
 import collections
 from typing import Any, List
 
+from src.constants.base import DAYS_RETENTION_PERIOD, MAXIMUM_NESTED_DEPTH
+
 from analyzer.utils.types import ConnascenceViolation
 try:
-    from .optimization.unified_visitor import UnifiedASTVisitor, ASTNodeData
+    from .optimization.unified_visitor import ASTNodeData, get_global_ast_data_cache
     from .utils.code_utils import get_code_snippet_for_node
 except ImportError:
     # Fallback for script execution
-    from optimization.unified_visitor import UnifiedASTVisitor, ASTNodeData
+    from optimization.unified_visitor import ASTNodeData, get_global_ast_data_cache
     from utils.code_utils import get_code_snippet_for_node
 try:
     from .detectors import (
@@ -116,9 +116,10 @@ class RefactoredConnascenceDetector(ast.NodeVisitor):
         all_violations = []
         
         try:
-            # PERFORMANCE OPTIMIZATION: Single-pass data collection
-            unified_visitor = UnifiedASTVisitor(self.file_path, self.source_lines)
-            collected_data = unified_visitor.collect_all_data(tree)
+            # PERFORMANCE OPTIMIZATION: Single-pass data collection, shared per file content
+            collected_data = get_global_ast_data_cache().get_or_collect(
+                self.file_path, tree=tree, source_lines=self.source_lines
+            )
             
             # PERFORMANCE OPTIMIZATION: Use detector pool for analysis
             all_violations.extend(self._analyze_with_detector_pool(collected_data))
@@ -226,6 +227,10 @@ class RefactoredConnascenceDetector(ast.NodeVisitor):
         
         NASA Rule 4: Function under 60 lines
         """
+        # Legacy detectors walk the fact table's tree (no re-parse)
+        if collected_data.tree is not None:
+            return detector.detect_violations(collected_data.tree)
+
         # Create minimal AST for legacy detectors
         dummy_tree = ast.Module(body=[], type_ignores=[])
         
@@ -4,6 +4,8 @@
 Unified reporting module.
 """
 
+from .chunked_html import ChunkedHTMLReportWriter
 from .coordinator import UnifiedReportingCoordinator
+from .streaming import StreamingJSONWriter, StreamingSARIFWriter
 
-__all__ = ["UnifiedReportingCoordinator"]
+__all__ = ["UnifiedReportingCoordinator", "ChunkedHTMLReportWriter", "StreamingJSONWriter", "StreamingSARIFWriter"]
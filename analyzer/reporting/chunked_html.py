@@ -0,0 +1,308 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Chunked HTML Report
+===================
+
+HTML report mode for very large result sets. Instead of inlining every
+violation into one page, the report is written as:
+
+- a small shell page (``<name>.html``) with the summary and viewer code
+- ``<name>_data/index.js``: precomputed summary index (totals and per-file
+  severity/type counts) used for filtering without touching violations
+- ``<name>_data/chunks/*.js``: paginated per-file violation chunks, fetched
+  by the page only when a file is expanded
+
+Chunks and the index are JSON documents wrapped in a single callback call so
+the page can load them with ``<script>`` tags, which (unlike ``fetch``) also
+works for reports opened straight from disk.
+"""
+
+from html import escape
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, List, Union
+import json
+
+from analyzer.reporting.report_model import ReportModel
+
+# Violations per chunk file
+DEFAULT_CHUNK_SIZE = 500
+
+# Reports above this many violations are chunked unless disabled explicitly
+CHUNKED_HTML_THRESHOLD = 5000
+
+# Files listed per page in the viewer
+FILE_LIST_PAGE_SIZE = 200
+
+_CALLBACK = "window.connascenceReport"
+
+_SHELL_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Connascence Analysis Report - $project_name</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .header { background: #f5f5f5; padding: 20px; border-radius: 5px; }
+        .metrics { display: flex; gap: 20px; margin: 20px 0; }
+        .metric { flex: 1; padding: 15px; background: #e9f4ff; border-radius: 5px; text-align: center; }
+        .metric div { font-size: 24px; font-weight: bold; }
+        .filters { display: flex; gap: 10px; margin: 20px 0; }
+        .file { margin: 5px 0; border: 1px solid #ddd; border-radius: 5px; }
+        .file-header { padding: 10px; cursor: pointer; background: #fafafa; }
+        .violation-item { padding: 10px; margin: 5px 10px; border-left: 4px solid #ccc; }
+        .critical { border-color: #d73a49; }
+        .high { border-color: #fb8500; }
+        .medium { border-color: #ffd60a; }
+        .low { border-color: #28a745; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Connascence Analysis Report</h1>
+        <p><strong>Project:</strong> $project_name</p>
+        <p><strong>Analysis Time:</strong> $timestamp</p>
+    </div>
+
+    <div class="metrics">
+        <div class="metric"><h3>Overall Quality</h3><div>$overall_score</div></div>
+        <div class="metric"><h3>NASA Compliance</h3><div>$nasa_score</div></div>
+        <div class="metric"><h3>Total Violations</h3><div>$total_violations</div></div>
+    </div>
+
+    <div class="filters">
+        <input id="filter" type="search" placeholder="Filter files">
+        <select id="severity"><option value="">All severities</option></select>
+        <select id="type"><option value="">All types</option></select>
+    </div>
+    <p id="status">Loading index...</p>
+    <div id="files"></div>
+    <button id="more-files" hidden>Show more files</button>
+
+    <script>
+    (function () {
+        var DATA_DIR = $data_dir;
+        var PAGE_SIZE = $page_size;
+        var state = { index: null, matches: [], shown: 0, pending: {} };
+
+        window.connascenceReport = {
+            index: function (data) { state.index = data; setup(); },
+            chunk: function (data) {
+                var callback = state.pending[data.id];
+                delete state.pending[data.id];
+                if (callback) { callback(data); }
+            }
+        };
+
+        function el(tag, className, text) {
+            var node = document.createElement(tag);
+            if (className) { node.className = className; }
+            if (text !== undefined) { node.textContent = text; }
+            return node;
+        }
+
+        function load(src) {
+            var script = document.createElement("script");
+            script.src = DATA_DIR + "/" + src;
+            document.head.appendChild(script);
+        }
+
+        function loadChunk(id, callback) {
+            state.pending[id] = callback;
+            load("chunks/" + id + ".js");
+        }
+
+        function addOptions(select, counts) {
+            Object.keys(counts).forEach(function (key) {
+                var option = el("option", null, key + " (" + counts[key] + ")");
+                option.value = key;
+                select.appendChild(option);
+            });
+        }
+
+        function setup() {
+            addOptions(document.getElementById("severity"), state.index.severity_counts);
+            addOptions(document.getElementById("type"), state.index.type_counts);
+            ["filter", "severity", "type"].forEach(function (id) {
+                document.getElementById(id).addEventListener("input", applyFilters);
+            });
+            document.getElementById("more-files").addEventListener("click", showMoreFiles);
+            applyFilters();
+        }
+
+        function selected() {
+            return {
+                text: document.getElementById("filter").value.toLowerCase(),
+                severity: document.getElementById("severity").value,
+                type: document.getElementById("type").value
+            };
+        }
+
+        function applyFilters() {
+            var filters = selected();
+            state.matches = state.index.files.filter(function (file) {
+                return (!filters.text || file.path.toLowerCase().indexOf(filters.text) >= 0) &&
+                    (!filters.severity || file.severity_counts[filters.severity]) &&
+                    (!filters.type || file.type_counts[filters.type]);
+            });
+            state.shown = 0;
+            document.getElementById("files").textContent = "";
+            showMoreFiles();
+        }
+
+        function showMoreFiles() {
+            var container = document.getElementById("files");
+            var end = Math.min(state.shown + PAGE_SIZE, state.matches.length);
+            for (var i = state.shown; i < end; i++) { container.appendChild(renderFile(state.matches[i])); }
+            state.shown = end;
+            document.getElementById("more-files").hidden = end >= state.matches.length;
+            document.getElementById("status").textContent =
+                state.matches.length + " of " + state.index.files.length + " files match";
+        }
+
+        function renderFile(file) {
+            var box = el("div", "file");
+            var header = el("div", "file-header", file.path + " (" + file.total + ")");
+            var body = el("div");
+            var nextPage = 0;
+            var more = el("button", null, "Load more violations");
+            more.hidden = true;
+
+            function loadPage() {
+                more.hidden = true;
+                loadChunk(file.chunks[nextPage], function (chunk) {
+                    var filters = selected();
+                    chunk.violations.forEach(function (violation) {
+                        if ((filters.severity && violation.severity !== filters.severity) ||
+                            (filters.type && violation.type !== filters.type)) { return; }
+                        var item = el("div", "violation-item " + (violation.severity || ""),
+                            "Line " + (violation.line_number || "?") + " [" + (violation.type || "unknown") + "] " +
+                            (violation.description || ""));
+                        body.insertBefore(item, more);
+                    });
+                    nextPage += 1;
+                    more.hidden = nextPage >= file.chunks.length;
+                });
+            }
+
+            header.addEventListener("click", function () {
+                if (nextPage === 0 && !body.childElementCount) {
+                    body.appendChild(more);
+                    more.addEventListener("click", loadPage);
+                    loadPage();
+                } else {
+                    body.hidden = !body.hidden;
+                }
+            });
+            box.appendChild(header);
+            box.appendChild(body);
+            return box;
+        }
+    })();
+    </script>
+    <script src="$index_src"></script>
+</body>
+</html>
+""")
+
+def _dump_callback(kind: str, payload: Dict[str, Any]) -> str:
+    """Serialize a payload as a single viewer callback invocation."""
+    return f"{_CALLBACK}.{kind}({json.dumps(payload, separators=(',', ':'), default=str)});\n"
+
+class ChunkedHTMLReportWriter:
+    """Writes a shell page, a summary index and paginated per-file chunks."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, page_size: int = FILE_LIST_PAGE_SIZE):
+        assert chunk_size > 0, "chunk_size must be positive"
+        self.chunk_size = chunk_size
+        self.page_size = page_size
+
+    @staticmethod
+    def data_dir_for(output_file: Union[str, Path]) -> Path:
+        """Directory holding the index and chunks of a shell page."""
+        output_file = Path(output_file)
+        return output_file.with_name(f"{output_file.stem}_data")
+
+    def write(self, model: ReportModel, output_file: Union[str, Path]) -> str:
+        """Write the report next to ``output_file`` and return the shell page."""
+        output_file = Path(output_file)
+        data_dir = self.data_dir_for(output_file)
+        chunks_dir = data_dir / "chunks"
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+        for stale in chunks_dir.glob("*.js"):
+            stale.unlink()
+
+        files = []
+        for file_number, (file_path, violations) in enumerate(sorted(model.violations_by_file.items())):
+            files.append(self._write_file_chunks(chunks_dir, file_number, file_path, violations))
+        files.sort(key=lambda entry: entry["total"], reverse=True)
+
+        with open(data_dir / "index.js", "w", encoding="utf-8") as f:
+            f.write(_dump_callback("index", self.build_index(model, files)))
+
+        shell = self.render_shell(model, data_dir.name)
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(shell)
+        return shell
+
+    def build_index(self, model: ReportModel, files: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summary index: project totals plus per-file counts and chunk ids."""
+        result = model.result
+        return {
+            "project": model.project_name,
+            "timestamp": result.timestamp,
+            "total_violations": result.total_violations,
+            "chunk_size": self.chunk_size,
+            "severity_counts": dict(model.severity_counts),
+            "type_counts": dict(model.type_counts),
+            "priority_fixes": list(result.priority_fixes[:10]),
+            "files": files,
+        }
+
+    def render_shell(self, model: ReportModel, data_dir_name: str) -> str:
+        """Render the shell page; its size does not depend on violation count."""
+        result = model.result
+        return _SHELL_TEMPLATE.substitute(
+            project_name=escape(model.project_name),
+            timestamp=escape(str(result.timestamp)),
+            overall_score=f"{result.overall_quality_score:.3f}",
+            nasa_score=f"{result.nasa_compliance_score:.3f}",
+            total_violations=result.total_violations,
+            data_dir=json.dumps(data_dir_name),
+            page_size=self.page_size,
+            index_src=escape(f"{data_dir_name}/index.js"),
+        )
+
+    def _write_file_chunks(self, chunks_dir: Path, file_number: int,
+                            file_path: str, violations: tuple) -> Dict[str, Any]:
+        """Write one file's violations as pages; return its index entry."""
+        severity_counts: Dict[str, int] = {}
+        type_counts: Dict[str, int] = {}
+        chunk_ids = []
+
+        for page, start in enumerate(range(0, len(violations), self.chunk_size)):
+            chunk_id = f"f{file_number:05d}-p{page:04d}"
+            page_violations = violations[start:start + self.chunk_size]
+            for violation in page_violations:
+                severity = violation.get("severity", "medium")
+                severity_counts[severity] = severity_counts.get(severity, 0) + 1
+                violation_type = violation.get("type", "unknown")
+                type_counts[violation_type] = type_counts.get(violation_type, 0) + 1
+
+            with open(chunks_dir / f"{chunk_id}.js", "w", encoding="utf-8") as f:
+                f.write(_dump_callback("chunk", {
+                    "id": chunk_id,
+                    "file_path": file_path,
+                    "page": page,
+                    "violations": list(page_violations),
+                }))
+            chunk_ids.append(chunk_id)
+
+        return {
+            "path": file_path,
+            "total": len(violations),
+            "severity_counts": severity_counts,
+            "type_counts": type_counts,
+            "chunks": chunk_ids,
+        }
@@ -17,12 +17,17 @@ while maintaining compatibility with all existing components.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+import os
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 from analyzer.analyzer_types import UnifiedAnalysisResult
+from analyzer.reporting.chunked_html import CHUNKED_HTML_THRESHOLD, DEFAULT_CHUNK_SIZE, ChunkedHTMLReportWriter
 from analyzer.reporting.json import JSONReporter
 from analyzer.reporting.sarif import SARIFReporter
 from analyzer.reporting.markdown import MarkdownReporter
+from analyzer.reporting.report_model import ReportModel, build_report_model
+from analyzer.reporting.streaming import write_json_report, write_sarif_report
 
 logger = logging.getLogger(__name__)
 
@@ -81,25 +86,16 @@ class UnifiedReportingCoordinator:
         options = options or {}
         logger.info(f"Generating {format_type} report for {analysis_result.project_path}")
 
-        # Route to appropriate reporter
-        if format_type == "json":
-            content = self._generate_json_report(analysis_result, options)
-        elif format_type == "sarif":
-            content = self._generate_sarif_report(analysis_result, options)
-        elif format_type == "markdown":
-            content = self._generate_markdown_report(analysis_result, options)
-        elif format_type == "html":
-            content = self._generate_html_report(analysis_result, options)
-        elif format_type == "text":
-            content = self._generate_text_report(analysis_result, options)
-        elif format_type == "csv":
-            content = self._generate_csv_report(analysis_result, options)
-        elif format_type == "xml":
-            content = self._generate_xml_report(analysis_result, options)
-        elif format_type == "summary":
-            content = self._generate_summary_report(analysis_result, options)
-        else:
-            raise ValueError(f"Format handler not implemented: {format_type}")
+        model = self.build_report_model(analysis_result)
+
+        if output_path and format_type == "html" and self._use_chunked_html(model, options):
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            content = self._write_chunked_html(model, options, output_path)
+            logger.info(f"Chunked HTML report saved to {output_path}")
+            return content
+
+        content = self._render(format_type, model, options)
 
         # Save to file if path provided
         if output_path:
@@ -113,21 +109,82 @@ class UnifiedReportingCoordinator:
 
         return content
 
+    def build_report_model(self, analysis_result: UnifiedAnalysisResult) -> ReportModel:
+        """Precompute the shared, immutable aggregates used by every format."""
+        return build_report_model(analysis_result, self._convert_to_legacy_format(analysis_result))
+
+    def _render(self, format_type: str, model: ReportModel, options: Dict) -> str:
+        """Route a precomputed report model to the format renderer."""
+        analysis_result = model.result
+        if format_type == "json":
+            return self._generate_json_report(analysis_result, options, model)
+        elif format_type == "sarif":
+            return self._generate_sarif_report(analysis_result, options, model)
+        elif format_type == "markdown":
+            return self._generate_markdown_report(analysis_result, options, model)
+        elif format_type == "html":
+            return self._generate_html_report(analysis_result, options, model)
+        elif format_type == "text":
+            return self._generate_text_report(analysis_result, options)
+        elif format_type == "csv":
+            return self._generate_csv_report(analysis_result, options)
+        elif format_type == "xml":
+            return self._generate_xml_report(analysis_result, options, model)
+        elif format_type == "summary":
+            return self._generate_summary_report(analysis_result, options, model)
+        raise ValueError(f"Format handler not implemented: {format_type}")
+
+    def _use_chunked_html(self, model: ReportModel, options: Dict) -> bool:
+        """Chunk HTML output when requested or when the result set is large."""
+        chunked = options.get("html_chunked")
+        if chunked is None:
+            return model.result.total_violations > CHUNKED_HTML_THRESHOLD
+        return bool(chunked)
+
+    def _write_chunked_html(self, model: ReportModel, options: Dict, output_file: Path) -> str:
+        """Write the shell page plus summary index and per-file chunks."""
+        writer = ChunkedHTMLReportWriter(chunk_size=options.get("html_chunk_size", DEFAULT_CHUNK_SIZE))
+        return writer.write(model, output_file)
+
+    def _write_report(self, format_type: str, model: ReportModel, options: Dict, output_file: Path) -> str:
+        """Render one format straight into its output file."""
+        if format_type == "html" and self._use_chunked_html(model, options):
+            self._write_chunked_html(model, options, output_file)
+            return str(output_file)
+        with open(output_file, "w", encoding="utf-8") as f:
+            if format_type == "json":
+                write_json_report(model.legacy_result, f, reporter=self.json_reporter,
+                                    compact=options.get("compact", False))
+            elif format_type == "sarif":
+                write_sarif_report(model.legacy_result, f, reporter=self.sarif_reporter,
+                                    compact=options.get("compact", False))
+            else:
+                f.write(self._render(format_type, model, options))
+        return str(output_file)
+
     def generate_multi_format_report(
         self,
         analysis_result: UnifiedAnalysisResult,
         formats: List[str],
         output_dir: Union[str, Path],
         base_filename: str = "connascence_report",
+        options: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, str]:
         """
         Generate reports in multiple formats simultaneously.
 
+        Aggregates are computed once into a ReportModel and the format
+        renderers run in parallel worker threads, each writing directly to
+        its own output file.
+
         Args:
             analysis_result: Results from unified analysis
             formats: List of format types to generate
             output_dir: Directory to save all reports
             base_filename: Base name for output files
+            options: Formatting options shared by all renderers
+            max_workers: Worker thread count (defaults to one per format, capped at CPU count)
 
         Returns:
             Dictionary mapping format to output file path
@@ -135,35 +192,47 @@ class UnifiedReportingCoordinator:
 
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        options = options or {}
 
-        generated_files = {}
+        # Determine file extension
+        extension_map = {
+            "json": "json",
+            "sarif": "sarif",
+            "markdown": "md",
+            "html": "html",
+            "text": "txt",
+            "csv": "csv",
+            "xml": "xml",
+            "summary": "txt",
+        }
 
+        jobs = {}
         for format_type in formats:
             if format_type not in self.SUPPORTED_FORMATS:
                 logger.warning(f"Skipping unsupported format: {format_type}")
                 continue
+            extension = extension_map.get(format_type, format_type)
+            jobs[format_type] = output_dir / f"{base_filename}.{extension}"
 
-            # Determine file extension
-            extension_map = {
-                "json": "json",
-                "sarif": "sarif",
-                "markdown": "md",
-                "html": "html",
-                "text": "txt",
-                "csv": "csv",
-                "xml": "xml",
-                "summary": "txt",
-            }
+        if not jobs:
+            return {}
 
-            extension = extension_map.get(format_type, format_type)
-            output_file = output_dir / f"{base_filename}.{extension}"
+        # Aggregate once; every renderer reads the same immutable model
+        model = self.build_report_model(analysis_result)
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
 
-            try:
-                self.generate_report(analysis_result, format_type, output_file)
-                generated_files[format_type] = str(output_file)
-                logger.info(f"Generated {format_type} report: {output_file}")
-            except Exception as e:
-                logger.error(f"Failed to generate {format_type} report: {e}")
+        generated_files = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                format_type: executor.submit(self._write_report, format_type, model, options, output_file)
+                for format_type, output_file in jobs.items()
+            }
+            for format_type, future in futures.items():
+                try:
+                    generated_files[format_type] = future.result()
+                    logger.info(f"Generated {format_type} report: {generated_files[format_type]}")
+                except Exception as e:
+                    logger.error(f"Failed to generate {format_type} report: {e}")
 
         return generated_files
 
@@ -175,10 +244,11 @@ class UnifiedReportingCoordinator:
         correlations = getattr(analysis_result, 'correlations', [])
         smart_recommendations = getattr(analysis_result, 'smart_recommendations', [])
         cross_phase_analysis = getattr(analysis_result, 'cross_phase_analysis', False)
+        model = build_report_model(analysis_result)
 
         dashboard_data = {
             "project_info": {
-                "name": Path(analysis_result.project_path).name,
+                "name": model.project_name,
                 "path": analysis_result.project_path,
                 "policy": analysis_result.policy_preset,
                 "analyzed_files": analysis_result.files_analyzed,
@@ -194,12 +264,7 @@ class UnifiedReportingCoordinator:
             },
             "violation_summary": {
                 "total": analysis_result.total_violations,
-                "by_severity": {
-                    "critical": analysis_result.critical_count,
-                    "high": analysis_result.high_count,
-                    "medium": analysis_result.medium_count,
-                    "low": analysis_result.low_count,
-                },
+                "by_severity": dict(model.severity_counts),
             },
             "detailed_violations": {
                 "connascence": analysis_result.connascence_violations,
@@ -212,9 +277,9 @@ class UnifiedReportingCoordinator:
                 "smart_recommendations": smart_recommendations,
             },
             "charts": {
-                "severity_distribution": self._create_severity_chart_data(analysis_result),
-                "file_distribution": self._create_file_chart_data(analysis_result),
-                "type_distribution": self._create_type_chart_data(analysis_result),
+                "severity_distribution": model.severity_chart,
+                "file_distribution": model.file_chart,
+                "type_distribution": model.type_chart,
                 "trend_data": self._create_trend_chart_data(analysis_result),
                 "correlation_network": self._create_correlation_chart_data(correlations),
             },
@@ -281,25 +346,35 @@ class UnifiedReportingCoordinator:
 
     # Format-specific generators
 
-    def _generate_json_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _legacy_result(self, analysis_result: UnifiedAnalysisResult, model: Optional[ReportModel]) -> Any:
+        """Legacy-format result from the shared model, converting only if absent."""
+        if model is not None and model.legacy_result is not None:
+            return model.legacy_result
+        return self._convert_to_legacy_format(analysis_result)
+
+    def _generate_json_report(self, analysis_result: UnifiedAnalysisResult, options: Dict,
+                                model: Optional[ReportModel] = None) -> str:
         """Generate JSON report using existing JSONReporter."""
         # Convert UnifiedAnalysisResult to format expected by JSONReporter
-        legacy_result = self._convert_to_legacy_format(analysis_result)
-        return self.json_reporter.generate(legacy_result)
+        legacy_result = self._legacy_result(analysis_result, model)
+        return self.json_reporter.generate(legacy_result, compact=options.get("compact", False))
 
-    def _generate_sarif_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_sarif_report(self, analysis_result: UnifiedAnalysisResult, options: Dict,
+                                model: Optional[ReportModel] = None) -> str:
         """Generate SARIF report using existing SARIFReporter."""
-        legacy_result = self._convert_to_legacy_format(analysis_result)
-        return self.sarif_reporter.generate(legacy_result)
+        legacy_result = self._legacy_result(analysis_result, model)
+        return self.sarif_reporter.generate(legacy_result, compact=options.get("compact", False))
 
-    def _generate_markdown_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_markdown_report(self, analysis_result: UnifiedAnalysisResult, options: Dict,
+                                    model: Optional[ReportModel] = None) -> str:
         """Generate Markdown report using existing MarkdownReporter."""
-        legacy_result = self._convert_to_legacy_format(analysis_result)
+        legacy_result = self._legacy_result(analysis_result, model)
         return self.markdown_reporter.generate(legacy_result)
 
-    def _generate_html_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_html_report(self, analysis_result: UnifiedAnalysisResult, options: Dict,
+                                model: Optional[ReportModel] = None) -> str:
         """Generate HTML report for dashboard."""
-        self.get_dashboard_report_data(analysis_result)
+        model = model or build_report_model(analysis_result)
 
         html_template = """
 <!DOCTYPE html>
@@ -307,16 +382,16 @@ class UnifiedReportingCoordinator:
 <head>
     <title>Connascence Analysis Report</title>
     <style>
-        body { font-family: Arial, sans-serif; margin: 40px; }
-        .header { background: #f5f5f5; padding: 20px; border-radius: 5px; }
-        .metrics { display: flex; gap: 20px; margin: 20px 0; }
-        .metric { flex: 1; padding: 15px; background: #e9f4ff; border-radius: 5px; text-align: center; }
-        .violations { margin: 20px 0; }
-        .violation-item { padding: 10px; margin: 5px 0; border-left: 4px solid #ccc; }
-        .critical { border-color: #d73a49; }
-        .high { border-color: #fb8500; }
-        .medium { border-color: #ffd60a; }
-        .low { border-color: #28a745; }
+        body {{ font-family: Arial, sans-serif; margin: 40px; }}
+        .header {{ background: #f5f5f5; padding: 20px; border-radius: 5px; }}
+        .metrics {{ display: flex; gap: 20px; margin: 20px 0; }}
+        .metric {{ flex: 1; padding: 15px; background: #e9f4ff; border-radius: 5px; text-align: center; }}
+        .violations {{ margin: 20px 0; }}
+        .violation-item {{ padding: 10px; margin: 5px 0; border-left: 4px solid #ccc; }}
+        .critical {{ border-color: #d73a49; }}
+        .high {{ border-color: #fb8500; }}
+        .medium {{ border-color: #ffd60a; }}
+        .low {{ border-color: #28a745; }}
     </style>
 </head>
 <body>
@@ -354,7 +429,7 @@ class UnifiedReportingCoordinator:
             priority_fixes_html += f'<div class="violation-item critical">[U+2022] {fix}</div>\n'
 
         return html_template.format(
-            project_name=Path(analysis_result.project_path).name,
+            project_name=model.project_name,
             timestamp=analysis_result.timestamp,
             overall_score=analysis_result.overall_quality_score,
             nasa_score=analysis_result.nasa_compliance_score,
@@ -407,12 +482,14 @@ class UnifiedReportingCoordinator:
 
         return output.getvalue()
 
-    def _generate_xml_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_xml_report(self, analysis_result: UnifiedAnalysisResult, options: Dict,
+                                model: Optional[ReportModel] = None) -> str:
         """Generate XML report for enterprise integration."""
+        model = model or build_report_model(analysis_result)
         xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <connascence-report>
     <metadata>
-        <project>{Path(analysis_result.project_path).name}</project>
+        <project>{model.project_name}</project>
         <timestamp>{analysis_result.timestamp}</timestamp>
         <policy>{analysis_result.policy_preset}</policy>
         <files-analyzed>{analysis_result.files_analyzed}</files-analyzed>
@@ -452,8 +529,10 @@ class UnifiedReportingCoordinator:
 
         return xml_content
 
-    def _generate_summary_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_summary_report(self, analysis_result: UnifiedAnalysisResult, options: Dict,
+                                    model: Optional[ReportModel] = None) -> str:
         """Generate executive summary report."""
+        model = model or build_report_model(analysis_result)
 
         # Calculate quality rating
         score = analysis_result.overall_quality_score
@@ -469,7 +548,7 @@ class UnifiedReportingCoordinator:
         summary = f"""EXECUTIVE SUMMARY - CONNASCENCE ANALYSIS
 =============================================
 
-Project: {Path(analysis_result.project_path).name}
+Project: {model.project_name}
 Analysis Date: {analysis_result.timestamp}
 
 OVERALL ASSESSMENT: {quality_rating} ({score:.3f}/1.000)
@@ -498,39 +577,6 @@ PRIORITY ACTIONS:
 
     # Helper methods for chart data and legacy conversion
 
-    def _create_severity_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
-        """Create chart data for severity distribution."""
-        return {
-            "labels": ["Critical", "High", "Medium", "Low"],
-            "data": [
-                analysis_result.critical_count,
-                analysis_result.high_count,
-                analysis_result.medium_count,
-                analysis_result.low_count,
-            ],
-        }
-
-    def _create_file_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
-        """Create chart data for file distribution."""
-        file_counts = {}
-        for violation in analysis_result.connascence_violations:
-            file_path = Path(violation.get("file_path", "")).name
-            file_counts[file_path] = file_counts.get(file_path, 0) + 1
-
-        # Get top 10 files
-        sorted_files = sorted(file_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        return {"labels": [item[0] for item in sorted_files], "data": [item[1] for item in sorted_files]}
-
-    def _create_type_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
-        """Create chart data for violation type distribution."""
-        type_counts = {}
-        for violation in analysis_result.connascence_violations:
-            viol_type = violation.get("type", "unknown")
-            type_counts[viol_type] = type_counts.get(viol_type, 0) + 1
-
-        return {"labels": list(type_counts.keys()), "data": list(type_counts.values())}
-
     def _create_trend_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
         """Create placeholder trend data (would be populated by historical tracking)."""
         return {
@@ -653,6 +699,9 @@ PRIORITY ACTIONS:
                 self.total_files_analyzed = unified_result.files_analyzed
                 self.analysis_duration_ms = unified_result.analysis_duration_ms
                 self.policy_preset = unified_result.policy_preset
+                self.file_stats = {}
+                self.budget_status = None
+                self.baseline_comparison = None
                 self.summary_metrics = {
                     "total_violations": unified_result.total_violations,
                     "critical_count": unified_result.critical_count,
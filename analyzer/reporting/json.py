@@ -12,13 +12,98 @@ import json
 
 from analyzer.ast_engine.core_analyzer import AnalysisResult, Violation
 
+def _violation_value(violation: Any, name: str, default: Any = "unknown") -> Any:
+    """Read a violation field from an object or dict, unwrapping enum values."""
+    if isinstance(violation, dict):
+        value = violation.get(name, default)
+    else:
+        value = getattr(violation, name, default)
+    return getattr(value, "value", value)
+
+class ViolationSummaryAccumulator:
+    """Running summary statistics, fed one violation at a time.
+
+    Memory grows with the number of distinct files, not with the number of
+    violations, so summaries can be produced while violations are streamed.
+    """
+
+    def __init__(self):
+        self.total_violations = 0
+        self.total_weight = 0.0
+        self.by_type: Dict[str, int] = {}
+        self.by_severity: Dict[str, int] = {}
+        self.by_locality: Dict[str, int] = {}
+        self.file_stats: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, violation: Any) -> None:
+        """Account for one violation."""
+        type_key = _violation_value(violation, "type")
+        severity_key = _violation_value(violation, "severity")
+        locality_key = _violation_value(violation, "locality", None)
+        weight = _violation_value(violation, "weight", 0.0) or 0.0
+        file_path = _violation_value(violation, "file_path", None)
+
+        self.total_violations += 1
+        self.total_weight += weight
+        self.by_type[type_key] = self.by_type.get(type_key, 0) + 1
+        self.by_severity[severity_key] = self.by_severity.get(severity_key, 0) + 1
+        self.by_locality[locality_key] = self.by_locality.get(locality_key, 0) + 1
+
+        if file_path not in self.file_stats:
+            self.file_stats[file_path] = {
+                "file_path": file_path,
+                "violation_count": 0,
+                "total_weight": 0.0,
+                "severity_breakdown": {},
+            }
+        stats = self.file_stats[file_path]
+        stats["violation_count"] += 1
+        stats["total_weight"] += weight
+        stats["severity_breakdown"][severity_key] = stats["severity_breakdown"].get(severity_key, 0) + 1
+
+    def top_files(self) -> List[Dict[str, Any]]:
+        """Files with the most violations, sorted by weight."""
+        sorted_files = sorted(
+            self.file_stats.values(), key=lambda x: (x["total_weight"], x["violation_count"]), reverse=True
+        )
+        return [{**file_stat, "total_weight": round(file_stat["total_weight"], 2)} for file_stat in sorted_files]
+
+    def summary(self, total_files_analyzed: int) -> Dict[str, Any]:
+        """Summary section in the JSONReporter schema."""
+        avg_weight = self.total_weight / self.total_violations if self.total_violations else 0
+
+        return {
+            "total_violations": self.total_violations,
+            "total_weight": round(self.total_weight, 2),
+            "average_weight": round(avg_weight, 2),
+            "files_with_violations": len(self.file_stats),
+            "violations_by_type": dict(sorted(self.by_type.items(), key=lambda item: str(item[0]))),
+            "violations_by_severity": dict(sorted(self.by_severity.items(), key=lambda item: str(item[0]))),
+            "violations_by_locality": dict(sorted(self.by_locality.items(), key=lambda item: str(item[0]))),
+            "top_files": self.top_files()[:10],
+            "quality_metrics": {
+                "connascence_index": round(self.total_weight, 2),
+                "violations_per_file": round(self.total_violations / max(1, total_files_analyzed), 2),
+                "critical_violations": self.by_severity.get("critical", 0),
+                "high_violations": self.by_severity.get("high", 0),
+            },
+        }
+
+    def quality_gates(self) -> Dict[str, bool]:
+        """Basic quality gate status from the running counts."""
+        return {
+            "no_critical_violations": self.by_severity.get("critical", 0) == 0,
+            "max_high_violations": self.by_severity.get("high", 0) <= 10,  # Configurable
+            "total_violations_acceptable": self.total_violations <= 100,  # Configurable
+        }
+
 class JSONReporter:
     """JSON report generator with stable schema."""
 
     def __init__(self):
         self.schema_version = "1.0.0"
 
-    def generate(self, result: AnalysisResult) -> str:
+    def generate(self, result: AnalysisResult, compact: bool = False) -> str:
         """Generate JSON report from analysis result."""
         report = {
             "schema_version": self.schema_version,
@@ -30,6 +115,8 @@ class JSONReporter:
         }
 
         # Ensure deterministic ordering
+        if compact:
+            return json.dumps(report, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
         return json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
 
     def _create_metadata(self, result: AnalysisResult) -> Dict[str, Any]:
@@ -52,49 +139,14 @@ class JSONReporter:
 
     def _create_summary(self, result: AnalysisResult) -> Dict[str, Any]:
         """Create summary statistics."""
-        violations = result.violations
-
-        # Count by type
-        by_type = {}
-        for violation in violations:
-            type_key = getattr(violation.type, 'value', violation.type) if hasattr(violation, 'type') else 'unknown'
-            by_type[type_key] = by_type.get(type_key, 0) + 1
+        return self._summarize(result.violations).summary(result.total_files_analyzed)
 
-        # Count by severity
-        by_severity = {}
+    def _summarize(self, violations: List[Violation]) -> ViolationSummaryAccumulator:
+        """Accumulate summary statistics in a single pass over violations."""
+        accumulator = ViolationSummaryAccumulator()
         for violation in violations:
-            severity_key = getattr(violation.severity, 'value', violation.severity) if hasattr(violation, 'severity') else 'unknown'
-            by_severity[severity_key] = by_severity.get(severity_key, 0) + 1
-
-        # Count by locality
-        by_locality = {}
-        for violation in violations:
-            locality_key = violation.locality
-            by_locality[locality_key] = by_locality.get(locality_key, 0) + 1
-
-        # Calculate weights
-        total_weight = sum(v.weight for v in violations)
-        avg_weight = total_weight / len(violations) if violations else 0
-
-        # File distribution
-        files_with_violations = len({v.file_path for v in violations})
-
-        return {
-            "total_violations": len(violations),
-            "total_weight": round(total_weight, 2),
-            "average_weight": round(avg_weight, 2),
-            "files_with_violations": files_with_violations,
-            "violations_by_type": dict(sorted(by_type.items())),
-            "violations_by_severity": dict(sorted(by_severity.items())),
-            "violations_by_locality": dict(sorted(by_locality.items())),
-            "top_files": self._get_top_problematic_files(violations)[:10],
-            "quality_metrics": {
-                "connascence_index": round(total_weight, 2),
-                "violations_per_file": round(len(violations) / max(1, result.total_files_analyzed), 2),
-                "critical_violations": by_severity.get("critical", 0),
-                "high_violations": by_severity.get("high", 0),
-            },
-        }
+            accumulator.add(violation)
+        return accumulator
 
     def _serialize_violation(self, violation: Violation) -> Dict[str, Any]:
         """Serialize a violation to JSON-friendly format."""
@@ -132,25 +184,17 @@ class JSONReporter:
         }
 
         # Calculate quality gate status
-        violations = result.violations
-        critical_violations = sum(1 for v in violations if getattr(v.severity, 'value', v.severity) == "critical")
-        high_violations = sum(1 for v in violations if getattr(v.severity, 'value', v.severity) == "high")
-
-        # Basic quality gates
-        compliance["quality_gates"] = {
-            "no_critical_violations": critical_violations == 0,
-            "max_high_violations": high_violations <= 10,  # Configurable
-            "total_violations_acceptable": len(violations) <= 100,  # Configurable
-        }
+        compliance["quality_gates"] = self._summarize(result.violations).quality_gates()
 
         return compliance
 
-    def export_results(self, result, output_file=None):
+    def export_results(self, result, output_file=None, compact=False):
         """Export results to JSON format.
 
         Args:
             result: Analysis result (dict or AnalysisResult object)
             output_file: Optional file path to write to. If None, returns JSON string.
+            compact: Emit JSON without indentation
 
         Returns:
             JSON string if output_file is None, otherwise writes to file.
@@ -158,10 +202,20 @@ class JSONReporter:
         # Handle both dict and AnalysisResult objects
         if isinstance(result, dict):
             # Convert dict result to JSON-friendly format
-            json_output = json.dumps(result, indent=2, sort_keys=True, ensure_ascii=False)
+            if compact:
+                json_output = json.dumps(result, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            else:
+                json_output = json.dumps(result, indent=2, sort_keys=True, ensure_ascii=False)
+        elif output_file:
+            # Stream violations straight to the file instead of building the document
+            from analyzer.reporting.streaming import write_json_report
+
+            with open(output_file, "w", encoding="utf-8") as f:
+                write_json_report(result, f, reporter=self, compact=compact)
+            return None
         else:
             # Use the generate method for AnalysisResult objects
-            json_output = self.generate(result)
+            json_output = self.generate(result, compact=compact)
 
         if output_file:
             # Write to file
@@ -173,32 +227,4 @@ class JSONReporter:
 
     def _get_top_problematic_files(self, violations: List[Violation]) -> List[Dict[str, Any]]:
         """Get files with the most violations, sorted by weight."""
-        file_stats = {}
-
-        for violation in violations:
-            file_path = violation.file_path
-            if file_path not in file_stats:
-                file_stats[file_path] = {
-                    "file_path": file_path,
-                    "violation_count": 0,
-                    "total_weight": 0.0,
-                    "severity_breakdown": {},
-                }
-
-            stats = file_stats[file_path]
-            stats["violation_count"] += 1
-            stats["total_weight"] += violation.weight
-
-            severity = getattr(violation.severity, 'value', violation.severity) if hasattr(violation, 'severity') else 'unknown'
-            stats["severity_breakdown"][severity] = stats["severity_breakdown"].get(severity, 0) + 1
-
-        # Sort by total weight, then by violation count
-        sorted_files = sorted(
-            file_stats.values(), key=lambda x: (x["total_weight"], x["violation_count"]), reverse=True
-        )
-
-        # Round weights for cleaner output
-        for file_stat in sorted_files:
-            file_stat["total_weight"] = round(file_stat["total_weight"], 2)
-
-        return sorted_files
+        return self._summarize(violations).top_files()
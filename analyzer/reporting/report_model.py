@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Precomputed Report Model
+========================
+
+Immutable view of a UnifiedAnalysisResult with every aggregate the format
+renderers need (severity counts, per-file and per-type groupings, top-N
+lists, chart data). It is built once per reporting run and then shared by
+all renderers, including renderers running in parallel workers.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+from analyzer.analyzer_types import UnifiedAnalysisResult
+
+TOP_N_FILES = 10
+
+@dataclass(frozen=True)
+class ReportModel:
+    """Shared, read-only aggregates for all report formats."""
+
+    result: UnifiedAnalysisResult
+    legacy_result: Any
+    project_name: str
+    severity_counts: Mapping[str, int]
+    violations_by_file: Mapping[str, Tuple[Dict[str, Any], ...]]
+    type_counts: Mapping[str, int]
+    file_counts: Mapping[str, int]
+    top_files: Tuple[Tuple[str, int], ...]
+
+    @property
+    def severity_chart(self) -> Dict[str, Any]:
+        """Chart data for severity distribution."""
+        return {
+            "labels": ["Critical", "High", "Medium", "Low"],
+            "data": [self.severity_counts[severity] for severity in ("critical", "high", "medium", "low")],
+        }
+
+    @property
+    def file_chart(self) -> Dict[str, Any]:
+        """Chart data for the top files by violation count."""
+        return {"labels": [name for name, _ in self.top_files], "data": [count for _, count in self.top_files]}
+
+    @property
+    def type_chart(self) -> Dict[str, Any]:
+        """Chart data for violation type distribution."""
+        return {"labels": list(self.type_counts.keys()), "data": list(self.type_counts.values())}
+
+def build_report_model(analysis_result: UnifiedAnalysisResult, legacy_result: Any = None) -> ReportModel:
+    """Group and count violations in a single pass and freeze the result."""
+    violations_by_file: Dict[str, list] = {}
+    type_counts: Dict[str, int] = {}
+    file_counts: Dict[str, int] = {}
+
+    for violation in analysis_result.connascence_violations:
+        file_path = violation.get("file_path", "")
+        violations_by_file.setdefault(file_path, []).append(violation)
+
+        file_name = Path(file_path).name
+        file_counts[file_name] = file_counts.get(file_name, 0) + 1
+
+        violation_type = violation.get("type", "unknown")
+        type_counts[violation_type] = type_counts.get(violation_type, 0) + 1
+
+    top_files = tuple(sorted(file_counts.items(), key=lambda x: x[1], reverse=True)[:TOP_N_FILES])
+
+    return ReportModel(
+        result=analysis_result,
+        legacy_result=legacy_result,
+        project_name=Path(analysis_result.project_path).name,
+        severity_counts=MappingProxyType({
+            "critical": analysis_result.critical_count,
+            "high": analysis_result.high_count,
+            "medium": analysis_result.medium_count,
+            "low": analysis_result.low_count,
+        }),
+        violations_by_file=MappingProxyType({path: tuple(items) for path, items in violations_by_file.items()}),
+        type_counts=MappingProxyType(type_counts),
+        file_counts=MappingProxyType(file_counts),
+        top_files=top_files,
+    )
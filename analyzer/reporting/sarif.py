@@ -19,6 +19,31 @@ import uuid
 from analyzer.ast_engine.core_analyzer import AnalysisResult, Violation
 from analyzer.thresholds import ConnascenceType
 
+# Order of rules in the tool descriptor; ruleIndex values point into it
+RULE_TYPE_ORDER = [
+    ConnascenceType.NAME,
+    ConnascenceType.TYPE,
+    ConnascenceType.MEANING,
+    ConnascenceType.POSITION,
+    ConnascenceType.ALGORITHM,
+    ConnascenceType.EXECUTION,
+    ConnascenceType.TIMING,
+    ConnascenceType.VALUE,
+    ConnascenceType.IDENTITY,
+]
+
+# Precomputed lookups so per-result rule indexing is O(1)
+RULE_INDEX_BY_TYPE = {connascence_type: index for index, connascence_type in enumerate(RULE_TYPE_ORDER)}
+RULE_INDEX_BY_ID = {f"CON_{connascence_type.value}": index for connascence_type, index in RULE_INDEX_BY_TYPE.items()}
+
+SARIF_SCHEMA_URI = "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json"
+
+def dump_json(document: Any, compact: bool = False) -> str:
+    """Serialize a report document, optionally without indentation."""
+    if compact:
+        return json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(document, indent=2, ensure_ascii=False)
+
 class SARIFReporter:
     """SARIF 2.1.0 report generator."""
 
@@ -28,48 +53,63 @@ class SARIFReporter:
         self.tool_uri = "https://github.com/connascence/connascence-analyzer"
         self.organization = "Connascence Analytics"
 
-    def generate(self, result: AnalysisResult) -> str:
+    def generate(self, result: AnalysisResult, compact: bool = False) -> str:
         """Generate SARIF report from analysis result."""
         sarif_report = {
-            "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
+            "$schema": SARIF_SCHEMA_URI,
             "version": "2.1.0",
             "runs": [self._create_run(result)],
         }
 
-        return json.dumps(sarif_report, indent=2, ensure_ascii=False)
+        return dump_json(sarif_report, compact)
 
     def _create_run(self, result: AnalysisResult) -> Dict[str, Any]:
         """Create the main SARIF run object."""
-        return {
+        results = [self._create_result(violation) for violation in result.violations]
+        run = self._create_run_header(result.timestamp, result.project_root)
+        run["results"] = results
+        run["properties"] = self._create_run_properties(result, len(results))
+        return run
+
+    def _create_run_header(self, start_time: str, working_directory: str,
+                           execution_successful: bool = True, conversion: bool = True) -> Dict[str, Any]:
+        """Run members that precede ``results``, shared with the streaming writer."""
+        start_time_utc = start_time if start_time.endswith("Z") else f"{start_time}Z"
+        run = {
             "tool": self._create_tool(),
             "automationDetails": {
                 "id": f"connascence/{uuid.uuid4()}",
                 "correlationGuid": str(uuid.uuid4()),
                 "description": {"text": "Connascence analysis for Python codebases"},
             },
-            "conversion": {
+        }
+        if conversion:
+            run["conversion"] = {
                 "tool": {"driver": {"name": "connascence-cli", "version": self.tool_version}},
                 "invocation": {
-                    "executionSuccessful": True,
-                    "startTimeUtc": f"{result.timestamp}Z" if not result.timestamp.endswith('Z') else result.timestamp,
+                    "executionSuccessful": execution_successful,
+                    "startTimeUtc": start_time_utc,
                     "endTimeUtc": f"{datetime.now().isoformat()}Z",
                 },
-            },
-            "invocations": [
-                {
-                    "executionSuccessful": True,
-                    "startTimeUtc": f"{result.timestamp}Z" if not result.timestamp.endswith('Z') else result.timestamp,
-                    "workingDirectory": {"uri": f"file://{result.project_root}"},
-                }
-            ],
-            "results": [self._create_result(violation) for violation in result.violations],
-            "properties": {
-                "analysisType": "connascence",
-                "totalFilesAnalyzed": result.total_files_analyzed,
-                "analysisDurationMs": result.analysis_duration_ms,
-                "summaryMetrics": result.summary_metrics,
-                "policyPreset": result.policy_preset,
-            },
+            }
+        run["invocations"] = [
+            {
+                "executionSuccessful": execution_successful,
+                "startTimeUtc": start_time_utc,
+                "workingDirectory": {"uri": f"file://{working_directory}"},
+            }
+        ]
+        return run
+
+    def _create_run_properties(self, result: AnalysisResult, total_results: int) -> Dict[str, Any]:
+        """Run-level ``properties`` for an analysis result."""
+        return {
+            "analysisType": "connascence",
+            "totalResults": total_results,
+            "totalFilesAnalyzed": result.total_files_analyzed,
+            "analysisDurationMs": result.analysis_duration_ms,
+            "summaryMetrics": result.summary_metrics,
+            "policyPreset": result.policy_preset,
         }
 
     def _create_tool(self) -> Dict[str, Any]:
@@ -288,20 +328,11 @@ class SARIFReporter:
         return mapping.get(severity, "warning")
 
     def _get_rule_index(self, connascence_type: ConnascenceType) -> int:
-        """Get the index of a rule in the rules array."""
-        # This would map to actual rule positions
-        type_order = [
-            ConnascenceType.NAME,
-            ConnascenceType.TYPE,
-            ConnascenceType.MEANING,
-            ConnascenceType.POSITION,
-            ConnascenceType.ALGORITHM,
-            ConnascenceType.EXECUTION,
-            ConnascenceType.TIMING,
-            ConnascenceType.VALUE,
-            ConnascenceType.IDENTITY,
-        ]
-        return type_order.index(connascence_type)
+        """Get the index of a rule in the rules array (-1 when the rule is unknown)."""
+        index = RULE_INDEX_BY_TYPE.get(connascence_type)
+        if index is None:
+            index = RULE_INDEX_BY_ID.get(f"CON_{getattr(connascence_type, 'value', connascence_type)}", -1)
+        return index
 
     def _normalize_path(self, file_path: str) -> str:
         """Normalize file path for SARIF."""
@@ -331,39 +362,39 @@ class SARIFReporter:
 
         return related_locations
 
-    def export_results(self, result, output_file=None):
+    def export_results(self, result, output_file=None, compact=False):
         """Export results to SARIF format.
 
         Args:
             result: Analysis result (dict or AnalysisResult object)
             output_file: Optional file path to write to. If None, returns SARIF string.
+            compact: Emit JSON without indentation
 
         Returns:
             SARIF JSON string if output_file is None, otherwise writes to file.
         """
+        if output_file:
+            # Stream results straight to the file instead of building the document
+            from analyzer.reporting.streaming import write_sarif_report
+
+            with open(output_file, "w", encoding="utf-8") as f:
+                write_sarif_report(result, f, reporter=self, compact=compact)
+            return None
+
         # Handle both dict and AnalysisResult objects
         if isinstance(result, dict):
             # Convert dict result to SARIF-compatible format
-            sarif_output = self._convert_dict_to_sarif(result)
-        else:
-            # Use the generate method for AnalysisResult objects
-            sarif_output = self.generate(result)
+            return self._convert_dict_to_sarif(result, compact=compact)
+        # Use the generate method for AnalysisResult objects
+        return self.generate(result, compact=compact)
 
-        if output_file:
-            # Write to file
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(sarif_output)
-        else:
-            # Return SARIF string
-            return sarif_output
-
-    def _convert_dict_to_sarif(self, result_dict):
+    def _convert_dict_to_sarif(self, result_dict, compact=False):
         """Convert dict-based analysis result to SARIF format."""
         # Create a minimal SARIF report from dict results
         violations = result_dict.get("violations", [])
 
         sarif_report = {
-            "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
+            "$schema": SARIF_SCHEMA_URI,
             "version": "2.1.0",
             "runs": [
                 {
@@ -389,7 +420,7 @@ class SARIFReporter:
             ],
         }
 
-        return json.dumps(sarif_report, indent=2, ensure_ascii=False)
+        return dump_json(sarif_report, compact)
 
     def _create_result_from_dict(self, violation_dict):
         """Create SARIF result from violation dictionary."""
@@ -426,4 +457,7 @@ class SARIFReporter:
             },
         }
 
+        if rule_id in RULE_INDEX_BY_ID:
+            result["ruleIndex"] = RULE_INDEX_BY_ID[rule_id]
+
         return result
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Streaming SARIF and JSON Report Writers
+
+Writes report documents incrementally to an open file handle. The document
+envelope is emitted up front, each violation is serialized and written as it
+arrives, and run-level summaries are appended once the stream is finished.
+Memory use is independent of the number of violations written.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, TextIO
+import json
+
+from analyzer.reporting.json import JSONReporter, ViolationSummaryAccumulator
+from analyzer.reporting.sarif import SARIF_SCHEMA_URI, SARIFReporter, dump_json
+
+# Placeholder swapped for the streamed array when splitting the envelope
+_STREAM_MARKER = "__STREAMED_ARRAY__"
+
+class _StreamingArrayWriter:
+    """Writes a JSON document whose one array member is filled incrementally."""
+
+    def __init__(self, stream: TextIO, compact: bool = False):
+        self.stream = stream
+        self.compact = compact
+        self.items_written = 0
+        self._suffix = ""
+        self._item_indent = ""
+        self._key_indent = ""
+        self._started = False
+        self._finished = False
+
+    def _open(self, envelope: Dict[str, Any]) -> None:
+        """Write the envelope up to the streamed array's opening bracket."""
+        assert not self._started, "stream already started"
+        prefix, self._suffix = dump_json(envelope, self.compact).split(json.dumps(_STREAM_MARKER), 1)
+        if not self.compact:
+            last_line = prefix.rsplit("\n", 1)[-1]
+            self._key_indent = last_line[: len(last_line) - len(last_line.lstrip())]
+            self._item_indent = self._key_indent + "  "
+        self.stream.write(prefix + "[")
+        self._started = True
+
+    def _write_item(self, item: Dict[str, Any]) -> None:
+        """Serialize and write one array element."""
+        assert self._started and not self._finished, "stream is not open"
+        separator = "," if self.items_written else ""
+        if self.compact:
+            self.stream.write(separator + dump_json(item, True))
+        else:
+            body = dump_json(item).replace("\n", "\n" + self._item_indent)
+            self.stream.write(f"{separator}\n{self._item_indent}{body}")
+        self.items_written += 1
+
+    def _close(self, trailing: Optional[Dict[str, Any]] = None) -> None:
+        """Close the array, append trailing members and finish the envelope."""
+        assert self._started and not self._finished, "stream is not open"
+        if self.compact:
+            self.stream.write("]")
+        else:
+            self.stream.write(f"\n{self._key_indent}]" if self.items_written else "]")
+
+        for key, value in (trailing or {}).items():
+            if self.compact:
+                self.stream.write(f",{json.dumps(key)}:{dump_json(value, True)}")
+            else:
+                body = dump_json(value).replace("\n", "\n" + self._key_indent)
+                self.stream.write(f",\n{self._key_indent}{json.dumps(key)}: {body}")
+
+        self.stream.write(self._suffix)
+        self._finished = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._started and not self._finished and exc_type is None:
+            self.finish()
+        return False
+
+class StreamingSARIFWriter(_StreamingArrayWriter):
+    """SARIF 2.1.0 writer that streams ``results`` entries to a file handle."""
+
+    def __init__(self, stream: TextIO, reporter: Optional[SARIFReporter] = None, compact: bool = False):
+        super().__init__(stream, compact)
+        self.reporter = reporter or SARIFReporter()
+
+    def begin(self,
+                start_time: Optional[str] = None,
+                working_directory: str = ".",
+                execution_successful: bool = True,
+                conversion: bool = True) -> "StreamingSARIFWriter":
+        """Write the SARIF envelope, tool descriptor, conversion and invocation."""
+        run = self.reporter._create_run_header(start_time or datetime.now().isoformat(), working_directory,
+                                               execution_successful, conversion)
+        run["results"] = _STREAM_MARKER
+        self._open({"$schema": SARIF_SCHEMA_URI, "version": "2.1.0", "runs": [run]})
+        return self
+
+    def write_violation(self, violation: Any) -> None:
+        """Convert one violation (object or dict) into a SARIF result and write it."""
+        if isinstance(violation, dict):
+            self._write_item(self.reporter._create_result_from_dict(violation))
+        else:
+            self._write_item(self.reporter._create_result(violation))
+
+    def write_violations(self, violations: Iterable[Any]) -> int:
+        """Write violations as they are produced; returns the number written."""
+        written = 0
+        for violation in violations:
+            self.write_violation(violation)
+            written += 1
+        return written
+
+    def finish(self, properties: Optional[Dict[str, Any]] = None) -> None:
+        """Close ``results`` and append run-level properties."""
+        run_properties = {"analysisType": "connascence", "totalResults": self.items_written}
+        run_properties.update(properties or {})
+        self._close({"properties": run_properties})
+
+class StreamingJSONWriter(_StreamingArrayWriter):
+    """JSONReporter-schema writer that streams ``violations`` to a file handle.
+
+    The summary and policy sections depend on every violation, so they are
+    written after the violations array rather than in sorted-key position.
+    """
+
+    def __init__(self, stream: TextIO, reporter: Optional[JSONReporter] = None, compact: bool = False):
+        super().__init__(stream, compact)
+        self.reporter = reporter or JSONReporter()
+        self.summary = ViolationSummaryAccumulator()
+
+    def begin(self, metadata: Optional[Dict[str, Any]] = None) -> "StreamingJSONWriter":
+        """Write schema version and metadata, then open ``violations``."""
+        self._open({
+            "metadata": metadata or {},
+            "schema_version": self.reporter.schema_version,
+            "violations": _STREAM_MARKER,
+        })
+        return self
+
+    def write_violation(self, violation: Any) -> None:
+        """Serialize one violation (object or dict), update the summary and write it."""
+        self.summary.add(violation)
+        if isinstance(violation, dict):
+            self._write_item(violation)
+        else:
+            self._write_item(self.reporter._serialize_violation(violation))
+
+    def write_violations(self, violations: Iterable[Any]) -> int:
+        """Write violations as they are produced; returns the number written."""
+        written = 0
+        for violation in violations:
+            self.write_violation(violation)
+            written += 1
+        return written
+
+    def finish(self,
+                total_files_analyzed: int = 0,
+                file_stats: Optional[Dict[str, Any]] = None,
+                policy_compliance: Optional[Dict[str, Any]] = None) -> None:
+        """Close ``violations`` and append summary, file stats and policy compliance."""
+        compliance = dict(policy_compliance or {})
+        compliance["quality_gates"] = self.summary.quality_gates()
+        self._close({
+            "file_stats": file_stats or {},
+            "policy_compliance": compliance,
+            "summary": self.summary.summary(total_files_analyzed),
+        })
+
+def write_sarif_report(result: Any, stream: TextIO,
+                        reporter: Optional[SARIFReporter] = None,
+                        compact: bool = False) -> int:
+    """Stream a SARIF report for an AnalysisResult or dict result to ``stream``."""
+    writer = StreamingSARIFWriter(stream, reporter=reporter, compact=compact)
+    if isinstance(result, dict):
+        writer.begin(working_directory=result.get("path", "."),
+                        execution_successful=result.get("success", True), conversion=False)
+        writer.write_violations(result.get("violations", []))
+        writer.finish({"policyPreset": result.get("policy", "default"),
+                        "summaryMetrics": result.get("summary", {})})
+    else:
+        writer.begin(start_time=result.timestamp, working_directory=result.project_root)
+        writer.write_violations(result.violations)
+        writer.finish(writer.reporter._create_run_properties(result, writer.items_written))
+    return writer.items_written
+
+def write_json_report(result: Any, stream: TextIO,
+                        reporter: Optional[JSONReporter] = None,
+                        compact: bool = False) -> int:
+    """Stream a JSONReporter-schema report for an AnalysisResult to ``stream``."""
+    reporter = reporter or JSONReporter()
+    writer = StreamingJSONWriter(stream, reporter=reporter, compact=compact)
+    writer.begin(reporter._create_metadata(result))
+    writer.write_violations(result.violations)
+    writer.finish(
+        total_files_analyzed=result.total_files_analyzed,
+        file_stats=result.file_stats,
+        policy_compliance={
+            "policy_preset": result.policy_preset,
+            "budget_status": result.budget_status,
+            "baseline_comparison": result.baseline_comparison,
+        },
+    )
+    return writer.items_written
@@ -1,13 +1,18 @@
-from src.constants.base import DAYS_RETENTION_PERIOD, MAXIMUM_NESTED_DEPTH
 """
-
 Result processing, correlation, and cross-validation system.
 NASA Rule 4 Compliant: All methods under 60 lines.
-NASA Rule MAXIMUM_NESTED_DEPTH Compliant: Comprehensive defensive assertions.
+NASA Rule 5 Compliant: Comprehensive defensive assertions.
 """
 
-import json
+from collections import defaultdict
+from itertools import combinations
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 import logging
+
+from src.violation_correlation import ViolationCorrelationIndex
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -137,6 +142,29 @@ class ResultAggregator:
         logger.info(f"Created {len(clusters)} correlation clusters")
         return clusters
 
+    def correlate_tool_findings(self, violations: List[Dict],
+                                linter_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Merge analyzer and linter reports of the same problem.
+        NASA Rule 4 Compliant: Under 60 lines.
+        """
+        # NASA Rule 5: Input validation
+        assert isinstance(violations, list), "violations must be a list"
+
+        index = ViolationCorrelationIndex()
+        index.add_analyzer_violations(violations)
+        if linter_results:
+            index.add_linter_results(linter_results)
+
+        findings = index.findings()
+        stats = index.get_stats()
+        logger.info(f"Merged {stats['reports']} tool reports into {stats['findings']} findings")
+        return {
+            'findings': [finding.to_dict() for finding in findings],
+            'agreed_findings': sum(1 for finding in findings if finding.agreement > 1),
+            'stats': stats
+        }
+
     def validate_result_consistency(self, results: List[Dict]) -> Dict[str, Any]:
         """
         Validate consistency across detector results.
@@ -226,22 +254,62 @@ class ResultAggregator:
         """Perform cross-correlation analysis between violations."""
         correlations = []
         
-        # Build correlation matrix
-        for i, violation_a in enumerate(violations):
-            for j, violation_b in enumerate(violations[i+1:], i+1):
-                correlation = self._calculate_violation_correlation(violation_a, violation_b)
-                
-                if correlation['strength'] >= self.correlation_threshold:
-                    correlations.append({
-                        'violation_a_id': violation_a.get('id', i),
-                        'violation_b_id': violation_b.get('id', j),
-                        'correlation_strength': correlation['strength'],
-                        'correlation_type': correlation['type'],
-                        'shared_factors': correlation['factors']
-                    })
+        # Score only the pairs that can reach the threshold
+        for i, j in self._correlation_candidates(violations):
+            violation_a, violation_b = violations[i], violations[j]
+            correlation = self._calculate_violation_correlation(violation_a, violation_b)
+            
+            if correlation['strength'] >= self.correlation_threshold:
+                correlations.append({
+                    'violation_a_id': violation_a.get('id', i),
+                    'violation_b_id': violation_b.get('id', j),
+                    'correlation_strength': correlation['strength'],
+                    'correlation_type': correlation['type'],
+                    'shared_factors': correlation['factors']
+                })
 
         return correlations
 
+    def _correlation_candidates(self, violations: List[Dict]) -> List[Tuple[int, int]]:
+        """
+        Index pairs that can reach the correlation threshold.
+        Scores outside one file top out at 0.4, and within a file a pair
+        needs the same type or a nearby line with the same severity
+        (see _calculate_pairwise_correlation), so a per-file index of
+        types and 10-line windows replaces the all-pairs scan.
+        """
+        by_file = defaultdict(list)
+        for index, violation in enumerate(violations):
+            by_file[violation.get('file_path')].append(index)
+
+        pairs = set()
+        for indices in by_file.values():
+            if len(indices) < 2:
+                continue
+            if self.correlation_threshold <= 0.6:
+                pairs.update(combinations(indices, 2))
+                continue
+
+            by_type = defaultdict(list)
+            by_window = defaultdict(list)
+            for index in indices:
+                violation = violations[index]
+                by_type[violation.get('type')].append(index)
+                line = violation.get('line_number', 0)
+                by_window[(violation.get('severity', 'medium'), line // 10)].append(index)
+
+            for group in by_type.values():
+                pairs.update(combinations(group, 2))
+            for (severity, window), group in by_window.items():
+                nearby = group + by_window.get((severity, window + 1), [])
+                for a in group:
+                    line_a = violations[a].get('line_number', 0)
+                    for b in nearby:
+                        if a != b and abs(line_a - violations[b].get('line_number', 0)) < 10:
+                            pairs.add((min(a, b), max(a, b)))
+
+        return sorted(pairs)
+
     def _calculate_aggregated_metrics(self, violations: List[Dict], detector_results: List[Dict]) -> Dict[str, float]:
         """Calculate aggregated quality metrics."""
         metrics = {}
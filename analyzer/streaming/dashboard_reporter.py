@@ -1,5 +1,6 @@
-from src.constants.base import DAYS_RETENTION_PERIOD, MAXIMUM_NESTED_DEPTH, MINIMUM_TEST_COVERAGE_PERCENTAGE
 """
+Dashboard Reporter for Streaming Analysis
+=========================================
 
 Generates real-time reporting data for streaming analysis dashboards.
 Provides structured data for visualization of violations, performance metrics,
@@ -8,9 +9,19 @@ and system health during continuous analysis operations.
 NASA Rule 7 Compliant: Bounded data structures with automatic cleanup.
 """
 
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from threading import RLock
+from typing import Any, Dict, List, Optional
 import json
 import time
 import logging
+
+from src.constants.base import DAYS_RETENTION_PERIOD, MAXIMUM_NESTED_DEPTH, MINIMUM_TEST_COVERAGE_PERCENTAGE
+
+from ..optimization.streaming_performance_monitor import get_global_streaming_monitor
+from .result_aggregator import AggregatedResult, get_global_stream_aggregator
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -1,4 +1,6 @@
-from src.constants.base import SESSION_TIMEOUT_SECONDS
+"""
+Incremental Cache for Streaming Analysis
+========================================
 
 Intelligent caching system for incremental analysis that tracks file changes,
 dependencies, and partial analysis results. Integrates with existing file_cache
@@ -20,6 +22,16 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import logging
+
+from src.constants.base import SESSION_TIMEOUT_SECONDS
+
+try:
+    from ..optimization.file_cache import FileContentCache, get_global_cache
+    CACHE_INTEGRATION_AVAILABLE = True
+except ImportError:
+    FileContentCache = Any
+    CACHE_INTEGRATION_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -161,7 +173,7 @@ class IncrementalCache:
             if new_content is not None:
                 new_hash = hashlib.sha256(new_content.encode('utf-8')).hexdigest()[:16]
                 new_size = len(new_content)
-            elif path_exists(file_path):
+            elif Path(file_path).exists():
                 # Read file if content not provided
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
@@ -9,10 +9,18 @@ access to aggregated analysis data during streaming operations.
 NASA Rule 7 Compliant: Bounded memory usage with LRU eviction.
 """
 
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from threading import RLock
+from typing import Any, Dict, List, Optional, Set, Tuple
 import json
 import logging
 import time
 
+from ..nasa_compliance_tracker import IncrementalComplianceTracker, flatten_violations
+
+logger = logging.getLogger(__name__)
+
 @dataclass
 class StreamAnalysisResult:
     """Individual streaming analysis result."""
@@ -98,6 +106,9 @@ class StreamResultAggregator:
         self.violation_timeline: defaultdict = defaultdict(lambda: deque(maxlen=max_trend_points))
         self.active_violations: Dict[str, Dict[str, Any]] = {}
         
+        # Running NASA compliance aggregate updated by per-file deltas
+        self.compliance_tracker = IncrementalComplianceTracker()
+        
         # Performance metrics
         self.aggregation_stats = {
             "updates_processed": 0,
@@ -133,6 +144,7 @@ class StreamResultAggregator:
             
             # Update aggregated metrics
             self._update_aggregated_metrics(result, old_result)
+            self.compliance_tracker.update_file(result.file_path, flatten_violations(result.violations))
             
             # Update violation timeline and trends
             self._update_violation_trends(result)
@@ -163,6 +175,7 @@ class StreamResultAggregator:
             
             # Update aggregated metrics by subtracting old result
             self._subtract_result_from_aggregated(old_result)
+            self.compliance_tracker.remove_file(file_path)
             
             # Clean up dependencies
             self._cleanup_dependencies(file_path)
@@ -229,6 +242,7 @@ class StreamResultAggregator:
                     "processing_velocity": velocity_data["files_per_minute"]
                 },
                 "violation_breakdown": self.aggregated_result.violation_breakdown,
+                "nasa_compliance": self.compliance_tracker.get_snapshot(),
                 "trends": recent_trends,
                 "velocity": velocity_data,
                 "top_files": top_violation_files,
@@ -21,6 +21,7 @@ from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Uni
 import hashlib
 import json
 import logging
+import os
 import time
 
 from dataclasses import dataclass, field
@@ -30,17 +31,28 @@ import weakref
 
 try:
     from watchdog.events import FileSystemEventHandler, FileSystemEvent
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
 except ImportError:
+    WATCHDOG_AVAILABLE = False
+    Observer = None
+
     # Fallback for when watchdog is not available
     class FileSystemEventHandler:
         """Fallback file system event handler."""
 
     class FileSystemEvent:
         """Fallback file system event."""
-    def __init__(self, src_path=''):
+        def __init__(self, src_path=''):
             self.src_path = src_path
             self.is_directory = False
 
+try:
+    from src.detectors.workload_optimizer import AdaptiveConcurrencyController, get_global_file_cost_estimator
+    ADAPTIVE_CONCURRENCY_AVAILABLE = True
+except ImportError:
+    ADAPTIVE_CONCURRENCY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -234,15 +246,18 @@ class StreamProcessor:
                 max_workers: int = 4,
                 cache_size: int = 10000,
                 buffer_size: int = 1000,
-                flush_interval: float = 5.0):
+                flush_interval: float = 5.0,
+                adaptive_concurrency: bool = True):
         """
         Initialize stream processor.
         
         Args:
             analyzer_factory: Factory function to create analyzer instances
             max_queue_size: Maximum analysis request queue size (NASA Rule 7)
-            max_workers: Maximum concurrent worker threads
+            max_workers: Initial concurrent workers (the cap when not adaptive)
             cache_size: Maximum cache entries to maintain
+            adaptive_concurrency: Resize active workers from measured throughput,
+                queue depth and memory headroom
         """
         assert 10 <= max_queue_size <= 50000, "max_queue_size must be 10-50000"
         assert 1 <= max_workers <= 16, "max_workers must be 1-16"
@@ -263,10 +278,25 @@ class StreamProcessor:
         self._processing_queue = asyncio.Queue(maxsize=max_queue_size)
         self._results_queue = asyncio.Queue(maxsize=max_queue_size * 2)
         
-        # Worker management
+        # Worker management: worker_limit tasks are started, of which
+        # _concurrency_limit may process requests at once
         self._workers: List[asyncio.Task] = []
         self._running = False
+        self.concurrency_controller = None
+        self.file_costs = None
+        self.worker_limit = max_workers
+        if adaptive_concurrency and ADAPTIVE_CONCURRENCY_AVAILABLE:
+            self.concurrency_controller = AdaptiveConcurrencyController(
+                initial_concurrency=max_workers,
+                max_concurrency=max(max_workers, min(16, (os.cpu_count() or 1) * 2)),
+            )
+            self.worker_limit = self.concurrency_controller.max_concurrency
+            self.file_costs = get_global_file_cost_estimator()
+        self._concurrency_limit = max_workers
+        self._retired_slots = 0
         self._worker_semaphore = asyncio.Semaphore(max_workers)
+        self._batch_completed = 0
+        self._batch_start = time.time()
         
         # Caching and optimization
         self._result_cache: Dict[str, AnalysisResult] = {}
@@ -452,7 +482,7 @@ class StreamProcessor:
     def process_file_change(self, file_path: str, changes: Dict[str, Any]):
         """Process file change event for streaming analysis."""
         try:
-            if not path_exists(file_path):
+            if not Path(file_path).exists():
                 return
 
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -473,14 +503,15 @@ class StreamProcessor:
         self._running = True
         
         # Start worker tasks
-        for i in range(self.max_workers):
+        for i in range(self.worker_limit):
             worker = asyncio.create_task(
                 self._worker_loop(),
                 name=f"StreamWorker-{i}"
             )
             self._workers.append(worker)
             
-        logger.info(f"Stream processor started with {self.max_workers} workers")
+        logger.info(f"Stream processor started with {self.worker_limit} workers "
+                    f"({self._concurrency_limit} active)")
     
     async def stop(self) -> None:
         """Stop the stream processor."""
@@ -599,8 +630,11 @@ class StreamProcessor:
                     timeout=1.0
                 )
                 
-                async with self._worker_semaphore:
+                await self._worker_semaphore.acquire()
+                try:
                     await self._process_request(request)
+                finally:
+                    self._release_worker_slot()
                     
             except asyncio.TimeoutError:
                 continue  # Normal timeout, check if still running
@@ -610,6 +644,39 @@ class StreamProcessor:
         
         logger.debug(f"Worker stopped: {asyncio.current_task().get_name()}")
     
+    def _release_worker_slot(self) -> None:
+        """Return a processing slot, retiring it if the limit was lowered."""
+        if self._retired_slots > 0:
+            self._retired_slots -= 1
+        else:
+            self._worker_semaphore.release()
+
+    def _resize_concurrency(self, new_limit: int) -> None:
+        """Change how many workers may process requests at once."""
+        delta = new_limit - self._concurrency_limit
+        self._concurrency_limit = new_limit
+        if delta < 0:
+            # Busy slots are retired as they are released
+            self._retired_slots -= delta
+            return
+        reclaimed = min(delta, self._retired_slots)
+        self._retired_slots -= reclaimed
+        for _ in range(delta - reclaimed):
+            self._worker_semaphore.release()
+
+    def _record_completed(self, items: int) -> None:
+        """Feed completed work to the concurrency controller once per batch."""
+        if self.concurrency_controller is None:
+            return
+        self._batch_completed += items
+        if self._batch_completed >= self._concurrency_limit:
+            new_limit = self.concurrency_controller.record_batch(
+                self._batch_completed, time.time() - self._batch_start, self._processing_queue.qsize()
+            )
+            self._batch_completed, self._batch_start = 0, time.time()
+            if new_limit != self._concurrency_limit:
+                self._resize_concurrency(new_limit)
+
     async def _process_request(self, request: AnalysisRequest) -> None:
         """
         Process individual analysis request.
@@ -648,6 +715,7 @@ class StreamProcessor:
             processing_time_ms = int((time.time() - start_time) * 1000)
             self._stats["requests_processed"] += 1
             self._stats["processing_time_ms"] += processing_time_ms
+            self._record_completed(len(request.file_changes))
             
             logger.debug(f"Processed request {request.request_id} in {processing_time_ms}ms")
             
@@ -713,7 +781,12 @@ class StreamProcessor:
         try:
             # Check if analyzer has the analyze_file method
             if hasattr(analyzer, 'analyze_file'):
-                result = analyzer.analyze_file(str(file_path))
+                # Analysis is CPU-bound and blocking; run it off the event loop
+                # so active workers overlap
+                start = time.perf_counter()
+                result = await asyncio.to_thread(analyzer.analyze_file, str(file_path))
+                if self.file_costs is not None:
+                    self.file_costs.record(str(file_path), time.perf_counter() - start)
                 if hasattr(result, 'violations'):
                     return [self._violation_to_dict(v) for v in result.violations]
                 elif isinstance(result, dict) and 'violations' in result:
@@ -910,7 +983,9 @@ class StreamProcessor:
             "queue_size": self._processing_queue.qsize(),
             "results_pending": self._results_queue.qsize(),
             "queue_overflows": self._stats["queue_overflows"],
-            "dependency_invalidations": self._stats["dependency_invalidations"]
+            "dependency_invalidations": self._stats["dependency_invalidations"],
+            "active_worker_limit": self._concurrency_limit,
+            "worker_limit": self.worker_limit
         }
     
     async def __aenter__(self):
@@ -924,8 +999,7 @@ class StreamProcessor:
 
 # Factory functions and utilities
 
-    def create_stream_processor(analyzer_factory: Callable[[], Any], **kwargs) -> StreamProcessor:
-        pass
+def create_stream_processor(analyzer_factory: Callable[[], Any], **kwargs) -> StreamProcessor:
     """Factory function to create configured stream processor."""
     return StreamProcessor(analyzer_factory=analyzer_factory, **kwargs)
 
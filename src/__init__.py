@@ -6,9 +6,19 @@ Advanced AI-driven development environment with Research Intelligence and Theate
 __version__ = "2.1.0"
 __author__ = "SPEK Enhanced Development Platform"
 
-# Core modules
-from . import risk
-from . import strategies
+import importlib
+
+# Core modules, imported on first access (PEP 562): ``risk`` pulls in pandas,
+# which every ``src.constants`` user would otherwise pay for.
+_LAZY_SUBMODULES = ('risk', 'strategies')
+
+def __getattr__(name):
+    """Import core submodules lazily."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'strategies',
@@ -1,7 +1,8 @@
 """Base adapter implementation with common functionality."""
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Callable, FrozenSet, Optional, Tuple
+import codecs
 import json
 import subprocess
 import time
@@ -9,20 +10,116 @@ import time
 from lib.shared.utilities import get_logger
 import asyncio
 
+from src.adapters.stream_parsing import JSONArrayStreamParser, LineStreamParser
+from src.models.linter_models import (
+    LinterAdapter, LinterConfig, LinterResult, LinterViolation, Position, StandardSeverity
+)
+
+logger = get_logger(__name__)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
 class BaseLinterAdapter(LinterAdapter):
     """Base implementation for common linter adapter functionality."""
     
+    # Whether the file list may be split into independent shards; tools that
+    # need whole-program context (mypy) are only split to respect argv limits
+    shardable: bool = True
+    # Whether findings for a file depend only on that file, so they may be
+    # reused from the per-file result cache while its content is unchanged
+    cacheable: bool = True
+    # Exit codes of a completed run (clean, or findings reported); anything
+    # else is a usage, configuration or crash error whose output is incomplete
+    completed_exit_codes: FrozenSet[int] = frozenset({0, 1})
+    # Whether the tool parallelizes internally; such tools run as one process
+    # per argv batch with get_parallel_args() instead of being sharded
+    native_parallelism: bool = False
+    # How stdout is consumed while the tool runs: 'json_array' (array or
+    # concatenated JSON values), 'lines', or None to buffer and call parse_output
+    stream_format: Optional[str] = None
+    
     def __init__(self, config: LinterConfig):
         super().__init__(config)
         self._version_cache: Optional[str] = None
     
-    async def run_linter(self, target_paths: List[str]) -> LinterResult:
-        """Execute the linter with proper error handling and timing."""
+    def get_parallel_args(self, jobs: int) -> List[str]:
+        """Arguments enabling the tool's own worker processes (none by default)."""
+        return []
+    
+    def parse_record(self, record: Any) -> Optional[LinterViolation]:
+        """Convert one streamed record (decoded JSON value or text line) to a violation."""
+        raise NotImplementedError(f"{self.tool_name} does not support streamed output")
+    
+    def parse_records(self, raw_output: str) -> List[LinterViolation]:
+        """Parse complete output through the streaming record path."""
+        parser = self._new_stream_parser()
+        records = parser.feed(raw_output)
+        try:
+            records += parser.close()
+        except ValueError as e:
+            logger.warning(f"Failed to parse output from {self.tool_name}: {e}")
+        return [violation for violation in map(self.parse_record, records) if violation is not None]
+    
+    def _new_stream_parser(self):
+        if self.stream_format == 'json_array':
+            return JSONArrayStreamParser()
+        if self.stream_format == 'lines':
+            return LineStreamParser()
+        raise ValueError(f"Unknown stream format: {self.stream_format}")
+    
+    async def _consume_stream(self, process, on_violation: Callable[[LinterViolation], None]) -> str:
+        """
+        Parse stdout chunk by chunk while the tool runs.
+        
+        Only the current partial record is buffered, never the whole output.
+        stderr is drained concurrently so a chatty tool cannot block on a
+        full pipe. Returns the decoded stderr.
+        """
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parser = self._new_stream_parser()
+        
+        def emit(records: List[Any]) -> None:
+            for record in records:
+                violation = self.parse_record(record)
+                if violation is not None:
+                    on_violation(violation)
+        
+        try:
+            while True:
+                chunk = await process.stdout.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                emit(parser.feed(decoder.decode(chunk)))
+            emit(parser.feed(decoder.decode(b'', final=True)))
+            try:
+                emit(parser.close())
+            except ValueError as e:
+                logger.warning(f"Truncated output from {self.tool_name}: {e}")
+            stderr = await stderr_task
+        finally:
+            if not stderr_task.done():
+                stderr_task.cancel()
+        await process.wait()
+        return stderr.decode('utf-8', errors='replace')
+    
+    async def run_linter(self, target_paths: List[str], extra_args: Optional[List[str]] = None,
+                         on_violation: Optional[Callable[[LinterViolation], None]] = None) -> LinterResult:
+        """
+        Execute the linter with proper error handling and timing.
+        
+        Adapters with a stream_format parse stdout while the tool is still
+        running; on_violation then sees each finding as soon as it is parsed.
+        """
         start_time = time.time()
         
         try:
-            # Build command
-            cmd = self.get_command_args(target_paths)
+            # Build command; target paths always come last, so extra
+            # arguments are placed between the options and the paths
+            if extra_args:
+                cmd = self.get_command_args([]) + extra_args + list(target_paths)
+            else:
+                cmd = self.get_command_args(target_paths)
             
             # Execute linter
             process = await asyncio.create_subprocess_exec(
@@ -32,11 +129,27 @@ class BaseLinterAdapter(LinterAdapter):
                 cwd=Path.cwd()
             )
             
+            violations: List[LinterViolation] = []
+            
+            def collect(violation: LinterViolation) -> None:
+                violations.append(violation)
+                if on_violation:
+                    on_violation(violation)
+            
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=self.config.timeout
-                )
+                if self.stream_format:
+                    stderr_str = await asyncio.wait_for(
+                        self._consume_stream(process, collect),
+                        timeout=self.config.timeout
+                    )
+                else:
+                    stdout, stderr = await asyncio.wait_for(
+                        process.communicate(),
+                        timeout=self.config.timeout
+                    )
+                    stderr_str = stderr.decode('utf-8', errors='replace')
+                    for violation in self.parse_output(stdout.decode('utf-8', errors='replace'), stderr_str):
+                        collect(violation)
             except asyncio.TimeoutError:
                 process.kill()
                 await process.wait()
@@ -44,13 +157,6 @@ class BaseLinterAdapter(LinterAdapter):
             
             execution_time = time.time() - start_time
             
-            # Decode output
-            stdout_str = stdout.decode('utf-8', errors='replace')
-            stderr_str = stderr.decode('utf-8', errors='replace')
-            
-            # Parse violations
-            violations = self.parse_output(stdout_str, stderr_str)
-            
             # Build result
             result = LinterResult(
                 tool=self.tool_name,
@@ -1,6 +1,6 @@
 """Flake8 linter adapter implementation."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 import re
 
@@ -9,14 +9,23 @@ from src.models.linter_models import (
     LinterConfig, LinterViolation, StandardSeverity, ViolationType
 )
 
+TEXT_LINE_PATTERN = re.compile(r'^(.+?):(\d+):(\d+): (\w\d+) (.+)$')
+
 class Flake8Adapter(BaseLinterAdapter):
     """Adapter for flake8 Python linter."""
     
-def __init__(self, config: LinterConfig):
+    native_parallelism = True
+    stream_format = 'lines'
+    
+    def __init__(self, config: LinterConfig):
         super().__init__(config)
         self.tool_name = "flake8"
     
-def get_command_args(self, target_paths: List[str]) -> List[str]:
+    def get_parallel_args(self, jobs: int) -> List[str]:
+        """Use flake8's own worker processes."""
+        return ['--jobs', str(jobs)]
+    
+    def get_command_args(self, target_paths: List[str]) -> List[str]:
         """Build flake8 command arguments."""
         cmd = self.config.get_command_base()
         
@@ -32,22 +41,26 @@ def get_command_args(self, target_paths: List[str]) -> List[str]:
         
         return cmd
     
-def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
+    def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
         """Parse flake8 output into standardized violations."""
-        violations = []
-        
         if not raw_output.strip():
-            return violations
-        
-        # Try JSON parsing first (structured format)
-        json_violations = self._parse_json_output(raw_output)
-        if json_violations:
-            return json_violations
-        
-        # Fall back to text parsing
-        return self._parse_text_output(raw_output)
+            return []
+        return self.parse_records(raw_output)
+    
+    def parse_record(self, line: str) -> Optional[LinterViolation]:
+        """Parse one output line, JSON-formatted or standard text."""
+        line = line.strip()
+        if not line:
+            return None
+        if line.startswith('{'):
+            try:
+                return self._violation_from_json(json.loads(line))
+            except json.JSONDecodeError:
+                # Skip malformed JSON lines
+                return None
+        return self._violation_from_text(line)
     
-def _parse_json_output(self, output: str) -> List[LinterViolation]:
+    def _parse_json_output(self, output: str) -> List[LinterViolation]:
         """Parse JSON-formatted flake8 output."""
         violations = []
         
@@ -56,62 +69,67 @@ def _parse_json_output(self, output: str) -> List[LinterViolation]:
                 continue
                 
             try:
-                data = json.loads(line)
-                
-                rule_id = data.get('code', '')
-                if not self.is_rule_enabled(rule_id):
-                    continue
-                
-                violation = self.create_violation(
-                    rule_id=rule_id,
-                    message=data.get('text', ''),
-                    file_path=data.get('file', ''),
-                    line=data.get('line', 0),
-                    column=data.get('column', 0),
-                    severity_raw=self._get_severity_from_code(rule_id),
-                    category=self._get_category_from_code(rule_id),
-                    raw_data=data
-                )
-                violations.append(violation)
-                
+                violation = self._violation_from_json(json.loads(line))
             except json.JSONDecodeError:
                 # Skip malformed JSON lines
                 continue
+            if violation:
+                violations.append(violation)
         
         return violations
     
-def _parse_text_output(self, output: str) -> List[LinterViolation]:
+    def _violation_from_json(self, data: Dict[str, Any]) -> Optional[LinterViolation]:
+        """Build a violation from one JSON-formatted line."""
+        rule_id = data.get('code', '')
+        if not self.is_rule_enabled(rule_id):
+            return None
+        
+        return self.create_violation(
+            rule_id=rule_id,
+            message=data.get('text', ''),
+            file_path=data.get('file', ''),
+            line=data.get('line', 0),
+            column=data.get('column', 0),
+            severity_raw=self._get_severity_from_code(rule_id),
+            category=self._get_category_from_code(rule_id),
+            raw_data=data
+        )
+    
+    def _parse_text_output(self, output: str) -> List[LinterViolation]:
         """Parse standard flake8 text output."""
         violations = []
         
-        # Pattern: filename:line:column: code message
-        pattern = r'^(.+?):(\d+):(\d+): (\w\d+) (.+)$'
-        
         for line in output.strip().split('\n'):
-            match = re.match(pattern, line)
-            if not match:
-                continue
-            
-            file_path, line_num, column, code, message = match.groups()
-            
-            if not self.is_rule_enabled(code):
-                continue
-            
-            violation = self.create_violation(
-                rule_id=code,
-                message=message,
-                file_path=file_path,
-                line=int(line_num),
-                column=int(column),
-                severity_raw=self._get_severity_from_code(code),
-                category=self._get_category_from_code(code),
-                raw_data={'raw_line': line}
-            )
-            violations.append(violation)
+            violation = self._violation_from_text(line)
+            if violation:
+                violations.append(violation)
         
         return violations
     
-def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
+    def _violation_from_text(self, line: str) -> Optional[LinterViolation]:
+        """Build a violation from one standard text line."""
+        # Pattern: filename:line:column: code message
+        match = TEXT_LINE_PATTERN.match(line)
+        if not match:
+            return None
+        
+        file_path, line_num, column, code, message = match.groups()
+        
+        if not self.is_rule_enabled(code):
+            return None
+        
+        return self.create_violation(
+            rule_id=code,
+            message=message,
+            file_path=file_path,
+            line=int(line_num),
+            column=int(column),
+            severity_raw=self._get_severity_from_code(code),
+            category=self._get_category_from_code(code),
+            raw_data={'raw_line': line}
+        )
+    
+    def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
         """Convert flake8 severity to standard severity."""
         # Apply user overrides first
         if rule_id:
@@ -142,7 +160,7 @@ def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardS
         
         return severity_map.get(tool_severity.lower(), StandardSeverity.WARNING)
     
-def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
+    def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
         """Determine violation type from flake8 rule ID."""
         if not rule_id:
             return ViolationType.STYLE
@@ -166,7 +184,7 @@ def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
         
         return type_map.get(first_char, ViolationType.STYLE)
     
-def _get_severity_from_code(self, code: str) -> str:
+    def _get_severity_from_code(self, code: str) -> str:
         """Extract severity indication from error code."""
         if not code:
             return "warning"
@@ -177,7 +195,7 @@ def _get_severity_from_code(self, code: str) -> str:
         else:
             return "warning"
     
-def _get_category_from_code(self, code: str) -> str:
+    def _get_category_from_code(self, code: str) -> str:
         """Get descriptive category from error code."""
         if not code:
             return "unknown"
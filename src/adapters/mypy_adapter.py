@@ -1,6 +1,6 @@
 """MyPy type checker adapter implementation."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 import re
 
@@ -9,14 +9,24 @@ from src.models.linter_models import (
     LinterConfig, LinterViolation, StandardSeverity, ViolationType
 )
 
+TEXT_LINE_PATTERN = re.compile(
+    r'^(.+?):(\d+):(?:(\d+):)?\s*(error|warning|note):\s*(.+?)(?:\s+\[([^\]]+)\])?$')
+TEXT_LINE_NO_COLUMN_PATTERN = re.compile(
+    r'^(.+?):(\d+):\s*(error|warning|note):\s*(.+?)(?:\s+\[([^\]]+)\])?$')
+
 class MypyAdapter(BaseLinterAdapter):
     """Adapter for MyPy static type checker."""
     
-def __init__(self, config: LinterConfig):
+    # Type checking needs the whole import graph in one process
+    shardable = False
+    cacheable = False
+    stream_format = 'lines'
+    
+    def __init__(self, config: LinterConfig):
         super().__init__(config)
         self.tool_name = "mypy"
     
-def get_command_args(self, target_paths: List[str]) -> List[str]:
+    def get_command_args(self, target_paths: List[str]) -> List[str]:
         """Build mypy command arguments."""
         cmd = self.config.get_command_base()
         
@@ -38,105 +48,111 @@ def get_command_args(self, target_paths: List[str]) -> List[str]:
         
         return cmd
     
-def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
+    def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
         """Parse mypy output into standardized violations."""
         violations = []
         
         if not raw_output.strip():
             return violations
         
-        # Try JSON parsing first
-        json_violations = self._parse_json_output(raw_output)
-        if json_violations:
-            return json_violations
+        # A JSON array document
+        if raw_output.lstrip().startswith('['):
+            return self._parse_json_output(raw_output)
         
-        # Fall back to text parsing
-        return self._parse_text_output(raw_output)
+        # JSON lines and text lines share the streaming path
+        return self.parse_records(raw_output)
+    
+    def parse_record(self, line: str) -> Optional[LinterViolation]:
+        """Parse one output line: a JSON object (mypy -O json) or standard text."""
+        line = line.strip()
+        if not line:
+            return None
+        if line.startswith('{'):
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                return None
+            return self._violation_from_json(item) if isinstance(item, dict) else None
+        return self._violation_from_text(line)
     
-def _parse_json_output(self, output: str) -> List[LinterViolation]:
+    def _parse_json_output(self, output: str) -> List[LinterViolation]:
         """Parse JSON-formatted mypy output."""
-        violations = []
-        
         # Check if output looks like JSON
         if not output.strip().startswith('[') and not output.strip().startswith('{'):
             return []
         
         json_data = self.safe_json_parse(output)
-        
-        for item in json_data:
-            if not isinstance(item, dict):
-                continue
-            
-            # Extract violation data
-            rule_id = item.get('code', item.get('error_code', ''))
-            message = item.get('message', '')
-            filename = item.get('file', item.get('filename', ''))
-            
-            line = item.get('line', 0)
-            column = item.get('column', 0)
-            severity = item.get('severity', 'error')
-            
-            # Create violation
-            violation = self.create_violation(
-                rule_id=rule_id,
-                message=message,
-                file_path=filename,
-                line=line,
-                column=column,
-                severity_raw=severity,
-                category='type-check',
-                raw_data=item
-            )
-            violations.append(violation)
-        
-        return violations
+        return [self._violation_from_json(item) for item in json_data if isinstance(item, dict)]
     
-def _parse_text_output(self, output: str) -> List[LinterViolation]:
+    def _violation_from_json(self, item: Dict[str, Any]) -> LinterViolation:
+        """Build a violation from one JSON diagnostic."""
+        # Extract violation data
+        rule_id = item.get('code', item.get('error_code', ''))
+        message = item.get('message', '')
+        filename = item.get('file', item.get('filename', ''))
+        
+        line = item.get('line', 0)
+        column = item.get('column', 0)
+        severity = item.get('severity', 'error')
+        
+        return self.create_violation(
+            rule_id=rule_id,
+            message=message,
+            file_path=filename,
+            line=line,
+            column=column,
+            severity_raw=severity,
+            category='type-check',
+            raw_data=item
+        )
+    
+    def _parse_text_output(self, output: str) -> List[LinterViolation]:
         """Parse standard mypy text output."""
         violations = []
         
-        # Pattern: filename:line:column: severity: message [error-code]
-        pattern = r'^(.+?):(\d+):(?:(\d+):)?\s*(error|warning|note):\s*(.+?)(?:\s+\[([^\]]+)\])?$'
-        
         for line in output.strip().split('\n'):
             if not line.strip():
                 continue
-            
-            match = re.match(pattern, line)
-            if not match:
-                # Try simplified pattern without column
-                simple_pattern = r'^(.+?):(\d+):\s*(error|warning|note):\s*(.+?)(?:\s+\[([^\]]+)\])?$'
-                match = re.match(simple_pattern, line)
-                if match:
-                    file_path, line_num, severity, message, error_code = match.groups()
-                    column = None
-                else:
-                    continue
-            else:
-                file_path, line_num, column_str, severity, message, error_code = match.groups()
-                column = int(column_str) if column_str else None
-            
-            # Use error code as rule ID, or generate one from message
-            rule_id = error_code or self._extract_rule_from_message(message)
-            
-            if not self.is_rule_enabled(rule_id):
-                continue
-            
-            violation = self.create_violation(
-                rule_id=rule_id,
-                message=message,
-                file_path=file_path,
-                line=int(line_num),
-                column=column,
-                severity_raw=severity,
-                category='type-check',
-                raw_data={'raw_line': line}
-            )
-            violations.append(violation)
+            violation = self._violation_from_text(line)
+            if violation:
+                violations.append(violation)
         
         return violations
     
-def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
+    def _violation_from_text(self, line: str) -> Optional[LinterViolation]:
+        """Build a violation from one text diagnostic line."""
+        # Pattern: filename:line:column: severity: message [error-code]
+        match = TEXT_LINE_PATTERN.match(line)
+        if not match:
+            # Try simplified pattern without column
+            match = TEXT_LINE_NO_COLUMN_PATTERN.match(line)
+            if match:
+                file_path, line_num, severity, message, error_code = match.groups()
+                column = None
+            else:
+                return None
+        else:
+            file_path, line_num, column_str, severity, message, error_code = match.groups()
+            column = int(column_str) if column_str else None
+        
+        # Use error code as rule ID, or generate one from message
+        rule_id = error_code or self._extract_rule_from_message(message)
+        
+        if not self.is_rule_enabled(rule_id):
+            return None
+        
+        return self.create_violation(
+            rule_id=rule_id,
+            message=message,
+            file_path=file_path,
+            line=int(line_num),
+            column=column,
+            severity_raw=severity,
+            category='type-check',
+            raw_data={'raw_line': line}
+        )
+    
+    def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
         """Convert mypy severity to standard severity."""
         # Apply user overrides first
         if rule_id:
@@ -153,12 +169,12 @@ def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardS
         
         return severity_map.get(tool_severity.lower(), StandardSeverity.ERROR)
     
-def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
+    def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
         """Determine violation type from mypy rule ID."""
         # All mypy violations are type-related
         return ViolationType.TYPE
     
-def _extract_rule_from_message(self, message: str) -> str:
+    def _extract_rule_from_message(self, message: str) -> str:
         """Extract or generate rule ID from error message."""
         # Common mypy error patterns
         patterns = {
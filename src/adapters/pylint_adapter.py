@@ -1,6 +1,6 @@
 """Pylint linter adapter implementation."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 
 from src.adapters.base_adapter import BaseLinterAdapter
@@ -11,11 +11,20 @@ from src.models.linter_models import (
 class PylintAdapter(BaseLinterAdapter):
     """Adapter for pylint Python linter."""
     
-def __init__(self, config: LinterConfig):
+    native_parallelism = True
+    # Import and inference checks read other modules, so per-file results go stale
+    cacheable = False
+    stream_format = 'json_array'
+    
+    def __init__(self, config: LinterConfig):
         super().__init__(config)
         self.tool_name = "pylint"
     
-def get_command_args(self, target_paths: List[str]) -> List[str]:
+    def get_parallel_args(self, jobs: int) -> List[str]:
+        """Use pylint's own worker processes."""
+        return ['--jobs', str(jobs)]
+    
+    def get_command_args(self, target_paths: List[str]) -> List[str]:
         """Build pylint command arguments."""
         cmd = self.config.get_command_base()
         
@@ -34,56 +43,51 @@ def get_command_args(self, target_paths: List[str]) -> List[str]:
         
         return cmd
     
-def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
+    def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
         """Parse pylint JSON output into standardized violations."""
-        violations = []
-        
         if not raw_output.strip():
-            return violations
+            return []
+        return self.parse_records(raw_output)
+    
+    def parse_record(self, item: Any) -> Optional[LinterViolation]:
+        """Convert one pylint JSON result to a violation."""
+        if not isinstance(item, dict):
+            return None
+        
+        # Extract violation data
+        rule_id = item.get('symbol', item.get('message-id', ''))
+        if not rule_id or not self.is_rule_enabled(rule_id):
+            return None
         
-        # Parse JSON output
-        json_data = self.safe_json_parse(raw_output)
+        # Get message and type information
+        message = item.get('message', '')
+        msg_type = item.get('type', '')
+        category = item.get('category', msg_type)
         
-        for item in json_data:
-            if not isinstance(item, dict):
-                continue
-            
-            # Extract violation data
-            rule_id = item.get('symbol', item.get('message-id', ''))
-            if not rule_id or not self.is_rule_enabled(rule_id):
-                continue
-            
-            # Get message and type information
-            message = item.get('message', '')
-            msg_type = item.get('type', '')
-            category = item.get('category', msg_type)
-            
-            # Extract position information
-            line = item.get('line', 0)
-            column = item.get('column', 0)
-            end_line = item.get('endLine')
-            end_column = item.get('endColumn')
-            
-            # Create violation
-            violation = self.create_violation(
-                rule_id=rule_id,
-                message=message,
-                file_path=item.get('path', ''),
-                line=line,
-                column=column,
-                end_line=end_line,
-                end_column=end_column,
-                severity_raw=msg_type,
-                category=category,
-                confidence=item.get('confidence', ''),
-                rule_description=item.get('obj', ''),  # Object/context info
-                raw_data=item
-            )
-            violations.append(violation)
+        # Extract position information
+        line = item.get('line', 0)
+        column = item.get('column', 0)
+        end_line = item.get('endLine')
+        end_column = item.get('endColumn')
         
-        return violations
+        # Create violation
+        violation = self.create_violation(
+            rule_id=rule_id,
+            message=message,
+            file_path=item.get('path', ''),
+            line=line,
+            column=column,
+            end_line=end_line,
+            end_column=end_column,
+            severity_raw=msg_type,
+            category=category,
+            confidence=item.get('confidence', ''),
+            rule_description=item.get('obj', ''),  # Object/context info
+            raw_data=item
+        )
+        return violation
     
-def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
+    def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
         """Convert pylint message type to standard severity."""
         # Apply user overrides first
         if rule_id:
@@ -110,7 +114,7 @@ def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardS
         
         return severity_map.get(tool_severity.lower(), StandardSeverity.WARNING)
     
-def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
+    def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
         """Determine violation type from pylint rule ID and category."""
         if not rule_id:
             return ViolationType.STYLE
@@ -150,7 +154,7 @@ def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
         
         return category_map.get(category.lower(), ViolationType.STYLE)
     
-def _get_confidence_level(self, confidence: str) -> str:
+    def _get_confidence_level(self, confidence: str) -> str:
         """Normalize pylint confidence levels."""
         confidence_map = {
             'HIGH': 'high',
@@ -11,11 +11,15 @@ from src.models.linter_models import (
 class RuffAdapter(BaseLinterAdapter):
     """Adapter for Ruff Python linter and formatter."""
     
-def __init__(self, config: LinterConfig):
+    # Ruff checks files on all cores by itself; sharding only adds startup cost
+    native_parallelism = True
+    stream_format = 'json_array'
+    
+    def __init__(self, config: LinterConfig):
         super().__init__(config)
         self.tool_name = "ruff"
     
-def get_command_args(self, target_paths: List[str]) -> List[str]:
+    def get_command_args(self, target_paths: List[str]) -> List[str]:
         """Build ruff command arguments."""
         cmd = self.config.get_command_base()
         
@@ -34,75 +38,70 @@ def get_command_args(self, target_paths: List[str]) -> List[str]:
         
         return cmd
     
-def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
+    def parse_output(self, raw_output: str, stderr: str = "") -> List[LinterViolation]:
         """Parse ruff JSON output into standardized violations."""
-        violations = []
-        
         if not raw_output.strip():
-            return violations
-        
-        # Parse JSON output
-        json_data = self.safe_json_parse(raw_output)
-        
-        for item in json_data:
-            if not isinstance(item, dict):
-                continue
-            
-            # Extract violation data
-            rule_id = item.get('code', '')
-            if not rule_id or not self.is_rule_enabled(rule_id):
-                continue
-            
-            # Get message and location
-            message = item.get('message', '')
-            filename = item.get('filename', '')
-            
-            # Extract location information
-            location = item.get('location', {})
-            line = location.get('row', 0)
-            column = location.get('column', 0)
-            
-            # Extract end location if available
-            end_location = item.get('end_location', {})
-            end_line = end_location.get('row') if end_location else None
-            end_column = end_location.get('column') if end_location else None
-            
-            # Extract fix suggestion if available
-            fix_suggestion = None
-            if 'fix' in item:
-                fix_data = item['fix']
-                if isinstance(fix_data, dict) and 'applicability' in fix_data:
-                    # Ruff provides structured fix data
-                    applicability = fix_data.get('applicability', '')
-                    if applicability in ['automatic', 'suggested']:
-                        # Extract fix message or edits
-                        edits = fix_data.get('edits', [])
-                        if edits:
-                            fix_suggestion = f"Automatic fix available ({len(edits)} edits)"
-            
-            # Determine URL for rule documentation
-            rule_url = self._get_rule_url(rule_id)
-            
-            # Create violation
-            violation = self.create_violation(
-                rule_id=rule_id,
-                message=message,
-                file_path=filename,
-                line=line,
-                column=column,
-                end_line=end_line,
-                end_column=end_column,
-                severity_raw=self._get_severity_from_rule(rule_id),
-                category=self._get_category_from_rule(rule_id),
-                fix_suggestion=fix_suggestion,
-                rule_description=rule_url,
-                raw_data=item
-            )
-            violations.append(violation)
-        
-        return violations
+            return []
+        return self.parse_records(raw_output)
+    
+    def parse_record(self, item: Any) -> Optional[LinterViolation]:
+        """Convert one ruff JSON result to a violation."""
+        if not isinstance(item, dict):
+            return None
+        
+        # Extract violation data
+        rule_id = item.get('code', '')
+        if not rule_id or not self.is_rule_enabled(rule_id):
+            return None
+        
+        # Get message and location
+        message = item.get('message', '')
+        filename = item.get('filename', '')
+        
+        # Extract location information
+        location = item.get('location', {})
+        line = location.get('row', 0)
+        column = location.get('column', 0)
+        
+        # Extract end location if available
+        end_location = item.get('end_location', {})
+        end_line = end_location.get('row') if end_location else None
+        end_column = end_location.get('column') if end_location else None
+        
+        # Extract fix suggestion if available
+        fix_suggestion = None
+        if 'fix' in item:
+            fix_data = item['fix']
+            if isinstance(fix_data, dict) and 'applicability' in fix_data:
+                # Ruff provides structured fix data
+                applicability = fix_data.get('applicability', '')
+                if applicability in ['automatic', 'suggested']:
+                    # Extract fix message or edits
+                    edits = fix_data.get('edits', [])
+                    if edits:
+                        fix_suggestion = f"Automatic fix available ({len(edits)} edits)"
+        
+        # Determine URL for rule documentation
+        rule_url = self._get_rule_url(rule_id)
+        
+        # Create violation
+        violation = self.create_violation(
+            rule_id=rule_id,
+            message=message,
+            file_path=filename,
+            line=line,
+            column=column,
+            end_line=end_line,
+            end_column=end_column,
+            severity_raw=self._get_severity_from_rule(rule_id),
+            category=self._get_category_from_rule(rule_id),
+            fix_suggestion=fix_suggestion,
+            rule_description=rule_url,
+            raw_data=item
+        )
+        return violation
     
-def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
+    def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardSeverity:
         """Convert ruff severity to standard severity."""
         # Apply user overrides first
         if rule_id:
@@ -139,7 +138,7 @@ def normalize_severity(self, tool_severity: str, rule_id: str = "") -> StandardS
         
         return severity_map.get(tool_severity.lower(), StandardSeverity.WARNING)
     
-def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
+    def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
         """Determine violation type from ruff rule ID."""
         if not rule_id:
             return ViolationType.STYLE
@@ -188,7 +187,7 @@ def get_violation_type(self, rule_id: str, category: str = "") -> ViolationType:
         
         return ViolationType.STYLE
     
-def _get_severity_from_rule(self, rule_id: str) -> str:
+    def _get_severity_from_rule(self, rule_id: str) -> str:
         """Get severity string based on rule type."""
         if rule_id.startswith(('F', 'E9', 'B0', 'S1')):
             return "error"
@@ -197,7 +196,7 @@ def _get_severity_from_rule(self, rule_id: str) -> str:
         else:
             return "info"
     
-def _get_category_from_rule(self, rule_id: str) -> str:
+    def _get_category_from_rule(self, rule_id: str) -> str:
         """Get category description from rule ID."""
         category_map = {
             'F': 'PyFlakes',
@@ -228,7 +227,7 @@ def _get_category_from_rule(self, rule_id: str) -> str:
         
         return 'Unknown'
     
-def _get_rule_url(self, rule_id: str) -> Optional[str]:
+    def _get_rule_url(self, rule_id: str) -> Optional[str]:
         """Get documentation URL for a rule."""
         if rule_id:
             # Ruff documentation URLs
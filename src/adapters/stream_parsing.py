@@ -0,0 +1,66 @@
+"""Incremental parsers for linter stdout."""
+
+from typing import Any, List
+import json
+
+class JSONArrayStreamParser:
+    """
+    Yield the elements of a top-level JSON array as their text arrives.
+
+    Also accepts concatenated JSON values (one object per line), since it
+    only skips the separators between values. Memory is bounded by the
+    largest single element, not by the whole document.
+    """
+
+    _SEPARATORS = " \t\r\n,[]"
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[Any]:
+        """Add text; return every element completed by it."""
+        self._buffer += text
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Return what is left at end of stream; a malformed tail raises ValueError."""
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> List[Any]:
+        values = []
+        buffer = self._buffer
+        position = 0
+        length = len(buffer)
+        while True:
+            while position < length and buffer[position] in self._SEPARATORS:
+                position += 1
+            if position >= length:
+                break
+            try:
+                value, position = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if final:
+                    self._buffer = ""
+                    raise ValueError(f"Malformed JSON near: {buffer[position:position + 80]!r}")
+                break  # element not complete yet
+            values.append(value)
+        self._buffer = buffer[position:]
+        return values
+
+class LineStreamParser:
+    """Yield complete lines as they arrive."""
+
+    def __init__(self):
+        self._partial = ""
+
+    def feed(self, text: str) -> List[str]:
+        """Add text; return every line completed by it."""
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        return lines
+
+    def close(self) -> List[str]:
+        """Return the unterminated last line, if any."""
+        tail, self._partial = self._partial, ""
+        return [tail] if tail else []
@@ -9,6 +9,11 @@ from lib.shared.utilities import get_logger
 import configparser
 import yaml
 
+from src.models.linter_models import LinterConfig, StandardSeverity
+from src.patterns.base.configuration_factory import ConfigFactory, ConfigurationManager, ConfigValidator
+
+logger = get_logger(__name__)
+
 @dataclass
 class LinterSuiteConfig:
     """Configuration for the complete linter suite."""
@@ -17,6 +22,15 @@ class LinterSuiteConfig:
     max_workers: int = 5
     timeout_per_tool: int = 300  # seconds
     
+    # Sharding: split each tool's file list across subprocesses
+    cpu_budget: int = 0  # concurrent linter processes; 0 = os.cpu_count()
+    min_shard_files: int = 50  # never make shards smaller than this
+    max_argv_bytes: int = 100_000  # keep each command line well under ARG_MAX
+    
+    # Per-file result cache: unchanged files are not re-linted
+    result_cache: bool = True
+    cache_file: str = '.linter_cache/results.json'
+    
     # Tool-specific configurations
     tool_configs: Dict[str, LinterConfig] = field(default_factory=dict)
     
@@ -55,6 +69,9 @@ class LinterConfigValidator(ConfigValidator):
         if 'max_workers' in config and config['max_workers'] <= 0:
             errors.append("max_workers must be positive")
 
+        if 'cpu_budget' in config and config['cpu_budget'] < 0:
+            errors.append("cpu_budget must be zero (auto) or positive")
+
         return errors
 
     def get_validator_name(self) -> str:
@@ -80,6 +97,9 @@ class LinterSuiteConfigFactory(ConfigFactory[LinterSuiteConfig]):
             suite_config.max_workers = config_data['max_workers']
         if 'timeout_per_tool' in config_data:
             suite_config.timeout_per_tool = config_data['timeout_per_tool']
+        for key in ('cpu_budget', 'min_shard_files', 'max_argv_bytes', 'result_cache', 'cache_file'):
+            if key in config_data:
+                setattr(suite_config, key, config_data[key])
 
         return suite_config
 
@@ -120,7 +140,7 @@ class LinterConfigManager:
             'timeout_per_tool': 300
         }
     
-def load_config(self, config_file: str) -> None:
+    def load_config(self, config_file: str) -> None:
         """Load configuration from file."""
         config_path = Path(config_file)
         
@@ -138,21 +158,21 @@ def load_config(self, config_file: str) -> None:
         except Exception as e:
             logger.error(f"Failed to load config from {config_file}: {e}")
     
-def _load_yaml_config(self, config_path: Path) -> None:
+    def _load_yaml_config(self, config_path: Path) -> None:
         """Load YAML configuration."""
         with open(config_path, 'r') as f:
             data = yaml.safe_load(f)
         
         self._apply_config_data(data)
     
-def _load_json_config(self, config_path: Path) -> None:
+    def _load_json_config(self, config_path: Path) -> None:
         """Load JSON configuration."""
         with open(config_path, 'r') as f:
             data = json.load(f)
         
         self._apply_config_data(data)
     
-def _apply_config_data(self, data: Dict[str, Any]) -> None:
+    def _apply_config_data(self, data: Dict[str, Any]) -> None:
         """Apply configuration data to suite config."""
         if 'enabled_tools' in data:
             self.suite_config.enabled_tools = data['enabled_tools']
@@ -166,6 +186,10 @@ def _apply_config_data(self, data: Dict[str, Any]) -> None:
         if 'timeout_per_tool' in data:
             self.suite_config.timeout_per_tool = data['timeout_per_tool']
         
+        for key in ('cpu_budget', 'min_shard_files', 'max_argv_bytes', 'result_cache', 'cache_file'):
+            if key in data:
+                setattr(self.suite_config, key, data[key])
+        
         if 'min_severity' in data:
             self.suite_config.min_severity = StandardSeverity(data['min_severity'])
         
@@ -174,7 +198,7 @@ def _apply_config_data(self, data: Dict[str, Any]) -> None:
             for tool_name, tool_config in data['tools'].items():
                 self.suite_config.tool_configs[tool_name] = self._create_tool_config(tool_name, tool_config)
     
-def _create_tool_config(self, tool_name: str, config_data: Dict[str, Any]) -> LinterConfig:
+    def _create_tool_config(self, tool_name: str, config_data: Dict[str, Any]) -> LinterConfig:
         """Create LinterConfig from configuration data."""
         base_config = self._default_configs.get(tool_name, LinterConfig(tool_name=tool_name))
         
@@ -205,7 +229,7 @@ def _create_tool_config(self, tool_name: str, config_data: Dict[str, Any]) -> Li
         
         return base_config
     
-def get_tool_config(self, tool_name: str) -> LinterConfig:
+    def get_tool_config(self, tool_name: str) -> LinterConfig:
         """Get configuration for a specific tool."""
         if tool_name in self.suite_config.tool_configs:
             return self.suite_config.tool_configs[tool_name]
@@ -213,15 +237,15 @@ def get_tool_config(self, tool_name: str) -> LinterConfig:
         # Return default configuration
         return self._default_configs.get(tool_name, LinterConfig(tool_name=tool_name))
     
-def get_enabled_tools(self) -> List[str]:
+    def get_enabled_tools(self) -> List[str]:
         """Get list of enabled tools."""
         return self.suite_config.enabled_tools
     
-def is_tool_enabled(self, tool_name: str) -> bool:
+    def is_tool_enabled(self, tool_name: str) -> bool:
         """Check if a tool is enabled."""
         return tool_name in self.suite_config.enabled_tools
     
-def _get_default_tool_configs(self) -> Dict[str, LinterConfig]:
+    def _get_default_tool_configs(self) -> Dict[str, LinterConfig]:
         """Get default configurations for all supported tools."""
         return {
             'flake8': LinterConfig(
@@ -251,7 +275,7 @@ def _get_default_tool_configs(self) -> Dict[str, LinterConfig]:
             )
         }
     
-def _find_config_file(self, tool_name: str, possible_files: List[str]) -> Optional[str]:
+    def _find_config_file(self, tool_name: str, possible_files: List[str]) -> Optional[str]:
         """Find configuration file for a tool."""
         for filename in possible_files:
             config_path = Path(filename)
@@ -265,7 +289,7 @@ def _find_config_file(self, tool_name: str, possible_files: List[str]) -> Option
         
         return None
     
-def _config_contains_tool_section(self, config_path: Path, tool_name: str) -> bool:
+    def _config_contains_tool_section(self, config_path: Path, tool_name: str) -> bool:
         """Check if a config file contains a section for the specified tool."""
         try:
             if config_path.suffix == '.toml':
@@ -281,13 +305,18 @@ def _config_contains_tool_section(self, config_path: Path, tool_name: str) -> bo
         except Exception:
             return False
     
-def save_config(self, output_file: str) -> None:
+    def save_config(self, output_file: str) -> None:
         """Save current configuration to file."""
         config_data = {
             'enabled_tools': self.suite_config.enabled_tools,
             'concurrent_execution': self.suite_config.concurrent_execution,
             'max_workers': self.suite_config.max_workers,
             'timeout_per_tool': self.suite_config.timeout_per_tool,
+            'cpu_budget': self.suite_config.cpu_budget,
+            'min_shard_files': self.suite_config.min_shard_files,
+            'max_argv_bytes': self.suite_config.max_argv_bytes,
+            'result_cache': self.suite_config.result_cache,
+            'cache_file': self.suite_config.cache_file,
             'min_severity': self.suite_config.min_severity.value,
             'tools': {}
         }
@@ -1,4 +1,6 @@
-from src.constants.base import MAXIMUM_NESTED_DEPTH
+"""
+High-Performance Parallel Executor
+==================================
 
 This module provides advanced parallel processing capabilities with intelligent
 load balancing, adaptive concurrency control, and minimal overhead execution.
@@ -20,7 +22,9 @@ import multiprocessing as mp
 import time
 import queue
 import weakref
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, Future
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError, as_completed, wait
+)
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional, Any, Callable, Union, Tuple, Iterator
 from collections import defaultdict, deque
@@ -33,7 +37,6 @@ from queue import PriorityQueue, Empty
 import pickle
 import signal
 import os
-"""
 
 @dataclass
 class ExecutionTask:
@@ -299,6 +302,175 @@ class AdaptiveBatchProcessor:
 
         return int(avg_size)
 
+    def partition_by_cost(self,
+                          costs: List[float],
+                          num_workers: int,
+                          chunks_per_worker: int = 4) -> List[List[int]]:
+        """
+        Group item indices into size-aware chunks, most expensive first.
+
+        Each chunk targets an equal share of the estimated total cost, so an
+        expensive item runs alone while cheap items are batched (up to the
+        adaptive batch size) to amortize dispatch overhead.
+        """
+        if not costs:
+            return []
+
+        order = sorted(range(len(costs)), key=lambda index: costs[index], reverse=True)
+        target_cost = sum(costs) / max(1, num_workers * chunks_per_worker)
+        max_items = max(self.min_batch_size, min(self.max_batch_size, self.current_batch_size))
+
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        current_cost = 0.0
+        for index in order:
+            current.append(index)
+            current_cost += costs[index]
+            if (target_cost > 0 and current_cost >= target_cost) or len(current) >= max_items:
+                chunks.append(current)
+                current, current_cost = [], 0.0
+        if current:
+            chunks.append(current)
+        return chunks
+
+@dataclass
+class ChunkOutcome:
+    """Result of one chunk run by the work-stealing process executor."""
+    items: List[Any]
+    result: Any
+    execution_time: float
+    worker_index: int
+    stolen: bool = False
+    error: Optional[str] = None
+
+class WorkStealingProcessExecutor:
+    """
+    Work-stealing execution of size-skewed workloads over process workers.
+
+    Items are grouped into size-aware chunks by AdaptiveBatchProcessor and
+    dealt longest-processing-time first onto per-worker deques. A worker
+    runs chunks from the head of its own deque; once empty it steals from
+    the tail of the deque with the most estimated work left. Exactly one
+    chunk per worker is in flight, so no work sits in the pool's internal
+    queue where it could not be stolen.
+
+    NASA Rule 7: In-flight chunks bounded by max_workers.
+    """
+
+    def __init__(self,
+                 max_workers: int,
+                 use_processes: bool = True,
+                 batch_processor: Optional[AdaptiveBatchProcessor] = None,
+                 chunks_per_worker: int = 4):
+        assert max_workers > 0, "max_workers must be positive"
+        assert chunks_per_worker > 0, "chunks_per_worker must be positive"
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.batch_processor = batch_processor or AdaptiveBatchProcessor()
+        self.chunks_per_worker = chunks_per_worker
+        self.last_run_stats: Dict[str, Any] = {}
+
+    def plan(self, costs: List[float]) -> List[deque]:
+        """Per-worker deques of (estimated_cost, item_indices), dealt LPT-first."""
+        chunks = self.batch_processor.partition_by_cost(costs, self.max_workers, self.chunks_per_worker)
+        weighted = sorted(((sum(costs[i] for i in chunk), chunk) for chunk in chunks),
+                          key=lambda entry: entry[0], reverse=True)
+
+        deques = [deque() for _ in range(self.max_workers)]
+        loads = [0.0] * self.max_workers
+        for chunk_cost, chunk in weighted:
+            worker = min(range(self.max_workers), key=lambda w: (loads[w], len(deques[w])))
+            deques[worker].append((chunk_cost, chunk))
+            loads[worker] += chunk_cost
+        return deques
+
+    def map_chunks(self,
+                   fn: Callable[..., Any],
+                   items: List[Any],
+                   costs: List[float],
+                   *args: Any,
+                   timeout: Optional[float] = None) -> List[ChunkOutcome]:
+        """
+        Run ``fn(chunk_items, *args)`` over all items; outcomes in completion order.
+
+        Raises concurrent.futures.TimeoutError if no chunk completes before
+        the deadline.
+        """
+        assert len(items) == len(costs), "items and costs must align"
+        deques = self.plan(costs)
+        remaining = [sum(entry[0] for entry in worker_deque) for worker_deque in deques]
+        busy_time = [0.0] * self.max_workers
+        outcomes: List[ChunkOutcome] = []
+        steals = 0
+        start_time = time.time()
+        deadline = start_time + timeout if timeout else None
+
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=self.max_workers) as pool:
+            in_flight: Dict[Future, Tuple[int, List[int], bool, float]] = {}
+
+            def dispatch(worker: int) -> None:
+                nonlocal steals
+                entry, stolen = self._next_chunk(worker, deques, remaining)
+                if entry is None:
+                    return
+                steals += int(stolen)
+                chunk = entry[1]
+                future = pool.submit(fn, [items[i] for i in chunk], *args)
+                in_flight[future] = (worker, chunk, stolen, time.time())
+
+            for worker in range(self.max_workers):
+                dispatch(worker)
+
+            while in_flight:
+                wait_timeout = None if deadline is None else max(0.0, deadline - time.time())
+                done, _ = wait(list(in_flight), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError(f"Work-stealing run exceeded {timeout}s")
+
+                for future in done:
+                    worker, chunk, stolen, dispatched_at = in_flight.pop(future)
+                    elapsed = time.time() - dispatched_at
+                    busy_time[worker] += elapsed
+                    try:
+                        outcome = ChunkOutcome([items[i] for i in chunk], future.result(),
+                                               elapsed, worker, stolen)
+                    except Exception as e:
+                        outcome = ChunkOutcome([items[i] for i in chunk], None,
+                                               elapsed, worker, stolen, error=str(e))
+                    outcomes.append(outcome)
+                    self.batch_processor.record_batch_performance(len(chunk), elapsed)
+                    dispatch(worker)
+
+        mean_busy = sum(busy_time) / self.max_workers
+        self.last_run_stats = {
+            'workers': self.max_workers,
+            'chunks': len(outcomes),
+            'steals': steals,
+            'makespan_s': time.time() - start_time,
+            'worker_busy_s': busy_time,
+            'imbalance': max(busy_time) / mean_busy if mean_busy > 0 else 1.0,
+            'batch_size': self.batch_processor.current_batch_size,
+        }
+        return outcomes
+
+    def _next_chunk(self,
+                    worker: int,
+                    deques: List[deque],
+                    remaining: List[float]) -> Tuple[Optional[Tuple[float, List[int]]], bool]:
+        """Pop from the worker's own head, else steal from the busiest tail."""
+        if deques[worker]:
+            entry = deques[worker].popleft()
+            remaining[worker] -= entry[0]
+            return entry, False
+
+        victim = max(range(len(deques)), key=lambda w: (remaining[w], len(deques[w])))
+        if not deques[victim]:
+            return None, False
+        entry = deques[victim].pop()
+        remaining[victim] -= entry[0]
+        return entry, True
+
 class HighPerformanceWorker:
     """High-performance worker with optimized execution."""
 
@@ -336,6 +508,7 @@ class HighPerformanceWorker:
 
         except (OSError, AttributeError):
             # CPU affinity not supported or failed
+            pass
 
     def start(self) -> None:
         """Start worker thread."""
@@ -347,7 +520,7 @@ class HighPerformanceWorker:
         """Stop worker thread."""
         self.running = False
         if self.thread:
-            self.thread.join(timeout=MAXIMUM_NESTED_DEPTH.0)
+            self.thread.join(timeout=5.0)
 
     def _worker_loop(self) -> None:
         """Main worker execution loop."""
@@ -12,6 +12,10 @@ Key Features:
 - Intelligent detector scheduling with priority queuing
 - Resource contention detection and mitigation
 - Adaptive concurrency control with feedback loops
+- Per-file cost history for longest-job-first scheduling
+
+scikit-learn is optional: without it the ML predictor keeps its default
+estimates while concurrency control and file cost history work unchanged.
 """
 
 from collections import defaultdict, deque
@@ -21,19 +25,26 @@ import json
 import logging
 import time
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
 import asyncio
 import math
 import numpy as np
+import os
 import pickle
 import psutil
 import sqlite3
 import threading
 
+try:
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import StandardScaler
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
 @dataclass
 class WorkloadMetrics:
     """Comprehensive workload metrics for analysis."""
@@ -62,7 +73,7 @@ class ResourceAllocation:
 class PredictionModel:
     """Machine learning model for workload prediction."""
     model: Any = None
-    scaler: StandardScaler = field(default_factory=StandardScaler)
+    scaler: Any = field(default_factory=lambda: StandardScaler() if SKLEARN_AVAILABLE else None)
     feature_names: List[str] = field(default_factory=list)
     last_trained: Optional[float] = None
     accuracy_score: float = 0.0
@@ -70,15 +81,16 @@ class PredictionModel:
 class WorkloadPredictor:
     """ML-based workload prediction system."""
 
-def __init__(self, history_size: int = 10000):
+    def __init__(self, history_size: int = 10000):
         self.history_size = history_size
         self.metrics_history: deque = deque(maxlen=history_size)
         self.execution_time_model = PredictionModel()
         self.resource_usage_model = PredictionModel()
         self.retrain_threshold = 0.8  # Retrain if accuracy drops below 80%
         self.min_samples_for_training = 100
+        self.file_costs = get_global_file_cost_estimator()
 
-def record_metrics(self, metrics: WorkloadMetrics) -> None:
+    def record_metrics(self, metrics: WorkloadMetrics) -> None:
         """Record workload metrics for analysis."""
         self.metrics_history.append(metrics)
 
@@ -87,7 +99,7 @@ def record_metrics(self, metrics: WorkloadMetrics) -> None:
             len(self.metrics_history) >= self.min_samples_for_training):
             self._retrain_models()
 
-def _extract_features(self, metrics: WorkloadMetrics) -> List[float]:
+    def _extract_features(self, metrics: WorkloadMetrics) -> List[float]:
         """Extract features for ML models."""
         return [
             metrics.queue_depth,
@@ -100,7 +112,7 @@ def _extract_features(self, metrics: WorkloadMetrics) -> List[float]:
             time.time() % 86400,  # Time of day
         ]
 
-def _prepare_training_data(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def _prepare_training_data(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Prepare training data from metrics history."""
         if len(self.metrics_history) < self.min_samples_for_training:
             return None, None, None
@@ -120,8 +132,11 @@ def _prepare_training_data(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
 
         return np.array(features), np.array(execution_times), np.array(resource_usage)
 
-def _retrain_models(self) -> None:
+    def _retrain_models(self) -> None:
         """Retrain ML models with latest data."""
+        if not SKLEARN_AVAILABLE:
+            return
+
         try:
             features, execution_times, resource_usage = self._prepare_training_data()
 
@@ -169,7 +184,7 @@ def _retrain_models(self) -> None:
         except Exception as e:
             logging.error(f"Model retraining failed: {e}")
 
-def predict_execution_time(self,
+    def predict_execution_time(self,
                             queue_depth: int,
                             concurrency_level: int,
                             system_load: float,
@@ -199,7 +214,7 @@ def predict_execution_time(self,
             logging.warning(f"Execution time prediction failed: {e}")
             return 1.0
 
-def predict_resource_usage(self,
+    def predict_resource_usage(self,
                                 queue_depth: int,
                                 concurrency_level: int,
                                 system_load: float,
@@ -230,17 +245,33 @@ def predict_resource_usage(self,
             return 0.5
 
 class AdaptiveConcurrencyController:
-    """Adaptive concurrency control with feedback loops."""
-
-def __init__(self, initial_concurrency: int = 4):
-        self.current_concurrency = initial_concurrency
-        self.min_concurrency = 1
-        self.max_concurrency = min(32, psutil.cpu_count() * 2)
+    """
+    Adaptive concurrency control with feedback loops.
+
+    ``record_batch`` hill-climbs the worker count on measured throughput:
+    a step that raised throughput is repeated, a step that lowered it is
+    reversed, and a plateau holds. Growth is capped by the queue depth, and
+    low memory headroom halves the worker count (multiplicative decrease).
+
+    NASA Rule 7: Concurrency bounded by [min_concurrency, max_concurrency].
+    """
+
+    def __init__(self, initial_concurrency: int = 4,
+                    min_concurrency: int = 1,
+                    max_concurrency: Optional[int] = None,
+                    min_memory_headroom_mb: float = 256.0,
+                    throughput_tolerance: float = 0.05):
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max_concurrency or min(32, (psutil.cpu_count() or 1) * 2)
+        assert self.min_concurrency <= self.max_concurrency, "min_concurrency exceeds max_concurrency"
+        self.current_concurrency = max(self.min_concurrency, min(self.max_concurrency, initial_concurrency))
 
         # Control parameters
         self.target_overhead = 0.1  # 1% target overhead
         self.overhead_tolerance = 0.5  # 0.5% tolerance
         self.adjustment_factor = 0.2  # How aggressively to adjust
+        self.min_memory_headroom_mb = min_memory_headroom_mb
+        self.throughput_tolerance = throughput_tolerance
 
         # Feedback tracking
         self.recent_overheads: deque = deque(maxlen=10)
@@ -248,12 +279,70 @@ def __init__(self, initial_concurrency: int = 4):
         self.last_adjustment = 0
         self.adjustment_cooldown = 30.0  # 30 seconds between adjustments
 
-def record_performance(self, overhead: float, throughput: float) -> None:
+        # Hill-climbing state
+        self._last_throughput: Optional[float] = None
+        self._direction = 1
+        self._lock = threading.Lock()
+        self.adjustments: deque = deque(maxlen=100)
+
+    def record_performance(self, overhead: float, throughput: float) -> None:
         """Record performance metrics for feedback control."""
         self.recent_overheads.append(overhead)
         self.recent_throughputs.append(throughput)
 
-def should_adjust(self) -> bool:
+    def record_batch(self, items_completed: int, elapsed: float, queue_depth: int = 0) -> int:
+        """
+        Feed one completed batch of work; returns the concurrency to use next.
+
+        Args:
+            items_completed: Work items finished in the batch
+            elapsed: Wall time of the batch in seconds
+            queue_depth: Items still waiting to be processed
+        """
+        assert items_completed >= 0, "items_completed cannot be negative"
+        throughput = items_completed / max(elapsed, 1e-6)
+        self.recent_throughputs.append(throughput)
+
+        with self._lock:
+            current = self.current_concurrency
+            if self.memory_headroom_mb() < self.min_memory_headroom_mb:
+                # Multiplicative decrease under memory pressure
+                target, reason = current // 2, 'memory_pressure'
+                self._direction = 1
+            elif self._last_throughput is None:
+                target, reason = current + self._direction, 'probe'
+            else:
+                gain = (throughput - self._last_throughput) / max(self._last_throughput, 1e-9)
+                if gain < -self.throughput_tolerance:
+                    self._direction = -self._direction
+                    target, reason = current + self._direction, 'throughput_drop'
+                elif gain > self.throughput_tolerance:
+                    target, reason = current + self._direction, 'throughput_gain'
+                else:
+                    target, reason = current, 'plateau'
+
+            # No point running more workers than there is queued work
+            if queue_depth > 0:
+                target = min(target, max(queue_depth, self.min_concurrency))
+            target = max(self.min_concurrency, min(self.max_concurrency, target))
+            self._last_throughput = throughput
+
+            if target != current:
+                logging.debug(f"Adjusting concurrency: {current} -> {target} ({reason}, "
+                                f"throughput {throughput:.2f}/s, queue depth {queue_depth})")
+                self.current_concurrency = target
+                self.last_adjustment = time.time()
+                self.adjustments.append((time.time(), current, target, reason))
+            return self.current_concurrency
+
+    def memory_headroom_mb(self) -> float:
+        """Available system memory in megabytes."""
+        try:
+            return psutil.virtual_memory().available / (1024 * 1024)
+        except Exception:
+            return float('inf')
+
+    def should_adjust(self) -> bool:
         """Determine if concurrency adjustment is needed."""
         if time.time() - self.last_adjustment < self.adjustment_cooldown:
             return False
@@ -264,7 +353,7 @@ def should_adjust(self) -> bool:
         avg_overhead = sum(self.recent_overheads) / len(self.recent_overheads)
         return abs(avg_overhead - self.target_overhead) > self.overhead_tolerance
 
-def adjust_concurrency(self) -> int:
+    def adjust_concurrency(self) -> int:
         """Adjust concurrency based on recent performance."""
         if not self.should_adjust():
             return self.current_concurrency
@@ -299,7 +388,7 @@ def adjust_concurrency(self) -> int:
 
         return self.current_concurrency
 
-def get_optimal_concurrency(self,
+    def get_optimal_concurrency(self,
                                 queue_size: int,
                                 system_load: float,
                                 predicted_execution_time: float) -> int:
@@ -321,28 +410,116 @@ def get_optimal_concurrency(self,
 
         return max(self.min_concurrency, min(self.max_concurrency, base_concurrency))
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Current concurrency and recent adjustments."""
+        return {
+            'current_concurrency': self.current_concurrency,
+            'min_concurrency': self.min_concurrency,
+            'max_concurrency': self.max_concurrency,
+            'last_throughput': self._last_throughput,
+            'recent_adjustments': [
+                {'timestamp': ts, 'from': old, 'to': new, 'reason': reason}
+                for ts, old, new, reason in list(self.adjustments)[-10:]
+            ],
+        }
+
+class FileCostEstimator:
+    """
+    Per-file analysis cost history for longest-job-first scheduling.
+
+    Known files are estimated from an exponentially weighted average of
+    their measured analysis times; unseen files from their size times the
+    observed seconds-per-byte rate.
+
+    NASA Rule 7: History bounded by max_entries (LRU).
+    """
+
+    # Seconds per byte assumed before any file has been measured
+    DEFAULT_SECONDS_PER_BYTE = 1e-6
+
+    def __init__(self, max_entries: int = 10000, smoothing: float = 0.5):
+        assert max_entries > 0, "max_entries must be positive"
+        assert 0.0 < smoothing <= 1.0, "smoothing must be in (0, 1]"
+        self.max_entries = max_entries
+        self.smoothing = smoothing
+        self._costs: OrderedDict = OrderedDict()
+        self._seconds_per_byte: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, file_path: str, seconds: float, size_bytes: Optional[int] = None) -> None:
+        """Record one measured analysis time for a file."""
+        key = str(file_path)
+        with self._lock:
+            previous = self._costs.pop(key, None)
+            cost = seconds if previous is None else previous + self.smoothing * (seconds - previous)
+            self._costs[key] = cost
+            while len(self._costs) > self.max_entries:
+                self._costs.popitem(last=False)
+
+            if size_bytes:
+                rate = seconds / size_bytes
+                self._seconds_per_byte = rate if self._seconds_per_byte is None else \
+                    self._seconds_per_byte + self.smoothing * (rate - self._seconds_per_byte)
+
+    def estimate(self, file_path: str, size_bytes: Optional[int] = None) -> float:
+        """Estimated analysis time in seconds."""
+        key = str(file_path)
+        with self._lock:
+            cost = self._costs.get(key)
+            rate = self._seconds_per_byte
+        if cost is not None:
+            return cost
+        if size_bytes is None:
+            try:
+                size_bytes = os.path.getsize(key)
+            except OSError:
+                size_bytes = 0
+        return size_bytes * (rate if rate is not None else self.DEFAULT_SECONDS_PER_BYTE)
+
+    def order_longest_first(self, file_paths: List[Any]) -> List[Any]:
+        """File paths sorted by descending estimated cost (stable for ties)."""
+        estimates = {id(path): self.estimate(path) for path in file_paths}
+        return sorted(file_paths, key=lambda path: estimates[id(path)], reverse=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """History size and learned rate."""
+        with self._lock:
+            return {'files_tracked': len(self._costs), 'seconds_per_byte': self._seconds_per_byte}
+
+_global_file_cost_estimator: Optional[FileCostEstimator] = None
+_file_cost_estimator_lock = threading.Lock()
+
+def get_global_file_cost_estimator() -> FileCostEstimator:
+    """Process-wide file cost history shared by all schedulers."""
+    global _global_file_cost_estimator
+    if _global_file_cost_estimator is None:
+        with _file_cost_estimator_lock:
+            if _global_file_cost_estimator is None:
+                _global_file_cost_estimator = FileCostEstimator()
+    return _global_file_cost_estimator
+
 class PriorityScheduler:
     """Intelligent detector scheduling with priority queuing."""
 
-def __init__(self):
+    def __init__(self):
         self.priority_queues: Dict[int, deque] = defaultdict(deque)
         self.detector_priorities: Dict[str, int] = {}
         self.detector_weights: Dict[str, float] = {}
         self.execution_counts: Dict[str, int] = defaultdict(int)
         self.last_execution: Dict[str, float] = {}
 
-def set_detector_priority(self, detector_name: str, priority: int, weight: float = 1.0) -> None:
+    def set_detector_priority(self, detector_name: str, priority: int, weight: float = 1.0) -> None:
         """Set priority and weight for a detector."""
         self.detector_priorities[detector_name] = priority
         self.detector_weights[detector_name] = weight
 
-def enqueue_task(self, detector_name: str, args: tuple, kwargs: dict) -> None:
+    def enqueue_task(self, detector_name: str, args: tuple, kwargs: dict) -> None:
         """Enqueue a task with priority-based scheduling."""
         priority = self.detector_priorities.get(detector_name, 5)  # Default priority
         task = (detector_name, args, kwargs, time.time())
         self.priority_queues[priority].append(task)
 
-def dequeue_batch(self, batch_size: int) -> List[Tuple[str, tuple, dict]]:
+    def dequeue_batch(self, batch_size: int) -> List[Tuple[str, tuple, dict]]:
         """Dequeue a batch of tasks with optimal scheduling."""
         batch = []
 
@@ -364,7 +541,7 @@ def dequeue_batch(self, batch_size: int) -> List[Tuple[str, tuple, dict]]:
 
         return batch
 
-def _should_schedule(self, detector_name: str) -> bool:
+    def _should_schedule(self, detector_name: str) -> bool:
         """Determine if detector should be scheduled based on fairness."""
         current_time = time.time()
         last_exec = self.last_execution.get(detector_name, 0)
@@ -375,7 +552,7 @@ def _should_schedule(self, detector_name: str) -> bool:
 
         return current_time - last_exec >= min_interval
 
-def get_queue_stats(self) -> Dict[str, Any]:
+    def get_queue_stats(self) -> Dict[str, Any]:
         """Get current queue statistics."""
         total_queued = sum(len(queue) for queue in self.priority_queues.values())
         queue_sizes = {priority: len(queue) for priority, queue in self.priority_queues.items()}
@@ -390,14 +567,14 @@ def get_queue_stats(self) -> Dict[str, Any]:
 class ResourceContentionDetector:
     """Detect and mitigate resource contention issues."""
 
-def __init__(self):
+    def __init__(self):
         self.cpu_usage_history: deque = deque(maxlen=60)  # 1 minute of data
         self.memory_usage_history: deque = deque(maxlen=60)
         self.io_wait_history: deque = deque(maxlen=60)
         self.contention_threshold = 0.85
         self.contention_events: List[Dict] = []
 
-def record_system_metrics(self) -> None:
+    def record_system_metrics(self) -> None:
         """Record current system metrics."""
         try:
             cpu_percent = psutil.cpu_percent(interval=1)
@@ -414,7 +591,7 @@ def record_system_metrics(self) -> None:
         except Exception as e:
             logging.warning(f"Failed to record system metrics: {e}")
 
-def detect_contention(self) -> Dict[str, Any]:
+    def detect_contention(self) -> Dict[str, Any]:
         """Detect resource contention and return mitigation suggestions."""
         if not self.cpu_usage_history:
             return {'contention_detected': False}
@@ -461,7 +638,7 @@ def detect_contention(self) -> Dict[str, Any]:
 class WorkloadOptimizer:
     """Main workload optimization coordinator."""
 
-def __init__(self):
+    def __init__(self):
         self.predictor = WorkloadPredictor()
         self.concurrency_controller = AdaptiveConcurrencyController()
         self.scheduler = PriorityScheduler()
@@ -474,7 +651,7 @@ def __init__(self):
         # Performance tracking
         self.optimization_history: List[Dict] = []
 
-def register_detector(self,
+    def register_detector(self,
                         detector_name: str,
                         priority: int = 5,
                         weight: float = 1.0,
@@ -482,7 +659,7 @@ def register_detector(self,
         """Register detector with optimization system."""
         self.scheduler.set_detector_priority(detector_name, priority, weight)
 
-def record_execution_metrics(self, metrics: WorkloadMetrics) -> None:
+    def record_execution_metrics(self, metrics: WorkloadMetrics) -> None:
         """Record execution metrics for optimization."""
         self.predictor.record_metrics(metrics)
 
@@ -492,7 +669,7 @@ def record_execution_metrics(self, metrics: WorkloadMetrics) -> None:
 
         self.concurrency_controller.record_performance(overhead, throughput)
 
-def optimize_allocation(self,
+    def optimize_allocation(self,
                             pending_tasks: List[Tuple[str, tuple, dict]],
                             current_system_load: float) -> ResourceAllocation:
         """Optimize resource allocation for pending tasks."""
@@ -588,7 +765,7 @@ def optimize_allocation(self,
 
         return allocation
 
-def _get_default_allocation(self) -> ResourceAllocation:
+    def _get_default_allocation(self) -> ResourceAllocation:
         """Get default resource allocation when optimization is disabled."""
         return ResourceAllocation(
             max_threads=4,
@@ -599,7 +776,7 @@ def _get_default_allocation(self) -> ResourceAllocation:
             confidence_score=0.5
         )
 
-def get_optimization_stats(self) -> Dict[str, Any]:
+    def get_optimization_stats(self) -> Dict[str, Any]:
         """Get optimization statistics and performance metrics."""
         if not self.optimization_history:
             return {'status': 'no_data'}
@@ -628,17 +805,17 @@ def get_optimization_stats(self) -> Dict[str, Any]:
             }
         }
 
-def enable_optimization(self) -> None:
+    def enable_optimization(self) -> None:
         """Enable workload optimization."""
         self.optimization_enabled = True
         logging.info("Workload optimization enabled")
 
-def disable_optimization(self) -> None:
+    def disable_optimization(self) -> None:
         """Disable workload optimization."""
         self.optimization_enabled = False
         logging.info("Workload optimization disabled")
 
-def save_state(self, filepath: str) -> None:
+    def save_state(self, filepath: str) -> None:
         """Save optimizer state for persistence."""
         state = {
             'optimization_history': self.optimization_history,
@@ -651,7 +828,7 @@ def save_state(self, filepath: str) -> None:
         with open(filepath, 'wb') as f:
             pickle.dump(state, f)
 
-def load_state(self, filepath: str) -> None:
+    def load_state(self, filepath: str) -> None:
         """Load optimizer state for persistence."""
         try:
             with open(filepath, 'rb') as f:
@@ -44,11 +44,13 @@ class UnifiedSeverityMapper:
     Provides consistent violation classification across flake8, pylint, ruff, mypy, bandit.
     """
     
-def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None):
         self.severity_rules: Dict[str, List[SeverityRule]] = {}
         self.tool_mappings: Dict[str, Dict[str, UnifiedSeverity]] = {}
         self.category_mappings: Dict[str, Dict[str, ViolationCategory]] = {}
         self.config_path = config_path
+        # Resolved (tool, rule, tool severity) lookups; prefix matching is a linear scan
+        self._severity_cache: Dict[Tuple[str, str, str], UnifiedSeverity] = {}
         
         # Load default mappings
         self._load_default_mappings()
@@ -57,7 +59,7 @@ def __init__(self, config_path: Optional[str] = None):
         if config_path:
             self._load_custom_config(config_path)
             
-def _load_default_mappings(self) -> None:
+    def _load_default_mappings(self) -> None:
         """Load default severity mappings for all supported tools"""
         
         # Flake8 mappings
@@ -155,7 +157,7 @@ def _load_default_mappings(self) -> None:
             "LOW": UnifiedSeverity.MEDIUM,
         }
         
-def _load_custom_config(self, config_path: str) -> None:
+    def _load_custom_config(self, config_path: str) -> None:
         """Load custom severity mappings from configuration file"""
         try:
             path = Path(config_path)
@@ -175,11 +177,12 @@ def _load_custom_config(self, config_path: str) -> None:
                     
                 for pattern, severity in mappings.items():
                     self.tool_mappings[tool][pattern] = UnifiedSeverity(severity)
+            self._severity_cache.clear()
                     
         except Exception as e:
             print(f"Warning: Could not load custom config from {config_path}: {e}")
             
-def map_severity(self, tool_name: str, rule_code: str, tool_severity: str = None) -> UnifiedSeverity:
+    def map_severity(self, tool_name: str, rule_code: str, tool_severity: str = None) -> UnifiedSeverity:
         """
         Map tool-specific rule code and severity to unified severity.
         
@@ -191,8 +194,14 @@ def map_severity(self, tool_name: str, rule_code: str, tool_severity: str = None
         Returns:
             Unified severity level
         """
-        tool_name = tool_name.lower()
+        key = (tool_name.lower(), rule_code or "", tool_severity or "")
+        severity = self._severity_cache.get(key)
+        if severity is None:
+            severity = self._severity_cache[key] = self._resolve_severity(*key)
+        return severity
         
+    def _resolve_severity(self, tool_name: str, rule_code: str, tool_severity: str) -> UnifiedSeverity:
+        """Uncached lookup behind map_severity()."""
         if tool_name not in self.tool_mappings:
             return UnifiedSeverity.MEDIUM  # Default fallback
             
@@ -214,7 +223,7 @@ def map_severity(self, tool_name: str, rule_code: str, tool_severity: str = None
         # Default fallback
         return UnifiedSeverity.MEDIUM
         
-def categorize_violation(self, tool_name: str, rule_code: str, message: str) -> ViolationCategory:
+    def categorize_violation(self, tool_name: str, rule_code: str, message: str) -> ViolationCategory:
         """
         Categorize violation based on tool, rule code, and message content.
         
@@ -274,7 +283,7 @@ def categorize_violation(self, tool_name: str, rule_code: str, message: str) ->
         # Maintainability (default fallback)
         return ViolationCategory.MAINTAINABILITY
         
-def get_severity_distribution(self, violations: List[Dict[str, Any]]) -> Dict[str, int]:
+    def get_severity_distribution(self, violations: List[Dict[str, Any]]) -> Dict[str, int]:
         """Get distribution of violations by unified severity level"""
         distribution = {severity.value: 0 for severity in UnifiedSeverity}
         
@@ -288,7 +297,7 @@ def get_severity_distribution(self, violations: List[Dict[str, Any]]) -> Dict[st
             
         return distribution
         
-def get_category_distribution(self, violations: List[Dict[str, Any]]) -> Dict[str, int]:
+    def get_category_distribution(self, violations: List[Dict[str, Any]]) -> Dict[str, int]:
         """Get distribution of violations by category"""
         distribution = {category.value: 0 for category in ViolationCategory}
         
@@ -302,7 +311,7 @@ def get_category_distribution(self, violations: List[Dict[str, Any]]) -> Dict[st
             
         return distribution
         
-def calculate_quality_score(self, violations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def calculate_quality_score(self, violations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Calculate overall code quality score based on violations.
         
@@ -362,7 +371,7 @@ def calculate_quality_score(self, violations: List[Dict[str, Any]]) -> Dict[str,
             "recommendations": recommendations
         }
         
-def _generate_recommendations(self, severity_dist: Dict[str, int],
+    def _generate_recommendations(self, severity_dist: Dict[str, int],
                                 category_dist: Dict[str, int]) -> List[str]:
         """Generate actionable recommendations based on violation patterns"""
         recommendations = []
@@ -392,7 +401,7 @@ def _generate_recommendations(self, severity_dist: Dict[str, int],
             
         return recommendations
         
-def export_config(self, output_path: str, format_type: str = "yaml") -> None:
+    def export_config(self, output_path: str, format_type: str = "yaml") -> None:
         """Export current mappings to configuration file"""
         config_data = {
             "tool_mappings": {
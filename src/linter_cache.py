@@ -0,0 +1,207 @@
+"""Persistent per-file cache of parsed linter violations."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from lib.shared.utilities import get_logger
+
+from src.models.linter_models import LinterConfig, LinterViolation
+
+logger = get_logger(__name__)
+
+LINTER_CACHE_VERSION = 1
+
+class LinterResultCache:
+    """
+    Cache of parsed violations per (tool context, file path, file content).
+
+    The tool context folds in the tool name, tool version, config-file
+    content, extra arguments, rule selection and severity overrides, so any
+    change to how a tool runs invalidates only that tool's entries. Files
+    whose key hits are never passed to the tool; a CI run re-lints only the
+    files the diff touched.
+
+    Tool versions are memoized by the resolved executable's path, size and
+    mtime, so `--version` runs once per tool install instead of every run.
+    """
+
+    def __init__(self, cache_file: Union[str, Path, None] = None, max_entries: int = 50_000):
+        assert max_entries > 0, "max_entries must be positive"
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.max_entries = max_entries
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.versions: Dict[str, Dict[str, Any]] = {}
+        self.run_id = 0
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        # Content digests for the current run, shared by all tools
+        self._digests: Dict[str, Optional[str]] = {}
+
+    def tool_context(self, tool: str, version: Optional[str], config: LinterConfig) -> str:
+        """Digest of everything besides the file that affects a tool's output."""
+        digest = hashlib.sha256()
+        for part in (tool, version or "", *config.extra_args,
+                     "enabled:" + ",".join(sorted(config.enabled_rules or [])),
+                     "disabled:" + ",".join(sorted(config.disabled_rules or [])),
+                     "overrides:" + ",".join(f"{rule}={severity.value}" for rule, severity
+                                             in sorted(config.severity_overrides.items()))):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        if config.config_file:
+            try:
+                digest.update(Path(config.config_file).read_bytes())
+            except OSError:
+                digest.update(b"missing-config")
+        return digest.hexdigest()[:32]
+
+    def cached_version(self, tool: str, executable: Optional[str]) -> Optional[str]:
+        """Memoized version if the executable is unchanged since it was recorded."""
+        stamp = self._executable_stamp(executable or tool)
+        record = self.versions.get(tool)
+        if stamp and record and record.get("stamp") == stamp:
+            return record.get("version")
+        return None
+
+    def remember_version(self, tool: str, executable: Optional[str], version: Optional[str]) -> None:
+        """Record a tool version against the current executable."""
+        stamp = self._executable_stamp(executable or tool)
+        if stamp and version:
+            with self._lock:
+                self.versions[tool] = {"stamp": stamp, "version": version}
+                self._dirty = True
+
+    def lookup(self, context: str, files: Sequence[str]
+               ) -> Tuple[List[LinterViolation], List[str], Dict[str, str]]:
+        """
+        Split files into cached and pending.
+
+        Returns:
+            (cached violations, files that must be linted, key per pending file)
+        """
+        cached: List[LinterViolation] = []
+        pending: List[str] = []
+        keys: Dict[str, str] = {}
+        file_keys = [(path, self._file_key(context, path)) for path in files]
+        with self._lock:
+            for path, key in file_keys:
+                entry = self.entries.get(key) if key else None
+                if entry is None:
+                    pending.append(path)
+                    if key:
+                        keys[path] = key
+                    continue
+                entry["used"] = self.run_id
+                cached.extend(LinterViolation.from_dict(item) for item in entry["violations"])
+            self.hits += len(files) - len(pending)
+            self.misses += len(pending)
+        return cached, pending, keys
+
+    def store(self, keys: Dict[str, str], files: Sequence[str], violations: Sequence[LinterViolation]) -> None:
+        """Record fresh results for files that were just linted."""
+        by_file: Dict[str, List[Dict[str, Any]]] = {}
+        aliases = {self._normalize(path): path for path in files}
+        for violation in violations:
+            path = aliases.get(self._normalize(violation.file_path))
+            if path is not None:
+                by_file.setdefault(path, []).append(violation.to_dict())
+
+        with self._lock:
+            for path in files:
+                key = keys.get(path)
+                if key:
+                    self.entries[key] = {"violations": by_file.get(path, []), "used": self.run_id}
+            self._dirty = True
+
+    def begin_run(self) -> None:
+        """Start a new run; entries used in it are the last to be evicted."""
+        with self._lock:
+            self.run_id += 1
+            self._digests = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "tool_versions": {tool: record["version"] for tool, record in self.versions.items()},
+        }
+
+    def load(self) -> bool:
+        """Load the cache file; returns False if missing, unreadable or stale."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return False
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load linter cache: {e}")
+            return False
+        if data.get("version") != LINTER_CACHE_VERSION:
+            logger.info("Ignoring linter cache with incompatible version")
+            return False
+        self.entries = data.get("entries", {})
+        self.versions = data.get("tool_versions", {})
+        self.run_id = data.get("run_id", 0)
+        return True
+
+    def save(self) -> None:
+        """Evict least recently used entries over max_entries and write atomically."""
+        if self.cache_file is None or not self._dirty:
+            return
+        with self._lock:
+            if len(self.entries) > self.max_entries:
+                keep = sorted(self.entries.items(), key=lambda item: item[1]["used"], reverse=True)
+                self.entries = dict(keep[:self.max_entries])
+            payload = {
+                "version": LINTER_CACHE_VERSION,
+                "run_id": self.run_id,
+                "tool_versions": self.versions,
+                "entries": self.entries,
+            }
+            self._dirty = False
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"), default=str)
+        os.replace(temp_file, self.cache_file)
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def _file_key(self, context: str, path: str) -> Optional[str]:
+        """Key for one file under a tool context; None if unreadable."""
+        normalized = self._normalize(path)
+        if normalized not in self._digests:
+            try:
+                self._digests[normalized] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+            except OSError:
+                self._digests[normalized] = None
+        content_digest = self._digests[normalized]
+        if content_digest is None:
+            return None
+        key = f"{context}\0{normalized}\0{content_digest}"
+        return hashlib.sha256(key.encode("utf-8", errors="surrogateescape")).hexdigest()[:40]
+
+    @staticmethod
+    def _executable_stamp(executable: str) -> Optional[str]:
+        """Path, size and mtime of the resolved executable."""
+        resolved = shutil.which(executable)
+        if resolved is None:
+            return None
+        try:
+            stat = os.stat(resolved)
+        except OSError:
+            return None
+        return f"{os.path.realpath(resolved)}:{stat.st_size}:{stat.st_mtime_ns}"
@@ -1,8 +1,93 @@
 """Async execution manager for concurrent linting operations."""
 
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import heapq
+import os
+import threading
+import time
+
 from lib.shared.utilities import get_logger
 import asyncio
 
+from src.adapters import BanditAdapter, Flake8Adapter, MypyAdapter, PylintAdapter, RuffAdapter
+from src.config.linter_config import LinterConfigManager, LinterSuiteConfig
+from src.linter_cache import LinterResultCache
+from src.models.linter_models import LinterResult, LinterViolation, StandardSeverity
+from src.violation_correlation import ViolationCorrelationIndex
+
+logger = get_logger(__name__)
+
+def plan_shards(files: Sequence[str], shard_count: int, max_argv_bytes: int) -> List[List[str]]:
+    """
+    Split files into size-balanced shards.
+
+    Files are dealt largest-first onto the lightest shard (LPT), so every
+    shard carries roughly the same number of bytes. Any shard whose command
+    line would exceed max_argv_bytes is then cut into consecutive pieces.
+    """
+    assert shard_count > 0, "shard_count must be positive"
+    assert max_argv_bytes > 0, "max_argv_bytes must be positive"
+
+    def file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    # Add one byte per file so many empty files still spread out
+    costed = sorted(((file_size(path) + 1, path) for path in files), reverse=True)
+    shards: List[List[str]] = [[] for _ in range(min(shard_count, len(costed)) or 1)]
+    loads = [(0, index) for index in range(len(shards))]
+    for cost, path in costed:
+        load, index = heapq.heappop(loads)
+        shards[index].append(path)
+        heapq.heappush(loads, (load + cost, index))
+
+    bounded: List[List[str]] = []
+    for shard in shards:
+        piece: List[str] = []
+        piece_bytes = 0
+        for path in shard:
+            arg_bytes = len(os.fsencode(path)) + 1
+            if piece and piece_bytes + arg_bytes > max_argv_bytes:
+                bounded.append(piece)
+                piece, piece_bytes = [], 0
+            piece.append(path)
+            piece_bytes += arg_bytes
+        if piece:
+            bounded.append(piece)
+    return bounded
+
+def merge_linter_results(tool: str, results: List[LinterResult], files: List[str],
+                         execution_time: float) -> LinterResult:
+    """Combine shard results into one, dropping duplicate violations."""
+    if len(results) == 1:
+        return results[0]
+
+    seen = set()
+    violations = []
+    for result in results:
+        for violation in result.violations:
+            key = (violation.file_path, violation.position.line, violation.position.column,
+                   violation.rule_id, violation.message)
+            if key not in seen:
+                seen.add(key)
+                violations.append(violation)
+
+    exit_codes = [result.exit_code for result in results]
+    errors = [result.error_output for result in results if result.error_output]
+    return LinterResult(
+        tool=tool,
+        exit_code=-1 if -1 in exit_codes else max(exit_codes, default=0),
+        violations=violations,
+        execution_time=execution_time,
+        files_analyzed=list(files),
+        config_used=results[0].config_used if results else None,
+        version=next((result.version for result in results if result.version), None),
+        error_output="\n".join(errors) if errors else None
+    )
+
 class LinterManager:
     """Manages concurrent execution of multiple linter tools."""
     
@@ -20,11 +105,18 @@ class LinterManager:
             'failed_runs': 0,
             'total_execution_time': 0.0,
             'avg_execution_time': 0.0,
-            'tool_stats': {}
+            'tool_stats': {},
+            'shard_stats': {}
         }
         
         # Thread safety
         self._stats_lock = threading.Lock()
+        
+        # Persistent per-file results and tool versions
+        self.result_cache: Optional[LinterResultCache] = None
+        if self.suite_config.result_cache:
+            self.result_cache = LinterResultCache(self.suite_config.cache_file)
+            self.result_cache.load()
     
     def _initialize_adapters(self) -> None:
         """Initialize all enabled linter adapters."""
@@ -53,8 +145,16 @@ class LinterManager:
             else:
                 logger.warning(f"Unknown tool: {tool_name}")
     
-    async def run_all_linters(self, target_paths: List[str]) -> Dict[str, LinterResult]:
-        """Run all enabled linters on the specified paths."""
+    async def run_all_linters(self, target_paths: List[str],
+                              on_violation: Optional[Callable[[LinterViolation], None]] = None
+                              ) -> Dict[str, LinterResult]:
+        """
+        Run all enabled linters on the specified paths.
+        
+        on_violation receives each finding as soon as it is parsed from a
+        running tool (or read from the cache), before any tool completes;
+        severity filtering applies only to the returned results.
+        """
         start_time = time.time()
         
         # Filter target paths
@@ -66,10 +166,17 @@ class LinterManager:
         logger.info(f"Running {len(self._adapters)} linters on {len(filtered_paths)} files")
         
         # Execute linters
+        if self.result_cache:
+            self.result_cache.begin_run()
         if self.suite_config.concurrent_execution:
-            results = await self._run_concurrent(filtered_paths)
+            results = await self._run_concurrent(filtered_paths, on_violation)
         else:
-            results = await self._run_sequential(filtered_paths)
+            results = await self._run_sequential(filtered_paths, on_violation)
+        if self.result_cache:
+            try:
+                self.result_cache.save()
+            except OSError as e:
+                logger.warning(f"Failed to save linter cache: {e}")
         
         # Update statistics
         execution_time = time.time() - start_time
@@ -83,20 +190,21 @@ class LinterManager:
         
         return filtered_results
     
-    async def _run_concurrent(self, target_paths: List[str]) -> Dict[str, LinterResult]:
-        """Run linters concurrently."""
-        semaphore = asyncio.Semaphore(self.suite_config.max_workers)
-        
-        async def run_with_semaphore(tool_name: str, adapter) -> tuple[str, LinterResult]:
-            async with semaphore:
-                logger.debug(f"Starting {tool_name} execution")
-                result = await adapter.run_linter(target_paths)
-                logger.debug(f"Completed {tool_name} execution")
-                return tool_name, result
+    async def _run_concurrent(self, target_paths: List[str],
+                              on_violation: Optional[Callable[[LinterViolation], None]] = None
+                              ) -> Dict[str, LinterResult]:
+        """Run linters concurrently, sharing one CPU budget across all shards."""
+        semaphore = asyncio.Semaphore(self._cpu_budget())
+        
+        async def run_tool(tool_name: str, adapter) -> tuple[str, LinterResult]:
+            logger.debug(f"Starting {tool_name} execution")
+            result = await self._run_tool_sharded(tool_name, adapter, target_paths, semaphore, on_violation)
+            logger.debug(f"Completed {tool_name} execution")
+            return tool_name, result
         
         # Create tasks for all adapters
         tasks = [
-            run_with_semaphore(tool_name, adapter)
+            run_tool(tool_name, adapter)
             for tool_name, adapter in self._adapters.items()
         ]
         
@@ -113,17 +221,117 @@ class LinterManager:
         
         return results
     
-    async def _run_sequential(self, target_paths: List[str]) -> Dict[str, LinterResult]:
+    async def _run_sequential(self, target_paths: List[str],
+                              on_violation: Optional[Callable[[LinterViolation], None]] = None
+                              ) -> Dict[str, LinterResult]:
         """Run linters sequentially."""
         results = {}
+        semaphore = asyncio.Semaphore(1)
         
         for tool_name, adapter in self._adapters.items():
             logger.info(f"Running {tool_name}...")
-            result = await adapter.run_linter(target_paths)
+            result = await self._run_tool_sharded(tool_name, adapter, target_paths, semaphore, on_violation)
             results[tool_name] = result
         
         return results
     
+    def _cpu_budget(self) -> int:
+        """Maximum linter processes running at once."""
+        return self.suite_config.cpu_budget or os.cpu_count() or 1
+    
+    def _plan_tool_shards(self, adapter, target_paths: List[str]) -> Tuple[List[List[str]], List[str], str]:
+        """
+        Choose shards, extra arguments and strategy name for one tool.
+        
+        Shardable tools get up to one shard per CPU, but no shard smaller than
+        min_shard_files. Tools with their own worker pool run once with a share
+        of the budget as their job count. Whole-program tools run once. Every
+        strategy is still split into several processes if argv would get too long.
+        """
+        budget = self._cpu_budget()
+        max_argv_bytes = self.suite_config.max_argv_bytes
+        
+        if adapter.native_parallelism:
+            jobs = max(1, budget // max(1, len(self._adapters)))
+            return plan_shards(target_paths, 1, max_argv_bytes), adapter.get_parallel_args(jobs), 'native'
+        if adapter.shardable:
+            shard_count = max(1, min(budget, len(target_paths) // max(1, self.suite_config.min_shard_files)))
+            return plan_shards(target_paths, shard_count, max_argv_bytes), [], 'sharded'
+        return plan_shards(target_paths, 1, max_argv_bytes), [], 'single'
+    
+    async def _tool_version(self, adapter) -> Optional[str]:
+        """Tool version, memoized across runs by the result cache."""
+        executable = adapter.config.executable_path or adapter.tool_name
+        version = self.result_cache.cached_version(adapter.tool_name, executable)
+        if version is None:
+            version = await adapter.get_version()
+            self.result_cache.remember_version(adapter.tool_name, executable, version)
+        elif hasattr(adapter, '_version_cache'):
+            # Spare run_linter its own --version subprocess
+            adapter._version_cache = version
+        return version
+    
+    async def _run_tool_sharded(self, tool_name: str, adapter, target_paths: List[str],
+                                semaphore: asyncio.Semaphore,
+                                on_violation: Optional[Callable[[LinterViolation], None]] = None
+                                ) -> LinterResult:
+        """Run one tool over the files missing from the cache, in parallel shards."""
+        start_time = time.time()
+        
+        # Tools whose findings depend on more than the file itself are never cached
+        cached_results: List[LinterResult] = []
+        pending, keys = list(target_paths), {}
+        if self.result_cache is not None and adapter.cacheable:
+            version = await self._tool_version(adapter)
+            context = self.result_cache.tool_context(adapter.tool_name, version, adapter.config)
+            cached, pending, keys = self.result_cache.lookup(context, target_paths)
+            if on_violation:
+                for violation in cached:
+                    on_violation(violation)
+            if len(pending) < len(target_paths):
+                pending_set = set(pending)
+                cached_results.append(LinterResult(
+                    tool=adapter.tool_name,
+                    exit_code=1 if cached else 0,
+                    violations=cached,
+                    execution_time=0.0,
+                    files_analyzed=[path for path in target_paths if path not in pending_set],
+                    config_used=adapter.config.config_file,
+                    version=version
+                ))
+        
+        shards, extra_args, strategy = self._plan_tool_shards(adapter, pending) if pending else ([], [], 'cached')
+        
+        async def run_shard(shard: List[str]) -> LinterResult:
+            async with semaphore:
+                if extra_args or on_violation:
+                    result = await adapter.run_linter(shard, extra_args, on_violation=on_violation)
+                else:
+                    result = await adapter.run_linter(shard)
+            if keys and result.exit_code in adapter.completed_exit_codes:
+                self.result_cache.store(keys, shard, result.violations)
+            return result
+        
+        shard_results = await asyncio.gather(*(run_shard(shard) for shard in shards))
+        execution_time = time.time() - start_time
+        
+        with self._stats_lock:
+            self._execution_stats['shard_stats'][tool_name] = {
+                'strategy': strategy,
+                'shards': len(shards),
+                'extra_args': extra_args,
+                'cached_files': len(target_paths) - len(pending),
+                'linted_files': len(pending),
+                'wall_time': execution_time,
+                'slowest_shard_time': max((r.execution_time for r in shard_results), default=0.0),
+                'shard_times': [r.execution_time for r in shard_results]
+            }
+        
+        if len(shards) > 1:
+            logger.info(f"{tool_name}: {len(shards)} shards ({strategy}) in {execution_time:.2f}s")
+        return merge_linter_results(adapter.tool_name, cached_results + list(shard_results),
+                                    target_paths, execution_time)
+    
     def _filter_paths(self, target_paths: List[str]) -> List[str]:
         """Filter target paths based on include/exclude patterns."""
         filtered_paths = []
@@ -253,7 +461,19 @@ class LinterManager:
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
         with self._stats_lock:
-            return self._execution_stats.copy()
+            stats = self._execution_stats.copy()
+        if self.result_cache:
+            stats['result_cache'] = self.result_cache.get_stats()
+        return stats
+    
+    def correlate_results(self, results: Dict[str, LinterResult],
+                          analyzer_violations: Optional[List[Dict[str, Any]]] = None) -> ViolationCorrelationIndex:
+        """Merge reports of the same problem across tools, optionally including analyzer violations."""
+        index = ViolationCorrelationIndex()
+        index.add_linter_results(results)
+        if analyzer_violations:
+            index.add_analyzer_violations(analyzer_violations)
+        return index
     
     def get_enabled_tools(self) -> List[str]:
         """Get list of enabled and available tools."""
@@ -83,6 +83,31 @@ class LinterViolation:
             "cwe_id": self.cwe_id,
             "raw_data": self.raw_data,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LinterViolation':
+        """Rebuild a violation from to_dict() output."""
+        position = data.get("position") or {}
+        return cls(
+            tool=data["tool"],
+            rule_id=data["rule_id"],
+            message=data["message"],
+            severity=StandardSeverity(data["severity"]),
+            violation_type=ViolationType(data["violation_type"]),
+            file_path=data["file_path"],
+            position=Position(
+                line=position.get("line", 0),
+                column=position.get("column"),
+                end_line=position.get("end_line"),
+                end_column=position.get("end_column"),
+            ),
+            rule_description=data.get("rule_description"),
+            fix_suggestion=data.get("fix_suggestion"),
+            confidence=data.get("confidence"),
+            category=data.get("category"),
+            cwe_id=data.get("cwe_id"),
+            raw_data=data.get("raw_data") or {},
+        )
 
 @dataclass
 class LinterResult:
@@ -0,0 +1,232 @@
+"""Indexed correlation of violations reported by several tools."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import importlib.util
+import os
+import re
+import sys
+
+from lib.shared.utilities import get_logger
+
+from src.models.linter_models import LinterResult, LinterViolation
+
+logger = get_logger(__name__)
+
+_UNIFIED_SEVERITY_PATH = Path(__file__).parent / "linter-integration" / "severity-mapping" / "unified_severity.py"
+
+def load_unified_severity():
+    """Import the unified severity module, which lives outside any package."""
+    module = sys.modules.get("unified_severity")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("unified_severity", str(_UNIFIED_SEVERITY_PATH))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del sys.modules[spec.name]
+            raise
+    return module
+
+# Rules different tools report for the same problem, mapped to one shared key.
+# flake8 and ruff share pyflakes/pycodestyle codes, so those need no entry.
+RULE_EQUIVALENTS: Dict[Tuple[str, str], str] = {
+    ("pylint", "W0611"): "F401", ("pylint", "unused-import"): "F401",
+    ("pylint", "W0612"): "F841", ("pylint", "unused-variable"): "F841",
+    ("pylint", "W0401"): "F403", ("pylint", "wildcard-import"): "F403",
+    ("pylint", "E0602"): "F821", ("pylint", "undefined-variable"): "F821",
+    ("pylint", "C0301"): "E501", ("pylint", "line-too-long"): "E501",
+    ("pylint", "C0303"): "W291", ("pylint", "trailing-whitespace"): "W291",
+    ("pylint", "W0702"): "E722", ("pylint", "bare-except"): "E722",
+    ("pylint", "R2004"): "magic-value", ("pylint", "magic-value-comparison"): "magic-value",
+    ("ruff", "PLR2004"): "magic-value",
+    ("connascence", "connascence_of_meaning"): "magic-value",
+    ("mypy", "name-defined"): "F821",
+}
+
+_RUFF_BANDIT_RULE = re.compile(r"^S(\d{3})$")
+
+# Analyzer severities onto UnifiedSeverity values
+_ANALYZER_SEVERITIES = {"informational": "info", "warning": "medium", "error": "high"}
+
+@dataclass
+class CorrelatedFinding:
+    """One problem as reported by one or more tools."""
+    file_path: str
+    line: int
+    rule_key: str
+    category: str
+    severity: Any  # UnifiedSeverity
+    message: str
+    tools: Dict[str, List[str]] = field(default_factory=dict)
+    members: List[Any] = field(default_factory=list)
+
+    @property
+    def agreement(self) -> int:
+        """Number of distinct tools reporting this finding."""
+        return len(self.tools)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert finding to dictionary format."""
+        return {
+            "file_path": self.file_path,
+            "line": self.line,
+            "rule_key": self.rule_key,
+            "category": self.category,
+            "severity": self.severity.value,
+            "message": self.message,
+            "tools": self.tools,
+            "agreement": self.agreement,
+            "reports": len(self.members),
+        }
+
+class ViolationCorrelationIndex:
+    """
+    Merge near-duplicate violations from linters and analyzers.
+
+    Findings are indexed by (file, line bucket, rule key). The rule key is
+    a shared rule name where tools are known to report the same problem
+    (pylint W0611 and flake8 F401, ruff S105 and bandit B105) and the
+    unified violation category otherwise. A new report only looks at its
+    own and the two neighbouring buckets, so merging is linear in the
+    number of reports instead of comparing every pair.
+
+    A tool never merges with itself: two reports from one tool stay two
+    findings unless they are exact repeats, which are dropped.
+    """
+
+    def __init__(self, line_tolerance: int = 1, severity_mapper=None):
+        assert line_tolerance >= 0, "line_tolerance cannot be negative"
+        unified_severity = load_unified_severity()
+        self.line_tolerance = line_tolerance
+        self.mapper = severity_mapper or unified_severity.unified_mapper
+        self._severity_type = unified_severity.UnifiedSeverity
+        self._severity_rank = {severity: rank for rank, severity in enumerate(self._severity_type)}
+        self._bucket_width = line_tolerance + 1
+        self._buckets: Dict[Tuple[str, int, str], List[CorrelatedFinding]] = {}
+        self._seen: Set[Tuple[str, str, str, int, str]] = set()
+        self._findings: List[CorrelatedFinding] = []
+        self.reports = 0
+        self.exact_duplicates = 0
+
+    def add_linter_results(self, results: Dict[str, LinterResult]) -> None:
+        """Index every violation of a LinterManager run."""
+        for result in results.values():
+            for violation in result.violations:
+                self.add_linter_violation(violation)
+        logger.debug(f"Indexed {self.reports} reports into {len(self._findings)} findings")
+
+    def add_linter_violation(self, violation: LinterViolation) -> Optional[CorrelatedFinding]:
+        """Index one linter violation; returns the finding it joined or created."""
+        tool = violation.tool.lower()
+        rule_key = (self._shared_rule(tool, violation.rule_id)
+                    or self._shared_rule(tool, str(violation.raw_data.get("message-id", ""))))
+        tool_severity = violation.raw_data.get("issue_severity") or violation.severity.value
+        severity = self.mapper.map_severity(tool, violation.rule_id, tool_severity)
+        return self._add(tool, violation.rule_id, violation.file_path, violation.position.line,
+                         violation.message, severity, rule_key, violation)
+
+    def add_analyzer_violations(self, violations: Iterable[Dict[str, Any]], tool: str = "connascence") -> None:
+        """Index violation dicts produced by the analyzer detectors."""
+        for violation in violations:
+            self.add_analyzer_violation(violation, tool)
+
+    def add_analyzer_violation(self, violation: Dict[str, Any], tool: str = "connascence"
+                               ) -> Optional[CorrelatedFinding]:
+        """Index one analyzer violation dict."""
+        tool = (violation.get("detector_source") or tool).lower()
+        rule = str(violation.get("type") or violation.get("rule_id") or "unknown")
+        raw_severity = str(violation.get("severity", "medium")).lower()
+        try:
+            severity = self._severity_type(_ANALYZER_SEVERITIES.get(raw_severity, raw_severity))
+        except ValueError:
+            severity = self._severity_type.MEDIUM
+        message = violation.get("description") or violation.get("message") or ""
+        line = violation.get("line_number") or violation.get("line") or 0
+        return self._add(tool, rule, violation.get("file_path", ""), int(line), message, severity,
+                         RULE_EQUIVALENTS.get(("connascence", rule)) or RULE_EQUIVALENTS.get((tool, rule)),
+                         violation)
+
+    def findings(self, min_agreement: int = 1) -> List[CorrelatedFinding]:
+        """Merged findings, most severe and most agreed-upon first."""
+        selected = [finding for finding in self._findings if finding.agreement >= min_agreement]
+        selected.sort(key=lambda finding: (self._severity_rank[finding.severity], -finding.agreement,
+                                           finding.file_path, finding.line))
+        return selected
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Report counts and how often tools agreed."""
+        agreement: Dict[int, int] = {}
+        pairs: Dict[str, int] = {}
+        for finding in self._findings:
+            agreement[finding.agreement] = agreement.get(finding.agreement, 0) + 1
+            tools = sorted(finding.tools)
+            for index, tool in enumerate(tools):
+                for other in tools[index + 1:]:
+                    pair = f"{tool}+{other}"
+                    pairs[pair] = pairs.get(pair, 0) + 1
+        return {
+            "reports": self.reports,
+            "exact_duplicates": self.exact_duplicates,
+            "findings": len(self._findings),
+            "merged_reports": self.reports - self.exact_duplicates - len(self._findings),
+            "by_agreement": agreement,
+            "tool_pairs": pairs,
+        }
+
+    def _add(self, tool: str, rule: str, file_path: str, line: int, message: str,
+             severity, rule_key: Optional[str], member: Any) -> Optional[CorrelatedFinding]:
+        self.reports += 1
+        normalized = os.path.normcase(os.path.normpath(file_path))
+        signature = (tool, rule, normalized, line, message)
+        if signature in self._seen:
+            self.exact_duplicates += 1
+            return None
+        self._seen.add(signature)
+
+        category = self.mapper.categorize_violation(tool, rule, message).value
+        if rule_key is None:
+            rule_key = "category:" + category
+        bucket = line // self._bucket_width
+
+        best = None
+        for candidate_bucket in (bucket - 1, bucket, bucket + 1):
+            for finding in self._buckets.get((normalized, candidate_bucket, rule_key), ()):
+                distance = abs(finding.line - line)
+                if (distance <= self.line_tolerance and tool not in finding.tools
+                        and (best is None or distance < abs(best.line - line))):
+                    best = finding
+
+        if best is None:
+            best = CorrelatedFinding(file_path=file_path, line=line, rule_key=rule_key,
+                                     category=category, severity=severity,
+                                     message=message)
+            self._findings.append(best)
+            self._buckets.setdefault((normalized, bucket, rule_key), []).append(best)
+        elif self._severity_rank[severity] < self._severity_rank[best.severity]:
+            best.severity = severity
+            best.message = message
+        best.tools.setdefault(tool, []).append(rule)
+        best.members.append(member)
+        return best
+
+    @staticmethod
+    def _shared_rule(tool: str, rule: str) -> Optional[str]:
+        """Shared key for rules several tools implement, if any."""
+        if not rule:
+            return None
+        shared = RULE_EQUIVALENTS.get((tool, rule))
+        if shared:
+            return shared
+        if tool == "ruff":
+            bandit_rule = _RUFF_BANDIT_RULE.match(rule)
+            if bandit_rule:
+                return "B" + bandit_rule.group(1)
+            if rule.startswith("PL"):
+                return RULE_EQUIVALENTS.get(("pylint", rule[2:]))
+            return rule
+        if tool in ("flake8", "bandit"):
+            return rule
+        return None
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Unit tests for the batched advisory client against a local stand-in server."""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from analyzer.enterprise.supply_chain.advisory_client import AdvisoryClient, AdvisoryResponseCache
+from analyzer.enterprise.supply_chain.vulnerability_scanner import VulnerabilityScanner
+
+OSV_ADVISORY = {
+    "id": "OSV-1", "modified": "2024-01-01T00:00:00Z", "summary": "Prototype pollution",
+    "database_specific": {"severity": "HIGH"},
+    "affected": [{"package": {"ecosystem": "npm", "name": "vulnerable"},
+                  "ranges": [{"type": "SEMVER", "events": [{"introduced": "0"}, {"fixed": "2.0.0"}]}]}],
+}
+GITHUB_ADVISORY = {
+    "ghsa_id": "GHSA-xxxx", "summary": "ReDoS", "severity": "medium", "html_url": "https://example.test/GHSA-xxxx",
+    "vulnerabilities": [{"package": {"ecosystem": "npm", "name": "vulnerable"}}],
+}
+
+class _StandInServer:
+    """Threaded HTTP server imitating the OSV and GitHub advisory APIs."""
+
+    def __init__(self, delay=0.0, fail_first_batch=False):
+        self.requests = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = delay
+        self.fail_first_batch = fail_first_batch
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server.track("querybatch"):
+                    if server.fail_first_batch:
+                        server.fail_first_batch = False
+                        return self._send(503, {}, {"Retry-After": "0"})
+                    results = [{"vulns": [{"id": "OSV-1", "modified": OSV_ADVISORY["modified"]}]}
+                               if query["package"]["name"] == "vulnerable" else {} for query in body["queries"]]
+                    self._send(200, {"results": results})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.startswith("/v1/vulns/"):
+                    with server.track("vulns"):
+                        self._conditional(OSV_ADVISORY, '"osv-1"')
+                elif url.path == "/advisories":
+                    with server.track("advisories"):
+                        affects = parse_qs(url.query)["affects"][0].split(",")
+                        hits = [GITHUB_ADVISORY] if any(a.startswith("vulnerable@") for a in affects) else []
+                        self._conditional(hits, '"gh-1"')
+                else:
+                    with server.track("other"):
+                        self._send(200, {"path": url.path})
+
+            def _conditional(self, payload, etag):
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, None, {"ETag": etag})
+                self._send(200, payload, {"ETag": etag})
+
+            def _send(self, status, payload, headers=None):
+                data = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def track(self, name):
+        server = self
+
+        class _Track:
+            def __enter__(self):
+                with server._lock:
+                    server.requests[name] += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                time.sleep(server.delay)
+
+            def __exit__(self, *exc_info):
+                with server._lock:
+                    server.in_flight -= 1
+
+        return _Track()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+@pytest.fixture
+def stand_in():
+    server = _StandInServer(fail_first_batch=True)
+    yield server
+    server.close()
+
+def _scanner(tmp_path, server, **config):
+    return VulnerabilityScanner({
+        "output_dir": str(tmp_path / "out"), "osv_api_url": f"{server.url}/v1", "github_api_url": server.url,
+        "github_api_key": "token", "advisory_cache_dir": str(tmp_path / "cache"), **config})
+
+class TestAdvisoryClient:
+    """Test batching, retries, caching and the concurrency cap."""
+
+    def test_repeat_scans_are_served_from_cache(self, tmp_path, stand_in):
+        """One batch per source on the first scan, none on the second, conditional GETs once stale."""
+        components = [{"name": f"pkg{index}", "version": "1.0.0", "ecosystem": "npm", "licenses": ["MIT"]}
+                      for index in range(120)]
+        components.append({"name": "vulnerable", "version": "1.2.0", "ecosystem": "npm", "licenses": ["MIT"]})
+
+        first = asyncio.run(_scanner(tmp_path, stand_in).scan_vulnerabilities(components))
+        assert sorted(v["id"] for v in first["vulnerabilities"]) == ["GHSA-xxxx", "OSV-1"]
+        assert stand_in.requests == {"querybatch": 2, "vulns": 1, "advisories": 3}
+        assert first["request_stats"]["retries"] == 1
+
+        stand_in.requests.clear()
+        second = asyncio.run(_scanner(tmp_path, stand_in).scan_vulnerabilities(components))
+        assert sum(stand_in.requests.values()) == 0
+        assert len(second["vulnerabilities"]) == 2
+
+        stale = asyncio.run(_scanner(tmp_path, stand_in, advisory_cache_ttl=0).scan_vulnerabilities(components))
+        assert stand_in.requests == {"querybatch": 1, "advisories": 3}
+        assert stale["request_stats"]["revalidated"] == 3
+        assert len(stale["vulnerabilities"]) == 2
+
+    def test_concurrency_is_capped(self, tmp_path):
+        """No more than max_concurrency requests are in flight at once."""
+        server = _StandInServer(delay=0.05)
+
+        async def fetch_all():
+            cache = AdvisoryResponseCache(tmp_path / "cache")
+            async with AdvisoryClient(cache, osv_api_url=f"{server.url}/v1", max_concurrency=3) as client:
+                await asyncio.gather(*(client.get_json(f"{server.url}/item/{index}") for index in range(12)))
+                return client.stats
+
+        try:
+            stats = asyncio.run(fetch_all())
+        finally:
+            server.close()
+        assert stats["requests"] == 12
+        assert server.max_in_flight <= 3
+
+    def test_github_advisories_only_match_npm_components(self, tmp_path, stand_in):
+        """A pypi package sharing an npm package's name does not inherit its advisories."""
+        scanner = _scanner(tmp_path, stand_in)
+        components = [{"name": "vulnerable", "version": "1.0.0", "ecosystem": "pypi"},
+                      {"name": "vulnerable", "version": "1.2.0", "ecosystem": "npm"},
+                      {"name": "vulnerable", "version": "1.0.0", "ecosystem": "maven"}]
+
+        async def query():
+            async with scanner._create_advisory_client() as client:
+                return await scanner._query_github_advisories(client, components)
+
+        results = asyncio.run(query())
+        assert [[v["id"] for v in vulns] for vulns in results] == [[], ["GHSA-xxxx"], []]
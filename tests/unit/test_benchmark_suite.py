@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Unit tests for the seeded corpus generator and benchmark suite."""
+
+import ast
+
+import pytest
+
+from analyzer.performance.benchmark_suite import SCENARIOS, AnalyzerBenchmarkSuite, BenchmarkResults
+from analyzer.performance.corpus_generator import CorpusConfig, SyntheticCorpusGenerator
+
+class _RecordingAnalyzer:
+    """Analyzer stand-in recording the calls made by scenarios."""
+
+    calls = []
+
+    def analyze_project(self, path):
+        self.calls.append(("project", path))
+        return {}
+
+    def analyze_file(self, path):
+        self.calls.append(("file", path))
+        return {}
+
+class TestCorpusGenerator:
+    """Test corpus reproducibility and shape."""
+
+    def test_same_seed_same_corpus(self, tmp_path):
+        """Identical configs produce identical digests; seeds change them."""
+        config = CorpusConfig(seed=7, file_count=15)
+        first = SyntheticCorpusGenerator(config).generate(tmp_path / "a")
+        second = SyntheticCorpusGenerator(config).generate(tmp_path / "b")
+        other = SyntheticCorpusGenerator(CorpusConfig(seed=8, file_count=15)).generate(tmp_path / "c")
+
+        assert first.digest == second.digest
+        assert first.digest != other.digest
+        assert first.files == second.files
+
+    def test_generated_sources_parse(self, tmp_path):
+        """Every generated module is valid Python."""
+        manifest = SyntheticCorpusGenerator(CorpusConfig(file_count=10, size_distribution="pareto")).generate(tmp_path)
+        for path in manifest.paths:
+            ast.parse(path.read_text())
+        assert len(manifest.paths) == 10
+
+    def test_density_and_duplicates(self, tmp_path):
+        """Violation density and duplicate ratio are honoured."""
+        clean = SyntheticCorpusGenerator(
+            CorpusConfig(file_count=10, violation_density=0.0, duplicate_ratio=0.0)
+        ).generate(tmp_path / "clean")
+        assert sum(clean.injected_violations.values()) == 0
+        assert clean.duplicate_files == 0
+
+        noisy = SyntheticCorpusGenerator(
+            CorpusConfig(file_count=40, violation_density=1.0, duplicate_ratio=0.5)
+        ).generate(tmp_path / "noisy")
+        assert sum(noisy.injected_violations.values()) > 0
+        assert noisy.duplicate_files > 0
+
+    def test_invalid_config_rejected(self):
+        """Out-of-range knobs fail fast."""
+        with pytest.raises(AssertionError):
+            CorpusConfig(violation_density=1.5)
+
+class TestAnalyzerBenchmarkSuite:
+    """Test scenario execution and result serialization."""
+
+    def test_work_dir_contents_are_preserved(self, tmp_path):
+        """The suite only removes the scratch directory it created inside work_dir."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        (work_dir / "keep.txt").write_text("user data")
+        suite = AnalyzerBenchmarkSuite(
+            corpus_config=CorpusConfig(file_count=3), analyzer_factory=_RecordingAnalyzer,
+            iterations=1, warmup=0, burst_size=1, work_dir=work_dir,
+        )
+        suite.run(scenarios=["cold_full_scan", "warm_rescan"])
+
+        assert [path.name for path in work_dir.iterdir()] == ["keep.txt"]
+        assert (work_dir / "keep.txt").read_text() == "user data"
+
+    def test_all_scenarios_produce_samples(self, tmp_path):
+        """Every scenario records the configured number of samples."""
+        _RecordingAnalyzer.calls = []
+        suite = AnalyzerBenchmarkSuite(
+            corpus_config=CorpusConfig(file_count=5), analyzer_factory=_RecordingAnalyzer,
+            iterations=3, warmup=1, burst_size=4, work_dir=tmp_path / "corpus",
+        )
+        results = suite.run(label="test")
+
+        assert set(results.scenarios) == set(SCENARIOS)
+        assert all(len(result.samples_ms) == 3 for result in results.scenarios.values())
+        assert len(results.scenarios["streaming_burst"].metadata["event_p95_ms"]) == 3
+        file_calls = [call for call in _RecordingAnalyzer.calls if call[0] == "file"]
+        assert len(file_calls) == 4 + 4 * 4  # single-file edits + burst events
+
+        output = tmp_path / "bench.json"
+        results.save(output)
+        loaded = BenchmarkResults.load(output)
+        assert loaded.corpus["digest"] == results.corpus["digest"]
+        assert len(loaded.scenarios["cold_full_scan"].samples_ms) == 3
+
+    def test_unknown_scenario(self):
+        """Unknown scenario names are rejected before any work."""
+        with pytest.raises(ValueError):
+            AnalyzerBenchmarkSuite(analyzer_factory=_RecordingAnalyzer).run(["nope"])
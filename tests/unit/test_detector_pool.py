@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Unit tests for the worker-local detector pool."""
+
+import ast
+import threading
+
+from analyzer.architecture.detector_pool import DetectorPool
+from analyzer.detectors import ExecutionDetector, PositionDetector
+
+SOURCE = ["counter = 0", "def bump():", "    global counter", "    counter += 1"]
+
+class TestDetectorPool:
+    """Test acquisition, reset and metrics."""
+
+    def test_reuse_resets_file_state(self):
+        """A released detector is reused and reset for the next file."""
+        pool = DetectorPool({'execution': ExecutionDetector})
+        detector = pool.acquire_detector('execution', 'first.py', SOURCE)
+        detector.detect_violations(ast.parse("\n".join(SOURCE)))
+        assert detector.global_assignments
+        pool.release_detector(detector)
+
+        reused = pool.acquire_detector('execution', 'second.py', [])
+        assert reused is detector
+        assert reused.file_path == 'second.py'
+        assert not reused.global_assignments and not reused.stateful_variables
+
+    def test_workers_get_separate_detectors(self):
+        """Each thread owns its detectors; metrics are summed across workers."""
+        pool = DetectorPool({'position': PositionDetector})
+        acquired = []
+        done, finish = threading.Barrier(5), threading.Event()
+
+        def work():
+            for _ in range(3):
+                detector = pool.acquire_detector('position', 'file.py', [])
+                acquired.append(detector)
+                pool.release_detector(detector)
+            done.wait()
+            finish.wait()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        done.wait()
+
+        assert len({id(detector) for detector in acquired}) == 4
+        metrics = pool.get_metrics()
+        assert metrics['workers'] == 4
+        assert metrics['total_acquisitions'] == 12
+        assert metrics['cache_hits'] == 8
+        assert metrics['pool_sizes'] == {'position': 4}
+
+        finish.set()
+        for thread in threads:
+            thread.join()
+
+    def test_exited_workers_are_unregistered(self):
+        """Joined threads leave the registry; their counters stay in the totals."""
+        pool = DetectorPool({'position': PositionDetector})
+
+        def work():
+            pool.release_detector(pool.acquire_detector('position', 'file.py', []))
+            pool.release_detector(pool.acquire_detector('position', 'file.py', []))
+
+        for _ in range(3):
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(pool._workers) == 0
+
+        pool.release_detector(pool.acquire_detector('position', 'main.py', []))
+        metrics = pool.get_metrics()
+        assert len(pool._workers) == metrics['workers'] == 1
+        assert metrics['total_acquisitions'] == 25 and metrics['cache_hits'] == 12
+        assert metrics['pool_sizes'] == {'position': 1}
+
+    def test_idle_worker_shrinks_to_warmup_count(self):
+        """Detectors beyond WARMUP_COUNT are dropped after MAX_IDLE_TIME unused."""
+        pool = DetectorPool({'position': PositionDetector})
+        held = [pool.acquire_detector('position', 'file.py', []) for _ in range(3)]
+        for detector in held:
+            pool.release_detector(detector)
+        assert pool.get_metrics()['pool_sizes'] == {'position': 3}
+
+        pool._worker_set().last_used -= pool.MAX_IDLE_TIME + 1
+        pool.release_detector(pool.acquire_detector('position', 'file.py', []))
+        assert pool.get_metrics()['pool_sizes'] == {'position': pool.WARMUP_COUNT}
+
+    def test_pool_size_bounded_per_worker(self):
+        """Acquisition fails once a worker holds MAX_POOL_SIZE detectors."""
+        pool = DetectorPool({'position': PositionDetector})
+        pool.MAX_POOL_SIZE = 2
+        held = [pool.acquire_detector('position', 'file.py', []) for _ in range(2)]
+        assert all(held)
+        assert pool.acquire_detector('position', 'file.py', []) is None
+        pool.release_detector(held[0])
+        assert pool.acquire_detector('position', 'file.py', []) is held[0]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Unit tests for per-detector profiling and collapsed-stack export."""
+
+from analyzer.architecture.connascence_orchestrator import ConnascenceOrchestrator
+from analyzer.architecture.detector_profiler import DetectorProfiler
+
+SOURCE = "def configure(a, b, c, d, e):\n    return a * 12345\n"
+
+class _Config:
+    """Minimal configuration provider."""
+
+    def __init__(self, **values):
+        self.values = values
+
+    def get_config(self, key, default):
+        return self.values.get(key, default)
+
+class TestDetectorProfiler:
+    """Test profiler bookkeeping."""
+
+    def test_disabled_profiler_records_nothing(self):
+        """Profiling is opt-in."""
+        profiler = DetectorProfiler()
+        with profiler.profile("detector", "rule", nodes=5):
+            pass
+        assert profiler.get_report()["detectors"] == {}
+        assert profiler.to_collapsed_stacks() == []
+
+    def test_nested_frames_split_self_time(self):
+        """Child time is excluded from the parent's self time."""
+        profiler = DetectorProfiler(enabled=True, track_memory=False)
+        for _ in range(3):
+            with profiler.profile("detector", "total"):
+                with profiler.profile("detector", "rule", nodes=2):
+                    sum(range(1000))
+
+        report = profiler.get_report()["detectors"]["detector"]
+        assert report["rule"]["calls"] == 3
+        assert report["rule"]["nodes_visited"] == 6
+        assert report["total"]["wall_time_ms"] >= report["rule"]["wall_time_ms"]
+        assert report["total"]["self_time_ms"] <= report["total"]["wall_time_ms"]
+
+    def test_collapsed_stacks_are_flamegraph_lines(self, tmp_path):
+        """Each line is a semicolon-joined stack and an integer sample count."""
+        profiler = DetectorProfiler(enabled=True, track_memory=False)
+        with profiler.profile("outer stage", "total"):
+            with profiler.profile("detector", "rule"):
+                sum(range(10000))
+
+        output = profiler.write_collapsed(tmp_path / "profile.folded")
+        lines = output.read_text().splitlines()
+        assert "outer_stage:total;detector:rule" in [line.rsplit(" ", 1)[0] for line in lines]
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_memory_tracking_records_allocations(self):
+        """tracemalloc deltas are attributed to the active frame."""
+        profiler = DetectorProfiler(enabled=True)
+        try:
+            with profiler.profile("detector", "allocate"):
+                data = [object() for _ in range(1000)]
+            assert profiler.get_report()["detectors"]["detector"]["allocate"]["allocated_bytes"] > 0
+        finally:
+            profiler.disable()
+        assert len(data) == 1000
+
+class TestOrchestratorProfiling:
+    """Test profiling exposure through the orchestrator."""
+
+    def test_system_status_reports_detector_rules(self, tmp_path):
+        """Per-rule stats and real memory usage appear in get_system_status."""
+        source_file = tmp_path / "module.py"
+        source_file.write_text(SOURCE)
+        orchestrator = ConnascenceOrchestrator(_Config(enable_profiling=True, enable_caching=False))
+        orchestrator.profiler.reset()
+        try:
+            orchestrator.analyze_file(source_file)
+            status = orchestrator.get_system_status()
+        finally:
+            orchestrator.profiler.disable()
+
+        rules = status["detector_profile"]["detectors"]["CoreConnascenceDetector"]
+        assert {"magic_literals", "parameter_coupling", "god_objects"} <= set(rules)
+        assert "collect_facts" in status["detector_profile"]["detectors"]["ProductionConnascenceOrchestrator"]
+        assert rules["magic_literals"]["nodes_visited"] > 0
+        assert isinstance(status["system_health"]["memory_usage"], dict)
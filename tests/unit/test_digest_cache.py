@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared single-pass file digest cache."""
+
+import hashlib
+import os
+
+from analyzer.enterprise.supply_chain.digest_cache import FileDigestCache, compute_digests
+from analyzer.enterprise.supply_chain.evidence_packager import EvidencePackager
+
+class TestFileDigestCache:
+    """Test single-pass hashing, memoization and invalidation by file identity."""
+
+    def test_all_algorithms_in_one_pass(self, tmp_path, monkeypatch):
+        """Every algorithm matches hashlib and the file is read exactly once."""
+        payload = os.urandom(10_000)
+        artifact = tmp_path / "artifact.bin"
+        artifact.write_bytes(payload)
+
+        reads = []
+        real_open = open
+
+        def counting_open(path, *args, **kwargs):
+            reads.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", counting_open)
+        digests = compute_digests(artifact, ("sha256", "sha512", "md5"), chunk_size=1000)
+        monkeypatch.undo()
+
+        assert len(reads) == 1
+        assert digests == {"sha256": hashlib.sha256(payload).hexdigest(),
+                           "sha512": hashlib.sha512(payload).hexdigest(),
+                           "md5": hashlib.md5(payload).hexdigest()}
+
+    def test_memoized_until_file_changes(self, tmp_path):
+        """Repeat lookups hit the cache; rewriting the file or adding an algorithm rehashes."""
+        cache = FileDigestCache(chunk_size=64)
+        artifact = tmp_path / "artifact.bin"
+        artifact.write_bytes(b"first")
+
+        first = cache.digest(artifact)
+        assert cache.digest(str(artifact)) == first
+        assert cache.get_stats()["hits"] == 1 and cache.get_stats()["bytes_hashed"] == 5
+
+        assert cache.digests(artifact, ("sha256", "sha512"))["sha512"] == hashlib.sha512(b"first").hexdigest()
+        assert cache.get_stats()["bytes_hashed"] == 10
+
+        artifact.write_bytes(b"second!")
+        stat = artifact.stat()
+        os.utime(artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert cache.digest(artifact) == hashlib.sha256(b"second!").hexdigest()
+
+    def test_bulk_api_and_packager_manifest(self, tmp_path):
+        """digests_many hashes in parallel; manifest checksums come from the warmed cache."""
+        paths = []
+        for index in range(6):
+            path = tmp_path / f"dist-{index}.tar.gz"
+            path.write_bytes(bytes([index]) * (3000 + index))
+            paths.append(str(path))
+
+        cache = FileDigestCache(chunk_size=512, max_workers=4)
+        results = cache.digests_many(paths + [paths[0], str(tmp_path / "missing")])
+        assert results[str(tmp_path / "missing")] == {}
+        assert all(results[path]["sha256"] == hashlib.sha256(open(path, "rb").read()).hexdigest() for path in paths)
+        assert cache.get_stats()["misses"] == 6
+
+        packager = EvidencePackager({"output_dir": str(tmp_path / "out")})
+        packager.digest_cache = cache
+        manifest = packager._create_artifact_manifest([{"path": path} for path in paths])
+        assert [set(entry["checksums"]) for entry in manifest] == [{"sha256", "sha512"}] * len(paths)
+        assert cache.get_stats()["bytes_hashed"] == 2 * sum(3000 + index for index in range(6))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Unit tests for streaming evidence package assembly."""
+
+import hashlib
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from analyzer.enterprise.supply_chain.evidence_packager import EvidencePackager
+
+@pytest.fixture
+def project(tmp_path):
+    project_dir = tmp_path / "project"
+    (project_dir / "src" / "pkg" / "deep").mkdir(parents=True)
+    (project_dir / "src" / "main.py").write_text("print('hi')\n")
+    (project_dir / "src" / "pkg" / "util.py").write_text("VALUE = 1\n")
+    (project_dir / "src" / "pkg" / "deep" / "skipped.py").write_text("# beyond max depth\n")
+    (project_dir / "docker-compose.yml").write_text("services: {}\n")
+    artifact = project_dir / "dist.tar.gz"
+    artifact.write_bytes(b"\x00" * 4096)
+    (project_dir / "dist.tar.gz.sig").write_bytes(b"signature")
+
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    (output_dir / "sbom-spdx.json").write_text(json.dumps({"spdxVersion": "SPDX-2.3"}))
+    return project_dir, output_dir, [{"path": str(artifact), "type": "archive"}]
+
+class TestStreamingEvidencePackage:
+    """Test archives are built directly from source files with inline hashes."""
+
+    @pytest.mark.parametrize("package_format", ["zip", "tar.gz"])
+    def test_package_round_trips_with_inline_hashes(self, project, tmp_path, package_format):
+        """Every entry is hashed in the manifest and verifies after extraction."""
+        project_dir, output_dir, artifacts = project
+        packager = EvidencePackager({"output_dir": str(output_dir), "package_format": package_format,
+                                     "include_source_code": True})
+        package_info = packager.create_evidence_package(str(project_dir), artifacts)
+
+        package_path = output_dir / f"evidence-package-{package_info['package_id']}.{package_format}"
+        assert package_info["package_path"] == str(package_path)
+        assert sorted(p.name for p in output_dir.iterdir()) == sorted([
+            package_path.name, f"package-info-{package_info['package_id']}.json", "sbom-spdx.json"])
+
+        if package_format == "zip":
+            with zipfile.ZipFile(package_path) as archive:
+                names = archive.namelist()
+                entries = {name: archive.read(name) for name in names}
+        else:
+            with tarfile.open(package_path) as archive:
+                names = archive.getnames()
+                entries = {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+        read = entries.__getitem__
+
+        assert names[-2:] == ["manifest.json", "attestation.json"]
+        assert len(names) == len(set(names)) == len(package_info["files_included"])
+        assert "source/src/pkg/util.py" in names and "source/src/pkg/deep/skipped.py" not in names
+        assert "signatures/dist.tar.gz.sig" in names and "sbom/sbom-spdx.json" in names
+
+        manifest_bytes = read("manifest.json")
+        manifest = json.loads(manifest_bytes)
+        assert set(manifest["integrity"]["files"]) == set(names) - {"manifest.json", "attestation.json"}
+        for name, digest in manifest["integrity"]["files"].items():
+            assert hashlib.sha256(read(name)).hexdigest() == digest
+        attestation = json.loads(read("attestation.json"))
+        assert attestation["evidence_integrity"]["manifest_hash"] == hashlib.sha256(manifest_bytes).hexdigest()
+
+        verification = packager.extract_evidence_package(str(package_path), str(tmp_path / "extracted"))["verification"]
+        assert verification["valid"], verification["checks_failed"]
+
+    def test_failed_packaging_leaves_no_partial_archive(self, project, monkeypatch):
+        """An error while streaming removes the partially written archive."""
+        project_dir, output_dir, artifacts = project
+        packager = EvidencePackager({"output_dir": str(output_dir)})
+        monkeypatch.setattr(packager, "_create_compliance_attestation",
+                            lambda artifacts: (_ for _ in ()).throw(RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError):
+            packager.create_evidence_package(str(project_dir), artifacts)
+        assert [p.name for p in output_dir.iterdir()] == ["sbom-spdx.json"]
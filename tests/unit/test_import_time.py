@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Import-time regression tests for the analyzer package."""
+
+from pathlib import Path
+import json
+import subprocess
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Budget for ``import analyzer`` in a fresh interpreter; eager imports cost ~800ms
+IMPORT_BUDGET_MS = 150
+
+# Modules that must not be loaded by ``import analyzer`` alone
+HEAVY_MODULES = ("pandas", "numpy", "requests", "analyzer.unified_analyzer", "analyzer.core")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"elapsed_ms": elapsed_ms, "modules": sorted(sys.modules)}}))
+"""
+
+def _probe_import(module, cwd=PROJECT_ROOT):
+    """Import a module in a fresh interpreter; returns elapsed ms and loaded modules."""
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=cwd, capture_output=True, text=True, check=True,
+        env={"PYTHONPATH": str(PROJECT_ROOT), "PATH": ""},
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+class TestImportTime:
+    """Test that importing the analyzer stays cheap."""
+
+    def test_import_analyzer_within_budget(self):
+        """Best of three cold imports stays under the budget."""
+        elapsed = min(_probe_import("analyzer")["elapsed_ms"] for _ in range(3))
+        assert elapsed < IMPORT_BUDGET_MS, f"import analyzer took {elapsed:.1f}ms (budget {IMPORT_BUDGET_MS}ms)"
+
+    def test_import_analyzer_defers_subsystems(self):
+        """Heavy subsystems load only on attribute access."""
+        loaded = set(_probe_import("analyzer")["modules"])
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_ast_cache_import_does_not_create_cache(self, tmp_path):
+        """The global AST cache is created on first use, not at import."""
+        _probe_import("analyzer.caching.ast_cache", cwd=tmp_path)
+        assert not (tmp_path / ".connascence_cache").exists()
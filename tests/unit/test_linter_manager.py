@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Unit tests for sharded linter execution in LinterManager."""
+
+import asyncio
+import json
+import sys
+
+from src.adapters.base_adapter import BaseLinterAdapter
+from src.adapters.mypy_adapter import MypyAdapter
+from src.adapters.pylint_adapter import PylintAdapter
+from src.config.linter_config import LinterSuiteConfig
+from src.linter_cache import LinterResultCache
+from src.linter_manager import LinterManager, plan_shards
+from src.models.linter_models import LinterConfig, StandardSeverity, ViolationType
+
+# Reports one violation per file plus a shared one every shard repeats
+_FAKE_LINTER = (
+    "import json, sys\n"
+    "files = sys.argv[1:]\n"
+    "items = [{'file': f, 'code': 'X100', 'line': 1} for f in files]\n"
+    "items.append({'file': 'shared.py', 'code': 'X200', 'line': 1})\n"
+    "print(json.dumps({'items': items}))\n"
+)
+
+class _FakeAdapter(BaseLinterAdapter):
+    """Runs a Python one-liner as the linter subprocess."""
+
+    version_calls = 0
+
+    async def get_version(self):
+        if self._version_cache is None:
+            type(self).version_calls += 1
+            self._version_cache = "fake 1.0"
+        return self._version_cache
+
+    def get_command_args(self, target_paths):
+        return [sys.executable, "-c", _FAKE_LINTER] + list(target_paths)
+
+    def parse_output(self, raw_output, stderr=""):
+        return [self.create_violation(item['code'], "fake", item['file'], item['line'])
+                for item in json.loads(raw_output)['items']]
+
+    def normalize_severity(self, tool_severity, rule_id=""):
+        return StandardSeverity.WARNING
+
+    def get_violation_type(self, rule_id, category=""):
+        return ViolationType.STYLE
+
+# Pylint-style JSON: flags main.py when the helper it imports is gone from dep.py
+_FAKE_PYLINT = (
+    "import json, os, sys\n"
+    "files = [f for f in sys.argv[1:] if f.endswith('.py')]\n"
+    "items = []\n"
+    "for f in files:\n"
+    "    dep = os.path.join(os.path.dirname(f), 'dep.py')\n"
+    "    if os.path.basename(f) == 'main.py' and 'def helper' not in open(dep).read():\n"
+    "        items.append({'path': f, 'symbol': 'no-name-in-module', 'type': 'error', 'line': 1})\n"
+    "print(json.dumps(items))\n"
+)
+
+class _FakePylintAdapter(PylintAdapter):
+    """PylintAdapter whose subprocess is a script with a cross-module check."""
+
+    run_count = 0
+
+    async def get_version(self):
+        return "pylint 3.0"
+
+    def get_command_args(self, target_paths):
+        type(self).run_count += 1
+        return [sys.executable, "-c", _FAKE_PYLINT] + list(target_paths)
+
+def _manager(**suite_values):
+    """Manager with no real tools enabled and, unless given, no result cache."""
+    suite_values.setdefault('result_cache', False)
+    manager = LinterManager(config=LinterSuiteConfig(enabled_tools=[], **suite_values))
+    manager._adapters = {}
+    return manager
+
+def _fake_adapter():
+    return _FakeAdapter(LinterConfig(tool_name='fake', executable_path=sys.executable))
+
+class TestShardPlanning:
+    """Test size balancing and argv limits."""
+
+    def test_shards_balance_bytes_and_respect_argv_limit(self, tmp_path):
+        """Large files are spread out; long command lines are split."""
+        files = []
+        for index, size in enumerate([900, 800, 100, 100, 100, 100, 100, 100]):
+            path = tmp_path / f"f{index}.py"
+            path.write_text("x" * size)
+            files.append(str(path))
+
+        shards = plan_shards(files, 2, max_argv_bytes=10_000)
+        loads = sorted(sum(len(open(f).read()) for f in shard) for shard in shards)
+        assert loads == [1100, 1200]
+
+        bounded = plan_shards(files, 1, max_argv_bytes=len(files[0]) * 3 + 3)
+        assert [len(shard) for shard in bounded] == [3, 3, 2]
+
+    def test_strategy_follows_adapter_capabilities(self):
+        """Native-parallel tools get --jobs; whole-program tools stay in one process."""
+        manager = _manager(cpu_budget=4, min_shard_files=2)
+        manager._adapters = {
+            'pylint': PylintAdapter(LinterConfig(tool_name='pylint')),
+            'mypy': MypyAdapter(LinterConfig(tool_name='mypy')),
+        }
+        files = [f"m{index}.py" for index in range(10)]
+
+        shards, extra_args, strategy = manager._plan_tool_shards(manager._adapters['pylint'], files)
+        assert (len(shards), extra_args, strategy) == (1, ['--jobs', '2'], 'native')
+        shards, extra_args, strategy = manager._plan_tool_shards(manager._adapters['mypy'], files)
+        assert (len(shards), strategy) == (1, 'single')
+
+class TestShardedExecution:
+    """Test running and merging shards through real subprocesses."""
+
+    def test_shards_run_and_merge_without_duplicates(self, tmp_path):
+        """Every file is linted once and violations repeated by shards are deduplicated."""
+        for index in range(12):
+            (tmp_path / f"mod{index}.py").write_text("value = 1\n" * (index + 1))
+        manager = _manager(cpu_budget=3, min_shard_files=2)
+        manager._adapters = {'fake': _fake_adapter()}
+
+        results = asyncio.run(manager.run_all_linters([str(tmp_path)]))
+
+        result = results['fake']
+        assert result.exit_code == 0
+        assert len(result.files_analyzed) == 12
+        assert len(result.violations) == 13
+        assert sorted(v.file_path for v in result.violations if v.rule_id == 'X100') == \
+            sorted(result.files_analyzed)
+        shard_stats = manager.get_execution_stats()['shard_stats']['fake']
+        assert shard_stats['strategy'] == 'sharded' and shard_stats['shards'] == 3
+
+class TestResultCache:
+    """Test the persistent per-file result cache."""
+
+    def test_only_changed_files_are_relinted(self, tmp_path):
+        """Unchanged files come from the cache across managers; edits miss."""
+        source = tmp_path / "src"
+        source.mkdir()
+        for index in range(6):
+            (source / f"mod{index}.py").write_text(f"value = {index}\n")
+        cache_file = tmp_path / "cache" / "results.json"
+
+        def run():
+            manager = _manager(result_cache=True, cache_file=str(cache_file), min_shard_files=2)
+            manager._adapters = {'fake': _fake_adapter()}
+            result = asyncio.run(manager.run_all_linters([str(source)]))['fake']
+            return result, manager.get_execution_stats()
+
+        _FakeAdapter.version_calls = 0
+        first, _ = run()
+        assert len(first.violations) == 7
+        assert _FakeAdapter.version_calls == 1
+
+        second, stats = run()
+        assert stats['shard_stats']['fake']['linted_files'] == 0
+        assert {v.file_path for v in second.violations} == {v.file_path for v in first.violations} - {'shared.py'}
+        assert _FakeAdapter.version_calls == 1  # memoized in the cache file
+
+        (source / "mod3.py").write_text("value = 'changed'\n")
+        third, stats = run()
+        assert stats['shard_stats']['fake']['linted_files'] == 1
+        assert stats['result_cache']['hits'] == 5
+        assert len(third.files_analyzed) == 6
+
+    def test_config_change_invalidates_tool_entries(self, tmp_path):
+        """A different rule selection produces a different tool context."""
+        cache = LinterResultCache()
+        config = LinterConfig(tool_name='fake')
+        before = cache.tool_context('fake', '1.0', config)
+        config.disabled_rules = ['X100']
+        assert cache.tool_context('fake', '1.0', config) != before
+        assert cache.tool_context('fake', '1.1', LinterConfig(tool_name='fake')) != \
+            cache.tool_context('fake', '1.0', LinterConfig(tool_name='fake'))
+
+    def test_cross_module_tools_bypass_cache(self, tmp_path):
+        """Pylint re-runs on an unchanged file when a module it imports changes."""
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "main.py").write_text("from dep import helper\n")
+        (source / "dep.py").write_text("def helper():\n    return 1\n")
+        cache_file = tmp_path / "cache" / "results.json"
+
+        def run():
+            manager = _manager(result_cache=True, cache_file=str(cache_file))
+            manager._adapters = {'pylint': _FakePylintAdapter(
+                LinterConfig(tool_name='pylint', executable_path=sys.executable))}
+            result = asyncio.run(manager.run_all_linters([str(source / "main.py")]))['pylint']
+            return result, manager.get_execution_stats()
+
+        assert not PylintAdapter.cacheable and not MypyAdapter.cacheable
+        first, _ = run()
+        assert first.violations == []
+
+        (source / "dep.py").write_text("def renamed():\n    return 1\n")
+        second, stats = run()
+        assert stats['shard_stats']['pylint']['cached_files'] == 0
+        assert [v.rule_id for v in second.violations] == ['no-name-in-module']
+        assert _FakePylintAdapter.run_count == 2
+
+    def test_failed_runs_are_not_cached(self, tmp_path):
+        """A usage error (exit 2, no output) must not make files read as clean."""
+        source = tmp_path / "src"
+        source.mkdir()
+        for index in range(3):
+            (source / f"mod{index}.py").write_text(f"value = {index}\n")
+        cache_file = tmp_path / "cache" / "results.json"
+        broken = tmp_path / "broken"
+        broken.write_text("")
+
+        class _MisconfiguredAdapter(_FakeAdapter):
+            def get_command_args(self, target_paths):
+                script = f"import os, sys\nif os.path.exists({str(broken)!r}): sys.exit(2)\n" + _FAKE_LINTER
+                return [sys.executable, "-c", script] + list(target_paths)
+
+            def parse_output(self, raw_output, stderr=""):
+                return super().parse_output(raw_output, stderr) if raw_output.strip() else []
+
+        def run():
+            manager = _manager(result_cache=True, cache_file=str(cache_file))
+            manager._adapters = {'fake': _MisconfiguredAdapter(
+                LinterConfig(tool_name='fake', executable_path=sys.executable))}
+            result = asyncio.run(manager.run_all_linters([str(source)]))['fake']
+            return result, manager.get_execution_stats()
+
+        first, _ = run()
+        assert first.exit_code == 2 and first.violations == []
+
+        broken.unlink()
+        second, stats = run()
+        assert stats['shard_stats']['fake']['cached_files'] == 0
+        assert len([v for v in second.violations if v.rule_id == 'X100']) == 3
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Unit tests for incremental parsing of linter output."""
+
+import asyncio
+import json
+import sys
+
+from src.adapters import base_adapter
+from src.adapters.flake8_adapter import Flake8Adapter
+from src.adapters.ruff_adapter import RuffAdapter
+from src.adapters.stream_parsing import JSONArrayStreamParser, LineStreamParser
+from src.models.linter_models import LinterConfig
+
+# Prints one result, waits for the test to see it, then finishes the array
+_BLOCKING_RUFF = r'''
+import json, os, sys, time
+sentinel = sys.argv[1]
+def item(code):
+    return json.dumps({"code": code, "message": "café — résumé", "filename": "a.py",
+                       "location": {"row": 1, "column": 1}}, ensure_ascii=False)
+sys.stdout.write("[" + item("F401")); sys.stdout.flush()
+deadline = time.time() + 10
+while not os.path.exists(sentinel) and time.time() < deadline:
+    time.sleep(0.01)
+sys.stdout.write("," + item("E501") + "]\n")
+'''
+
+class _BlockingRuffAdapter(RuffAdapter):
+    """Ruff adapter running the blocking script instead of ruff."""
+
+    def __init__(self, config, sentinel):
+        super().__init__(config)
+        self.sentinel = sentinel
+        self._version_cache = "ruff 0.0"
+
+    def get_command_args(self, target_paths):
+        return [sys.executable, "-c", _BLOCKING_RUFF, self.sentinel]
+
+class TestStreamParsers:
+    """Test the incremental parsers."""
+
+    def test_json_array_elements_complete_across_chunks(self):
+        """Elements split over many small feeds are returned once complete."""
+        document = json.dumps([{"code": "A1", "nested": {"x": [1, 2]}}, {"code": "B2"}, "s,]"])
+        parser = JSONArrayStreamParser()
+        values = []
+        for start in range(0, len(document), 3):
+            values.extend(parser.feed(document[start:start + 3]))
+        values.extend(parser.close())
+        assert values == json.loads(document)
+
+    def test_concatenated_values_and_lines(self):
+        """JSON lines parse like an array; the line parser keeps partial lines."""
+        assert JSONArrayStreamParser().feed('{"a": 1}\n{"b": 2}\n') == [{"a": 1}, {"b": 2}]
+        lines = LineStreamParser()
+        assert lines.feed("one\ntw") == ["one"]
+        assert lines.feed("o\nthree") == ["two"]
+        assert lines.close() == ["three"]
+
+class TestStreamingAdapters:
+    """Test adapters parsing stdout while the tool runs."""
+
+    def test_violations_arrive_before_the_tool_exits(self, tmp_path, monkeypatch):
+        """The first finding reaches on_violation while the process still runs."""
+        monkeypatch.setattr(base_adapter, "STREAM_CHUNK_SIZE", 5)  # split multi-byte characters
+        sentinel = tmp_path / "seen"
+        adapter = _BlockingRuffAdapter(LinterConfig(tool_name="ruff", timeout=20), str(sentinel))
+        seen = []
+
+        def on_violation(violation):
+            seen.append(violation.rule_id)
+            sentinel.touch()
+
+        result = asyncio.run(adapter.run_linter(["a.py"], on_violation=on_violation))
+
+        assert result.exit_code == 0 and result.error_output is None
+        assert seen == ["F401", "E501"]
+        assert result.violations[0].message == "café — résumé"
+
+    def test_flake8_lines_mix_json_and_text(self):
+        """Each line is parsed independently; malformed JSON lines are skipped."""
+        adapter = Flake8Adapter(LinterConfig(tool_name="flake8"))
+        output = ('{"file":"a.py","line":1,"column":2,"code":"E501","text":"long"}\n'
+                  '{"file":"a.py","line":2,"code":"E1\n'
+                  'b.py:3:4: W291 trailing whitespace\n')
+        violations = adapter.parse_output(output)
+        assert [(v.file_path, v.rule_id) for v in violations] == [("a.py", "E501"), ("b.py", "W291")]
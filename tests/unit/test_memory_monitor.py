@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Unit tests for phase-scoped allocation tracing and cache namespace reporting."""
+
+import gc
+
+import pytest
+
+from analyzer.architecture.connascence_orchestrator import ConnascenceOrchestrator
+from analyzer.optimization import memory_monitor
+from analyzer.optimization.memory_monitor import (
+    CacheNamespaceRegistry, MemoryMonitor, get_cache_namespace_report, register_cache_namespace,
+    unregister_cache_namespace,
+)
+
+class _Config:
+    """Minimal configuration provider."""
+
+    def __init__(self, **values):
+        self.values = values
+
+    def get_config(self, key, default):
+        return self.values.get(key, default)
+
+class _Cache:
+    """Cache reporting a fixed footprint."""
+
+    def memory_footprint(self):
+        return {'entries': 3, 'size_bytes': 2048}
+
+@pytest.fixture
+def monitor():
+    """Monitor with tracing on; tracemalloc is stopped afterwards."""
+    traced = MemoryMonitor()
+    traced.enable_allocation_tracing(top_n=5, sample_every=3)
+    yield traced
+    traced.disable_allocation_tracing()
+
+class TestPhaseTracing:
+    """Test allocation attribution to analysis phases."""
+
+    def test_phase_reports_retained_bytes_and_allocation_site(self, monitor):
+        """Memory kept by a phase is attributed to it, with the allocating line on top."""
+        with monitor.trace_phase('parse'):
+            retained = [bytearray(1024) for _ in range(2000)]
+
+        phase = monitor.get_memory_report()['allocation_phases']['phases']['parse']
+        assert phase['net_retained_mb'] > 1.5
+        assert phase['top_sites'][0]['site'].startswith(__file__)
+        assert any('parse' in text for text in monitor.get_memory_report()['recommendations'])
+        del retained
+
+    def test_snapshots_are_sampled_and_phases_ordered(self, monitor):
+        """Only one in sample_every calls diffs snapshots; canonical phases come first."""
+        for _ in range(5):
+            with monitor.trace_phase('detect'):
+                pass
+        with monitor.trace_phase('custom'):
+            pass
+        with monitor.trace_phase('discovery'):
+            pass
+
+        phases = monitor.get_phase_report()['phases']
+        assert list(phases) == ['discovery', 'detect', 'custom']
+        assert phases['detect']['calls'] == 5 and phases['detect']['sampled_calls'] == 2
+
+    def test_disabled_tracing_is_a_shared_no_op(self):
+        """Without tracing, trace_phase records nothing."""
+        untraced = MemoryMonitor()
+        assert untraced.trace_phase('parse') is untraced.trace_phase('detect')
+        with untraced.trace_phase('parse'):
+            pass
+        assert untraced.get_phase_report()['phases'] == {}
+
+class TestCacheNamespaces:
+    """Test the cache size registration API."""
+
+    def test_bound_reporters_are_weak_and_sizes_total(self):
+        """A collected cache drops out of the report; function reporters stay."""
+        registry = CacheNamespaceRegistry()
+        cache = _Cache()
+        registry.register('results', cache.memory_footprint)
+        registry.register('static', lambda: {'entries': 1, 'size_bytes': 100})
+        assert registry.report()['total_size_bytes'] == 2148
+
+        del cache
+        gc.collect()
+        assert list(registry.report()['namespaces']) == ['static']
+
+    def test_global_registry_feeds_memory_report(self):
+        """Registered namespaces appear in get_memory_report with a size recommendation."""
+        cache = _Cache()
+        register_cache_namespace('test_cache', cache.memory_footprint)
+        try:
+            report = MemoryMonitor().get_memory_report()
+            assert report['cache_namespaces']['namespaces']['test_cache']['entries'] == 3
+            assert get_cache_namespace_report()['total_size_bytes'] >= 2048
+        finally:
+            unregister_cache_namespace('test_cache')
+
+class TestOrchestratorPhases:
+    """Test phase wiring in the analysis pipeline."""
+
+    def test_pipeline_phases_are_traced(self, tmp_path, monkeypatch):
+        """Analysis and reporting populate every canonical phase."""
+        monkeypatch.setattr(memory_monitor, '_global_monitor', None)
+        (tmp_path / 'module.py').write_text("def f(a, b, c, d, e, g):\n    return a * 12345\n")
+        orchestrator = ConnascenceOrchestrator(_Config(
+            enable_caching=False, enable_parallel_processing=False, trace_allocations=True))
+        try:
+            result = orchestrator.analyze_project(tmp_path)
+            orchestrator.reporter.generate_report(result)
+            phases = orchestrator.get_system_status()['allocation_phases']['phases']
+        finally:
+            orchestrator.memory_monitor.disable_allocation_tracing()
+
+        assert list(phases) == list(memory_monitor.ANALYSIS_PHASES)
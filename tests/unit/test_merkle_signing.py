@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Unit tests for Merkle batch signing and inclusion proofs."""
+
+import json
+import shutil
+import subprocess
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from analyzer.enterprise.supply_chain.crypto_signer import CryptographicSigner
+from analyzer.enterprise.supply_chain.evidence_packager import EvidencePackager
+from analyzer.enterprise.supply_chain.merkle import MerkleTree, merkle_node_hash, verify_inclusion
+from analyzer.enterprise.supply_chain.supply_chain_analyzer import SupplyChainAnalyzer
+
+def _reference_root(leaves):
+    """RFC 6962 MTH: split at the largest power of two below n."""
+    if len(leaves) == 1:
+        return leaves[0]
+    split = 1
+    while split * 2 < len(leaves):
+        split *= 2
+    return merkle_node_hash(_reference_root(leaves[:split]), _reference_root(leaves[split:]))
+
+class TestMerkleTree:
+    """Test tree construction and audit paths."""
+
+    def test_roots_and_proofs_for_every_size(self):
+        """Roots match RFC 6962 and every leaf's proof verifies, tampered ones do not."""
+        for size in range(1, 34):
+            leaves = [bytes([index]) * 32 for index in range(size)]
+            tree = MerkleTree(leaves)
+            assert tree.root == _reference_root(leaves)
+            for index in range(size):
+                proof = tree.proof(index)
+                assert verify_inclusion(leaves[index], index, size, proof, tree.root)
+                if size > 1:
+                    assert not verify_inclusion(leaves[index], (index + 1) % size, size, proof, tree.root)
+                assert not verify_inclusion(b"\xff" * 32, index, size, proof, tree.root)
+
+@pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl not installed")
+class TestMerkleSigning:
+    """Test one signature covers a batch of artifacts."""
+
+    @pytest.fixture
+    def signer(self, tmp_path):
+        key, cert = tmp_path / "signing.key", tmp_path / "signing.pem"
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", str(key),
+                        "-out", str(cert), "-days", "1", "-subj", "/CN=test-signer"],
+                       check=True, capture_output=True)
+        signer = CryptographicSigner({"output_dir": str(tmp_path / "out"), "signing_key_path": str(key),
+                                      "signing_cert_path": str(cert)})
+        with patch.object(signer, "_is_cosign_available", return_value=False):
+            yield signer
+
+    def test_one_signature_and_per_artifact_proofs(self, tmp_path, signer):
+        """A batch is signed once; each artifact verifies from its own proof."""
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        artifacts = []
+        for index in range(7):
+            path = dist / f"wheel-{index}.whl"
+            path.write_bytes(bytes([index]) * 1024)
+            artifacts.append({"path": str(path)})
+        artifacts.append({"path": str(dist / "missing.whl")})
+
+        real_run = subprocess.run
+        sign_calls = []
+
+        def counting_run(cmd, *args, **kwargs):
+            if cmd[:2] == ["openssl", "dgst"] and "-sign" in cmd:
+                sign_calls.append(cmd)
+            return real_run(cmd, *args, **kwargs)
+
+        with patch("subprocess.run", side_effect=counting_run):
+            results = signer.sign_artifacts(artifacts)
+
+        assert len(sign_calls) == 1
+        assert results["signatures_created"] == 1 and results["verification_successful"] == 1
+        assert results["artifacts_signed"] == 7
+        assert results["merkle_root"]["tree_size"] == 7
+        assert [error["artifact"] for error in results["errors"]] == [str(dist / "missing.whl")]
+        assert {entry["signing_method"] for entry in results["artifacts"]} == {"merkle/pki"}
+
+        for artifact in artifacts[:-1]:
+            assert signer.verify_inclusion_proof(artifact["path"])["valid"]
+
+        (dist / "wheel-3.whl").write_bytes(b"tampered")
+        assert not signer.verify_inclusion_proof(str(dist / "wheel-3.whl"))["valid"]
+
+        proof_path = dist / "wheel-4.whl.proof.json"
+        proof = json.loads(proof_path.read_text())
+        proof["leaf_index"] = 5
+        proof_path.write_text(json.dumps(proof))
+        verification = signer.verify_inclusion_proof(str(dist / "wheel-4.whl"), check_signature=False)
+        assert verification["errors"] == ["Inclusion proof does not lead to the root"]
+
+    def test_per_artifact_mode_is_kept(self, tmp_path, signer):
+        """signing_mode='per_artifact' still produces one signature per artifact."""
+        signer.signing_mode = "per_artifact"
+        paths = []
+        for index in range(2):
+            path = tmp_path / f"artifact-{index}.bin"
+            path.write_bytes(b"payload %d" % index)
+            paths.append(path)
+
+        results = signer.sign_artifacts([{"path": str(path)} for path in paths])
+        assert results["signatures_created"] == results["artifacts_signed"] == 2 and "merkle_root" not in results
+        assert all((tmp_path / f"{path.name}.sig").exists() for path in paths)
+
+    def test_summary_counts_artifacts_covered_by_batch(self, tmp_path, signer):
+        """The analysis summary reports signed artifacts, not the number of Merkle signatures."""
+        artifacts = []
+        for index in range(5):
+            path = tmp_path / f"artifact-{index}.bin"
+            path.write_bytes(b"payload %d" % index)
+            artifacts.append({"path": str(path)})
+        results = signer.sign_artifacts(artifacts)
+
+        analyzer = SupplyChainAnalyzer({"output_dir": str(tmp_path / "out")})
+        summary = analyzer._generate_analysis_summary({"status": "SUCCESS", "signatures": results})
+        assert results["signatures_created"] == 1
+        assert summary["artifacts_signed"] == 5
+
+    def test_copied_proof_verifies_without_signer_paths(self, tmp_path, signer):
+        """A proof resolves its statement, signature and certificate from its own directory."""
+        artifacts = []
+        for index in range(3):
+            path = tmp_path / f"lib-{index}.tar.gz"
+            path.write_bytes(b"release %d" % index)
+            artifacts.append({"path": str(path)})
+        merkle_root = signer.sign_artifacts(artifacts)["merkle_root"]
+
+        moved = tmp_path / "moved"
+        moved.mkdir()
+        for name in ("lib-1.tar.gz", "lib-1.tar.gz.proof.json"):
+            shutil.copy(tmp_path / name, moved)
+        for key in ("statement_path", "signature_path", "certificate_path"):
+            shutil.move(merkle_root[key], moved)
+
+        verification = signer.verify_inclusion_proof(str(moved / "lib-1.tar.gz"))
+        assert verification["valid"], verification["errors"]
+    def test_packaged_proof_verifies_after_relocation(self, tmp_path, signer):
+        """The package holds only this run's root; its proofs verify without the signer's paths."""
+        out = tmp_path / "out"
+        (out / "merkle-root-0000000000000000.json").write_text("{}")
+        (out / "merkle-root-0000000000000000.json.sig").write_bytes(b"stale")
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        artifacts = []
+        for index in range(3):
+            path = dist / f"lib-{index}.tar.gz"
+            path.write_bytes(b"release %d" % index)
+            artifacts.append({"path": str(path)})
+        results = signer.sign_artifacts(artifacts)
+        statement_name = Path(results["merkle_root"]["statement_path"]).name
+
+        package_info = EvidencePackager({"output_dir": str(out)}).create_evidence_package(str(dist), artifacts)
+        roots = sorted(name for name in package_info["files_included"] if "merkle-root-" in name)
+        assert roots == [f"signatures/{statement_name}", f"signatures/{statement_name}.sig",
+                         f"signatures/{statement_name}.sig.json"]
+        assert "signatures/signing.pem" in package_info["files_included"]
+
+        extracted = tmp_path / "elsewhere"
+        with zipfile.ZipFile(package_info["package_path"]) as archive:
+            archive.extractall(extracted)
+        shutil.copy(dist / "lib-1.tar.gz", extracted / "signatures")
+        shutil.rmtree(out)
+        (tmp_path / "signing.pem").unlink()
+
+        verification = signer.verify_inclusion_proof(str(extracted / "signatures" / "lib-1.tar.gz"))
+        assert verification["valid"], verification["errors"]
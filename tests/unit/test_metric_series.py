@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Unit tests for constant-memory metric storage in the performance monitors."""
+
+import random
+
+from analyzer.optimization.metric_series import MetricSeries, QuantileSketch, RateCounter, RingBuffer
+from analyzer.optimization.streaming_performance_monitor import StreamingPerformanceMonitor
+from analyzer.performance.real_time_monitor import BottleneckDetector, RealTimeMetrics
+
+class TestRingBuffer:
+    """Test the fixed-capacity window."""
+
+    def test_wraps_in_arrival_order_with_running_mean(self):
+        """Old samples are overwritten; tail and mean cover only the window."""
+        ring = RingBuffer(4)
+        for value in range(1, 11):
+            ring.append(float(value))
+
+        assert len(ring) == 4
+        assert ring.values() == [7.0, 8.0, 9.0, 10.0]
+        assert ring.tail(2) == [9.0, 10.0]
+        assert ring.last() == 10.0
+        assert ring.mean() == 8.5
+
+class TestQuantileSketch:
+    """Test sketch accuracy and bounds."""
+
+    def test_percentiles_within_relative_accuracy(self):
+        """p50/p95/p99 stay within 1% of the exact sample percentiles."""
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(3.0, 1.0) for _ in range(20000)]
+        series = MetricSeries(window_size=100)
+        for value in samples:
+            series.add(value)
+
+        ordered = sorted(samples)
+        for percent in (50, 95, 99):
+            exact = ordered[int(percent / 100 * (len(ordered) - 1))]
+            assert abs(series.percentile(percent) - exact) <= 0.011 * exact
+        assert series.summary()['min'] == ordered[0]
+
+    def test_bins_are_bounded(self):
+        """Wide value ranges collapse low buckets instead of growing."""
+        sketch = QuantileSketch(relative_accuracy=0.01, max_bins=64)
+        for exponent in range(-6, 12):
+            for step in range(50):
+                sketch.add(10.0 ** exponent * (1 + step / 50))
+        assert sketch.bin_count <= 64
+        assert sketch.quantile(1.0) == sketch.max
+
+    def test_rate_counter_expires_old_seconds(self):
+        """Only events inside the window count towards the rate."""
+        counter = RateCounter(window_seconds=10)
+        counter.add(5, now=100.0)
+        counter.add(5, now=105.0)
+        assert counter.total(now=109.0) == 10
+        assert counter.total(now=112.0) == 5
+
+class TestMonitors:
+    """Test monitor wiring."""
+
+    def test_streaming_monitor_storage_is_constant(self):
+        """Many events keep fixed-size windows while the sketch still reports tails."""
+        monitor = StreamingPerformanceMonitor()
+        monitor.start_session("s1", watched_files=3)
+        for index in range(5000):
+            monitor.record_file_event("modified", "a.py", float(index % 100))
+            monitor.record_debounce_delay(10.0)
+
+        metrics = monitor.get_current_metrics()
+        assert len(metrics.analysis_latency_ms) == 500
+        assert len(metrics.debounce_delays_ms) == 200
+        timing = monitor.get_performance_report()["timing_analysis"]
+        assert 93.0 <= timing["p95_latency_ms"] <= 96.0
+        assert timing["max_latency_ms"] == 99.0
+        assert monitor.end_session("s1").average_latency_ms == 49.5
+
+    def test_bottleneck_detector_baseline_and_anomaly(self):
+        """The baseline comes from the ring windows and wait-time spikes still alert."""
+        detector = BottleneckDetector(history_window=50)
+        for index in range(40):
+            detector.analyze_metrics(RealTimeMetrics(
+                timestamp=float(index), average_wait_time_ms=1.0 + (index % 2) * 0.1,
+                throughput_ops_per_second=100.0))
+        assert detector.baseline_metrics["throughput_ops"] == 100.0
+
+        alerts = detector.analyze_metrics(RealTimeMetrics(
+            timestamp=41.0, average_wait_time_ms=9.0, throughput_ops_per_second=100.0))
+        assert any("anomaly" in alert.alert_id for alert in alerts)
+        assert detector.get_percentiles()["wait_time_ms"]["count"] == 41
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Unit tests for incremental NASA compliance scoring."""
+
+import pytest
+
+from analyzer.nasa_compliance_calculator import NASAComplianceCalculator
+from analyzer.nasa_compliance_tracker import IncrementalComplianceTracker, flatten_violations
+
+@pytest.fixture
+def calculator(tmp_path):
+    """Calculator backed by a temporary default config."""
+    return NASAComplianceCalculator(config_path=str(tmp_path / "nasa_config.json"))
+
+class _StubCache:
+    """Minimal stand-in for IncrementalCache partial result storage."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def store_partial_result(self, file_path, result_type, data, content_hash):
+        self.entries[(file_path, result_type)] = (content_hash, data)
+
+    def get_partial_result(self, file_path, result_type, current_hash=None):
+        entry = self.entries.get((file_path, result_type))
+        if entry is None or entry[0] != current_hash:
+            return None
+        return type("Partial", (), {"data": entry[1]})()
+
+class TestIncrementalComplianceTracker:
+    """Test delta-maintained compliance aggregate."""
+
+    def test_matches_full_recalculation(self, calculator):
+        """Incremental score equals scoring the full violation list."""
+        tracker = IncrementalComplianceTracker(calculator=calculator)
+        file_a = [{"type": "god_object", "severity": "high"}, {"type": "magic_literal", "severity": "medium"}]
+        file_b = [{"type": "position_coupling", "severity": "low"}]
+        tracker.update_file("a.py", file_a)
+        tracker.update_file("b.py", file_b)
+
+        expected = calculator.calculate_compliance(file_a + file_b, file_count=2)
+        result = tracker.get_compliance_result()
+        assert result.score == pytest.approx(expected.score)
+        assert result.violation_breakdown == expected.violation_breakdown
+
+    def test_update_replaces_previous_counts(self, calculator):
+        """Re-analysing a file applies only the delta."""
+        tracker = IncrementalComplianceTracker(calculator=calculator)
+        tracker.update_file("a.py", [{"type": "x", "severity": "critical"}] * 3)
+        tracker.update_file("a.py", [{"type": "x", "severity": "low"}])
+
+        assert tracker.get_severity_counts() == {"critical": 0, "high": 0, "medium": 0, "low": 1}
+        assert tracker.remove_file("a.py")
+        assert tracker.get_severity_counts()["low"] == 0
+        assert not tracker.remove_file("a.py")
+
+    def test_result_memoized_until_change(self, calculator):
+        """Reads between changes reuse the scored result."""
+        tracker = IncrementalComplianceTracker(calculator=calculator)
+        tracker.update_file("a.py", [{"type": "x", "severity": "high"}])
+        first = tracker.get_compliance_result()
+        assert tracker.get_compliance_result() is first
+        tracker.update_file("b.py", [])
+        assert tracker.get_compliance_result() is not first
+
+    def test_counts_restored_from_cache(self, calculator):
+        """Unchanged files restore counts without their violation list."""
+        cache = _StubCache()
+        tracker = IncrementalComplianceTracker(calculator=calculator, cache=cache)
+        tracker.update_file("a.py", [{"type": "x", "severity": "high"}], content_hash="h1")
+
+        restored = IncrementalComplianceTracker(calculator=calculator, cache=cache)
+        assert restored.update_file("a.py", content_hash="h1") is not None
+        assert restored.get_severity_counts()["high"] == 1
+        assert restored.update_file("a.py", content_hash="h2") is None
+
+    def test_metrics_compliance_from_categories(self, calculator):
+        """Category counts feed ConnascenceMetrics scoring."""
+        tracker = IncrementalComplianceTracker(calculator=calculator)
+        tracker.update_file("a.py", {"magic_literal": [{"severity": "medium"}] * 4})
+        compliance = tracker.get_metrics_compliance()
+        assert compliance["rule_scores"]["rule_8"] == pytest.approx(0.6)
+
+    def test_flatten_type_keyed_violations(self):
+        """Streaming payloads keyed by type are flattened."""
+        flat = flatten_violations({"magic_literal": [{"line": 1}], "god_object": [], "other": 1})
+        assert [v["type"] for v in flat] == ["magic_literal", "other"]
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Unit tests for the offline OSV mirror."""
+
+import asyncio
+import json
+import zipfile
+from unittest.mock import patch
+
+from analyzer.enterprise.supply_chain.osv_mirror import OSVMirror, range_intervals, version_in_interval
+from analyzer.enterprise.supply_chain.vulnerability_scanner import VulnerabilityScanner
+
+def _advisory(advisory_id, ecosystem, name, events=None, versions=None, modified="2024-01-01T00:00:00Z", **extra):
+    affected = {"package": {"ecosystem": ecosystem, "name": name}}
+    if events is not None:
+        affected["ranges"] = [{"type": "ECOSYSTEM", "events": events}]
+    if versions is not None:
+        affected["versions"] = versions
+    return {"id": advisory_id, "modified": modified, "summary": f"{advisory_id} summary",
+            "affected": [affected], **extra}
+
+def _write_export(path, advisories):
+    with zipfile.ZipFile(path, "w") as archive:
+        for advisory in advisories:
+            archive.writestr(f"{advisory['id']}.json", json.dumps(advisory))
+    return path
+
+class TestVersionIntervals:
+    """Test precomputed intervals and version ordering."""
+
+    def test_events_flatten_to_intervals(self):
+        """Fixed bounds are exclusive, last_affected inclusive, an open range is unbounded."""
+        intervals = range_intervals("npm", [{"introduced": "0"}, {"fixed": "1.2.0"},
+                                            {"introduced": "2.0.0"}, {"last_affected": "2.1.0"},
+                                            {"introduced": "3.0.0"}])
+        assert intervals == [(None, "1.2.0", False), ("2.0.0", "2.1.0", True), ("3.0.0", None, False)]
+
+        assert version_in_interval("npm", "1.2.0-beta.1", intervals[0])
+        assert not version_in_interval("npm", "1.2.0", intervals[0])
+        assert version_in_interval("npm", "2.1.0", intervals[1])
+        assert version_in_interval("PyPI", "1.9", ("1.4", "1.10", False))
+        assert not version_in_interval("PyPI", "1.10.0", ("1.4", "1.10", False))
+
+class TestOSVMirror:
+    """Test importing exports and scanning against the store."""
+
+    def test_import_and_lookup(self, tmp_path):
+        """Ranges, explicit versions, updates and withdrawals are all honoured."""
+        export = _write_export(tmp_path / "all.zip", [
+            _advisory("PYSEC-1", "PyPI", "Django_REST", events=[{"introduced": "0"}, {"fixed": "2.0"}]),
+            _advisory("GHSA-1", "npm", "left-pad", versions=["1.0.0", "1.0.1"]),
+            _advisory("GHSA-2", "npm", "left-pad", events=[{"introduced": "0"}], withdrawn="2024-02-01"),
+        ])
+        mirror = OSVMirror(tmp_path / "osv.db")
+        assert mirror.import_archive(export) == {"imported": 2, "unchanged": 0, "withdrawn": 1, "skipped": 0}
+
+        assert [a["id"] for a in mirror.lookup("PyPI", "django-rest", "1.9")] == ["PYSEC-1"]
+        assert mirror.lookup("PyPI", "django-rest", "2.0") == []
+        assert [a["id"] for a in mirror.lookup("npm", "left-pad", "1.0.1")] == ["GHSA-1"]
+        assert mirror.lookup("npm", "left-pad", "1.0.2") == []
+
+        newer = _advisory("PYSEC-1", "PyPI", "django-rest", events=[{"introduced": "0"}, {"fixed": "2.1"}],
+                          modified="2024-06-01T00:00:00Z")
+        assert mirror.import_advisories([newer])["imported"] == 1
+        assert mirror.import_archive(export)["unchanged"] == 2
+        assert [a["id"] for a in mirror.lookup("PyPI", "django-rest", "2.0")] == ["PYSEC-1"]
+        assert mirror.get_stats()["advisories"] == 2
+
+    def test_scanner_runs_against_mirror_without_network(self, tmp_path):
+        """With osv_mirror_path set, scan_vulnerabilities never opens an HTTP session."""
+        mirror = OSVMirror(tmp_path / "osv.db")
+        mirror.import_advisories([_advisory(
+            "PYSEC-2", "PyPI", "requests", events=[{"introduced": "0"}, {"fixed": "2.31.0"}],
+            database_specific={"severity": "HIGH"})])
+        mirror.close()
+
+        scanner = VulnerabilityScanner({"output_dir": str(tmp_path / "out"), "osv_mirror_path": str(tmp_path / "osv.db")})
+        components = [{"name": "requests", "version": "2.30.0", "ecosystem": "pypi", "licenses": ["Apache-2.0"]},
+                      {"name": "requests", "version": "2.31.0", "ecosystem": "pypi", "licenses": ["Apache-2.0"]}]
+        components += [{"name": f"pkg{index}", "version": "1.0.0", "ecosystem": "npm", "licenses": ["MIT"]}
+                       for index in range(2000)]
+
+        with patch("aiohttp.ClientSession", side_effect=AssertionError("network used")):
+            results = asyncio.run(scanner.scan_vulnerabilities(components))
+
+        assert [v["id"] for v in results["vulnerabilities"]] == ["PYSEC-2"]
+        assert results["summary"]["high"] == 1
+        assert len(results["components_scanned"]) == len(components)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Unit tests for size-aware chunking and the work-stealing process executor."""
+
+import time
+
+from analyzer.performance.parallel_analyzer import ParallelAnalysisConfig, ParallelConnascenceAnalyzer
+from src.detectors.parallel_executor import AdaptiveBatchProcessor, WorkStealingProcessExecutor
+from src.detectors.workload_optimizer import FileCostEstimator
+
+def _sleep_chunk(items, durations):
+    """Process-pool task: sleep for each item's duration and echo the items."""
+    for item in items:
+        time.sleep(durations[item])
+    return items
+
+class TestSizeAwareChunking:
+    """Test cost-based partitioning and LPT dealing."""
+
+    def test_expensive_items_run_alone_and_cheap_items_batch(self):
+        """One heavy item gets its own chunk; light items are grouped up to the batch size."""
+        processor = AdaptiveBatchProcessor()
+        processor.current_batch_size = 3
+        costs = [10.0] + [0.1] * 7
+
+        chunks = processor.partition_by_cost(costs, num_workers=2, chunks_per_worker=2)
+        assert chunks[0] == [0]
+        assert all(len(chunk) <= 3 for chunk in chunks)
+        assert sorted(index for chunk in chunks for index in chunk) == list(range(8))
+
+    def test_plan_balances_estimated_load(self):
+        """Chunks are dealt longest-first onto the least loaded deque."""
+        executor = WorkStealingProcessExecutor(max_workers=2)
+        executor.batch_processor.current_batch_size = 1
+        deques = executor.plan([5.0, 4.0, 3.0, 2.0, 1.0, 1.0])
+        loads = sorted(sum(cost for cost, _ in worker_deque) for worker_deque in deques)
+        assert loads == [8.0, 8.0]
+
+class TestWorkStealing:
+    """Test stealing over real process workers."""
+
+    def test_idle_worker_steals_from_slow_worker(self):
+        """Wrong estimates are corrected at run time by stealing; every item runs once."""
+        durations = {index: 0.01 for index in range(8)}
+        durations[0] = 0.6
+        executor = WorkStealingProcessExecutor(max_workers=2)
+        executor.batch_processor.current_batch_size = 1
+
+        outcomes = executor.map_chunks(_sleep_chunk, list(range(8)), [1.0] * 8, durations)
+
+        assert sorted(item for outcome in outcomes for item in outcome.result) == list(range(8))
+        assert all(outcome.error is None for outcome in outcomes)
+        assert executor.last_run_stats['steals'] == 3
+        assert any(outcome.stolen for outcome in outcomes)
+
+    def test_analyzer_uses_work_stealing_and_learns_costs(self, tmp_path):
+        """The parallel analyzer schedules through the executor and records per-file costs."""
+        for name, lines in (("small.py", 2), ("large.py", 200)):
+            (tmp_path / name).write_text("def f(a, b):\n    return a * 42\n" * lines)
+        analyzer = ParallelConnascenceAnalyzer(ParallelAnalysisConfig(max_workers=2, use_processes=False))
+        analyzer.file_costs = FileCostEstimator()
+
+        result = analyzer.analyze_files_batch(sorted(tmp_path.glob("*.py")))
+
+        assert result["files_analyzed"] == 2
+        assert result["scheduling"]["strategy"] == "work_stealing"
+        assert analyzer.file_costs.get_stats()["files_tracked"] == 2
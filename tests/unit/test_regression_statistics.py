@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Unit tests for regression detection statistics."""
+
+import numpy as np
+import pytest
+
+from analyzer.performance.benchmark_suite import BenchmarkResults, ScenarioResult
+from analyzer.performance.regression_detector import (
+    BaselineTracker,
+    PerformanceMetric,
+    RegressionType,
+    StatisticalAnalyzer,
+    evaluate_benchmark_gate,
+)
+from analyzer.performance.statistical_tests import (
+    WelfordAccumulator,
+    bootstrap_relative_change_ci,
+    mann_whitney_u,
+    student_t_sf,
+    welch_t_test,
+)
+
+class TestStatisticalTests:
+    """Test p-values against reference values."""
+
+    def test_student_t_tail(self):
+        """Exact t tail probabilities (reference values from tables)."""
+        assert student_t_sf(1.0, 1) == pytest.approx(0.25)
+        assert student_t_sf(2.0, 10) == pytest.approx(0.036694, abs=1e-6)
+        assert student_t_sf(-2.0, 10) == pytest.approx(1 - 0.036694, abs=1e-6)
+
+    def test_welch_matches_reference(self):
+        """Welch statistic, df and p-value for a known example."""
+        result = welch_t_test([1, 2, 3, 4, 5], [3, 4, 5, 6, 7, 8])
+        assert result.statistic == pytest.approx(2.40192, abs=1e-5)
+        assert result.df == pytest.approx(8.98936, abs=1e-5)
+        assert result.p_value == pytest.approx(0.03980, abs=1e-5)
+        assert welch_t_test([1, 2, 3, 4, 5], [3, 4, 5, 6, 7, 8], "greater").p_value == pytest.approx(0.01990, abs=1e-5)
+
+    def test_welch_vectorized_rows(self):
+        """Several metrics are tested in one call."""
+        result = welch_t_test([[1, 2, 3], [5, 5, 6]], [[2, 3, 4], [9, 9, 10]])
+        assert result.p_value.shape == (2,)
+        assert result.p_value[1] < 0.01 < result.p_value[0]
+
+    def test_mann_whitney_with_ties(self):
+        """U statistic and tie-corrected normal approximation."""
+        result = mann_whitney_u([1, 2, 3, 4, 5], [3, 4, 5, 6, 7, 8])
+        assert result.statistic == pytest.approx(25.5)
+        assert result.p_value == pytest.approx(0.0660, abs=1e-4)
+
+    def test_bootstrap_ci_brackets_change(self):
+        """A 50% slowdown yields a CI above zero."""
+        low, high = bootstrap_relative_change_ci([10, 11, 10, 12, 9, 10], [15, 16, 15, 14, 16, 15])
+        assert 0 < low < 50 < high
+
+    def test_welford_matches_numpy(self):
+        """Streaming add/remove/merge agree with batch statistics."""
+        values = np.random.default_rng(1).normal(100, 5, 200)
+        first, second = WelfordAccumulator(), WelfordAccumulator()
+        for value in values[:120]:
+            first.add(value)
+        for value in values[120:]:
+            second.add(value)
+        first.merge(second)
+        assert first.mean == pytest.approx(values.mean())
+        assert first.variance == pytest.approx(values.var(ddof=1))
+
+        first.remove(values[0])
+        assert first.mean == pytest.approx(values[1:].mean())
+        assert first.variance == pytest.approx(values[1:].var(ddof=1))
+
+class TestRegressionDetection:
+    """Test detector and benchmark gate."""
+
+    def test_detect_regression_uses_real_p_value(self):
+        """Noise does not trigger; a real shift does."""
+        analyzer = StatisticalAnalyzer()
+        stable = analyzer.detect_regression([100, 102, 98, 101, 99], [101, 99, 100, 102, 98])
+        assert not stable["regression_detected"]
+        assert stable["p_value"] > 0.5
+
+        slower = analyzer.detect_regression([100, 102, 98, 101, 99], [130, 128, 131, 129, 132], alternative="greater")
+        assert slower["regression_detected"]
+        assert slower["p_value"] < 0.001
+
+    def test_tracker_keeps_streaming_stats(self):
+        """Baseline stats come from accumulators bounded by the window."""
+        tracker = BaselineTracker()
+        for i in range(1005):
+            tracker.add_metric_data(PerformanceMetric("latency", RegressionType.LATENCY, float(i), timestamp=1.0 + i))
+        stats = tracker.get_metric_statistics("latency")
+        assert stats.count == 1000
+        assert stats.mean == pytest.approx(np.arange(5, 1005).mean())
+        details = tracker.get_baseline_stats()["metric_details"]["latency"]
+        assert (details["mean"], details["std_dev"]) == (stats.mean, stats.stdev)
+
+    def test_benchmark_gate(self):
+        """Only statistically real slowdowns fail the gate."""
+        def results(cold, warm):
+            return BenchmarkResults(corpus={"digest": "d"}, scenarios={
+                "cold_full_scan": ScenarioResult("cold_full_scan", cold),
+                "warm_rescan": ScenarioResult("warm_rescan", warm),
+            }).to_dict()
+
+        baseline = results([100, 101, 99, 100, 102], [10, 11, 10, 9, 10])
+        same = results([101, 100, 100, 99, 101], [10, 10, 11, 10, 9])
+        slower = results([100, 101, 99, 100, 102], [14, 15, 14, 15, 14])
+
+        assert evaluate_benchmark_gate(baseline, same)["passed"]
+        gate = evaluate_benchmark_gate(baseline, slower)
+        assert not gate["passed"]
+        assert gate["scenarios"]["benchmark.warm_rescan"]["regression_detected"]
+        assert not gate["scenarios"]["benchmark.cold_full_scan"]["regression_detected"]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Unit tests for shared-aggregation multi-format reporting."""
+
+import json
+
+import pytest
+
+from analyzer.analyzer_types import UnifiedAnalysisResult
+from analyzer.reporting.chunked_html import ChunkedHTMLReportWriter
+from analyzer.reporting.coordinator import UnifiedReportingCoordinator
+from analyzer.reporting.report_model import build_report_model
+
+@pytest.fixture
+def analysis_result():
+    """Unified result with violations spread over a few files."""
+    violations = [
+        {"id": f"v{i}", "type": "CoM" if i % 2 else "CoP", "severity": "high" if i < 2 else "medium",
+         "file_path": f"src/module_{i % 3}.py", "line_number": i + 1, "description": f"Issue {i}", "weight": 2}
+        for i in range(9)
+    ]
+    return UnifiedAnalysisResult(
+        connascence_violations=violations, duplication_clusters=[], nasa_violations=[],
+        total_violations=9, critical_count=0, high_count=2, medium_count=7, low_count=0,
+        connascence_index=18.0, nasa_compliance_score=0.9, duplication_score=1.0, overall_quality_score=0.8,
+        project_path="/tmp/project", policy_preset="default", analysis_duration_ms=5, files_analyzed=3,
+        timestamp="2025-01-01T00:00:00", priority_fixes=["Fix CoP"], improvement_actions=[],
+    )
+
+class TestReportModel:
+    """Test the precomputed report model."""
+
+    def test_groupings_and_counts(self, analysis_result):
+        """Model groups violations by file and counts by type once."""
+        model = build_report_model(analysis_result)
+        assert model.project_name == "project"
+        assert sum(len(items) for items in model.violations_by_file.values()) == 9
+        assert model.type_counts == {"CoP": 5, "CoM": 4}
+        assert model.top_files[0][1] == 3
+        assert model.severity_chart["data"] == [0, 2, 7, 0]
+
+    def test_model_is_immutable(self, analysis_result):
+        """Renderers cannot mutate the shared aggregates."""
+        model = build_report_model(analysis_result)
+        with pytest.raises(TypeError):
+            model.type_counts["CoP"] = 0
+        with pytest.raises(AttributeError):
+            model.project_name = "other"
+
+class TestMultiFormatReport:
+    """Test parallel multi-format generation."""
+
+    def test_formats_written_in_parallel(self, analysis_result, tmp_path):
+        """Each renderer writes its own output file from the shared model."""
+        coordinator = UnifiedReportingCoordinator()
+        formats = ["json", "sarif", "html", "csv", "xml", "summary", "text"]
+        generated = coordinator.generate_multi_format_report(analysis_result, formats, tmp_path, max_workers=4)
+
+        assert set(generated) == set(formats)
+        sarif = json.loads((tmp_path / "connascence_report.sarif").read_text())
+        assert len(sarif["runs"][0]["results"]) == 9
+        report = json.loads((tmp_path / "connascence_report.json").read_text())
+        assert report["summary"]["total_violations"] == 9
+        assert "<project>project</project>" in (tmp_path / "connascence_report.xml").read_text()
+
+    def test_model_built_once(self, analysis_result, tmp_path, monkeypatch):
+        """Aggregation runs once regardless of the number of formats."""
+        coordinator = UnifiedReportingCoordinator()
+        calls = []
+        original = coordinator.build_report_model
+        monkeypatch.setattr(coordinator, "build_report_model", lambda result: calls.append(1) or original(result))
+
+        coordinator.generate_multi_format_report(analysis_result, ["csv", "xml", "summary"], tmp_path)
+        assert len(calls) == 1
+
+def _load_callback(path):
+    """Parse the JSON payload of an index or chunk script."""
+    text = path.read_text()
+    return json.loads(text[text.index("(") + 1:text.rindex(")")])
+
+class TestChunkedHTMLReport:
+    """Test the shell page + index + chunk HTML mode."""
+
+    def test_chunks_and_index_written(self, analysis_result, tmp_path):
+        """Violations go to per-file pages; the shell page inlines none of them."""
+        coordinator = UnifiedReportingCoordinator()
+        output = tmp_path / "report.html"
+        shell = coordinator.generate_report(
+            analysis_result, "html", output, options={"html_chunked": True, "html_chunk_size": 2}
+        )
+
+        assert "Issue 0" not in shell
+        assert 'src="report_data/index.js"' in shell
+        data_dir = ChunkedHTMLReportWriter.data_dir_for(output)
+        index = _load_callback(data_dir / "index.js")
+        assert [entry["total"] for entry in index["files"]] == [3, 3, 3]
+        assert all(len(entry["chunks"]) == 2 for entry in index["files"])
+        assert index["severity_counts"]["high"] == 2
+
+        chunk = _load_callback(data_dir / "chunks" / f"{index['files'][0]['chunks'][1]}.js")
+        assert len(chunk["violations"]) == 1
+
+    def test_small_reports_stay_inline(self, analysis_result, tmp_path):
+        """Below the threshold the single-page report is kept."""
+        coordinator = UnifiedReportingCoordinator()
+        content = coordinator.generate_report(analysis_result, "html", tmp_path / "report.html")
+        assert "Fix CoP" in content
+        assert not (tmp_path / "report_data").exists()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Unit tests for streaming lockfile parsing and the SBOM component cache."""
+
+import base64
+import hashlib
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from analyzer.enterprise.supply_chain.lockfile_stream import iter_npm_lock_packages, iter_object_sections
+from analyzer.enterprise.supply_chain.sbom_generator import SBOMGenerator
+
+LEFT_PAD_INTEGRITY = "sha512-" + base64.b64encode(hashlib.sha512(b"left-pad").digest()).decode()
+
+LOCKFILE = {
+    "name": "demo",
+    "lockfileVersion": 2,
+    "requires": True,
+    "packages": {
+        "": {"name": "demo", "dependencies": {"left-pad": "^1.3.0"}},
+        "node_modules/left-pad": {"version": "1.3.0", "integrity": LEFT_PAD_INTEGRITY, "license": "WTFPL"},
+        "node_modules/@scope/util": {"version": "2.0.1", "description": "braces } and \"quotes\" {["},
+        "node_modules/@scope/util/node_modules/left-pad": {"version": "0.0.1"},
+    },
+    "dependencies": {
+        "left-pad": {"version": "1.2.0"},
+        "legacy-only": {"version": "0.9.0", "dependencies": {"nested": {"version": "1.0.0"}}},
+    },
+}
+
+@pytest.fixture
+def project(tmp_path):
+    project_dir = tmp_path / "demo"
+    project_dir.mkdir()
+    (project_dir / "package.json").write_text(json.dumps({
+        "name": "demo", "version": "4.5.6",
+        "dependencies": {"left-pad": "^1.3.0", "legacy-only": "^0.9.0"},
+        "devDependencies": {"@scope/util": "^2.0.0"}}))
+    (project_dir / "package-lock.json").write_text(json.dumps(LOCKFILE, indent=2))
+    (project_dir / "requirements.txt").write_text("requests==2.31.0\n")
+    return project_dir
+
+class TestLockfileStream:
+    """Test member-by-member parsing of package-lock.json."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+    def test_members_match_full_parse(self, tmp_path, chunk_size):
+        """Streaming yields the same entries as json.load regardless of chunk boundaries."""
+        lock_path = tmp_path / "package-lock.json"
+        lock_path.write_text(json.dumps(LOCKFILE, indent=2))
+
+        entries = list(iter_npm_lock_packages(lock_path, chunk_size=chunk_size))
+        assert [(section, name) for section, name, _ in entries] == [
+            ("packages", "left-pad"), ("packages", "@scope/util"),
+            ("dependencies", "left-pad"), ("dependencies", "legacy-only")]
+        assert entries[1][2] == LOCKFILE["packages"]["node_modules/@scope/util"]
+
+        members = list(iter_object_sections(io.StringIO('{"a": 12345, "s": {"k": [1, 2.5e3, null, true]}}'),
+                                            ("s",), chunk_size=chunk_size))
+        assert members == [("s", "k", [1, 2500.0, None, True])]
+
+        scalars = '{"packages": {"a": 1.5, "b": 1e5, "c": -0.25E-2, "d": true, "e": 12345678}}'
+        members = list(iter_object_sections(io.StringIO(scalars), ("packages",), chunk_size=chunk_size))
+        assert members == [("packages", "a", 1.5), ("packages", "b", 1e5), ("packages", "c", -0.0025),
+                           ("packages", "d", True), ("packages", "e", 12345678)]
+
+class TestIncrementalSBOM:
+    """Test components are cached by input hashes and both formats share one model."""
+
+    def test_unchanged_inputs_skip_analysis(self, tmp_path, project):
+        """A second run reuses everything; changed lockfiles or missing outputs rebuild what is needed."""
+        generator = SBOMGenerator({"output_dir": str(tmp_path / "out")})
+        paths = generator.generate_all_formats(str(project))
+
+        cyclone_dx = json.loads(open(paths["cyclone_dx"]).read())
+        spdx = json.loads(open(paths["spdx"]).read())
+        assert cyclone_dx["metadata"]["timestamp"] == spdx["creationInfo"]["created"]
+        assert cyclone_dx["metadata"]["component"]["version"] == "4.5.6"
+        components = {c["name"]: c for c in cyclone_dx["components"]}
+        assert components["left-pad"]["version"] == "1.3.0"
+        assert components["left-pad"]["hashes"] == [
+            {"alg": "sha512", "content": hashlib.sha512(b"left-pad").hexdigest()}]
+        assert components["left-pad"]["licenses"] == [{"license": {"name": "WTFPL"}}]
+        assert components["legacy-only"]["version"] == "0.9.0"
+        assert components["requests"]["version"] == "2.31.0"
+
+        fresh = SBOMGenerator({"output_dir": str(tmp_path / "out")})
+        with patch.object(fresh, "_analyze_dependencies", side_effect=AssertionError("re-analyzed")), \
+                patch.object(fresh, "_generate_spdx", side_effect=AssertionError("re-rendered")):
+            assert fresh.generate_all_formats(str(project)) == paths
+
+        # Outputs removed but inputs unchanged: re-render from cached components only
+        (tmp_path / "out" / "sbom-spdx.json").unlink()
+        with patch.object(fresh, "_analyze_dependencies", side_effect=AssertionError("re-analyzed")):
+            fresh.generate_all_formats(str(project))
+        assert (tmp_path / "out" / "sbom-spdx.json").exists()
+
+        lock = dict(LOCKFILE, packages=dict(LOCKFILE["packages"]))
+        lock["packages"]["node_modules/left-pad"] = {"version": "1.3.1"}
+        (project / "package-lock.json").write_text(json.dumps(lock))
+        fresh.generate_all_formats(str(project))
+        cyclone_dx = json.loads(open(paths["cyclone_dx"]).read())
+        assert {c["name"]: c["version"] for c in cyclone_dx["components"]}["left-pad"] == "1.3.1"
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Unit tests for streaming SARIF and JSON report writers."""
+
+import io
+import json
+
+from analyzer.ast_engine.core_analyzer import AnalysisResult, Violation
+from analyzer.reporting.json import JSONReporter
+from analyzer.reporting.sarif import RULE_TYPE_ORDER, SARIFReporter
+from analyzer.reporting.streaming import StreamingJSONWriter, StreamingSARIFWriter, write_json_report
+from analyzer.thresholds import ConnascenceType
+
+def _violation(index, connascence_type=ConnascenceType.MEANING, severity="medium"):
+    """Build a violation shaped like analyzer output."""
+    return Violation(
+        id=f"v{index}", type=connascence_type, severity=type("S", (), {"value": severity})(),
+        weight=1.5, locality="local", file_path=f"src/file_{index % 3}.py", line_number=index + 1,
+        column=0, end_line=None, end_column=None, description=f"Magic literal {index}",
+        recommendation="Use a constant", function_name=None, class_name=None,
+        code_snippet=None, context={},
+    )
+
+def _analysis_result(violations):
+    """Build an AnalysisResult with the attributes reporters read."""
+    result = AnalysisResult(violations)
+    result.timestamp = "2025-01-01T00:00:00"
+    result.project_root = "/project"
+    result.total_files_analyzed = 3
+    result.analysis_duration_ms = 10
+    result.summary_metrics = {}
+    result.policy_preset = "default"
+    result.file_stats = {}
+    result.budget_status = None
+    result.baseline_comparison = None
+    return result
+
+class TestStreamingSARIFWriter:
+    """Test SARIF streaming."""
+
+    def test_streamed_document_is_valid_sarif(self):
+        """Streamed output parses and carries every result."""
+        stream = io.StringIO()
+        with StreamingSARIFWriter(stream).begin() as writer:
+            writer.write_violations(_violation(i) for i in range(5))
+
+        document = json.loads(stream.getvalue())
+        run = document["runs"][0]
+        assert document["version"] == "2.1.0"
+        assert len(run["results"]) == 5
+        assert run["properties"]["totalResults"] == 5
+        assert run["results"][0]["ruleIndex"] == RULE_TYPE_ORDER.index(ConnascenceType.MEANING)
+
+    def test_compact_mode_has_no_newlines(self):
+        """Compact mode writes a single line."""
+        stream = io.StringIO()
+        writer = StreamingSARIFWriter(stream, compact=True).begin()
+        writer.write_violation({"rule_id": "CON_CoP", "severity": "high", "file_path": "a.py"})
+        writer.finish()
+
+        assert "\n" not in stream.getvalue()
+        result = json.loads(stream.getvalue())["runs"][0]["results"][0]
+        assert result["ruleIndex"] == RULE_TYPE_ORDER.index(ConnascenceType.POSITION)
+
+    def test_empty_stream(self):
+        """A stream without violations still forms a valid document."""
+        stream = io.StringIO()
+        StreamingSARIFWriter(stream).begin().finish()
+        assert json.loads(stream.getvalue())["runs"][0]["results"] == []
+
+    def test_export_results_to_file(self, tmp_path):
+        """export_results streams dict results to disk."""
+        output = tmp_path / "report.sarif"
+        SARIFReporter().export_results({"violations": [{"rule_id": "CON_CoM"}] * 3}, str(output))
+        assert len(json.loads(output.read_text())["runs"][0]["results"]) == 3
+
+    def test_streamed_file_matches_generate(self, tmp_path):
+        """export_results to a file writes the same run as generate(), conversion included."""
+        result = _analysis_result([_violation(i) for i in range(4)])
+        output = tmp_path / "report.sarif"
+        reporter = SARIFReporter()
+        reporter.export_results(result, str(output))
+
+        streamed = json.loads(output.read_text())
+        buffered = json.loads(reporter.generate(result))
+        for document in (streamed, buffered):
+            run = document["runs"][0]
+            assert run["conversion"]["invocation"].pop("endTimeUtc")
+            assert run.pop("automationDetails")["id"].startswith("connascence/")
+        assert streamed == buffered
+        assert list(streamed["runs"][0]) == list(buffered["runs"][0])
+
+class TestStreamingJSONWriter:
+    """Test JSON streaming."""
+
+    def test_matches_buffered_reporter(self):
+        """Streamed summary and violations match JSONReporter.generate."""
+        result = _analysis_result([_violation(i) for i in range(7)])
+        stream = io.StringIO()
+        assert write_json_report(result, stream) == 7
+
+        streamed = json.loads(stream.getvalue())
+        buffered = json.loads(JSONReporter().generate(result))
+        assert streamed["summary"] == buffered["summary"]
+        assert streamed["violations"] == buffered["violations"]
+        assert streamed["policy_compliance"] == buffered["policy_compliance"]
+
+    def test_compact_output(self):
+        """Compact JSON writer output parses."""
+        stream = io.StringIO()
+        with StreamingJSONWriter(stream, compact=True).begin() as writer:
+            writer.write_violation({"type": "CoM", "severity": "critical", "file_path": "a.py", "weight": 2})
+
+        document = json.loads(stream.getvalue())
+        assert "\n" not in stream.getvalue()
+        assert document["summary"]["quality_metrics"]["critical_violations"] == 1
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared per-file AST fact table."""
+
+import ast
+
+from analyzer.architecture.connascence_detector import ConnascenceDetector
+from analyzer.context_analyzer import ContextAnalyzer
+from analyzer.ml_modules.pattern_detector import PatternDetector
+from analyzer.nasa_engine.nasa_analyzer import NASAAnalyzer
+from analyzer.optimization import unified_visitor
+from analyzer.optimization.unified_visitor import ASTDataCache
+
+SOURCE = '''
+TIMEOUT = 30
+
+class Handler:
+    def configure(self, a, b, c, d, e, f):
+        while True:
+            handle(a * 12345)
+        return "/etc/app/config.yaml"
+
+def helper():
+    assert TIMEOUT
+    for item in range(3):
+        print(item)
+'''
+
+class TestASTDataCache:
+    """Test fact-table collection and reuse."""
+
+    def test_same_content_is_collected_once(self, monkeypatch):
+        """Unchanged content is parsed once; changed content is re-collected."""
+        parses = []
+        real_parse = ast.parse
+        monkeypatch.setattr(unified_visitor.ast, "parse",
+                            lambda *args, **kwargs: parses.append(1) or real_parse(*args, **kwargs))
+        cache = ASTDataCache()
+
+        first = cache.get_or_collect("module.py", SOURCE)
+        assert cache.get_or_collect("module.py", SOURCE) is first
+        assert cache.get_or_collect("module.py", SOURCE + "\nx = 1\n") is not first
+        assert len(parses) == 2
+        assert cache.get_stats()["hits"] == 1
+
+    def test_supplied_tree_is_never_answered_from_another_tree(self):
+        """Two trees for one path with empty source_lines get their own facts."""
+        detector = ConnascenceDetector()
+        first = ast.parse("def configure(a, b, c, d, e, f):\n    return a\n")
+        second = ast.parse("import time\ntime.sleep(5)\n")
+
+        first_types = {v.type for v in detector.detect_violations(first, "x.py", [])}
+        second_types = {v.type for v in detector.detect_violations(second, "x.py", [])}
+        assert first_types == {"Parameter Coupling"}
+        assert "Timing Dependency" in second_types and "Parameter Coupling" not in second_types
+
+        cache = ASTDataCache()
+        data = cache.get_or_collect("x.py", tree=first, source_lines=[])
+        assert cache.get_or_collect("x.py", tree=first, source_lines=[]) is data
+        assert cache.get_or_collect("x.py", tree=second, source_lines=[]).tree is second
+
+    def test_lru_eviction_is_bounded(self):
+        """The least recently used fact table is evicted first."""
+        cache = ASTDataCache(max_entries=2)
+        for name in ("a.py", "b.py", "c.py"):
+            cache.get_or_collect(name, SOURCE)
+        stats = cache.get_stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+
+    def test_node_index_matches_walk(self):
+        """Indexed nodes are exactly those ast.walk yields."""
+        data = ASTDataCache().get_or_collect("module.py", SOURCE)
+        walked = list(ast.walk(data.tree))
+        assert data.node_count == len(walked)
+        constants = {id(n) for n in walked if isinstance(n, ast.Constant)}
+        assert {id(n) for n in data.nodes_of(ast.Constant)} == constants
+        assert data.max_lineno() == max(getattr(n, "lineno", 0) for n in walked)
+
+class TestAnalyzeFromData:
+    """Test that analyzers give the same results from the shared fact table."""
+
+    def test_analyzers_match_direct_analysis(self):
+        """Each analyzer's fact-table results equal its tree-walking results."""
+        data = ASTDataCache().get_or_collect("module.py", SOURCE)
+        tree = ast.parse(SOURCE)
+        lines = SOURCE.splitlines()
+
+        detector = ConnascenceDetector()
+        shared = detector.analyze_from_data(data)
+        direct = (detector._detect_god_objects(tree, "module.py")
+                    + detector._detect_configuration_coupling(tree, "module.py", lines)
+                    + detector._detect_timing_dependencies(tree, "module.py"))
+        assert {(v.type, v.line_number) for v in direct} <= {(v.type, v.line_number) for v in shared}
+        assert any(v.type == "Magic Literal" for v in shared)
+
+        nasa = NASAAnalyzer()
+        direct_nasa = [(v.type, v.line_number) for rule in (
+            nasa._check_loop_bounds, nasa._check_assertion_density, nasa._check_return_values)
+            for v in rule(tree, "module.py")]
+        shared_nasa = [(v.type, v.line_number) for v in nasa.analyze_from_data(data)]
+        assert direct_nasa and set(direct_nasa) <= set(shared_nasa)
+
+        assert [c.name for c in ContextAnalyzer().analyze_from_data(data)] == ["Handler"]
+        patterns = PatternDetector().analyze_from_data(data)
+        assert "long_parameter_list" in {p.pattern_name for p in patterns}
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Unit tests for cross-tool violation correlation."""
+
+import random
+
+from analyzer.result_aggregator import ResultAggregator
+from src.models.linter_models import LinterResult, LinterViolation, Position, StandardSeverity, ViolationType
+from src.violation_correlation import ViolationCorrelationIndex
+
+def _violation(tool, rule_id, line, file_path="pkg/mod.py", message="", **raw_data):
+    return LinterViolation(
+        tool=tool, rule_id=rule_id, message=message or f"{rule_id} reported", severity=StandardSeverity.WARNING,
+        violation_type=ViolationType.STYLE, file_path=file_path, position=Position(line=line), raw_data=raw_data)
+
+def _results(*violations):
+    results = {}
+    for violation in violations:
+        results.setdefault(violation.tool, LinterResult(
+            tool=violation.tool, exit_code=1, violations=[], execution_time=0.0,
+            files_analyzed=[violation.file_path])).violations.append(violation)
+    return results
+
+class TestViolationCorrelationIndex:
+    """Test merging of reports across tools."""
+
+    def test_equivalent_rules_merge_and_tools_are_reported(self):
+        """Known equivalent rules merge across tools; distinct rules and repeats do not."""
+        index = ViolationCorrelationIndex(line_tolerance=1)
+        index.add_linter_results(_results(
+            _violation("flake8", "F401", 3, message="'os' imported but unused"),
+            _violation("flake8", "F401", 3, message="'os' imported but unused"),
+            _violation("pylint", "unused-import", 3, message="Unused import os", **{"message-id": "W0611"}),
+            _violation("ruff", "F401", 4, file_path="./pkg/mod.py"),
+            _violation("flake8", "E501", 3, message="line too long (120 > 100 characters)"),
+            _violation("ruff", "S105", 10, message="Possible hardcoded password"),
+            _violation("bandit", "B105", 10, message="Possible hardcoded password", issue_severity="LOW"),
+            _violation("ruff", "PLR2004", 20, message="Magic value used in comparison"),
+        ))
+        index.add_analyzer_violations([{"type": "connascence_of_meaning", "file_path": "pkg/mod.py",
+                                        "line_number": 21, "severity": "high", "description": "Magic literal 42"}])
+
+        findings = {finding.rule_key: finding for finding in index.findings()}
+        assert set(findings) == {"F401", "E501", "B105", "magic-value"}
+        assert sorted(findings["F401"].tools) == ["flake8", "pylint", "ruff"]
+        assert sorted(findings["B105"].tools) == ["bandit", "ruff"]
+        assert findings["magic-value"].agreement == 2
+        assert findings["magic-value"].severity.value == "high"
+
+        stats = index.get_stats()
+        assert stats["exact_duplicates"] == 1
+        assert stats["findings"] == 4 and stats["merged_reports"] == 4
+        assert stats["tool_pairs"]["bandit+ruff"] == 1
+
+    def test_one_tool_never_merges_with_itself(self):
+        """Two different findings from one tool on nearby lines stay separate."""
+        index = ViolationCorrelationIndex(line_tolerance=2)
+        index.add_linter_violation(_violation("mypy", "arg-type", 5, message="Argument 1 has incompatible type"))
+        index.add_linter_violation(_violation("mypy", "arg-type", 6, message="Argument 2 has incompatible type"))
+        assert [finding.agreement for finding in index.findings()] == [1, 1]
+
+class TestResultAggregatorCorrelation:
+    """Test the indexed pair search in ResultAggregator."""
+
+    def test_indexed_correlation_matches_all_pairs(self):
+        """Candidate pairs produce exactly the correlations of the full scan."""
+        rng = random.Random(3)
+        violations = [{
+            "id": index,
+            "file_path": f"f{rng.randrange(4)}.py",
+            "type": rng.choice(["god_object", "connascence_of_meaning", "connascence_of_position"]),
+            "severity": rng.choice(["high", "medium", "low"]),
+            "line_number": rng.randrange(200),
+        } for index in range(300)]
+        aggregator = ResultAggregator(config_manager=object())
+
+        expected = []
+        for i, violation_a in enumerate(violations):
+            for violation_b in violations[i + 1:]:
+                strength = aggregator._calculate_pairwise_correlation(violation_a, violation_b)
+                if strength >= aggregator.correlation_threshold:
+                    expected.append((violation_a["id"], violation_b["id"]))
+
+        correlations = aggregator._cross_correlate_violations(violations)
+        assert [(c["violation_a_id"], c["violation_b_id"]) for c in correlations] == expected
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Unit tests for line-shift-tolerant violation fingerprints."""
+
+from analyzer.optimization.violation_fingerprints import (
+    BaselineIndex,
+    FingerprintCalculator,
+    build_scope_map,
+)
+
+SOURCE = [
+    "class Service:",
+    "    def run(self):",
+    "        return 42",
+    "",
+    "def helper():",
+    "    return 42",
+]
+
+def _calculator(sources):
+    """Calculator reading source lines from an in-memory mapping."""
+    return FingerprintCalculator(source_provider=sources.get)
+
+class TestFingerprints:
+    """Test fingerprint stability."""
+
+    def test_scope_map_qualifies_nested_scopes(self):
+        """Lines map to their qualified enclosing scope."""
+        scope_map = build_scope_map(SOURCE)
+        assert scope_map[2] == "Service.run"
+        assert scope_map[5] == "helper"
+
+    def test_inserted_lines_keep_fingerprint(self):
+        """Shifting a finding down does not change its fingerprint."""
+        violation = {"file_path": "a.py", "rule_id": "CON_M", "line_number": 3}
+        before = _calculator({"a.py": SOURCE}).fingerprint(violation)
+
+        shifted = ["import os", ""] + SOURCE
+        moved = {**violation, "line_number": 5}
+        assert _calculator({"a.py": shifted}).fingerprint(moved) == before
+
+    def test_same_snippet_in_other_scope_differs(self):
+        """Identical code in different scopes gets distinct fingerprints."""
+        calculator = _calculator({"a.py": SOURCE})
+        first = calculator.fingerprint({"file_path": "a.py", "rule_id": "CON_M", "line_number": 3})
+        second = calculator.fingerprint({"file_path": "a.py", "rule_id": "CON_M", "line_number": 6})
+        assert first != second
+
+    def test_duplicates_numbered_by_occurrence(self):
+        """Repeated findings in one scope stay distinguishable."""
+        violation = {"file_path": "b.py", "rule_id": "X", "description": "dup"}
+        fingerprints = _calculator({}).fingerprint_all([violation, dict(violation)])
+        assert len(set(fingerprints)) == 2
+
+class TestBaselineIndex:
+    """Test baseline classification and persistence."""
+
+    def test_classify_new_unchanged_fixed(self, tmp_path):
+        """Findings are classified by set lookup and scoped to analyzed files."""
+        calculator = _calculator({})
+        kept = {"file_path": "a.py", "rule_id": "X", "description": "kept"}
+        gone = {"file_path": "a.py", "rule_id": "X", "description": "gone"}
+        other = {"file_path": "b.py", "rule_id": "X", "description": "other"}
+        added = {"file_path": "a.py", "rule_id": "Y", "description": "added"}
+
+        index = BaselineIndex(tmp_path / "index.json")
+        index.rebuild([kept, gone, other], calculator, commit_hash="abc")
+        index.save()
+
+        loaded = BaselineIndex(tmp_path / "index.json")
+        assert loaded.load()
+        assert len(loaded) == 3 and loaded.commit_hash == "abc"
+
+        diff = loaded.classify([kept, added], calculator, scope_files=["a.py"])
+        assert diff.unchanged == [kept]
+        assert diff.new == [added]
+        assert [entry["description"] for entry in diff.fixed] == ["gone"]
+
+    def test_update_files_keeps_other_files(self):
+        """Incremental updates only replace entries of re-analyzed files."""
+        calculator = _calculator({})
+        index = BaselineIndex()
+        index.rebuild([{"file_path": "a.py", "rule_id": "X"}, {"file_path": "b.py", "rule_id": "X"}], calculator)
+        index.update_files([], calculator, ["a.py"])
+        assert [entry["file_path"] for entry in index.entries.values()] == ["b.py"]
+
+class _MagicNumberAnalyzer:
+    """Stand-in analyzer reporting '42' literals with absolute paths, like the real ones."""
+
+    def analyze_path(self, path):
+        from pathlib import Path
+
+        target = Path(path)
+        files = sorted(target.rglob("*.py")) if target.is_dir() else [target]
+        violations = [
+            {"file_path": str(file.resolve()), "type": "connascence_of_meaning", "severity": "medium",
+             "line_number": number, "description": "Magic literal 42"}
+            for file in files
+            for number, line in enumerate(file.read_text().splitlines(), 1) if "42" in line
+        ]
+        return {"violations": violations, "summary": {}}
+
+class TestIncrementalAnalyzer:
+    """Test baseline comparison through IncrementalAnalyzer itself."""
+
+    def test_resolved_findings_and_stale_entries(self, tmp_path):
+        """Fixes are reported as resolved, line shifts are not new, stored paths are relative."""
+        from analyzer.optimization.incremental_analyzer import IncrementalAnalyzer
+
+        (tmp_path / "a.py").write_text("def a():\n    return 42\n")
+        (tmp_path / "b.py").write_text("def b():\n    return 42\n")
+        incremental = IncrementalAnalyzer(tmp_path, analyzer=_MagicNumberAnalyzer())
+        incremental.create_baseline()
+        assert sorted(e["file_path"] for e in incremental.baseline_index.entries.values()) == ["a.py", "b.py"]
+
+        (tmp_path / "a.py").write_text("def a():\n    return 0\n")
+        (tmp_path / "b.py").write_text("import os\n\ndef b():\n    return 42\n")
+        result = incremental.analyze_changes(changed_files=["a.py", "b.py"])
+
+        assert result.new_violations == []
+        assert [v["file_path"] for v in result.resolved_violations] == ["a.py"]
+        assert [e["file_path"] for e in incremental.baseline_index.entries.values()] == ["b.py"]
+
+        reloaded = IncrementalAnalyzer(tmp_path, analyzer=_MagicNumberAnalyzer())
+        (tmp_path / "c.py").write_text("LIMIT = 42\n")
+        result = reloaded.analyze_changes(changed_files=["c.py"])
+        assert [v["file_path"] for v in result.new_violations] == [str((tmp_path / "c.py").resolve())]
+        assert result.resolved_violations == []
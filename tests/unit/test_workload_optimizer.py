@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Unit tests for adaptive concurrency and longest-job-first scheduling."""
+
+import asyncio
+
+from analyzer.architecture.connascence_orchestrator import ConnascenceOrchestrator
+from analyzer.streaming.stream_processor import StreamProcessor
+from src.detectors.workload_optimizer import AdaptiveConcurrencyController, FileCostEstimator
+
+class _Config:
+    """Minimal configuration provider."""
+
+    def __init__(self, **values):
+        self.values = values
+
+    def get_config(self, key, default):
+        return self.values.get(key, default)
+
+class TestAdaptiveConcurrencyController:
+    """Test the throughput feedback loop."""
+
+    def _controller(self, **kwargs):
+        controller = AdaptiveConcurrencyController(initial_concurrency=4, max_concurrency=8, **kwargs)
+        controller.memory_headroom_mb = lambda: 10_000.0
+        return controller
+
+    def test_climbs_while_throughput_improves_and_reverses_on_drop(self):
+        """Steps repeat while throughput rises and reverse when it falls."""
+        controller = self._controller()
+        assert controller.record_batch(10, 1.0, queue_depth=100) == 5
+        assert controller.record_batch(12, 1.0, queue_depth=100) == 6
+        assert controller.record_batch(8, 1.0, queue_depth=100) == 5
+        assert controller.record_batch(8, 1.0, queue_depth=100) == 5  # plateau holds
+
+    def test_memory_pressure_halves_concurrency(self):
+        """Low memory headroom is a multiplicative decrease."""
+        controller = self._controller(min_memory_headroom_mb=512.0)
+        controller.memory_headroom_mb = lambda: 100.0
+        assert controller.record_batch(10, 1.0, queue_depth=100) == 2
+        assert controller.get_stats()["recent_adjustments"][-1]["reason"] == "memory_pressure"
+
+    def test_growth_capped_by_queue_depth(self):
+        """Never more workers than queued work."""
+        controller = self._controller()
+        assert controller.record_batch(10, 1.0, queue_depth=2) == 2
+
+class TestFileCostEstimator:
+    """Test cost history and LJF ordering."""
+
+    def test_longest_first_uses_history_then_size(self, tmp_path):
+        """Measured files are ranked by history, unseen files by size."""
+        small, large, slow = (tmp_path / name for name in ("small.py", "large.py", "slow.py"))
+        small.write_text("x = 1\n")
+        large.write_text("x = 1\n" * 5000)
+        slow.write_text("x = 1\n")
+        estimator = FileCostEstimator()
+        estimator.record(str(slow), 5.0)
+
+        assert estimator.order_longest_first([small, large, slow]) == [slow, large, small]
+
+    def test_history_is_smoothed_and_bounded(self):
+        """Repeated measurements are averaged; old files are evicted."""
+        estimator = FileCostEstimator(max_entries=2, smoothing=0.5)
+        estimator.record("a.py", 2.0)
+        estimator.record("a.py", 4.0)
+        assert estimator.estimate("a.py") == 3.0
+        estimator.record("b.py", 1.0)
+        estimator.record("c.py", 1.0)
+        assert estimator.get_stats()["files_tracked"] == 2
+
+class TestSchedulingIntegration:
+    """Test the orchestrator and stream processor wiring."""
+
+    def test_orchestrator_submits_longest_first(self, tmp_path, monkeypatch):
+        """With one worker, files are analyzed in descending estimated cost."""
+        for name, lines in (("a.py", 1), ("b.py", 400), ("c.py", 40)):
+            (tmp_path / name).write_text("value = 1\n" * lines)
+        orchestrator = ConnascenceOrchestrator(_Config(
+            enable_caching=False, max_worker_threads=1, max_worker_threads_limit=1))
+        orchestrator.file_costs = FileCostEstimator()
+        order = []
+        monkeypatch.setattr(orchestrator, "_analyze_single_file", lambda path: order.append(path.name) or [])
+
+        orchestrator.analyze_project(tmp_path)
+        assert order == ["b.py", "c.py", "a.py"]
+        assert orchestrator.get_system_status()["concurrency"]["current_concurrency"] == 1
+
+    def test_stream_processor_resizes_active_workers(self):
+        """Lowering the limit retires busy slots; raising it reclaims them."""
+        async def scenario():
+            processor = StreamProcessor(max_workers=4)
+            semaphore = processor._worker_semaphore
+            for _ in range(4):
+                await semaphore.acquire()
+            processor._resize_concurrency(2)
+            for _ in range(4):
+                processor._release_worker_slot()
+            free_after_shrink = semaphore._value
+            processor._resize_concurrency(3)
+            return free_after_shrink, semaphore._value
+
+        assert asyncio.run(scenario()) == (2, 3)